@@ -20,10 +20,12 @@ Updated with enhanced engine and all new capabilities
 
 
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 
 from flask_cors import CORS
 
+import hmac
+
 import json
 
 import traceback
@@ -42,18 +44,28 @@ from functools import wraps
 
 from collections import defaultdict
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from werkzeug.datastructures import Headers
+
 
 
 # UPDATED IMPORT: Use the new enhanced engine
 
 from horary_engine.engine import HoraryEngine, serialize_planet_with_solar
-from horary_engine.serialization import (
-    serialize_lunar_aspect,
-    deserialize_chart_for_evaluation,
-)
-from horary_engine.services.geolocation import LocationError
+from horary_engine.serialization import serialize_lunar_aspect
+from horary_engine.calculation.ephemeris import get_ephemeris
+from horary_engine.calculation.ephemeris_data import configure_ephemeris_data
+from horary_engine.calculation.precision import get_precision_profile
+from horary_engine.services.planetary_hours import get_planetary_hours_service
+from horary_engine.services.gazetteer import get_gazetteer
+from horary_engine.services.geocoding import get_geocode_cache
+from horary_engine.services.geolocation import LocationError, get_timezone_manager
+from horary_engine.services.result_cache import get_result_cache
 from evaluate_chart import evaluate_chart
 from horary_engine.utils import token_to_string
+from horary_engine.response_fields import expand_fields, parse_fields, project, wants
+from horary_config import ConfigWatcher, HoraryError, cfg, config_status, reload_config
 
 
 
@@ -127,6 +139,13 @@ CORS(app)  # Enable CORS for all routes
 
 horary_engine = HoraryEngine()
 
+# Warm planetary-hour tables for frequently used locations
+get_planetary_hours_service().precompute_configured()
+
+# Optional hot reload of horary_constants.yaml (poll interval in seconds)
+if os.getenv("HORARY_CONFIG_WATCH"):
+    ConfigWatcher(float(os.getenv("HORARY_CONFIG_WATCH"))).start()
+
 
 
 # Simple metrics collection
@@ -346,7 +365,8 @@ def health_check():
 
             'status': 'healthy',
 
-            'test_calculation': f"Sun at {sun_pos[0][0]:.2f}°"
+            'test_calculation': f"Sun at {sun_pos[0][0]:.2f}°",
+            **configure_ephemeris_data().to_dict()
 
         }
 
@@ -480,9 +500,6 @@ def health_check():
 
 
 
-# Simple in-memory cache for timezone requests
-_timezone_cache = {}
-
 @app.route('/api/get-timezone', methods=['POST'])
 
 @timing_decorator('get_timezone')
@@ -513,12 +530,6 @@ def get_timezone():
 
         
 
-        # Check cache first
-        cache_key = location.lower()
-        if cache_key in _timezone_cache:
-            logger.info(f"Using cached timezone for location: {location}")
-            return jsonify(_timezone_cache[cache_key])
-
         logger.info(f"Getting timezone for location: {location}")
 
         
@@ -535,9 +546,9 @@ def get_timezone():
 
             # Get timezone using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
+            from horary_engine.services.geolocation import get_timezone_manager
 
-            timezone_manager = TimezoneManager()
+            timezone_manager = get_timezone_manager()
 
             timezone_str = timezone_manager.get_timezone_for_location(lat, lon)
 
@@ -560,9 +571,6 @@ def get_timezone():
             }
 
             
-            # Cache the result
-            _timezone_cache[cache_key] = result
-
             # Log timezone detection with safe encoding
             location_safe = full_location.encode('ascii', 'replace').decode('ascii') if full_location else 'Unknown'
             logger.info(f"Enhanced timezone detection successful: {timezone_str} for {location_safe}")
@@ -667,9 +675,9 @@ def get_current_time():
 
             # Get current time using enhanced timezone manager
 
-            from horary_engine.services.geolocation import TimezoneManager
+            from horary_engine.services.geolocation import get_timezone_manager
 
-            timezone_manager = TimezoneManager()
+            timezone_manager = get_timezone_manager()
 
             dt_local, dt_utc, timezone_used = timezone_manager.get_current_time_for_location(lat, lon)
 
@@ -769,6 +777,9 @@ def calculate_chart():
 
     Now includes future retrograde, directional motion, enhanced reception, and more
 
+    ``fields``/``include`` (query) or ``fields`` (body) limits the response to those
+    sections and skips building the others; see horary_engine.response_fields.
+
     """
 
     try:
@@ -791,8 +802,21 @@ def calculate_chart():
 
             }), 400
 
-        
+    except Exception as e:
+        return jsonify(_chart_error(e)), 500
+
+    body, status = _calculate_chart_item(data, request.args, request.headers)
+    return jsonify(body), status
+
 
+def _calculate_chart_item(data, args, headers):
+    """Judge one ``/api/calculate-chart`` request body.
+
+    ``args`` and ``headers`` are the query parameters and headers of the HTTP
+    request (shared by every item of a batch). Returns the response body and
+    status code.
+    """
+    try:
         # Extract basic parameters
 
         question = data.get('question', '').strip()
@@ -809,15 +833,40 @@ def calculate_chart():
 
         manual_houses = data.get('manualHouses')
 
-        use_reasoning_v1 = request.headers.get('X-Use-Reasoning-V1')
+        use_reasoning_v1 = headers.get('X-Use-Reasoning-V1')
         if use_reasoning_v1 is None:
-            use_reasoning_v1 = request.args.get('useReasoningV1')
+            use_reasoning_v1 = args.get('useReasoningV1')
         if use_reasoning_v1 is None:
             use_reasoning_v1 = os.getenv('USE_REASONING_V1', 'false')
         use_reasoning_v1 = str(use_reasoning_v1).lower() == 'true'
+
+        # Named ephemeris precision profile (header wins over body field)
+        precision = headers.get('X-Precision-Profile') or data.get('precision')
+        try:
+            precision_profile = get_precision_profile(precision)
+        except ValueError as e:
+            return {
+                'error': str(e),
+                'judgment': 'ERROR',
+                'confidence': 0,
+                'reasoning': [make_reason('Invalid precision profile')]
+            }, 400
 
         
 
+        # Response sections to build (query ``fields``/``include`` or body ``fields``; default all)
+        try:
+            fields = parse_fields(
+                args.get('fields') or args.get('include') or data.get('fields')
+            )
+        except ValueError as e:
+            return {
+                'error': str(e),
+                'judgment': 'ERROR',
+                'confidence': 0,
+                'reasoning': [make_reason('Invalid response fields')]
+            }, 400
+
         # NEW: Extract enhanced parameters
 
         ignore_radicality = data.get('ignoreRadicality', False)
@@ -864,7 +913,7 @@ def calculate_chart():
 
         if not question:
 
-            return jsonify({
+            return {
 
                 'error': 'Question is required',
 
@@ -874,13 +923,13 @@ def calculate_chart():
 
                 'reasoning': [make_reason('No horary question provided')]
 
-            }), 400
+            }, 400
 
         
 
         if not location:
 
-            return jsonify({
+            return {
 
                 'error': 'Location is required',
 
@@ -890,7 +939,7 @@ def calculate_chart():
 
                 'reasoning': [make_reason('No location provided')]
 
-            }), 400
+            }, 400
 
         
 
@@ -900,7 +949,7 @@ def calculate_chart():
 
             if not date_str or not time_str:
 
-                return jsonify({
+                return {
 
                     'error': 'Date and time are required when not using current time',
 
@@ -910,7 +959,7 @@ def calculate_chart():
 
                     'reasoning': [make_reason('Date and time must be provided for manual time entry')]
 
-                }), 400
+                }, 400
 
         
 
@@ -926,7 +975,7 @@ def calculate_chart():
 
                 if len(houses_list) < 2:
 
-                    return jsonify({
+                    return {
 
                         'error': 'Manual houses must include at least querent and quesited houses (e.g., "1,7")',
 
@@ -936,11 +985,11 @@ def calculate_chart():
 
                         'reasoning': [make_reason('Invalid manual house specification')]
 
-                    }), 400
+                    }, 400
 
             except ValueError:
 
-                return jsonify({
+                return {
 
                     'error': 'Manual houses must be numbers separated by commas (e.g., "1,7")',
 
@@ -950,7 +999,7 @@ def calculate_chart():
 
                     'reasoning': [make_reason('Invalid manual house format')]
 
-                }), 400
+                }, 400
 
         
 
@@ -986,14 +1035,17 @@ def calculate_chart():
 
                 "ignore_saturn_7th": ignore_saturn_7th,
 
-                "exaltation_confidence_boost": exaltation_confidence_boost
-
+                "exaltation_confidence_boost": exaltation_confidence_boost,
+                "precision": precision_profile.name,
+                "fields": expand_fields(fields)
             }
 
             
             logger.info("About to call horary_engine.judge()...")
             try:
-                result = horary_engine.judge(question, settings)
+                with get_ephemeris(precision_profile).measure() as ephemeris_usage, \
+                        get_result_cache().track() as cache_status:
+                    result, chart = horary_engine.judge_with_chart(question, settings)
                 logger.info(f"horary_engine.judge() completed successfully, got result type: {type(result)}")
             except Exception as judge_error:
                 logger.error(f"ERROR in horary_engine.judge(): {str(judge_error)}")
@@ -1010,7 +1062,7 @@ def calculate_chart():
 
             logger.error(f"Location error: {str(e)}")
 
-            return jsonify({
+            return {
 
                 'error': str(e),
 
@@ -1022,7 +1074,7 @@ def calculate_chart():
 
                 'error_type': 'LocationError'
 
-            }), 400
+            }, 400
 
         
 
@@ -1038,7 +1090,7 @@ def calculate_chart():
 
             logger.error(f"Chart calculation error: {result['error']}")
 
-            return jsonify(result), 500
+            return result, 500
 
         
 
@@ -1047,6 +1099,10 @@ def calculate_chart():
         result['calculation_metadata'] = {
 
             'calculation_time_seconds': calculation_time,
+            'ephemeris_usage': ephemeris_usage,
+
+            'result_cache': cache_status,
+            'precision_profile': precision_profile.name,
 
             'timestamp': datetime.now(timezone.utc).isoformat(),
 
@@ -1128,10 +1184,10 @@ def calculate_chart():
 
         # Attach structured evaluation results
         try:
-            chart_data = result.get('chart_data')
-            if chart_data:
-                chart_obj = deserialize_chart_for_evaluation(chart_data)
-                evaluation = evaluate_chart(chart_obj, use_dsl=False)
+            # Evaluate the chart the engine judged; chart_data is for the response only
+            reasoning_field = 'reasoning_v1' if use_reasoning_v1 else 'rationale'
+            if chart is not None and (wants(fields, 'ledger') or wants(fields, reasoning_field)):
+                evaluation = evaluate_chart(chart, use_dsl=False)
                 ledger = evaluation.get('ledger', [])
                 for entry in ledger:
                     entry['key'] = token_to_string(entry.get('key'))
@@ -1154,41 +1210,165 @@ def calculate_chart():
             else:
                 result['rationale'] = result.get('reasoning', [])
 
-        return jsonify(result)
+        return project(result, fields), 200
 
         
 
     except Exception as e:
+        return _chart_error(e), 500
 
-        error_msg = f"Error calculating enhanced chart: {str(e)}"
 
-        logger.error(error_msg)
+def _chart_error(e):
+    """Response body for an unexpected error while calculating a chart."""
 
-        logger.error(traceback.format_exc())
+    error_msg = f"Error calculating enhanced chart: {str(e)}"
 
-        
+    logger.error(error_msg)
 
-        return jsonify({
+    logger.error(traceback.format_exc())
 
-            'error': error_msg,
+    
 
-            'judgment': 'ERROR',
+    return {
 
-            'confidence': 0,
+        'error': error_msg,
 
-            'reasoning': [make_reason(f'Enhanced calculation error: {str(e)}')],
+        'judgment': 'ERROR',
 
-            'calculation_metadata': {
+        'confidence': 0,
 
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+        'reasoning': [make_reason(f'Enhanced calculation error: {str(e)}')],
 
-                'api_version': '2.0.0'
+        'calculation_metadata': {
 
-            }
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+
+            'api_version': '2.0.0'
+
+        }
+
+    }
 
-        }), 500
 
 
+@app.route('/api/calculate-chart/batch', methods=['POST'])
+@timing_decorator('calculate_chart_batch')
+def calculate_chart_batch():
+    """Judge many ``/api/calculate-chart`` request bodies in one call.
+
+    The body is a JSON array of request objects (or ``{"items": [...]}``), or
+    ``application/x-ndjson`` with one request object per line, read as the
+    items are scheduled. Query parameters and headers apply to every item.
+    Items run on a pool of ``batch.workers`` threads and share the geocoding,
+    timezone and chart caches, so a location or chart used by several items
+    is resolved once.
+
+    The response is NDJSON streamed in completion order: one line per item
+    with ``index``, ``id`` (echoed from the item), ``status``, ``elapsed_ms``
+    and ``result`` (plus ``error`` when the item failed), then a line with
+    ``summary``.
+    """
+    settings = getattr(cfg(), 'batch', None)
+    max_items = getattr(settings, 'max_items', 1000)
+    if request.mimetype == 'application/x-ndjson':
+        items = _ndjson_items(request.stream)
+    else:
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            data = data.get('items')
+        if not isinstance(data, list):
+            return jsonify({'error': 'Expected a JSON array of chart requests', 'success': False}), 400
+        if len(data) > max_items:
+            return jsonify({'error': f'A batch is limited to {max_items} items', 'success': False}), 400
+        items = iter(data)
+
+    stream = _stream_batch(items, request.args.copy(), Headers(request.headers),
+                           workers=getattr(settings, 'workers', 4), max_items=max_items)
+    return Response(stream_with_context(stream), mimetype='application/x-ndjson')
+
+
+def _ndjson_items(stream):
+    """Request objects from an NDJSON body; malformed lines yield the error."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield ValueError(f'Invalid JSON: {e}')
+
+
+def _batch_item(index, item, args, headers):
+    """Judge one batch item and build its response line."""
+    start = time.perf_counter()
+    if isinstance(item, dict) and item:
+        try:
+            body, status = _calculate_chart_item(item, args, headers)
+        except Exception as e:
+            body, status = _chart_error(e), 500
+    else:
+        error = str(item) if isinstance(item, ValueError) else 'Expected a chart request object'
+        body, status = {
+            'error': error,
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason('Invalid batch item')]
+        }, 400
+    line = {
+        'index': index,
+        'id': item.get('id') if isinstance(item, dict) else None,
+        'status': status,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+        'result': body,
+    }
+    if status != 200:
+        line['error'] = body.get('error')
+    return line
+
+
+def _stream_batch(items, args, headers, workers, max_items):
+    """Run batch items on a thread pool and yield NDJSON lines as they finish.
+
+    At most ``2 * workers`` items are in flight, so neither the request body
+    nor the results are held in memory at once.
+    """
+    start = time.perf_counter()
+    counts = {'items': 0, 'succeeded': 0, 'failed': 0}
+    truncated = False
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='chart-batch') as pool:
+        pending = set()
+        items = iter(items)
+        exhausted = False
+        submitted = 0
+        while True:
+            while not exhausted and len(pending) < 2 * workers:
+                item = next(items, _END)
+                if item is _END:
+                    exhausted = True
+                elif submitted >= max_items:
+                    exhausted = truncated = True
+                else:
+                    pending.add(pool.submit(_batch_item, submitted, item, args, headers))
+                    submitted += 1
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                line = future.result()
+                counts['items'] += 1
+                counts['succeeded' if line['status'] == 200 else 'failed'] += 1
+                yield app.json.dumps(line) + '\n'
+
+    summary = {'summary': True, **counts, 'elapsed_ms': round((time.perf_counter() - start) * 1000, 1)}
+    if truncated:
+        summary['error'] = f'A batch is limited to {max_items} items; the rest were not read'
+    yield app.json.dumps(summary) + '\n'
+
+
+# Marks the end of the batch items
+_END = object()
+
 
 @app.route('/api/moon-debug', methods=['POST'])
 
@@ -1258,6 +1438,95 @@ def moon_debug():
 
 
 
+@app.route('/api/planetary-hours', methods=['GET'])
+@timing_decorator('planetary_hours')
+def planetary_hours():
+    """Planetary hours for one local date and location.
+
+    Query parameters: ``lat``, ``lon``, optional ``date`` (YYYY-MM-DD, default
+    today) and ``timezone`` (default: detected from the coordinates).
+    """
+    try:
+        lat = float(request.args['lat'])
+        lon = float(request.args['lon'])
+    except (KeyError, ValueError):
+        return jsonify({'error': 'Numeric lat and lon query parameters are required', 'success': False}), 400
+
+    timezone_str = request.args.get('timezone')
+    if not timezone_str:
+        timezone_str = horary_engine.engine.timezone_manager.get_timezone_for_location(lat, lon) or 'UTC'
+
+    try:
+        import pytz
+        date_str = request.args.get('date')
+        day = datetime.strptime(date_str, '%Y-%m-%d').date() if date_str else datetime.now(pytz.timezone(timezone_str)).date()
+        table = get_planetary_hours_service().table(day, lat, lon, timezone_str)
+    except (ValueError, KeyError) as e:
+        # Bad date, unknown timezone or no sunrise/sunset at this latitude
+        return jsonify({'error': str(e), 'success': False}), 400
+
+    result = table.to_dict()
+    result['success'] = True
+    return jsonify(result)
+
+
+
+@app.route('/api/locations/autocomplete', methods=['GET'])
+@timing_decorator('location_autocomplete')
+def location_autocomplete():
+    """Place suggestions from the offline gazetteer.
+
+    Query parameters: ``q`` (partial place name, optionally followed by
+    ``, region`` or ``, country``) and ``limit``. Suggestions rank exact names
+    before prefixes before misspellings, and by population within each group.
+    """
+    gazetteer = get_gazetteer()
+    if gazetteer is None:
+        return jsonify({'error': 'Offline gazetteer is not installed', 'success': False}), 503
+
+    settings = getattr(cfg(), 'gazetteer', None)
+    try:
+        limit = int(request.args.get('limit', getattr(settings, 'autocomplete_limit', 10)))
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer', 'success': False}), 400
+    limit = max(1, min(limit, getattr(settings, 'max_autocomplete_limit', 50)))
+
+    query = request.args.get('q', '')
+    results = [
+        {**place.to_dict(), 'match': match}
+        for place, match in gazetteer.search(query, limit=limit)
+    ]
+    return jsonify({'query': query, 'results': results, 'success': True})
+
+
+@app.route('/api/admin/reload-config', methods=['POST'])
+@timing_decorator('reload_config')
+def reload_configuration():
+    """Reload horary_constants.yaml without restarting.
+
+    Disabled (404) unless ``HORARY_ADMIN_TOKEN`` is set; requests must then
+    send it in the ``X-Admin-Token`` header. Only the worker serving the
+    request reloads; use ``HORARY_CONFIG_WATCH`` to have every worker follow
+    the file.
+    """
+    admin_token = os.getenv('HORARY_ADMIN_TOKEN')
+    if not admin_token:
+        return jsonify({'error': 'Not found', 'success': False}), 404
+    supplied = request.headers.get('X-Admin-Token', '')
+    if not hmac.compare_digest(supplied.encode('utf-8'), admin_token.encode('utf-8')):
+        return jsonify({'error': 'Invalid admin token', 'success': False}), 403
+
+    try:
+        reload_config()
+    except HoraryError as e:
+        # The previous configuration stays active
+        return jsonify({'error': str(e), 'success': False}), 400
+
+    result = config_status()
+    result['success'] = True
+    return jsonify(result)
+
+
 @app.route('/api/metrics', methods=['GET'])
 
 @timing_decorator('metrics')
@@ -1274,6 +1543,12 @@ def get_metrics():
 
             'metrics': metrics.get_stats(),
 
+            'result_cache': get_result_cache().stats(),
+
+            'geocoding': get_geocode_cache().stats(),
+
+            'timezones': get_timezone_manager().stats(),
+
             'enhanced_engine_stats': {
 
                 'version': '2.0.0',
@@ -1542,6 +1817,8 @@ def serialize_moon_debug(debug_data):
                     debug_data.get('void_result', {}).get('first_applying_aspect')
                 ),
 
+                'void_period': debug_data.get('void_result', {}).get('void_period'),
+
             },
 
             'future_aspects': []
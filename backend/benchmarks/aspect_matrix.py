@@ -0,0 +1,60 @@
+"""Aspect detection throughput: pairwise loop against the aspect matrices.
+
+Positions are random, so only aspect detection is measured (no ephemeris
+timing of applying aspects). Run from the backend directory::
+
+    python benchmarks/aspect_matrix.py --charts 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.aspects import aspect_matrices, calculate_enhanced_aspects, orb_limit_matrix
+from horary_engine.chart_batch import BATCH_PLANETS
+from models import Planet, PlanetPosition, Sign
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    longitude = rng.uniform(0, 360, (args.charts, len(BATCH_PLANETS)))
+    speed = rng.uniform(-1.0, 1.5, (args.charts, len(BATCH_PLANETS)))
+    speed[:, BATCH_PLANETS.index(Planet.MOON)] = rng.uniform(11.8, 15.1, args.charts)
+
+    signs = list(Sign)
+    charts = [
+        {
+            planet: PlanetPosition(planet=planet, longitude=float(lon), latitude=0.0, house=1,
+                                   sign=signs[int(lon // 30)], dignity_score=0, speed=float(spd))
+            for planet, lon, spd in zip(BATCH_PLANETS, longitude[n], speed[n])
+        }
+        for n in range(args.charts)
+    ]
+
+    limits = orb_limit_matrix(BATCH_PLANETS)
+    t0 = time.perf_counter()
+    aspect_matrices(longitude, speed, limits)
+    batch_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for planets in charts:
+        calculate_enhanced_aspects(planets, None)
+    per_chart_s = time.perf_counter() - t0
+
+    print(f"charts:      {args.charts}")
+    print(f"matrices:    {batch_s:.3f}s ({args.charts / batch_s:,.0f} charts/s)")
+    print(f"per chart:   {per_chart_s:.3f}s ({args.charts / per_chart_s:,.0f} charts/s)")
+
+
+if __name__ == "__main__":
+    main()
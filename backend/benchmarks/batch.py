@@ -0,0 +1,91 @@
+"""Batch endpoint against one request per item.
+
+Posts ``--items`` chart requests spread over ``--charts`` distinct chart
+times (several questions per chart, as in a batch of related questions)
+once as separate ``/api/calculate-chart`` calls and once as a single
+``/api/calculate-chart/batch`` call, through the Flask test client. The
+result cache is emptied before each run and geocoding is stubbed out, so
+only chart and judgment work is timed.
+
+Run from the backend directory::
+
+    python benchmarks/batch.py --items 200 --charts 20
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+from horary_engine.services.result_cache import get_result_cache, reset_result_cache
+
+QUESTIONS = [
+    "Will I get the job?",
+    "Should I move house?",
+    "Will I find my keys?",
+    "Will he come back?",
+    "Will the sale go through?",
+]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--charts", type=int, default=20)
+    parser.add_argument("--fields", default="judgment,confidence")
+    args = parser.parse_args(argv)
+
+    engine_module.safe_geocode = lambda location: (51.5074, -0.1278, "London, UK")
+    from app import app
+
+    # The endpoint logs and prints every step of a judgment
+    logging.disable(logging.CRITICAL)
+    client = app.test_client()
+    items = [
+        {
+            "question": QUESTIONS[i % len(QUESTIONS)] + f" ({i})",
+            "location": "London",
+            "useCurrentTime": False,
+            "date": "2024-03-15",
+            "time": f"{9 + i % args.charts // 60:02d}:{i % args.charts % 60:02d}",
+            "timezone": "Europe/London",
+        }
+        for i in range(args.items)
+    ]
+    url = f"?fields={args.fields}"
+
+    reset_result_cache()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in items:
+            assert client.post("/api/calculate-chart" + url, json=item).status_code == 200
+    single = time.perf_counter() - start
+
+    reset_result_cache()
+    start = time.perf_counter()
+    first = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = client.post("/api/calculate-chart/batch" + url, json=items)
+        lines = []
+        for chunk in response.response:
+            if first is None:
+                first = time.perf_counter() - start
+            lines.append(json.loads(chunk))
+    batch = time.perf_counter() - start
+    assert lines[-1]["succeeded"] == args.items, lines[-1]
+
+    print(f"{args.items} items over {args.charts} charts")
+    print(f"{'single requests':<18} {single * 1000:8.0f} ms")
+    print(f"{'batch':<18} {batch * 1000:8.0f} ms  (first line after {first * 1000:.0f} ms)")
+    print(f"charts coalesced: {get_result_cache().stats()['coalesced_charts']}")
+
+
+if __name__ == "__main__":
+    main()
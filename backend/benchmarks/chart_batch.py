@@ -0,0 +1,59 @@
+"""Throughput of ``calculate_chart_batch`` against sequential ``calculate_chart``.
+
+Run from the backend directory::
+
+    python benchmarks/chart_batch.py --charts 1000
+"""
+
+import argparse
+import datetime
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # calculate_chart logs every chart at INFO
+    logging.disable(logging.INFO)
+
+    rng = np.random.default_rng(args.seed)
+    start = datetime.datetime(1950, 1, 1)
+    minutes = rng.integers(0, 60 * 24 * 365 * 100, args.charts)
+    times = [start + datetime.timedelta(minutes=int(m)) for m in minutes]
+    lats = rng.uniform(-60, 60, args.charts)
+    lons = rng.uniform(-180, 180, args.charts)
+
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    # Untimed pass so lazily fitted providers (chebyshev) are measured warm
+    calculator.calculate_chart_batch(times, lats, lons)
+
+    t0 = time.perf_counter()
+    calculator.calculate_chart_batch(times, lats, lons)
+    batch_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for dt, lat, lon in zip(times, lats, lons):
+        calculator.calculate_chart(dt, dt, "UTC", lat, lon, "benchmark")
+    sequential_s = time.perf_counter() - t0
+
+    print(f"provider:    {calculator.ephemeris.provider.name}")
+    print(f"charts:      {args.charts}")
+    print(f"batch:       {batch_s:.3f}s ({args.charts / batch_s:,.0f} charts/s)")
+    print(f"sequential:  {sequential_s:.3f}s ({args.charts / sequential_s:,.0f} charts/s)")
+    print(f"speedup:     {sequential_s / batch_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
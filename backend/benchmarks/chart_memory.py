@@ -0,0 +1,159 @@
+"""Memory held by a cache of ``HoraryChart`` objects.
+
+Calculates ``--distinct`` charts with ``calculate_chart`` and fills a cache
+of ``--charts`` copies. Copies are pickle round trips, so each one owns its
+floats, lists and dicts like a freshly calculated chart. The same cache is
+then rebuilt with ``__dict__``-backed model dataclasses and the dense 7x7x5
+perfection table, the layout used before the models were slotted.
+
+Memory is the growth of the resident set while each cache is built (both
+caches stay alive so the second cannot reuse the first one's pages). Where
+``/proc`` is not available ``tracemalloc`` is used instead, which needs
+several times more memory for 100k charts.
+
+Run from the backend directory::
+
+    python benchmarks/chart_memory.py --charts 100000
+"""
+
+import argparse
+import datetime
+import gc
+import logging
+import os
+import pickle
+import sys
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import models
+from horary_engine import perfection
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+MODEL_CLASSES = [
+    models.SolarAnalysis,
+    models.PlanetPosition,
+    models.AspectInfo,
+    models.LunarAspect,
+    models.HoraryChart,
+]
+
+
+def _dict_backed(cls):
+    """Dataclass with the fields of ``cls`` but without ``__slots__``."""
+    specs = []
+    for f in fields(cls):
+        if f.default_factory is not MISSING:
+            specs.append((f.name, f.type, field(default_factory=f.default_factory)))
+        elif f.default is not MISSING:
+            specs.append((f.name, f.type, field(default=f.default)))
+        else:
+            specs.append((f.name, f.type))
+    return make_dataclass(cls.__name__, specs)
+
+
+LEGACY_CLASSES = {cls: _dict_backed(cls) for cls in MODEL_CLASSES}
+
+
+class _DensePerfectionMatrix:
+    """Perfection matrix storage as nested lists over the full table."""
+
+    def __init__(self, matrix: perfection.PerfectionMatrix, planets):
+        n_planets, n_aspects = len(perfection.CLASSICAL_PLANETS), len(perfection.ASPECT_TYPES)
+        self.julian_day = matrix.julian_day
+        self.planets = planets
+        self._days = [[[None] * n_aspects for _ in range(n_planets)] for _ in range(n_planets)]
+        self._searched = [[[0.0] * n_aspects for _ in range(n_planets)] for _ in range(n_planets)]
+        self._exit = [None] * n_planets
+        self._exit_searched = [0.0] * n_planets
+        self.solves = matrix.solves
+        for cell, (days, searched) in matrix._aspects.items():
+            pair, k = divmod(cell, n_aspects)
+            i, j = divmod(pair, n_planets)
+            self._days[i][j][k] = self._days[j][i][k] = days
+            self._searched[i][j][k] = self._searched[j][i][k] = searched
+        for i, (days, searched) in matrix._exits.items():
+            self._exit[i], self._exit_searched[i] = days, searched
+
+
+def _to_legacy(value, memo):
+    """Rebuild ``value`` with the legacy classes, sharing what it shares."""
+    done = memo.get(id(value))
+    if done is not None:
+        return done
+    legacy = LEGACY_CLASSES.get(type(value))
+    if legacy is not None:
+        result = legacy(**{f.name: _to_legacy(getattr(value, f.name), memo) for f in fields(value)})
+    elif isinstance(value, perfection.PerfectionMatrix):
+        result = _DensePerfectionMatrix(value, _to_legacy(value.planets, memo))
+    elif isinstance(value, dict):
+        result = {key: _to_legacy(item, memo) for key, item in value.items()}
+    elif isinstance(value, list):
+        result = [_to_legacy(item, memo) for item in value]
+    else:
+        return value
+    memo[id(value)] = result
+    return result
+
+
+def _load_compact(data: bytes):
+    return pickle.loads(data)
+
+
+def _load_legacy(data: bytes):
+    return _to_legacy(pickle.loads(data), {})
+
+
+def _memory() -> int:
+    """Resident set size (Linux) or memory traced by ``tracemalloc``."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _build_cache(blobs, n: int, load):
+    """Cache of ``n`` charts loaded from ``blobs`` and the bytes it added."""
+    gc.collect()
+    before = _memory()
+    cache = {i: load(blobs[i % len(blobs)]) for i in range(n)}
+    gc.collect()
+    return cache, _memory() - before
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    # calculate_chart logs every chart at INFO
+    logging.disable(logging.INFO)
+
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    start = datetime.datetime(2000, 1, 1)
+    blobs = []
+    for i in range(args.distinct):
+        dt = start + datetime.timedelta(hours=37 * i)
+        chart = calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.13, "London")
+        blobs.append(pickle.dumps(chart))
+
+    _memory()  # start tracemalloc before the caches if /proc is missing
+    # Both caches stay referenced until the figures are printed
+    compact_cache, compact = _build_cache(blobs, args.charts, _load_compact)
+    legacy_cache, legacy = _build_cache(blobs, args.charts, _load_legacy)
+
+    print(f"charts:      {args.charts:,} ({args.distinct} distinct)")
+    print(f"compact:     {compact / 2**20:,.1f} MiB ({compact / args.charts:,.0f} B/chart)")
+    print(f"dict-backed: {legacy / 2**20:,.1f} MiB ({legacy / args.charts:,.0f} B/chart)")
+    print(f"reduction:   {1 - compact / legacy:.0%}")
+    del compact_cache, legacy_cache
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Offline gazetteer lookups and the network-free request path.
+
+Times ``Gazetteer.resolve`` and ``Gazetteer.search`` for names drawn from the
+index, then posts ``/api/calculate-chart`` through the Flask test client with
+geocoding served by the gazetteer alone (the geocoding service is disabled,
+so a miss fails the run). Uses the configured gazetteer file, one built from
+``--source`` (a GeoNames cities dump), or ``--synthetic N`` random places.
+
+Run from the backend directory::
+
+    python benchmarks/gazetteer.py --source cities15000.zip --requests 100
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.services.geocoding as geocoding
+from horary_engine.services import gazetteer as gazetteer_module
+from horary_engine.services.gazetteer import Place, read_geonames, write_gazetteer
+
+
+def _synthetic(n, seed=7):
+    rng = random.Random(seed)
+
+    def word():
+        return rng.choice(string.ascii_uppercase) + "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10)))
+
+    for i in range(n):
+        name = word()
+        place = Place(i + 1, name, f"{name}, Region, United Kingdom", rng.uniform(-60, 65), rng.uniform(-180, 180),
+                      "GB", "Region", int(rng.paretovariate(1.2) * 1000), "Europe/London")
+        yield place, [], [word() for _ in range(rng.randint(0, 12))]
+
+
+def _time(fn, args):
+    times = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times), times[int(0.95 * (len(times) - 1))]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", type=Path, help="GeoNames cities dump to build an index from")
+    parser.add_argument("--synthetic", type=int, help="build an index of N random places instead")
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.source or args.synthetic:
+            path = Path(tmp) / "gazetteer.bin"
+            entries = read_geonames(args.source) if args.source else _synthetic(args.synthetic)
+            start = time.perf_counter()
+            write_gazetteer(entries, path)
+            print(f"built {path.stat().st_size / 2**20:.1f} MiB index in {time.perf_counter() - start:.1f} s")
+            gazetteer_module.DEFAULT_GAZETTEER_PATH = path
+        gazetteer_module.reset_gazetteer()
+        start = time.perf_counter()
+        gazetteer = gazetteer_module.get_gazetteer()
+        if gazetteer is None:
+            parser.error("no gazetteer file; pass --source or --synthetic")
+        print(f"loaded {gazetteer.place_count} places, {gazetteer.key_count} names "
+              f"in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        rng = random.Random(11)
+        names = [gazetteer.place(rng.randrange(gazetteer.place_count)).name for _ in range(args.lookups)]
+        typos = [name[:2] + name[3] + name[2] + name[4:] if len(name) > 4 else name for name in names]
+        rows = [
+            ("resolve", *_time(gazetteer.resolve, names)),
+            ("search (3-letter prefix)", *_time(lambda q: gazetteer.search(q[:3]), names)),
+            ("search (misspelt)", *_time(gazetteer.search, typos)),
+        ]
+        for name, median, p95 in rows:
+            print(f"{name:<28} median {median * 1e6:8.1f} us  p95 {p95 * 1e6:8.1f} us")
+
+        def offline(query, timeout):
+            raise RuntimeError(f"geocoding service called for {query!r}")
+
+        geocoding.nominatim_lookup = offline
+        geocoding.reset_geocode_cache()
+        from app import app
+
+        # The endpoint logs and prints every step of a judgment
+        logging.disable(logging.CRITICAL)
+        client = app.test_client()
+        times = []
+        for i in range(args.requests):
+            payload = {
+                "question": "Will I get the job?",
+                "location": gazetteer.place(i % gazetteer.place_count).label,
+                "useCurrentTime": False,
+                "date": "2024-03-15",
+                "time": f"{9 + i % 12:02d}:{i % 60:02d}",
+            }
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                response = client.post("/api/calculate-chart", json=payload)
+            times.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.get_json()
+        times.sort()
+        print(f"{'/api/calculate-chart':<28} median {statistics.median(times) * 1000:8.1f} ms  "
+              f"p95 {times[int(0.95 * (len(times) - 1))] * 1000:8.1f} ms  (no network)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Speed/accuracy trade-off of each ephemeris precision profile.
+
+For a sample of charts, every profile in ``ephemeris.precision.profiles`` is
+timed on sequential ``calculate_chart`` calls and one
+``calculate_chart_batch`` call, and compared with ``precise`` on planetary
+longitude, speed and solved perfection time of applying aspects.
+
+Run from the backend directory::
+
+    python benchmarks/precision_profiles.py --charts 300
+"""
+
+import argparse
+import datetime
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.precision import precision_profile_names
+from horary_engine.chart_batch import BATCH_PLANETS
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+REFERENCE = "precise"
+
+
+def _charts(calculator, samples, profile):
+    return [
+        calculator.calculate_chart(dt, dt, "UTC", lat, lon, "benchmark", precision=profile)
+        for dt, lat, lon in samples
+    ]
+
+
+def _perfection_times(charts):
+    """(chart index, planet pair) -> solved days to perfection for applying aspects."""
+    times = {}
+    for i, chart in enumerate(charts):
+        for aspect in chart.aspects:
+            if aspect.applying and np.isfinite(aspect.time_to_perfection):
+                times[(i, aspect.planet1, aspect.planet2)] = aspect.time_to_perfection
+    return times
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+
+    rng = np.random.default_rng(args.seed)
+    start = datetime.datetime(1950, 1, 1)
+    minutes = rng.integers(0, 60 * 24 * 365 * 100, args.charts)
+    times = [start + datetime.timedelta(minutes=int(m)) for m in minutes]
+    lats = rng.uniform(-60, 60, args.charts)
+    lons = rng.uniform(-180, 180, args.charts)
+    samples = list(zip(times, lats, lons))
+
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    reference = _charts(calculator, samples, REFERENCE)
+    reference_times = _perfection_times(reference)
+
+    print(f"{args.charts} charts, maximum differences from profile '{REFERENCE}'\n")
+    print(f"{'profile':<10} {'charts/s':>9} {'batch/s':>9} {'dlon arcsec':>12} "
+          f"{'dspeed deg/d':>13} {'dperf min':>10} {'aspects':>8}")
+    for profile in precision_profile_names():
+        # Untimed pass so lazily fitted providers are measured warm
+        _charts(calculator, samples, profile)
+
+        t0 = time.perf_counter()
+        charts = _charts(calculator, samples, profile)
+        sequential_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        calculator.calculate_chart_batch(times, lats, lons, precision=profile)
+        batch_s = time.perf_counter() - t0
+
+        dlon = dspeed = 0.0
+        for chart, ref in zip(charts, reference):
+            for planet in BATCH_PLANETS:
+                a, b = chart.planets[planet], ref.planets[planet]
+                dlon = max(dlon, abs((a.longitude - b.longitude + 180.0) % 360.0 - 180.0))
+                dspeed = max(dspeed, abs(a.speed - b.speed))
+
+        solved = _perfection_times(charts)
+        common = solved.keys() & reference_times.keys()
+        dperf = max((abs(solved[k] - reference_times[k]) for k in common), default=0.0)
+
+        print(f"{profile:<10} {args.charts / sequential_s:>9,.0f} {args.charts / batch_s:>9,.0f} "
+              f"{dlon * 3600:>12.4f} {dspeed:>13.2e} {dperf * 1440:>10.3f} {len(common):>8}")
+
+
+if __name__ == "__main__":
+    main()
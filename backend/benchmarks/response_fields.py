@@ -0,0 +1,86 @@
+"""Latency of ``/api/calculate-chart`` with and without field projection.
+
+Posts the same questions for ``--charts`` chart times through the Flask test
+client, once for the full response and once per ``--fields`` projection, and
+reports the median and p95 request time and the response size. Geocoding
+resolves to fixed coordinates so network lookups do not dominate the timing.
+
+Run from the backend directory::
+
+    python benchmarks/response_fields.py --charts 100
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+
+PROJECTIONS = ["judgment,confidence,timing", "judgment,confidence,timing,ledger,rationale"]
+QUESTIONS = ["Will I get the job?", "Will he return?", "Will I sell my house?", "Will I pass the exam?"]
+
+
+def _payloads(n):
+    start = datetime.datetime(2001, 1, 1, 9, 0)
+    for i in range(n):
+        dt = start + datetime.timedelta(hours=53 * i)
+        yield {
+            "question": QUESTIONS[i % len(QUESTIONS)],
+            "location": "London, UK",
+            "useCurrentTime": False,
+            "date": dt.strftime("%Y-%m-%d"),
+            "time": dt.strftime("%H:%M"),
+            "timezone": "Europe/London",
+        }
+
+
+def _run(client, payloads, fields=None):
+    url = "/api/calculate-chart" + (f"?fields={fields}" if fields else "")
+    times, sizes = [], []
+    for payload in payloads:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = client.post(url, json=payload)
+        times.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_json()
+        sizes.append(len(response.data))
+    times.sort()
+    return statistics.median(times), times[int(0.95 * (len(times) - 1))], statistics.mean(sizes)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=100)
+    parser.add_argument("--fields", action="append", help="projection to time (repeatable)")
+    args = parser.parse_args(argv)
+
+    engine_module.safe_geocode = lambda location, timeout=10: (51.5074, -0.1278, location)
+    from app import app
+
+    # The endpoint logs and prints every step of a judgment
+    logging.disable(logging.CRITICAL)
+    client = app.test_client()
+    payloads = list(_payloads(args.charts))
+    _run(client, payloads[:2])  # warm caches and imports
+
+    rows = [("full", *_run(client, payloads))]
+    for fields in args.fields or PROJECTIONS:
+        rows.append((fields, *_run(client, payloads, fields)))
+
+    full_median = rows[0][1]
+    print(f"charts: {args.charts}")
+    for name, median, p95, size in rows:
+        print(f"{name:<48} median {median * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  "
+              f"{size / 1024:7.1f} KiB  x{full_median / median:.2f}")
+
+
+if __name__ == "__main__":
+    main()
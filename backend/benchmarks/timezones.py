@@ -0,0 +1,73 @@
+"""Cold and warm timezone lookup latency.
+
+Compares what ``/api/get-timezone`` and ``/api/current-time`` used to pay per
+request (constructing a ``TimezoneManager`` and querying the polygons) with
+the shared manager: polygon lookups, raster lookups and cache hits, each
+over ``--points`` random coordinates between 60 S and 70 N.
+
+Run from the backend directory::
+
+    python benchmarks/timezones.py --points 5000
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.services.geolocation import TimezoneManager
+from horary_engine.services.timezone_raster import get_timezone_raster
+
+
+def _time(fn, points):
+    times = []
+    for lat, lon in points:
+        start = time.perf_counter()
+        fn(lat, lon)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times), times[int(0.95 * (len(times) - 1))]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--constructions", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Polygon lookups log every step
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(5)
+    points = [(rng.uniform(-60, 70), rng.uniform(-180, 180)) for _ in range(args.points)]
+
+    def per_request(lat, lon):
+        TimezoneManager().get_timezone_for_location(lat, lon)
+
+    raster = get_timezone_raster()
+    polygons = TimezoneManager(cache_size=0)
+    rastered = TimezoneManager(cache_size=0, raster=raster)
+    cached = TimezoneManager(raster=raster)
+    for lat, lon in points:
+        cached.get_timezone_for_location(lat, lon)
+
+    rows = [
+        ("new manager per request", *_time(per_request, points[:args.constructions])),
+        ("polygons", *_time(polygons.get_timezone_for_location, points)),
+        ("raster, polygons at borders", *_time(rastered.get_timezone_for_location, points)),
+        ("cache hit", *_time(cached.get_timezone_for_location, points)),
+    ]
+    if raster is not None:
+        stats = rastered.stats()
+        share = stats["raster_hits"] / (stats["raster_hits"] + stats["polygon_lookups"])
+        print(f"raster: {raster.resolution} deg cells, answered {share:.1%} of lookups")
+    for name, median, p95 in rows:
+        print(f"{name:<30} median {median * 1e6:10.1f} us  p95 {p95 * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
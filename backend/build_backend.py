@@ -35,6 +35,14 @@ def build_backend():
         "--add-data", f"{backend_dir / 'production_server.py'};.",
         # Include rule pack YAMLs
         "--add-data", f"{backend_dir / 'rules_lilly_general_v1.yaml'};.",
+        # Precomputed planetary station calendar
+        "--add-data", f"{backend_dir / 'horary_engine' / 'calculation' / 'data' / 'station_calendar.bin'};horary_engine/calculation/data",
+        # Precomputed lunar ingress / void-of-course calendar
+        "--add-data", f"{backend_dir / 'horary_engine' / 'calculation' / 'data' / 'lunar_calendar.bin'};horary_engine/calculation/data",
+        # Swiss Ephemeris .se1 files (see horary_engine/calculation/ephemeris_data.py)
+        "--add-data", f"{backend_dir / 'horary_engine' / 'calculation' / 'data' / 'ephe'};horary_engine/calculation/data/ephe",
+        # Offline gazetteer (see horary_engine/services/gazetteer.py)
+        "--add-data", f"{backend_dir / 'horary_engine' / 'services' / 'data'};horary_engine/services/data",
         # Hidden imports for modules that PyInstaller might miss
         "--hidden-import", "swisseph",
         "--hidden-import", "timezonefinder",
@@ -5,7 +5,7 @@ a = Analysis(
     ['C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\app.py'],
     pathex=[],
     binaries=[],
-    datas=[('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_constants.yaml', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_config.py', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\production_server.py', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\rules_lilly_general_v1.yaml', '.')],
+    datas=[('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_constants.yaml', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_config.py', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\production_server.py', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\rules_lilly_general_v1.yaml', '.'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_engine\\calculation\\data\\station_calendar.bin', 'horary_engine/calculation/data'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_engine\\calculation\\data\\lunar_calendar.bin', 'horary_engine/calculation/data'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_engine\\calculation\\data\\ephe', 'horary_engine/calculation/data/ephe'), ('C:\\Users\\sabaa\\Downloads\\codexhorary\\backend\\horary_engine\\services\\data', 'horary_engine/services/data')],
     hiddenimports=['swisseph', 'timezonefinder', 'geopy', 'pytz', 'flask', 'flask_cors'],
     hookspath=[],
     hooksconfig={},
@@ -2,15 +2,31 @@
 Horary Engine Configuration Loader
 Loads and caches configuration from YAML file with lazy singleton pattern
 
+The YAML is compiled into an immutable snapshot: every section becomes a
+frozen, slotted ``ConfigSection`` (lists become tuples) and the root carries
+``tables``, the derived orb tables the aspect code needs. ``cfg()`` returns
+the current snapshot; ``reload_config()`` swaps in a new one atomically, so
+a reload never leaves a half-updated configuration and caches keyed on the
+snapshot object rebuild on their own. ``config_snapshot()`` pins one
+snapshot for a whole request.
+
 Created for horary_engine.py refactor
 """
 
+import functools
 import os
+import threading
+import time
 import yaml
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +36,205 @@ class HoraryError(Exception):
     pass
 
 
+# Classical planets and aspects covered by the compiled orb tables
+TABLE_PLANETS: Tuple[str, ...] = ("Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn")
+TABLE_ASPECTS: Tuple[str, ...] = ("conjunction", "sextile", "square", "trine", "opposition")
+
+# Share of the combined moieties allowed per aspect; other aspects get 0.8
+MOIETY_ASPECT_FACTORS: Mapping[str, float] = MappingProxyType({
+    "conjunction": 1.0,
+    "opposition": 1.0,
+    "trine": 0.85,
+    "square": 0.85,
+    "sextile": 0.7,
+})
+
+DEFAULT_ASPECT_ORB = 8.0
+
+
+class ConfigSection:
+    """Frozen configuration section whose attributes are the YAML keys.
+
+    Each distinct key set gets its own slotted subclass, so attribute access
+    is a slot read and a section cannot be modified once compiled.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Configuration is read-only; cannot set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Configuration is read-only; cannot delete '{name}'")
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and section_items(self) == section_items(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key}={value!r}" for key, value in section_items(self).items())
+        return f"{type(self).__name__}({items})"
+
+    def __reduce__(self):
+        # Section classes are generated, so pickle by value
+        return (_restore_section, (section_items(self), "tables" in type(self).__slots__))
+
+
+@functools.lru_cache(maxsize=None)
+def _section_type(keys: Tuple[str, ...], root: bool = False) -> type:
+    name = "ConfigSnapshot" if root else "ConfigSection"
+    return type(name, (ConfigSection,), {"__slots__": keys + (("tables",) if root else ())})
+
+
+def _freeze(value: Any) -> Any:
+    """Compile YAML data into frozen sections and tuples."""
+    if isinstance(value, dict):
+        return _make_section({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _make_section(values: Dict[str, Any], root: bool = False, **extra: Any) -> ConfigSection:
+    section = object.__new__(_section_type(tuple(values), root))
+    for key, item in {**values, **extra}.items():
+        object.__setattr__(section, key, item)
+    return section
+
+
+def _restore_section(values: Dict[str, Any], root: bool) -> ConfigSection:
+    if root:
+        return _make_section(values, root=True, tables=compile_tables(_make_section(values)))
+    return _make_section(values)
+
+
+def section_items(section: Any) -> Dict[str, Any]:
+    """Keys and values of a configuration section (frozen or ``SimpleNamespace``)."""
+    if isinstance(section, ConfigSection):
+        return {key: getattr(section, key) for key in type(section).__slots__ if key != "tables"}
+    return dict(vars(section))
+
+
+@dataclass(frozen=True)
+class CompiledTables:
+    """Orb tables derived from the ``orbs`` section.
+
+    ``aspect_orb`` follows :data:`TABLE_ASPECTS`. ``moiety`` holds half of
+    each planet's orb (``None`` when the configuration has no moieties).
+    ``max_orb`` is the allowed orb per planet pair and aspect, shaped
+    ``(7, 7, 5)`` over :data:`TABLE_PLANETS` and :data:`TABLE_ASPECTS`:
+    the moiety-based orb, or the aspect orb plus the luminary bonuses when
+    that is zero.
+    """
+
+    aspect_orb: Tuple[float, ...]
+    aspect_index: Mapping[str, int]
+    moiety: Optional[Mapping[str, float]]
+    planet_index: Mapping[str, int]
+    max_orb: np.ndarray
+
+    def orb(self, config_key: str) -> float:
+        """Configured orb of an aspect, by its ``orbs`` key."""
+        index = self.aspect_index.get(config_key)
+        return self.aspect_orb[index] if index is not None else DEFAULT_ASPECT_ORB
+
+    def moiety_orb(self, planet1: str, planet2: str, config_key: str) -> float:
+        """Moiety-based orb for two planets (0 when moieties are not configured)."""
+        if self.moiety is None:
+            return 0
+        combined = self.moiety.get(planet1, 0.0) + self.moiety.get(planet2, 0.0)
+        return combined * MOIETY_ASPECT_FACTORS.get(config_key, 0.8)
+
+
+def compile_tables(config: Any) -> CompiledTables:
+    """Derive :class:`CompiledTables` from a configuration namespace."""
+    orbs = config.orbs
+    aspect_orb = []
+    for key in TABLE_ASPECTS:
+        orb = getattr(orbs, key, None)
+        if orb is None:
+            logger.warning(f"Orb not found for {key}, using default {DEFAULT_ASPECT_ORB}")
+            orb = DEFAULT_ASPECT_ORB
+        aspect_orb.append(orb)
+
+    moieties = getattr(orbs, "moieties", None)
+    moiety = None
+    if moieties is not None:
+        moiety = MappingProxyType({name: full / 2.0 for name, full in section_items(moieties).items()})
+
+    tables = CompiledTables(
+        aspect_orb=tuple(aspect_orb),
+        aspect_index=MappingProxyType({key: k for k, key in enumerate(TABLE_ASPECTS)}),
+        moiety=moiety,
+        planet_index=MappingProxyType({name: i for i, name in enumerate(TABLE_PLANETS)}),
+        max_orb=np.zeros((len(TABLE_PLANETS), len(TABLE_PLANETS), len(TABLE_ASPECTS))),
+    )
+    max_orb = tables.max_orb
+    for i, p1 in enumerate(TABLE_PLANETS):
+        for j, p2 in enumerate(TABLE_PLANETS):
+            for k, key in enumerate(TABLE_ASPECTS):
+                orb = tables.moiety_orb(p1, p2, key)
+                # Fallback to configured orbs if moiety system disabled
+                if orb == 0:
+                    orb = aspect_orb[k]
+                    if "Sun" in (p1, p2):
+                        orb += orbs.sun_orb_bonus
+                    if "Moon" in (p1, p2):
+                        orb += orbs.moon_orb_bonus
+                max_orb[i, j, k] = orb
+    max_orb.flags.writeable = False
+    return tables
+
+
+def config_tables(config: Any) -> CompiledTables:
+    """The compiled tables of a snapshot, or compiled now for another namespace."""
+    tables = getattr(config, "tables", None)
+    return tables if isinstance(tables, CompiledTables) else compile_tables(config)
+
+
+def config_file_path() -> Path:
+    """The YAML file in use: ``HORARY_CONFIG`` or ``horary_constants.yaml``."""
+    # Allow override via environment variable for testing
+    config_path = os.environ.get('HORARY_CONFIG')
+    if config_path:
+        return Path(config_path)
+    # Default to horary_constants.yaml in same directory as this file
+    return Path(__file__).parent / 'horary_constants.yaml'
+
+
+def load_snapshot(config_file: Optional[Path] = None) -> ConfigSection:
+    """Read and compile a configuration file into a new snapshot."""
+    config_file = Path(config_file) if config_file else config_file_path()
+    try:
+        if not config_file.exists():
+            raise HoraryError(f"Configuration file not found: {config_file}")
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config_dict = yaml.safe_load(f)
+
+        if not config_dict:
+            raise HoraryError(f"Empty or invalid configuration file: {config_file}")
+        if 'tables' in config_dict:
+            raise HoraryError("'tables' is reserved for the compiled orb tables")
+
+        sections = {key: _freeze(value) for key, value in config_dict.items()}
+        tables = compile_tables(_make_section(sections))
+        return _make_section(sections, root=True, tables=tables)
+
+    except yaml.YAMLError as e:
+        raise HoraryError(f"Invalid YAML in configuration file {config_file}: {e}")
+    except HoraryError:
+        raise
+    except Exception as e:
+        raise HoraryError(f"Failed to load configuration from {config_file}: {e}")
+
+
 class HoraryConfig:
     """Lazy singleton configuration loader for horary constants"""
     
     _instance: Optional['HoraryConfig'] = None
-    _config: Optional[SimpleNamespace] = None
+    _config: Optional[ConfigSection] = None
     
     def __new__(cls) -> 'HoraryConfig':
         if cls._instance is None:
@@ -37,48 +247,12 @@ class HoraryConfig:
     
     def _load_config(self) -> None:
         """Load configuration from YAML file"""
-        
-        # Allow override via environment variable for testing
-        config_path = os.environ.get('HORARY_CONFIG')
-        
-        if config_path:
-            config_file = Path(config_path)
-        else:
-            # Default to horary_constants.yaml in same directory as this file
-            config_file = Path(__file__).parent / 'horary_constants.yaml'
-        
-        try:
-            if not config_file.exists():
-                raise HoraryError(f"Configuration file not found: {config_file}")
-            
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_dict = yaml.safe_load(f)
-            
-            if not config_dict:
-                raise HoraryError(f"Empty or invalid configuration file: {config_file}")
-            
-            # Convert nested dict to nested SimpleNamespace for dot notation access
-            self._config = self._dict_to_namespace(config_dict)
-            
-            logger.info(f"Loaded horary configuration from {config_file}")
-            
-        except yaml.YAMLError as e:
-            raise HoraryError(f"Invalid YAML in configuration file {config_file}: {e}")
-        except Exception as e:
-            raise HoraryError(f"Failed to load configuration from {config_file}: {e}")
-    
-    def _dict_to_namespace(self, d: Dict[str, Any]) -> SimpleNamespace:
-        """Convert nested dictionary to nested SimpleNamespace"""
-        if isinstance(d, dict):
-            return SimpleNamespace(**{k: self._dict_to_namespace(v) for k, v in d.items()})
-        elif isinstance(d, list):
-            return [self._dict_to_namespace(item) for item in d]
-        else:
-            return d
+        config_file = config_file_path()
+        _install(load_snapshot(config_file), config_file)
     
     @property
-    def config(self) -> SimpleNamespace:
-        """Get the configuration namespace"""
+    def config(self) -> ConfigSection:
+        """Get the configuration snapshot"""
         if self._config is None:
             self._load_config()
         return self._config
@@ -128,23 +302,7 @@ class HoraryConfig:
     def validate_required_keys(self) -> None:
         """Validate that all required configuration keys are present"""
         
-        required_keys = [
-            'timing.default_moon_speed_fallback',
-            'orbs.conjunction',
-            'confidence.base_confidence',
-            'confidence.lunar_confidence_caps.favorable',
-            'confidence.lunar_confidence_caps.unfavorable',
-            'radicality.asc_too_early',
-            'radicality.asc_too_late'
-        ]
-        
-        missing_keys = []
-        for key in required_keys:
-            try:
-                self.require(key)
-            except HoraryError:
-                missing_keys.append(key)
-        
+        missing_keys = _missing_keys(self.config)
         if missing_keys:
             raise HoraryError(f"Missing required configuration keys: {missing_keys}")
     
@@ -155,6 +313,49 @@ class HoraryConfig:
         cls._config = None
 
 
+REQUIRED_KEYS = [
+    'timing.default_moon_speed_fallback',
+    'orbs.conjunction',
+    'confidence.base_confidence',
+    'confidence.lunar_confidence_caps.favorable',
+    'confidence.lunar_confidence_caps.unfavorable',
+    'radicality.asc_too_early',
+    'radicality.asc_too_late'
+]
+
+
+def _missing_keys(config: Any) -> list:
+    missing_keys = []
+    for key_path in REQUIRED_KEYS:
+        value = config
+        try:
+            for key in key_path.split('.'):
+                value = getattr(value, key)
+        except AttributeError:
+            missing_keys.append(key_path)
+    return missing_keys
+
+
+# Snapshot bookkeeping, updated only under _reload_lock
+_reload_lock = threading.Lock()
+_generation = 0
+_loaded_from: Optional[Path] = None
+_loaded_at: Optional[float] = None
+
+# Snapshot pinned by config_snapshot() for the current request
+_pinned: ContextVar[Optional[ConfigSection]] = ContextVar("horary_config_snapshot", default=None)
+
+
+def _install(snapshot: ConfigSection, config_file: Path) -> None:
+    global _generation, _loaded_from, _loaded_at
+    with _reload_lock:
+        HoraryConfig._config = snapshot
+        _generation += 1
+        _loaded_from = config_file
+        _loaded_at = time.time()
+    logger.info(f"Loaded horary configuration from {config_file}")
+
+
 # Global configuration instance
 def get_config() -> HoraryConfig:
     """Get the global configuration instance"""
@@ -162,9 +363,122 @@ def get_config() -> HoraryConfig:
 
 
 # Convenience function for quick access
-def cfg() -> SimpleNamespace:
-    """Get configuration namespace directly"""
-    return get_config().config
+def cfg() -> ConfigSection:
+    """Get the configuration snapshot directly
+
+    Inside :func:`config_snapshot` this is the snapshot pinned for the
+    request, otherwise the current one.
+    """
+    pinned = _pinned.get()
+    if pinned is not None:
+        return pinned
+    config = HoraryConfig._config
+    if config is None:
+        config = get_config().config
+    return config
+
+
+@contextmanager
+def config_snapshot() -> Iterator[ConfigSection]:
+    """Pin the current snapshot for the calling context.
+
+    Everything that calls :func:`cfg` inside the block, including code
+    running after a concurrent :func:`reload_config`, sees the same values.
+    """
+    snapshot = cfg()
+    token = _pinned.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _pinned.reset(token)
+
+
+def with_config_snapshot(func: Callable) -> Callable:
+    """Decorator running ``func`` inside :func:`config_snapshot`."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with config_snapshot():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def reload_config(config_file: Optional[Path] = None) -> ConfigSection:
+    """Load the configuration file again and swap it in atomically.
+
+    The new snapshot is compiled and validated before it replaces the
+    current one; on any error the current snapshot stays in place and
+    :class:`HoraryError` is raised. Requests already running keep the
+    snapshot they pinned.
+    """
+    config_file = Path(config_file) if config_file else config_file_path()
+    snapshot = load_snapshot(config_file)
+    missing_keys = _missing_keys(snapshot)
+    if missing_keys:
+        raise HoraryError(f"Missing required configuration keys: {missing_keys}")
+    _install(snapshot, config_file)
+    return snapshot
+
+
+def config_status() -> Dict[str, Any]:
+    """Source file, load time and generation of the current snapshot."""
+    cfg()
+    return {
+        "path": str(_loaded_from) if _loaded_from else None,
+        "loaded_at": _loaded_at,
+        "generation": _generation,
+    }
+
+
+class ConfigWatcher:
+    """Reload the configuration when its file changes.
+
+    Polls the file's modification time from a daemon thread. Each worker
+    process runs its own watcher, so one edit reaches every worker without
+    a restart. A file that fails to load is logged and the previous
+    snapshot stays active.
+    """
+
+    def __init__(self, interval: float = 2.0, config_file: Optional[Path] = None):
+        self.interval = interval
+        self.config_file = Path(config_file) if config_file else config_file_path()
+        self._mtime = self._read_mtime()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _read_mtime(self) -> Optional[float]:
+        try:
+            return self.config_file.stat().st_mtime
+        except OSError:
+            return None
+
+    def check(self) -> bool:
+        """Reload if the file changed since the last check; True when reloaded."""
+        mtime = self._read_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            reload_config(self.config_file)
+        except HoraryError as e:
+            logger.error(f"Configuration reload failed, keeping previous configuration: {e}")
+            return False
+        return True
+
+    def start(self) -> 'ConfigWatcher':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="horary-config-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
 
 
 # Validate configuration on import (unless in test environment)
@@ -4,16 +4,24 @@ from __future__ import annotations
 
 import datetime
 import math
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import swisseph as swe
 
-from horary_config import cfg
+from horary_config import cfg, config_tables
 try:
     from ..models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
 from .calculation.helpers import days_to_sign_exit
+from .calculation.lunar_timeline import TIMELINE_PLANETS, lunar_timeline
+from .perfection import PerfectionMatrix, solve_aspect_time
+
+
+# The Moon crosses a sign in at most about 2.6 days
+_MOON_SIGN_DAYS = 3.0
 
 
 def _signed_longitude_delta(lon1: float, lon2: float) -> float:
@@ -112,80 +120,30 @@ def calculate_moon_last_aspect(
 
 def calculate_moon_next_aspect(
     planets: Dict[Planet, PlanetPosition],
-    _jd_ut: float,
-    ignore_orb_for_voc: bool = False,
+    jd_ut: float,
 ) -> Optional[LunarAspect]:
     """Calculate Moon's next applying aspect.
 
-    Cross-sign perfection is disallowed; aspects must perfect before the Moon
-    changes signs.
-
-    Parameters
-    ----------
-    ignore_orb_for_voc:
-        When True, do not gate candidates by current-orb proximity. This is
-        used by the traditional Void-of-Course check, which should consider
-        any applying Ptolemaic aspect that perfects before sign exit, even if
-        it's currently outside display orbs.
+    This is the first exact Ptolemaic aspect to a classical planet on the
+    Moon's :func:`lunar_timeline` before it leaves its sign, whatever the
+    current orb. Cross-sign perfection is disallowed. The lunar calendar's
+    void periods end at the same events, so the Moon is void of course
+    exactly when this returns ``None``.
     """
 
-    moon_pos = planets[Planet.MOON]
-
-    # Only consider classical planets as targets
-    classical_targets = {
-        Planet.SUN,
-        Planet.MERCURY,
-        Planet.VENUS,
-        Planet.MARS,
-        Planet.JUPITER,
-        Planet.SATURN,
-    }
-
-    # Find closest applying aspect
-    applying_aspects: List[LunarAspect] = []
-
-    for planet, planet_pos in planets.items():
-        if planet not in classical_targets:
-            continue
-
-        # Calculate current separation using signed delta
-        separation = abs(_signed_longitude_delta(moon_pos.longitude, planet_pos.longitude))
-
-        # Check each aspect type
-        for aspect_type in Aspect:
-            orb_diff = abs(separation - aspect_type.degrees)
-            max_orb = aspect_type.orb
-
-            # For general display/UI we gate by orb. For VOC determination,
-            # we must not exclude future applying aspects that are currently
-            # outside the orb but still perfect before sign exit.
-            if ignore_orb_for_voc or orb_diff <= max_orb:
-                t = time_to_perfection(moon_pos, planet_pos, aspect_type)
-                if t > 0:
-                    within_sign = _will_perfect_before_sign_exit(
-                        moon_pos, planet_pos, aspect_type, t
-                    )
-
-                    # Skip aspects that perfect after either planet leaves its current sign
-                    if not within_sign:
-                        continue
-
-                    applying_aspects.append(
-                        LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=orb_diff,
-                            perfection_eta_days=t,
-                            perfection_eta_description=format_timing_description(t),
-                            applying=True,
-                        )
-                    )
-
-    # Return soonest (smallest time_to_exact)
-    if applying_aspects:
-        return min(applying_aspects, key=lambda x: x.perfection_eta_days)
-
+    targets = [planet for planet in planets if planet in TIMELINE_PLANETS]
+    for event in lunar_timeline(jd_ut, _MOON_SIGN_DAYS, planets=targets):
+        if event.is_ingress:
+            return None
+        return LunarAspect(
+            planet=event.planet,
+            aspect=event.aspect,
+            orb=event.orb,
+            degrees_difference=event.orb,
+            perfection_eta_days=event.days,
+            perfection_eta_description=format_timing_description(event.days),
+            applying=True,
+        )
     return None
 
 
@@ -229,117 +187,237 @@ def format_timing_description(days: float) -> str:
 
 
 def calculate_enhanced_aspects(
-    planets: Dict[Planet, PlanetPosition], jd_ut: float
+    planets: Dict[Planet, PlanetPosition], jd_ut: float,
+    perfections: Optional[PerfectionMatrix] = None,
 ) -> List[AspectInfo]:
-    """Enhanced aspect calculation with configuration"""
-    aspects: List[AspectInfo] = []
+    """Enhanced aspect calculation with configuration
+
+    Candidates, orbs, applying flags and linear perfection times for every
+    pair come from :func:`aspect_matrices` in a few array operations; only
+    applying aspects are then timed exactly against the ephemeris. Passing
+    the chart's ``perfections`` matrix records those solved times so later
+    perfection checks reuse them.
+    """
     planet_list = list(planets.keys())
+    if len(planet_list) < 2:
+        return []
     config = cfg()
+    max_future_days = config.timing.max_future_days
 
-    for i, planet1 in enumerate(planet_list):
-        for planet2 in planet_list[i + 1 :]:
-            pos1 = planets[planet1]
-            pos2 = planets[planet2]
+    positions = [planets[planet] for planet in planet_list]
+    longitude = np.array([pos.longitude for pos in positions], dtype=float)
+    speed = np.array([pos.speed for pos in positions], dtype=float)
+    matrices = aspect_matrices(longitude, speed, orb_limit_matrix(planet_list, config))
 
-            # Calculate angular separation using signed delta
-            angle_diff = abs(_signed_longitude_delta(pos1.longitude, pos2.longitude))
+    # Per-pair work is only left for the few pairs in aspect
+    codes = matrices.code.tolist()
+    orbs = matrices.orb.tolist()
+    applying_flags = matrices.applying.tolist()
+    times = matrices.time_to_perfection.tolist()
 
-            # Check each traditional aspect
-            aspect_candidates: List[AspectInfo] = []
-            for aspect_type in Aspect:
-                orb_diff = abs(angle_diff - aspect_type.degrees)
-
-                # ENHANCED: Traditional moiety-based orb calculation
-                max_orb = calculate_moiety_based_orb(
-                    planet1, planet2, aspect_type, config
-                )
-
-                # Fallback to configured orbs if moiety system disabled
-                if max_orb == 0:
-                    max_orb = aspect_type.orb
-                    # Luminary bonuses (legacy)
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-
-                if orb_diff <= max_orb:
-                    # Classify applying/separating via orb shrink (direction-aware, incl. retrograde)
-                    applying_raw = _is_orb_shrinking(pos1, pos2, aspect_type)
-                    # Compute analytical time for supplemental timing info only
-                    t = time_to_perfection(pos1, pos2, aspect_type)
-                    if applying_raw:
-                        within_sign = (
-                            math.isfinite(t)
-                            and t > 0
-                            and _will_perfect_before_sign_exit(
-                                pos1, pos2, aspect_type, t
-                            )
+    aspects: List[AspectInfo] = []
+    for i, pos1 in enumerate(positions):
+        for j in range(i + 1, len(positions)):
+            if codes[i][j] < 0:
+                continue
+            pos2 = positions[j]
+            aspect_type = ASPECT_ORDER[codes[i][j]]
+            orb = orbs[i][j]
+            applying = applying_flags[i][j]
+            t = times[i][j]
+
+            within_sign = False
+            exact_time = None
+            if applying:
+                if jd_ut:
+                    # Exact perfection from the ephemeris when it is in range
+                    if perfections is not None:
+                        solved = perfections.time_to_perfection(
+                            planet_list[i], planet_list[j], aspect_type, max_future_days
                         )
                     else:
-                        within_sign = False
+                        solved = solve_aspect_time(pos1, pos2, aspect_type, jd_ut, max_future_days)
+                    if solved is not None:
+                        t = solved
+                # Applying/separating is kinematic (orb shrinking); cross-sign
+                # motion is indicated separately by `perfection_within_sign`
+                within_sign = _will_perfect_before_sign_exit(pos1, pos2, aspect_type, t)
+                if t < max_future_days:
+                    exact_time = _exact_time(jd_ut, t)
+
+            aspects.append(
+                AspectInfo(
+                    planet1=planet_list[i],
+                    planet2=planet_list[j],
+                    aspect=aspect_type,
+                    orb=orb,
+                    applying=applying,
+                    time_to_perfection=t,
+                    perfection_within_sign=within_sign,
+                    exact_time=exact_time,
+                    # If already very close, report a small value
+                    degrees_to_exact=max(orb, 0.1),
+                )
+            )
 
-                    # Applying/separating should be determined kinematically
-                    # (orb shrinking) and not depend on whether perfection
-                    # occurs within the current signs. Cross-sign motion is
-                    # indicated separately by `perfection_within_sign`.
-                    applying_effective = applying_raw
+    return aspects
 
-                    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
-                        pos1, pos2, aspect_type, jd_ut, t
-                    )
 
-                    aspect_candidates.append(
-                        AspectInfo(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            applying=applying_effective,
-                            time_to_perfection=t,
-                            perfection_within_sign=within_sign,
-                            exact_time=exact_time,
-                            degrees_to_exact=degrees_to_exact,
-                        )
-                    )
+def _exact_time(jd_ut: float, t: float) -> Optional[datetime.datetime]:
+    """UTC datetime ``t`` days after ``jd_ut``, or ``None`` if it cannot be formed."""
+    try:
+        year, month, day, hour, minute, second = swe.jdut1_to_utc(jd_ut + t, 1)  # Gregorian
+        return datetime.datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second)
+        )
+    except Exception:
+        return None
 
-            if aspect_candidates:
-                # Choose candidate with smallest orb difference
-                best_aspect = min(aspect_candidates, key=lambda x: x.orb)
-                aspects.append(best_aspect)
 
-    return aspects
+# ---------------------------------------------------------------------------
+# Vectorised aspect matrices
+# ---------------------------------------------------------------------------
+
+# Aspect codes in the matrices index this list; -1 means no aspect
+ASPECT_ORDER: List[Aspect] = list(Aspect)
+_ASPECT_DEGREES = np.array([aspect.degrees for aspect in ASPECT_ORDER], dtype=float)
+
+# Window used to decide applying/separating (as in _is_orb_shrinking)
+APPLYING_DT_DAYS = 0.05
+
+
+@dataclass
+class AspectMatrices:
+    """Closest in-orb aspect for every planet pair of one or many charts.
+
+    Arrays are shaped ``(..., P, P)`` for positions shaped ``(..., P)`` and
+    are symmetric; the diagonal never holds an aspect.
+    """
+
+    code: np.ndarray  # index into ASPECT_ORDER, -1 if none
+    orb: np.ndarray  # NaN if none
+    applying: np.ndarray
+    time_to_perfection: np.ndarray  # linear extrapolation, NaN if none
+
+
+_orb_limit_cache: Dict[Tuple[Planet, ...], Tuple[object, np.ndarray]] = {}
+
+
+def orb_limit_matrix(planets: Sequence[Planet], config=None) -> np.ndarray:
+    """Allowed orb per planet pair and aspect, shape ``(P, P, 5)``.
+
+    Moiety-based orbs, falling back to the configured aspect orbs plus the
+    luminary bonuses. Classical planets are read from the configuration's
+    compiled ``max_orb`` table. Cached until the configuration object changes.
+    """
+    config = config or cfg()
+    key = tuple(planets)
+    cached = _orb_limit_cache.get(key)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    tables = config_tables(config)
+    rows = [tables.planet_index.get(p.value) for p in key]
+    columns = [tables.aspect_index[aspect.config_key] for aspect in ASPECT_ORDER]
+    if None not in rows:
+        limits = tables.max_orb[np.ix_(rows, rows, columns)]
+    else:
+        limits = np.zeros((len(key), len(key), len(ASPECT_ORDER)))
+        for i, p1 in enumerate(key):
+            for j, p2 in enumerate(key):
+                for a, aspect in enumerate(ASPECT_ORDER):
+                    orb = tables.moiety_orb(p1.value, p2.value, aspect.config_key)
+                    # Fallback to configured orbs if moiety system disabled
+                    if orb == 0:
+                        orb = tables.orb(aspect.config_key)
+                        if Planet.SUN in (p1, p2):
+                            orb += config.orbs.sun_orb_bonus
+                        if Planet.MOON in (p1, p2):
+                            orb += config.orbs.moon_orb_bonus
+                    limits[i, j, a] = orb
+    _orb_limit_cache[key] = (config, limits)
+    return limits
+
+
+def _separation(longitude: np.ndarray) -> np.ndarray:
+    """Angular separation in [0, 180] for every pair, shape ``(..., P, P)``."""
+    return np.abs((longitude[..., :, None] - longitude[..., None, :] + 180) % 360 - 180)
+
+
+def aspect_matrices(longitude: np.ndarray, speed: np.ndarray,
+                    limits: np.ndarray) -> AspectMatrices:
+    """Detect aspects between all planets from positions shaped ``(..., P)``.
+
+    Matches the pairwise rules of :func:`calculate_enhanced_aspects`: the
+    in-orb aspect with the smallest orb wins, applying means the orb shrinks
+    over :data:`APPLYING_DT_DAYS`, and perfection time is the linear
+    :func:`time_to_perfection`.
+    """
+    longitude = np.asarray(longitude, dtype=float)
+    speed = np.asarray(speed, dtype=float)
+    # Separation and aspect angles both lie in [0, 180], so no wrap is needed
+    orb = np.abs(_separation(longitude)[..., None] - _ASPECT_DEGREES)
+
+    masked = np.where(orb <= limits, orb, np.inf)
+    best = masked.argmin(axis=-1)
+    best_orb = masked.min(axis=-1)
+    has_aspect = np.isfinite(best_orb)
+    has_aspect[..., np.arange(longitude.shape[-1]), np.arange(longitude.shape[-1])] = False
+    best_degrees = _ASPECT_DEGREES[best]
+
+    future_separation = _separation((longitude + speed * APPLYING_DT_DAYS) % 360)
+    applying = has_aspect & (np.abs(future_separation - best_degrees) < best_orb)
+
+    # time_to_perfection for the chosen aspect
+    delta = (longitude[..., :, None] - longitude[..., None, :] - best_degrees + 180) % 360 - 180
+    relative_speed = speed[..., :, None] - speed[..., None, :]
+    t = np.divide(-delta, relative_speed, out=np.full(delta.shape, np.inf),
+                  where=relative_speed != 0)
+
+    return AspectMatrices(
+        code=np.where(has_aspect, best, -1).astype(np.int8),
+        orb=np.where(has_aspect, best_orb, np.nan),
+        applying=applying,
+        time_to_perfection=np.where(has_aspect, t, np.nan),
+    )
+
+
+def _sign_exit_days(longitude: np.ndarray, speed: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`days_to_sign_exit`; ``inf`` for stationary planets."""
+    sign_start = (longitude % 360 // 30) * 30
+    to_start = longitude - sign_start
+    # Retrograde exactly on a boundary leaves through the previous sign
+    degrees = np.where(speed > 0, sign_start + 30 - longitude,
+                       np.where(np.abs(to_start) < 1e-6, to_start + 30, to_start))
+    moving = np.abs(speed) >= 0.001
+    return np.divide(degrees, np.abs(speed), out=np.full(degrees.shape, np.inf), where=moving)
+
+
+def perfects_within_sign(longitude: np.ndarray, speed: np.ndarray,
+                         t: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_will_perfect_before_sign_exit` for ``(..., P, P)`` times."""
+    ok = (t > 0) & np.isfinite(t)
+    t = np.where(ok, t, 0.0)
+    exit_days = _sign_exit_days(longitude, speed)
+    ok &= (t <= exit_days[..., :, None]) & (t <= exit_days[..., None, :])
+
+    sign = longitude // 30
+    future1 = (longitude[..., :, None] + speed[..., :, None] * t) % 360 // 30
+    future2 = (longitude[..., None, :] + speed[..., None, :] * t) % 360 // 30
+    return ok & (future1 == sign[..., :, None]) & (future2 == sign[..., None, :])
 
 
 def calculate_moiety_based_orb(
     planet1: Planet, planet2: Planet, aspect_type: Aspect, config
 ) -> float:
-    """Calculate traditional moiety-based orb for two planets (ENHANCED)"""
-
-    if not hasattr(config.orbs, "moieties"):
-        return 0  # Fallback to legacy system
-
-    # Get planetary full orb values and convert to moieties (half-orbs)
-    full_orb1 = getattr(config.orbs.moieties, planet1.value, 0.0)
-    full_orb2 = getattr(config.orbs.moieties, planet2.value, 0.0)
-
-    moiety1 = full_orb1 / 2.0
-    moiety2 = full_orb2 / 2.0
-
-    # Combined moiety orb (sum of half-orbs)
-    combined_moiety = moiety1 + moiety2
-
-    # Traditional aspect-specific adjustments
-    if aspect_type in [Aspect.CONJUNCTION, Aspect.OPPOSITION]:
-        # Conjunction and opposition get full combined moieties
-        return combined_moiety
-    if aspect_type in [Aspect.TRINE, Aspect.SQUARE]:
-        # Squares and trines get slightly reduced orbs
-        return combined_moiety * 0.85
-    if aspect_type == Aspect.SEXTILE:
-        # Sextiles get more restrictive orbs
-        return combined_moiety * 0.7
-    return combined_moiety * 0.8  # Other aspects
+    """Calculate traditional moiety-based orb for two planets (ENHANCED)
+
+    Sum of the two half-orbs, scaled per aspect by
+    ``MOIETY_ASPECT_FACTORS``; 0 when the configuration has no moieties
+    (fallback to legacy system).
+    """
+    tables = config_tables(config)
+    return tables.moiety_orb(planet1.value, planet2.value, aspect_type.config_key)
 
 
 def is_applying_enhanced(
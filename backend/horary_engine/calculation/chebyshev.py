@@ -0,0 +1,256 @@
+"""Chebyshev polynomial approximation of the traditional planets.
+
+Each body's geocentric longitude, latitude and distance are fitted with
+Chebyshev series over fixed-length date segments aligned to J2000. The
+coefficients come from Swiss Ephemeris and are evaluated in NumPy, so a
+sweep over thousands of instants costs a handful of array operations
+instead of one ``swe.calc_ut`` call per body per instant.
+
+Segments are fitted lazily the first time they are touched and can be
+persisted. To precompute a range::
+
+    python -m horary_engine.calculation.chebyshev --start 1950 --end 2050
+
+Accuracy against Swiss Ephemeris is about 1e-6 degrees, except within a
+day or so of a planet's conjunction with the Sun, where the ephemeris'
+light-deflection correction has a few-arcsecond kink the polynomials
+smooth over (up to ~1e-3 degrees in longitude for Saturn).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+logger = logging.getLogger(__name__)
+
+# Speeds come from the derivative of the fitted series, so the samples skip
+# FLG_SPEED and its extra evaluations
+_FLAGS = swe.FLG_SWIEPH
+
+# Segments are numbered from this epoch (J2000.0)
+EPOCH_JD = 2451545.0
+
+# Segment length in days and polynomial degree per body, chosen so the fit
+# error stays well under the ephemeris' own numerical noise
+SEGMENTS: Dict[int, Tuple[float, int]] = {
+    swe.SUN: (16.0, 10),
+    swe.MOON: (8.0, 16),
+    swe.MERCURY: (8.0, 12),
+    swe.VENUS: (16.0, 12),
+    swe.MARS: (16.0, 12),
+    swe.JUPITER: (16.0, 10),
+    swe.SATURN: (16.0, 10),
+}
+
+DEFAULT_COEFFICIENTS_PATH = Path(__file__).parent / "data" / "chebyshev_ephemeris.npz"
+
+# coefficients (3, degree+1) for lon/lat/dist and their derivatives (3, degree)
+_Segment = Tuple[np.ndarray, np.ndarray]
+
+
+def _fit_matrix(degree: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Chebyshev-Gauss nodes on [-1, 1] and the matrix mapping samples to coefficients."""
+    n = degree + 1
+    k = np.arange(n)
+    nodes = np.cos(np.pi * (k + 0.5) / n)
+    basis = np.cos(np.pi * np.outer(np.arange(n), k + 0.5) / n) * (2.0 / n)
+    basis[0] *= 0.5
+    return nodes, basis
+
+
+def _derivative(coeffs: np.ndarray) -> np.ndarray:
+    """Coefficients of d/dx for series along the last axis."""
+    n = coeffs.shape[-1]
+    der = np.zeros(coeffs.shape[:-1] + (n - 1,))
+    for j in range(n - 1, 0, -1):
+        der[..., j - 1] = 2 * j * coeffs[..., j] + (der[..., j + 1] if j + 1 < n - 1 else 0.0)
+    der[..., 0] *= 0.5
+    return der
+
+
+def _clenshaw(coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Evaluate series ``coeffs[..., j]`` at ``x`` (broadcast over leading axes)."""
+    b1 = np.zeros(np.broadcast(coeffs[..., 0], x).shape)
+    b2 = np.zeros_like(b1)
+    two_x = 2 * x
+    for j in range(coeffs.shape[-1] - 1, 0, -1):
+        b1, b2 = two_x * b1 - b2 + coeffs[..., j], b1
+    return x * b1 - b2 + coeffs[..., 0]
+
+
+def _clenshaw_scalar(coeffs, x: float) -> float:
+    b1 = b2 = 0.0
+    two_x = 2 * x
+    for c in reversed(coeffs[1:]):
+        b1, b2 = two_x * b1 - b2 + c, b1
+    return x * b1 - b2 + coeffs[0]
+
+
+class ChebyshevEphemeris:
+    """Lazily fitted Chebyshev segments for the seven traditional planets."""
+
+    def __init__(self):
+        self._segments: Dict[int, Dict[int, _Segment]] = {body: {} for body in SEGMENTS}
+        # Plain-float copies used by the scalar evaluator
+        self._scalar: Dict[int, Dict[int, Tuple[list, list]]] = {body: {} for body in SEGMENTS}
+        self._matrices = {degree: _fit_matrix(degree) for _, degree in SEGMENTS.values()}
+        self._lock = threading.Lock()
+
+    def covers(self, body: int) -> bool:
+        return body in SEGMENTS
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+    def calc(self, jd: float, body: int) -> Tuple[float, float, float, float, float, float]:
+        """Position of one body at one instant, in ``swe.calc_ut`` layout.
+
+        Returns ``(longitude, latitude, distance, lon_speed, lat_speed, dist_speed)``.
+        """
+        seg_days, _ = SEGMENTS[body]
+        index = math.floor((jd - EPOCH_JD) / seg_days)
+        scalar = self._scalar[body].get(index)
+        if scalar is None:
+            self._segment(body, index)
+            scalar = self._scalar[body][index]
+        coeffs, der = scalar
+
+        x = 2.0 * (jd - EPOCH_JD - index * seg_days) / seg_days - 1.0
+        scale = 2.0 / seg_days
+        return (
+            _clenshaw_scalar(coeffs[0], x) % 360.0,
+            _clenshaw_scalar(coeffs[1], x),
+            _clenshaw_scalar(coeffs[2], x),
+            _clenshaw_scalar(der[0], x) * scale,
+            _clenshaw_scalar(der[1], x) * scale,
+            _clenshaw_scalar(der[2], x) * scale,
+        )
+
+    def calc_many(self, jds, body: int) -> np.ndarray:
+        """Positions of one body at many instants as an ``(n, 6)`` array."""
+        jds = np.asarray(jds, dtype=float)
+        seg_days, _ = SEGMENTS[body]
+        indices = np.floor((jds - EPOCH_JD) / seg_days).astype(np.int64)
+        unique, inverse = np.unique(indices, return_inverse=True)
+
+        segments = [self._segment(body, int(i)) for i in unique]
+        coeffs = np.stack([s[0] for s in segments])[inverse]
+        der = np.stack([s[1] for s in segments])[inverse]
+
+        x = (2.0 * (jds - EPOCH_JD - indices * seg_days) / seg_days - 1.0)[:, None]
+        values = _clenshaw(coeffs, x)
+        rates = _clenshaw(der, x) * (2.0 / seg_days)
+
+        out = np.empty((jds.size, 6))
+        out[:, :3] = values
+        out[:, 3:] = rates
+        out[:, 0] %= 360.0
+        return out
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+    def _segment(self, body: int, index: int) -> _Segment:
+        segment = self._segments[body].get(index)
+        if segment is None:
+            with self._lock:
+                segment = self._segments[body].get(index)
+                if segment is None:
+                    self._store(body, index, self._fit(body, index))
+                    segment = self._segments[body][index]
+        return segment
+
+    def _fit(self, body: int, index: int) -> np.ndarray:
+        seg_days, degree = SEGMENTS[body]
+        nodes, basis = self._matrices[degree]
+        start = EPOCH_JD + index * seg_days
+        samples = np.array([
+            swe.calc_ut(start + (x + 1.0) * seg_days / 2.0, body, _FLAGS)[0][:3]
+            for x in nodes
+        ])
+        # Longitude must be continuous across 0 Aries inside a segment
+        samples[:, 0] = np.unwrap(samples[:, 0], period=360.0)
+        return samples.T @ basis.T
+
+    def _store(self, body: int, index: int, coeffs: np.ndarray) -> None:
+        der = _derivative(coeffs)
+        self._segments[body][index] = (coeffs, der)
+        self._scalar[body][index] = (coeffs.tolist(), der.tolist())
+
+    def precompute(self, jd_start: float, jd_end: float) -> int:
+        """Fit every segment overlapping ``[jd_start, jd_end]``; returns the count."""
+        count = 0
+        for body, (seg_days, _) in SEGMENTS.items():
+            first = math.floor((jd_start - EPOCH_JD) / seg_days)
+            last = math.floor((jd_end - EPOCH_JD) / seg_days)
+            for index in range(first, last + 1):
+                self._segment(body, index)
+                count += 1
+        return count
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Path) -> None:
+        """Write all fitted segments to a NumPy ``.npz`` archive."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {"epoch": np.array([EPOCH_JD])}
+        for body, segments in self._segments.items():
+            seg_days, degree = SEGMENTS[body]
+            indices = sorted(segments)
+            arrays[f"index_{body}"] = np.array(indices, dtype=np.int64)
+            arrays[f"coeffs_{body}"] = (
+                np.stack([segments[i][0] for i in indices])
+                if indices else np.zeros((0, 3, degree + 1))
+            )
+            arrays[f"layout_{body}"] = np.array([seg_days, degree])
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "ChebyshevEphemeris":
+        """Read segments written by :meth:`save`.
+
+        Bodies whose segment layout no longer matches :data:`SEGMENTS` are
+        skipped and will be refitted on demand.
+        """
+        ephemeris = cls()
+        with np.load(Path(path)) as data:
+            if float(data["epoch"][0]) != EPOCH_JD:
+                raise ValueError(f"Unsupported Chebyshev coefficient file: {path}")
+            for body, (seg_days, degree) in SEGMENTS.items():
+                if f"index_{body}" not in data:
+                    continue
+                layout = data[f"layout_{body}"]
+                if float(layout[0]) != seg_days or int(layout[1]) != degree:
+                    logger.warning(f"Ignoring stale Chebyshev segments for body {body} in {path}")
+                    continue
+                for index, coeffs in zip(data[f"index_{body}"], data[f"coeffs_{body}"]):
+                    ephemeris._store(body, int(index), coeffs)
+        return ephemeris
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Precompute Chebyshev ephemeris coefficients")
+    parser.add_argument("--start", type=int, default=1950)
+    parser.add_argument("--end", type=int, default=2050)
+    parser.add_argument("--output", type=Path, default=DEFAULT_COEFFICIENTS_PATH)
+    args = parser.parse_args(argv)
+
+    ephemeris = ChebyshevEphemeris()
+    count = ephemeris.precompute(swe.julday(args.start, 1, 1, 0.0), swe.julday(args.end, 1, 1, 0.0))
+    ephemeris.save(args.output)
+    print(f"Wrote {count} segments ({args.start}-{args.end}) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Single access layer for planetary positions.
+
+A judgment asks for the same body at the same instant many times: the chart
+itself, the Moon's speed for the story and timing, sun altitude for
+combustion exceptions, and the event solver's first probe all start at the
+chart moment. ``Ephemeris`` sits in front of the configured position
+provider with a bounded, thread-safe LRU keyed by ``(body, quantized JD,
+flags)`` so each distinct lookup reaches the C library once, and counts
+calls, hits and misses so ephemeris cost can be measured in one place.
+
+Each precision profile (see ``precision.py``) gets its own instance and
+cache. Per-request figures come from :meth:`Ephemeris.measure`::
+
+    with get_ephemeris().measure() as usage:
+        engine.judge(question, settings)
+    usage  # {'calls': 212, 'hits': 87, 'misses': 125}
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import cfg
+
+from .ephemeris_data import configure_ephemeris_data
+from .position_provider import get_position_provider
+from .precision import PrecisionProfile, active_precision, get_precision_profile
+
+DEFAULT_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+Position = Tuple[float, float, float, float, float, float]
+
+
+class Ephemeris:
+    """LRU-cached, instrumented front end for a position provider.
+
+    Lookups with :data:`DEFAULT_FLAGS` go to the provider; other flag sets
+    (equatorial, heliocentric, ...) are passed straight to ``swe.calc_ut``.
+    """
+
+    def __init__(self, provider=None, max_entries: int = 4096,
+                 quantum_days: float = 1.0e-8):
+        self.provider = provider or get_position_provider()
+        self.max_entries = max_entries
+        self.quantum_days = quantum_days
+
+        self._cache: "OrderedDict[Tuple[int, int, int], Position]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._hits = 0
+        self._misses = 0
+        # Usage dicts of the measure() blocks active on each thread
+        self._local = threading.local()
+
+    def calc(self, jd: float, body: int, flags: int = DEFAULT_FLAGS) -> Position:
+        """Position of ``body`` at ``jd`` in ``swe.calc_ut`` layout."""
+        key = (body, round(jd / self.quantum_days), flags)
+        with self._lock:
+            self._calls += 1
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+        if data is not None:
+            self._record(hit=True)
+            return data
+
+        if flags == DEFAULT_FLAGS:
+            data = tuple(self.provider.calc(jd, body))
+        else:
+            data = tuple(swe.calc_ut(jd, body, flags)[0])
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = data
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        self._record(hit=False)
+        return data
+
+    def calc_many(self, jds, body: int) -> np.ndarray:
+        """Positions at many instants as an ``(n, 6)`` array, bypassing the cache.
+
+        Dense sweeps rarely repeat an instant and would only evict useful
+        entries; each row still counts as one call and one miss.
+        """
+        data = self.provider.calc_many(jds, body)
+        count = len(data)
+        with self._lock:
+            self._calls += count
+            self._misses += count
+        for usage in self._active():
+            usage["calls"] += count
+            usage["misses"] += count
+        return data
+
+    def stats(self) -> Dict[str, float]:
+        """Totals since construction (or the last :meth:`clear`)."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "provider": self.provider.name,
+                "calls": self._calls,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self._cache),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self) -> None:
+        """Empty the cache and zero the counters."""
+        with self._lock:
+            self._cache.clear()
+            self._calls = self._hits = self._misses = 0
+
+    @contextmanager
+    def measure(self) -> Iterator[Dict[str, int]]:
+        """Count lookups made by the current thread inside the ``with`` block."""
+        usage = {"calls": 0, "hits": 0, "misses": 0}
+        active = self._active()
+        active.append(usage)
+        try:
+            yield usage
+        finally:
+            active.remove(usage)
+
+    def _active(self) -> List[Dict[str, int]]:
+        active = getattr(self._local, "usages", None)
+        if active is None:
+            active = self._local.usages = []
+        return active
+
+    def _record(self, hit: bool) -> None:
+        for usage in self._active():
+            usage["calls"] += 1
+            usage["hits" if hit else "misses"] += 1
+
+
+_ephemerides: Dict[str, Ephemeris] = {}
+_ephemeris_lock = threading.Lock()
+
+
+def get_ephemeris(profile: Union[str, PrecisionProfile, None] = None) -> Ephemeris:
+    """Return the process-wide ephemeris for ``profile`` (default: the active one)."""
+    if profile is None:
+        profile = active_precision()
+    elif not isinstance(profile, PrecisionProfile):
+        profile = get_precision_profile(profile)
+
+    ephemeris = _ephemerides.get(profile.name)
+    if ephemeris is None:
+        with _ephemeris_lock:
+            ephemeris = _ephemerides.get(profile.name)
+            if ephemeris is None:
+                configure_ephemeris_data()
+                settings = getattr(getattr(cfg(), "ephemeris", None), "cache", None)
+                ephemeris = Ephemeris(
+                    provider=get_position_provider(profile.provider),
+                    max_entries=getattr(settings, "max_entries", 4096),
+                    quantum_days=getattr(settings, "quantum_days", 1.0e-8),
+                )
+                _ephemerides[profile.name] = ephemeris
+    return ephemeris
+
+
+def reset_ephemeris() -> None:
+    """Discard the shared ephemerides so the next call re-reads configuration."""
+    with _ephemeris_lock:
+        _ephemerides.clear()
@@ -0,0 +1,219 @@
+"""Swiss Ephemeris data files: location, bundling and preloading.
+
+Swiss Ephemeris reads planetary (``sepl_XX.se1``) and lunar
+(``semo_XX.se1``) files covering 600 years each. When they are missing it
+silently falls back to the analytical Moshier model, and when they are
+present they are opened on the first request. This module resolves the
+data directory, memory-maps the files for the configured date range at
+startup, and records which backend calculations actually use.
+
+The directory is taken from, in order:
+
+1. the ``HORARY_EPHE_PATH`` environment variable,
+2. ``ephemeris.data_path`` in ``horary_constants.yaml``,
+3. ``horary_engine/calculation/data/ephe`` (bundled into the executable)
+   when it holds any ``.se1`` files.
+
+To copy the files for the configured range into the bundle directory::
+
+    python -m horary_engine.calculation.ephemeris_data --source /path/to/ephe
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import mmap
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import swisseph as swe
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+EPHE_PATH_ENV = "HORARY_EPHE_PATH"
+DEFAULT_EPHE_DIR = Path(__file__).parent / "data" / "ephe"
+
+# Each file covers 600 years starting at a multiple of 600
+_FILE_SPAN_YEARS = 600
+_FILE_PREFIXES = ("sepl", "semo")
+
+_PAGE = mmap.PAGESIZE
+
+# Preloaded maps, kept open for the life of the process
+_mapped: List[mmap.mmap] = []
+
+
+@dataclass
+class EphemerisDataStatus:
+    """Outcome of :func:`configure_ephemeris_data`."""
+
+    backend: str  # "SWIEPH" or "MOSHIER"
+    path: Optional[str]
+    date_range: Tuple[int, int]
+    files: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    preloaded_bytes: int = 0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend,
+            "path": self.path,
+            "date_range": list(self.date_range),
+            "files": self.files,
+            "missing": self.missing,
+            "preloaded_bytes": self.preloaded_bytes,
+        }
+
+
+def required_files(start_year: int, end_year: int) -> List[str]:
+    """Planet and Moon file names covering ``start_year`` through ``end_year``."""
+    names = []
+    first = math.floor(start_year / _FILE_SPAN_YEARS)
+    last = math.floor(end_year / _FILE_SPAN_YEARS)
+    for block in range(first, last + 1):
+        century = block * _FILE_SPAN_YEARS // 100
+        suffix = f"_{century:02d}" if century >= 0 else f"m{-century:02d}"
+        names.extend(f"{prefix}{suffix}.se1" for prefix in _FILE_PREFIXES)
+    return names
+
+
+def _settings():
+    return getattr(cfg(), "ephemeris", None)
+
+
+def configured_date_range() -> Tuple[int, int]:
+    date_range = getattr(_settings(), "date_range", None) or (1800, 2399)
+    return int(date_range[0]), int(date_range[1])
+
+
+def resolve_ephe_path() -> Optional[Path]:
+    """Directory holding the ``.se1`` files, or ``None`` to use the library default."""
+    custom = os.environ.get(EPHE_PATH_ENV) or getattr(_settings(), "data_path", None)
+    if custom:
+        return Path(custom)
+    if any(DEFAULT_EPHE_DIR.glob("*.se1")):
+        return DEFAULT_EPHE_DIR
+    return None
+
+
+def _preload(paths: List[Path]) -> int:
+    """Map each file read-only and touch every page so reads never hit disk."""
+    total = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                continue
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            for offset in range(0, size, _PAGE):
+                _ = mapped[offset]
+            _mapped.append(mapped)
+            total += size
+    return total
+
+
+def _detect_backend(start_year: int, end_year: int) -> str:
+    """Ask the library which ephemeris answered, opening the files as a side effect."""
+    year = min(max(2000, start_year), end_year)
+    jd = swe.julday(year, 1, 1, 12.0)
+    backend = "SWIEPH"
+    for body in (swe.SUN, swe.MOON):
+        _, retflag = swe.calc_ut(jd, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        if not retflag & swe.FLG_SWIEPH:
+            backend = "MOSHIER"
+    return backend
+
+
+_status: Optional[EphemerisDataStatus] = None
+_status_lock = threading.Lock()
+
+
+def configure_ephemeris_data() -> EphemerisDataStatus:
+    """Point Swiss Ephemeris at its data files and preload them (once per process)."""
+    global _status
+    if _status is not None:
+        return _status
+    with _status_lock:
+        if _status is not None:
+            return _status
+
+        start_year, end_year = configured_date_range()
+        path = resolve_ephe_path()
+        swe.set_ephe_path(str(path) if path else '')
+
+        files: List[str] = []
+        missing: List[str] = []
+        preloaded = 0
+        if path is not None:
+            for name in required_files(start_year, end_year):
+                (files if (path / name).is_file() else missing).append(name)
+            if getattr(_settings(), "preload", True) and files:
+                try:
+                    preloaded = _preload([path / name for name in files])
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not preload ephemeris files from {path}: {e}")
+
+        backend = _detect_backend(start_year, end_year)
+        if backend == "MOSHIER":
+            logger.warning(
+                f"Swiss Ephemeris data files not found ({path or 'library default path'}); "
+                "using the Moshier analytical ephemeris"
+            )
+        elif missing:
+            logger.warning(f"Ephemeris files missing for {start_year}-{end_year}: {', '.join(missing)}")
+        else:
+            logger.info(f"Swiss Ephemeris files loaded from {path}: {', '.join(files)}")
+
+        _status = EphemerisDataStatus(
+            backend=backend,
+            path=str(path) if path else None,
+            date_range=(start_year, end_year),
+            files=files,
+            missing=missing,
+            preloaded_bytes=preloaded,
+        )
+        return _status
+
+
+def reset_ephemeris_data() -> None:
+    """Forget the configured state so the next call re-reads configuration (for testing)."""
+    global _status
+    with _status_lock:
+        _status = None
+        for mapped in _mapped:
+            mapped.close()
+        _mapped.clear()
+
+
+def main(argv: Optional[list] = None) -> None:
+    start_year, end_year = configured_date_range()
+    parser = argparse.ArgumentParser(description="Copy Swiss Ephemeris files into the bundle directory")
+    parser.add_argument("--source", type=Path, required=True, help="directory containing .se1 files")
+    parser.add_argument("--start", type=int, default=start_year)
+    parser.add_argument("--end", type=int, default=end_year)
+    parser.add_argument("--output", type=Path, default=DEFAULT_EPHE_DIR)
+    args = parser.parse_args(argv)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    missing = []
+    for name in required_files(args.start, args.end):
+        source = args.source / name
+        if source.is_file():
+            shutil.copy2(source, args.output / name)
+            print(f"Copied {name}")
+        else:
+            missing.append(name)
+    if missing:
+        raise SystemExit(f"Missing from {args.source}: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""Exact event times from the ephemeris by bracketing and root-finding.
+
+Perfection, sign ingress and station times used to come from linear
+extrapolation of the speeds at the chart moment, or from fixed-step scans.
+``EventSolver`` instead evaluates the real ephemeris: it walks forward in
+steps that are provably too short to jump over a root, brackets the first
+sign change and polishes it with Brent's method. Because each step is sized
+from the distance still to cover, events outside the search window are
+usually rejected after a single ephemeris call.
+
+Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+
+from horary_config import cfg
+
+from .ephemeris import get_ephemeris
+from .precision import active_precision
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds on geocentric speed in degrees/day, with a small margin.
+# The safe step |f| / bound can never overshoot a root of f.
+MAX_SPEED = {
+    swe.SUN: 1.05,
+    swe.MOON: 15.5,
+    swe.MERCURY: 2.3,
+    swe.VENUS: 1.3,
+    swe.MARS: 0.85,
+    swe.JUPITER: 0.27,
+    swe.SATURN: 0.15,
+}
+_DEFAULT_MAX_SPEED = 15.5
+
+NON_STATIONING_BODIES = (swe.SUN, swe.MOON)
+
+# Newton probes aim slightly past the predicted root so they bracket it
+_PROBE_OVERSHOOT = 0.02
+
+# Evaluates (value, derivative) at a Julian Day
+EventFunction = Callable[[float], Tuple[float, float]]
+
+
+def _wrap180(angle: float) -> float:
+    """Normalise an angle to [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _crossed(f_a: float, f_b: float) -> bool:
+    """True when a wrapped angle changed sign through zero rather than 180."""
+    return (f_a < 0 < f_b or f_b < 0 < f_a) and abs(f_a) + abs(f_b) < 180.0
+
+
+@dataclass
+class SolvedEvent:
+    """An event located by :class:`EventSolver`."""
+
+    jd: float
+    days: float
+    iterations: int
+    ephemeris_calls: int
+
+
+class EventSolver:
+    """Find the first aspect perfection, ingress or station after a moment."""
+
+    def __init__(self, tolerance_days: Optional[float] = None,
+                 max_iterations: Optional[int] = None,
+                 min_step_days: Optional[float] = None,
+                 station_step_days: Optional[float] = None,
+                 ephemeris=None):
+        settings = getattr(cfg().timing, "event_solver", None)
+        self.ephemeris = ephemeris or get_ephemeris()
+        self.tolerance_days = tolerance_days or getattr(settings, "tolerance_days", 1.0e-5)
+        self.max_iterations = max_iterations or getattr(settings, "max_iterations", 60)
+        self.min_step_days = min_step_days or getattr(settings, "min_step_days", 0.05)
+        self.station_step_days = station_step_days or getattr(settings, "station_step_days", 2.0)
+
+        # Running totals for tuning; read with stats()
+        self._lock = threading.Lock()
+        self._events = 0
+        self._iterations = 0
+        self._ephemeris_calls = 0
+
+    # ------------------------------------------------------------------
+    # Public event types
+    # ------------------------------------------------------------------
+    def aspect_perfection(self, body1: int, body2: int, angle: float,
+                          jd_start: float, max_days: float) -> Optional[SolvedEvent]:
+        """First time after ``jd_start`` that two bodies are ``angle`` degrees apart.
+
+        Both polarities are searched (e.g. +90 and -90 for a square), so the
+        result does not depend on argument order. Returns ``None`` when the
+        aspect does not perfect within ``max_days``.
+        """
+        bound = MAX_SPEED.get(body1, _DEFAULT_MAX_SPEED) + MAX_SPEED.get(body2, _DEFAULT_MAX_SPEED)
+        targets = {abs(angle) % 360.0, -abs(angle) % 360.0}
+
+        best: Optional[SolvedEvent] = None
+        calls = 0
+        iterations = 0
+        for target in sorted(targets):
+            def separation(jd: float, target=target) -> Tuple[float, float]:
+                lon1, speed1 = self._position(body1, jd)
+                lon2, speed2 = self._position(body2, jd)
+                return _wrap180(lon1 - lon2 - target), speed1 - speed2
+
+            window = best.days if best is not None else max_days
+            found, n_iter, n_calls = self._first_root(separation, bound, jd_start, window)
+            iterations += n_iter
+            calls += n_calls * 2
+            if found is not None:
+                best = SolvedEvent(found, found - jd_start, 0, 0)
+
+        return self._finish(best, iterations, calls)
+
+    def sign_ingress(self, body: int, jd_start: float, max_days: float) -> Optional[SolvedEvent]:
+        """First time after ``jd_start`` that a body leaves its current sign.
+
+        Direct and retrograde exits are both considered, so a planet that
+        stations and backs out of the sign is handled correctly.
+        """
+        lon0, _ = self._position(body, jd_start)
+        sign_start = math.floor(lon0 / 30.0) * 30.0
+        bound = MAX_SPEED.get(body, _DEFAULT_MAX_SPEED)
+
+        best: Optional[SolvedEvent] = None
+        calls = 1
+        iterations = 0
+        for boundary in (sign_start + 30.0, sign_start):
+            def offset(jd: float, boundary=boundary) -> Tuple[float, float]:
+                lon, speed = self._position(body, jd)
+                return _wrap180(lon - boundary), speed
+
+            window = best.days if best is not None else max_days
+            found, n_iter, n_calls = self._first_root(offset, bound, jd_start, window)
+            iterations += n_iter
+            calls += n_calls
+            if found is not None:
+                best = SolvedEvent(found, found - jd_start, 0, 0)
+
+        return self._finish(best, iterations, calls)
+
+    def station(self, body: int, jd_start: float, max_days: float) -> Optional[SolvedEvent]:
+        """First retrograde or direct station after ``jd_start``.
+
+        Speed is sampled every ``station_step_days``; no classical planet
+        stations twice in less than about three weeks, so a sign change of
+        the speed cannot be missed.
+        """
+        if body in NON_STATIONING_BODIES:
+            return None
+
+        def speed(jd: float) -> float:
+            return self._position(body, jd)[1]
+
+        jd_end = jd_start + max_days
+        jd_a, f_a = jd_start, speed(jd_start)
+        calls = 1
+        found = None
+        iterations = 0
+        while jd_a < jd_end:
+            jd_b = min(jd_a + self.station_step_days, jd_end)
+            f_b = speed(jd_b)
+            calls += 1
+            if (f_a < 0 < f_b) or (f_b < 0 < f_a):
+                found, iterations, n_calls = self._brent(speed, jd_a, jd_b, f_a, f_b)
+                calls += n_calls
+                break
+            jd_a, f_a = jd_b, f_b
+
+        event = SolvedEvent(found, found - jd_start, 0, 0) if found is not None else None
+        return self._finish(event, iterations, calls)
+
+    def stats(self) -> dict:
+        """Totals since construction: events found, Brent iterations and ephemeris calls."""
+        with self._lock:
+            return {
+                "events": self._events,
+                "iterations": self._iterations,
+                "ephemeris_calls": self._ephemeris_calls,
+            }
+
+    # ------------------------------------------------------------------
+    # Root finding
+    # ------------------------------------------------------------------
+    def _first_root(self, func: EventFunction, bound: float, jd_start: float,
+                    max_days: float) -> Tuple[Optional[float], int, int]:
+        """Locate the first zero of a wrapped angular function.
+
+        ``bound`` must exceed ``|func'|`` everywhere in the window. Returns
+        ``(jd or None, brent iterations, function evaluations)``.
+        """
+        jd_end = jd_start + max_days
+        jd = jd_start
+        f, df = func(jd)
+        calls = 1
+
+        while True:
+            remaining = jd_end - jd
+            # Even at full speed the gap cannot close inside the window
+            if remaining <= 0 or abs(f) > bound * remaining:
+                return None, 0, calls
+
+            safe = max(abs(f) / bound, self.min_step_days)
+
+            # Approaching: try to bracket in one jump using the current speed
+            if f * df < 0 and -f / df > safe:
+                dt = min(-f / df * (1 + _PROBE_OVERSHOOT), remaining)
+                f_probe, _ = func(jd + dt)
+                calls += 1
+                if _crossed(f, f_probe):
+                    root, iterations, n_calls = self._brent(
+                        lambda x: func(x)[0], jd, jd + dt, f, f_probe)
+                    return root, iterations, calls + n_calls
+
+            dt = min(safe, remaining)
+            f_next, df_next = func(jd + dt)
+            calls += 1
+            if f_next == 0:
+                return jd + dt, 0, calls
+            if _crossed(f, f_next):
+                root, iterations, n_calls = self._brent(
+                    lambda x: func(x)[0], jd, jd + dt, f, f_next)
+                return root, iterations, calls + n_calls
+            jd, f, df = jd + dt, f_next, df_next
+
+    def _brent(self, func: Callable[[float], float], a: float, b: float,
+               fa: float, fb: float) -> Tuple[float, int, int]:
+        """Brent's method on a bracket ``[a, b]`` with ``fa * fb < 0``.
+
+        Returns ``(root, iterations, function evaluations)``.
+        """
+        # b is the best estimate, c the contrapoint, a the previous b
+        c, fc = b, fb
+        d = e = b - a
+        calls = 0
+
+        for iteration in range(1, self.max_iterations + 1):
+            if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, fa = b, fb
+                b, fb = c, fc
+                c, fc = a, fa
+
+            tol = 2 * 2.2e-16 * abs(b) + 0.5 * self.tolerance_days
+            m = 0.5 * (c - b)
+            if abs(m) <= tol or fb == 0:
+                return b, iteration, calls
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                # Secant when only two points are distinct, else inverse quadratic
+                s = fb / fa
+                if a == c:
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            fb = func(b)
+            calls += 1
+
+        logger.debug(f"Event solver hit max_iterations ({self.max_iterations}) at JD {b}")
+        return b, self.max_iterations, calls
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _position(self, body: int, jd: float) -> Tuple[float, float]:
+        data = self.ephemeris.calc(jd, body)
+        return data[0], data[3]
+
+    def _finish(self, event: Optional[SolvedEvent], iterations: int,
+                calls: int) -> Optional[SolvedEvent]:
+        with self._lock:
+            self._iterations += iterations
+            self._ephemeris_calls += calls
+            if event is not None:
+                self._events += 1
+        if event is None:
+            return None
+        event.iterations = iterations
+        event.ephemeris_calls = calls
+        return event
+
+
+_solvers: Dict[str, EventSolver] = {}
+_solver_lock = threading.Lock()
+
+
+def get_event_solver() -> EventSolver:
+    """Return the process-wide solver for the active precision profile.
+
+    Settings come from ``timing.event_solver``; the profile chooses the
+    ephemeris and may override the tolerance.
+    """
+    profile = active_precision()
+    solver = _solvers.get(profile.name)
+    if solver is None:
+        with _solver_lock:
+            solver = _solvers.get(profile.name)
+            if solver is None:
+                solver = EventSolver(
+                    tolerance_days=profile.solver_tolerance_days,
+                    ephemeris=get_ephemeris(profile),
+                )
+                _solvers[profile.name] = solver
+    return solver
+
+
+def reset_event_solver() -> None:
+    """Discard the shared solvers so the next call re-reads configuration."""
+    with _solver_lock:
+        _solvers.clear()
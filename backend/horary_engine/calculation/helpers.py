@@ -18,12 +18,19 @@ import datetime
 from typing import Tuple, Optional, Dict, Any
 import swisseph as swe
 
+from .ephemeris import get_ephemeris
+from .event_solver import get_event_solver
+from .station_calendar import StationCalendarMiss, get_station_calendar
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
                                max_days: int = 365) -> Optional[float]:
     """
     Calculate when a planet will next station (turn retrograde/direct)
     using Swiss Ephemeris.
+    
+    Stations are looked up in the precomputed station calendar; outside
+    its range the event solver brackets the speed sign change instead.
     
     Args:
         planet_id: Swiss Ephemeris planet ID
@@ -35,71 +42,20 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
     
     Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
     """
-    step_size = 0.1  # Check every 0.1 days
-    
-    try:
-        # Get initial speed
-        initial_data, _ = swe.calc_ut(jd_start, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        initial_speed = initial_data[3]
-        
-        # Search forward in time
-        current_jd = jd_start + step_size
-        max_jd = jd_start + max_days
-        
-        previous_speed = initial_speed
-        
-        while current_jd < max_jd:
-            try:
-                planet_data, _ = swe.calc_ut(current_jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                current_speed = planet_data[3]
-                
-                # Check for sign change in speed (station)
-                if (previous_speed > 0 and current_speed < 0) or (previous_speed < 0 and current_speed > 0):
-                    # Found a station, refine the timing
-                    return _refine_station_time(planet_id, current_jd - step_size, current_jd)
-                
-                previous_speed = current_speed
-                current_jd += step_size
-                
-            except Exception:
-                # Skip errors and continue
-                current_jd += step_size
-                continue
-    
-    except Exception:
-        pass
-    
-    return None
-
-
-def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> float:
-    """Refine station time to higher precision using binary search"""
-    tolerance = 0.001  # About 1.5 minutes
-    
-    while (jd_after - jd_before) > tolerance:
-        jd_mid = (jd_before + jd_after) / 2
-        
-        try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            speed_before = data_before[3]
-            speed_mid = data_mid[3]
-            
-            # Check which side of midpoint the station is on
-            if (speed_before > 0 and speed_mid > 0) or (speed_before < 0 and speed_mid < 0):
-                # Station is after midpoint
-                jd_before = jd_mid
-            else:
-                # Station is before midpoint
-                jd_after = jd_mid
-                
-        except Exception:
-            break
-    
-    return (jd_before + jd_after) / 2
-
-
+    calendar = get_station_calendar()
+    if calendar is not None:
+        try:
+            return calendar.next_station(planet_id, jd_start, max_days)
+        except StationCalendarMiss:
+            pass
+
+    try:
+        event = get_event_solver().station(planet_id, jd_start, max_days)
+    except swe.Error:
+        return None
+    return event.jd if event is not None else None
+
+
 def calculate_future_longitude(longitude: float, speed: float, days: float) -> float:
     """
     Calculate where a planet will be in the future given current position and speed.
@@ -279,7 +235,7 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
     """
     try:
         # Calculate ecliptic position of the Sun
-        sun_data, _ = swe.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
+        sun_data = get_ephemeris().calc(jd_ut, swe.SUN)
         sun_longitude = sun_data[0]
         sun_latitude = sun_data[1]
         sun_distance = sun_data[2]
@@ -315,7 +271,7 @@ def calculate_moon_variable_speed(jd_ut: float) -> float:
     Classical source: Lilly III Chap. XXV - Moon's variable motion in timing
     """
     try:
-        moon_data, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        moon_data = get_ephemeris().calc(jd_ut, swe.MOON)
         return abs(moon_data[3])  # Return absolute speed
     except Exception:
         return 13.0  # Classical average fallback
@@ -0,0 +1,390 @@
+"""Precomputed lunar ingress and void-of-course calendar.
+
+The Moon is void of course from its last Ptolemaic aspect to a classical
+planet until it leaves its sign. Deriving that from the speeds at the chart
+moment means extrapolating every aspect on each request. The calendar
+instead stores, for every Moon sign ingress over a fixed epoch, the time of
+the last exact aspect made in the sign being left, so "is the Moon void at
+JD" and "the next N void periods" are answered with a bisect.
+
+Times are exact ephemeris times (Moon and target both moving), so the
+calendar is the reference for void-of-course across the engine and API.
+To regenerate it for a different epoch::
+
+    python -m horary_engine.calculation.lunar_calendar --start 1900 --end 2100
+
+Classical source: Lilly III Chap. XXV - "Void of course"
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import logging
+import struct
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import cfg
+try:
+    from ...models import Aspect, Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, Planet, Sign
+
+logger = logging.getLogger(__name__)
+
+# Planets the Moon must aspect for it not to be void (as in
+# calculate_moon_next_aspect)
+VOID_TARGETS = {
+    swe.SUN: Planet.SUN,
+    swe.MERCURY: Planet.MERCURY,
+    swe.VENUS: Planet.VENUS,
+    swe.MARS: Planet.MARS,
+    swe.JUPITER: Planet.JUPITER,
+    swe.SATURN: Planet.SATURN,
+}
+
+# Moon-minus-planet elongations at which a Ptolemaic aspect is exact
+_ELONGATIONS = np.array([0.0, 60.0, 90.0, 120.0, 180.0, 240.0, 270.0, 300.0])
+_ASPECT_BY_DEGREES = {aspect.degrees: aspect for aspect in Aspect}
+_SIGNS = list(Sign)
+
+DEFAULT_CALENDAR_PATH = Path(__file__).parent / "data" / "lunar_calendar.bin"
+
+_MAGIC = b"HLUN"
+_VERSION = 1
+# magic, version, ingress count, first covered JD, last covered JD
+_HEADER = struct.Struct("<4sHIdd")
+
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Coarse sampling step for the generator. The Moon gains at most ~17 degrees
+# a day on any planet, well under the 30 degree gap between aspect angles
+# and the width of a sign, so no event can fall between two samples unseen.
+_SCAN_STEP_DAYS = 1.0
+
+
+class LunarCalendarMiss(LookupError):
+    """Raised when a query falls outside the calendar's epoch."""
+    pass
+
+
+@dataclass
+class VoidPeriod:
+    """An interval during which the Moon makes no further aspect in its sign."""
+
+    start_jd: float
+    end_jd: float  # the ingress that ends it
+    sign: Sign
+    next_sign: Sign
+    last_planet: Optional[Planet]  # None if no aspect was made in the whole sign
+    last_aspect: Optional[Aspect]
+
+    @property
+    def duration_days(self) -> float:
+        return self.end_jd - self.start_jd
+
+    def contains(self, jd: float) -> bool:
+        return self.start_jd <= jd < self.end_jd
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start_jd": self.start_jd,
+            "end_jd": self.end_jd,
+            "duration_hours": round(self.duration_days * 24, 2),
+            "sign": self.sign.sign_name,
+            "next_sign": self.next_sign.sign_name,
+            "last_planet": self.last_planet.value if self.last_planet else None,
+            "last_aspect": self.last_aspect.display_name if self.last_aspect else None,
+        }
+
+
+class LunarCalendar:
+    """Moon sign ingresses with the void-of-course start preceding each one.
+
+    Entry ``i`` is the ingress at ``ingress_jd[i]`` into sign
+    ``ingress_sign[i]`` (0 = Aries); the Moon was void from
+    ``void_start[i]`` until then. ``jd_start`` is the ingress before the
+    first entry, so every covered moment has a full sign stay on record.
+    """
+
+    def __init__(self, jd_start: float, jd_end: float, ingress_jd: array,
+                 ingress_sign: array, void_start: array,
+                 last_body: array, last_elongation: array):
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.ingress_jd = ingress_jd
+        self.ingress_sign = ingress_sign
+        self.void_start = void_start
+        self.last_body = last_body  # Swiss Ephemeris id, -1 if none
+        self.last_elongation = last_elongation  # index into _ELONGATIONS, -1 if none
+
+    def __len__(self) -> int:
+        return len(self.ingress_jd)
+
+    def covers(self, jd: float) -> bool:
+        return self.jd_start <= jd < self.jd_end
+
+    def next_ingress(self, jd: float) -> Tuple[float, Sign]:
+        """Time and sign of the Moon's first ingress after ``jd``."""
+        idx = self._index(jd)
+        return self.ingress_jd[idx], _SIGNS[self.ingress_sign[idx]]
+
+    def void_period_at(self, jd: float) -> Optional[VoidPeriod]:
+        """The void period containing ``jd``, or ``None`` if the Moon is not void."""
+        idx = self._index(jd)
+        if jd < self.void_start[idx]:
+            return None
+        return self._period(idx)
+
+    def is_void(self, jd: float) -> bool:
+        idx = self._index(jd)
+        return jd >= self.void_start[idx]
+
+    def next_void_periods(self, jd: float, count: int = 1) -> List[VoidPeriod]:
+        """Up to ``count`` void periods that have not ended by ``jd``.
+
+        A period in progress at ``jd`` is included first. Fewer periods are
+        returned when the epoch ends.
+        """
+        idx = self._index(jd)
+        stop = min(idx + max(count, 0), len(self))
+        return [self._period(i) for i in range(idx, stop)]
+
+    def _index(self, jd: float) -> int:
+        if not self.covers(jd):
+            raise LunarCalendarMiss(f"No lunar calendar data at JD {jd}")
+        return bisect.bisect_right(self.ingress_jd, jd)
+
+    def _period(self, idx: int) -> VoidPeriod:
+        sign = self.ingress_sign[idx]
+        body = self.last_body[idx]
+        elongation = self.last_elongation[idx]
+        aspect = None
+        if elongation >= 0:
+            degrees = float(_ELONGATIONS[elongation])
+            aspect = _ASPECT_BY_DEGREES[int(min(degrees, 360.0 - degrees))]
+        return VoidPeriod(
+            start_jd=self.void_start[idx],
+            end_jd=self.ingress_jd[idx],
+            sign=_SIGNS[(sign - 1) % 12],
+            next_sign=_SIGNS[sign],
+            last_planet=VOID_TARGETS.get(body),
+            last_aspect=aspect,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "LunarCalendar":
+        """Read a calendar written by :meth:`save`."""
+        data = Path(path).read_bytes()
+        magic, version, count, jd_start, jd_end = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported lunar calendar file: {path}")
+
+        offset = _HEADER.size
+        columns = []
+        for typecode in ("d", "b", "d", "b", "b"):
+            values = array(typecode)
+            size = count * values.itemsize
+            values.frombytes(data[offset:offset + size])
+            if len(values) != count:
+                raise ValueError(f"Truncated lunar calendar file: {path}")
+            if sys.byteorder != "little" and values.itemsize > 1:
+                values.byteswap()
+            offset += size
+            columns.append(values)
+
+        return cls(jd_start, jd_end, *columns)
+
+    def save(self, path: Path) -> None:
+        """Write the calendar as a compact little-endian binary file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self), self.jd_start, self.jd_end))
+            for typecode, values in (("d", self.ingress_jd), ("b", self.ingress_sign),
+                                     ("d", self.void_start), ("b", self.last_body),
+                                     ("b", self.last_elongation)):
+                out = array(typecode, values)
+                if sys.byteorder != "little" and out.itemsize > 1:
+                    out.byteswap()
+                f.write(out.tobytes())
+
+
+def _position(body: int, jd: float) -> Tuple[float, float]:
+    data, _ = swe.calc_ut(jd, body, _FLAGS)
+    return data[0], data[3]
+
+
+def _unwrapped_longitudes(body: int, jds: np.ndarray) -> np.ndarray:
+    lons = np.array([_position(body, jd)[0] for jd in jds])
+    steps = (np.diff(lons) + 180.0) % 360.0 - 180.0
+    return np.concatenate(([lons[0]], lons[0] + np.cumsum(steps)))
+
+
+def _refine(func, jd_a: float, jd_b: float, guess: float, tolerance: float) -> float:
+    """Newton iterations on ``func -> (value, derivative)`` kept inside ``[jd_a, jd_b]``."""
+    jd = guess
+    for _ in range(20):
+        value, derivative = func(jd)
+        step = value / derivative
+        jd = min(max(jd - step, jd_a), jd_b)
+        if abs(step) < tolerance:
+            break
+    return jd
+
+
+def _crossings(values: np.ndarray, levels: np.ndarray, period: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample intervals in which an increasing ``values`` passes a level.
+
+    Returns the interval start indices and the absolute level crossed
+    (``levels`` repeat every ``period``).
+    """
+    counts = np.floor(values / period) * len(levels) + np.searchsorted(levels, values % period, side="right")
+    idx = np.nonzero(np.diff(counts))[0]
+    crossed = counts[idx + 1] - 1
+    level = np.floor(crossed / len(levels)) * period + levels[(crossed % len(levels)).astype(int)]
+    return idx, level
+
+
+def build_lunar_calendar(start_year: int, end_year: int,
+                         tolerance: float = 1e-6) -> LunarCalendar:
+    """Compute a calendar covering 1 January ``start_year`` to 1 January ``end_year``."""
+    # Pad by more than the longest sign stay so both ends are fully covered
+    jd_first = swe.julday(start_year, 1, 1, 0.0) - 3.0
+    jd_last = swe.julday(end_year, 1, 1, 0.0) + 3.0
+    jds = np.arange(jd_first, jd_last + _SCAN_STEP_DAYS, _SCAN_STEP_DAYS)
+    moon = _unwrapped_longitudes(swe.MOON, jds)
+
+    # Ingresses: the Moon is always direct, so its longitude only increases
+    ingresses = []
+    sign_idx, boundaries = _crossings(moon, np.array([0.0]), 30.0)
+    for i, boundary in zip(sign_idx, boundaries):
+        def offset(jd: float, boundary=boundary % 360.0) -> Tuple[float, float]:
+            lon, speed = _position(swe.MOON, jd)
+            return (lon - boundary + 180.0) % 360.0 - 180.0, speed
+
+        guess = jds[i] + (boundary - moon[i]) / (moon[i + 1] - moon[i]) * _SCAN_STEP_DAYS
+        jd = _refine(offset, jds[i], jds[i + 1], guess, tolerance)
+        ingresses.append((jd, int(boundary // 30.0) % 12))
+
+    # Exact aspects to each target, by sample interval
+    perfections: List[Tuple[int, int, float, float]] = []  # (interval, body, elongation, first guess)
+    for body in VOID_TARGETS:
+        elongation = moon - _unwrapped_longitudes(body, jds)
+        for i, level in zip(*_crossings(elongation, _ELONGATIONS, 360.0)):
+            fraction = (level - elongation[i]) / (elongation[i + 1] - elongation[i])
+            perfections.append((int(i), body, float(level), jds[i] + fraction * _SCAN_STEP_DAYS))
+    perfections.sort()
+
+    def perfection_time(interval: int, body: int, level: float, guess: float) -> float:
+        def separation(jd: float) -> Tuple[float, float]:
+            lon_moon, speed_moon = _position(swe.MOON, jd)
+            lon_body, speed_body = _position(body, jd)
+            return ((lon_moon - lon_body - level + 180.0) % 360.0 - 180.0,
+                    speed_moon - speed_body)
+
+        return _refine(separation, jds[interval], jds[interval + 1], guess, tolerance)
+
+    # For each ingress, walk back through candidate intervals until an
+    # aspect is found that perfects during the sign stay
+    ingress_jd, ingress_sign, void_start = array("d"), array("b"), array("d")
+    last_body, last_elongation = array("b"), array("b")
+    intervals = [p[0] for p in perfections]
+    for (prev_jd, _), (jd, sign) in zip(ingresses, ingresses[1:]):
+        latest: Optional[Tuple[float, int, int]] = None
+        pos = bisect.bisect_right(intervals, int((jd - jd_first) // _SCAN_STEP_DAYS)) - 1
+        while pos >= 0 and latest is None:
+            interval = intervals[pos]
+            if jds[interval + 1] < prev_jd:
+                break
+            while pos >= 0 and intervals[pos] == interval:
+                _, body, level, guess = perfections[pos]
+                exact = perfection_time(interval, body, level, guess)
+                if prev_jd <= exact < jd and (latest is None or exact > latest[0]):
+                    index = int(np.searchsorted(_ELONGATIONS, level % 360.0))
+                    latest = (exact, body, index)
+                pos -= 1
+
+        ingress_jd.append(jd)
+        ingress_sign.append(sign)
+        if latest is None:
+            # No aspect in the whole sign: void from the previous ingress
+            void_start.append(prev_jd)
+            last_body.append(-1)
+            last_elongation.append(-1)
+        else:
+            void_start.append(latest[0])
+            last_body.append(latest[1])
+            last_elongation.append(latest[2])
+
+    return LunarCalendar(ingresses[0][0], ingress_jd[-1], ingress_jd, ingress_sign,
+                         void_start, last_body, last_elongation)
+
+
+_calendar: Optional[LunarCalendar] = None
+_calendar_loaded = False
+_calendar_lock = threading.Lock()
+
+
+def _configured_path() -> Optional[Path]:
+    settings = getattr(cfg().timing, "lunar_calendar", None)
+    if settings is not None and not getattr(settings, "enabled", True):
+        return None
+    custom_path = getattr(settings, "path", None) if settings is not None else None
+    return Path(custom_path) if custom_path else DEFAULT_CALENDAR_PATH
+
+
+def get_lunar_calendar() -> Optional[LunarCalendar]:
+    """Return the process-wide calendar, loading it on first use.
+
+    Returns ``None`` when the calendar is disabled or cannot be read, in
+    which case callers fall back to extrapolating from the chart.
+    """
+    global _calendar, _calendar_loaded
+    if _calendar_loaded:
+        return _calendar
+    with _calendar_lock:
+        if not _calendar_loaded:
+            path = _configured_path()
+            if path is not None:
+                try:
+                    _calendar = LunarCalendar.load(path)
+                    logger.info(f"Loaded lunar calendar from {path}")
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Lunar calendar unavailable ({e}); falling back to aspect extrapolation")
+                    _calendar = None
+            _calendar_loaded = True
+    return _calendar
+
+
+def reset_lunar_calendar() -> None:
+    """Forget the loaded calendar so the next lookup reloads it (for testing)."""
+    global _calendar, _calendar_loaded
+    with _calendar_lock:
+        _calendar = None
+        _calendar_loaded = False
+
+
+def main(argv: Optional[list] = None) -> None:
+    settings = getattr(cfg().timing, "lunar_calendar", None)
+    parser = argparse.ArgumentParser(description="Generate the lunar ingress and void-of-course calendar")
+    parser.add_argument("--start", type=int, default=getattr(settings, "start_year", 1900))
+    parser.add_argument("--end", type=int, default=getattr(settings, "end_year", 2100))
+    parser.add_argument("--output", type=Path, default=DEFAULT_CALENDAR_PATH)
+    args = parser.parse_args(argv)
+
+    calendar = build_lunar_calendar(args.start, args.end)
+    calendar.save(args.output)
+    print(f"Wrote {len(calendar)} lunar ingresses ({args.start}-{args.end}) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Streaming timeline of the Moon's exact aspects and sign ingresses.
+
+Translation of light, recent separations and the Moon story all ask the
+same question: what does the Moon do next (or last)? Sampling the Moon's
+extrapolated longitude every half day only finds aspects to that
+resolution and repeats the work for each caller. :func:`lunar_timeline`
+instead walks the real ephemeris one step at a time, solves every aspect
+perfection and ingress inside the step exactly, and yields them in time
+order. Consumers iterate and stop as soon as they have what they need, so
+the ephemeris is only read as far as the answer requires::
+
+    for event in lunar_timeline(chart.julian_day, 15.0):
+        if event.is_ingress:
+            break
+
+Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import cfg
+
+from .ephemeris import get_ephemeris
+from .lunar_calendar import VOID_TARGETS, _ASPECT_BY_DEGREES, _ELONGATIONS, _refine
+from .precision import active_precision
+try:
+    from ...models import Aspect, Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, Planet, Sign
+
+ASPECT = "aspect"
+INGRESS = "ingress"
+
+_SWE_ID = {planet: body for body, planet in VOID_TARGETS.items()}
+TIMELINE_PLANETS = tuple(_SWE_ID)
+_SIGNS = list(Sign)
+
+# The Moon gains at most ~17 degrees a day on any planet: less than the 30
+# degrees between aspect angles or sign boundaries, so at most one event
+# per planet (and one ingress) can fall inside a one-day step.
+_STEP_DAYS = 1.0
+
+
+@dataclass
+class LunarEvent:
+    """An exact lunar aspect or a Moon sign ingress."""
+
+    kind: str  # ASPECT or INGRESS
+    jd: float
+    days: float  # from the timeline start; negative in the past
+    sign: Sign  # Moon's sign at the event (the sign entered, for an ingress)
+    planet: Optional[Planet] = None
+    aspect: Optional[Aspect] = None
+    orb: float = 0.0  # elongation the Moon covers between start and exactness
+
+    @property
+    def is_ingress(self) -> bool:
+        return self.kind == INGRESS
+
+
+def _levels_between(a: float, b: float, levels: np.ndarray, period: float) -> List[float]:
+    """Unwrapped ``levels`` (repeating every ``period``) strictly between ``a`` and ``b``."""
+    lo, hi = min(a, b), max(a, b)
+    found = []
+    base = np.floor(lo / period) * period
+    while base <= hi:
+        for level in levels:
+            value = base + level
+            if lo < value < hi:
+                found.append(float(value))
+        base += period
+    return found
+
+
+def moon_elongation(planet: Planet, jd: float, ephemeris=None) -> float:
+    """Moon-minus-``planet`` longitude at ``jd``, in ``[0, 360)`` degrees."""
+    ephemeris = ephemeris or get_ephemeris()
+    return (ephemeris.calc(jd, swe.MOON)[0] - ephemeris.calc(jd, _SWE_ID[planet])[0]) % 360.0
+
+
+def lunar_timeline(jd_start: float, days: float, backward: bool = False,
+                   planets: Iterable[Planet] = TIMELINE_PLANETS,
+                   ephemeris=None) -> Iterator[LunarEvent]:
+    """Yield the Moon's exact aspects and ingresses within ``days`` of ``jd_start``.
+
+    Events come in time order moving away from ``jd_start``: ascending
+    when looking forward, most recent first when ``backward``. Aspects are
+    the Ptolemaic aspects to ``planets`` (classical planets only). The
+    ephemeris defaults to the one for the active precision profile.
+    """
+    ephemeris = ephemeris or get_ephemeris()
+    settings = getattr(cfg().timing, "event_solver", None)
+    tolerance = (active_precision().solver_tolerance_days
+                 or getattr(settings, "tolerance_days", 1.0e-5))
+    bodies = [(planet, _SWE_ID[planet]) for planet in planets if planet in _SWE_ID]
+    direction = -1.0 if backward else 1.0
+
+    def position(body: int, jd: float) -> Tuple[float, float]:
+        data = ephemeris.calc(jd, body)
+        return data[0], data[3]
+
+    def separation(body: int, level: float):
+        def func(jd: float) -> Tuple[float, float]:
+            lon_moon, speed_moon = position(swe.MOON, jd)
+            lon_body, speed_body = position(body, jd)
+            return (lon_moon - lon_body - level + 180.0) % 360.0 - 180.0, speed_moon - speed_body
+        return func
+
+    def moon_offset(boundary: float):
+        def func(jd: float) -> Tuple[float, float]:
+            lon, speed = position(swe.MOON, jd)
+            return (lon - boundary + 180.0) % 360.0 - 180.0, speed
+        return func
+
+    # Unwrapped Moon longitude and Moon-minus-planet elongations at the step start
+    moon_start = position(swe.MOON, jd_start)[0]
+    elong_start = {body: (moon_start - position(body, jd_start)[0]) % 360.0 for _, body in bodies}
+    jd_a, moon_a, elong_a = jd_start, moon_start, dict(elong_start)
+
+    travelled = 0.0
+    while travelled < days:
+        step = min(_STEP_DAYS, days - travelled)
+        travelled += step
+        jd_b = jd_start + direction * travelled
+        lo, hi = min(jd_a, jd_b), max(jd_a, jd_b)
+
+        moon_raw = position(swe.MOON, jd_b)[0]
+        moon_b = moon_a + (moon_raw - moon_a + 180.0) % 360.0 - 180.0
+        events: List[LunarEvent] = []
+
+        for boundary in _levels_between(moon_a, moon_b, np.array([0.0]), 30.0):
+            guess = jd_a + (boundary - moon_a) / (moon_b - moon_a) * (jd_b - jd_a)
+            jd = _refine(moon_offset(boundary % 360.0), lo, hi, guess, tolerance)
+            # The Moon only moves forward, so in either direction this is
+            # the moment it entered the sign starting at the boundary
+            sign_index = int(boundary // 30.0) % 12
+            events.append(LunarEvent(INGRESS, jd, jd - jd_start, _SIGNS[sign_index]))
+
+        elong_b = {}
+        for planet, body in bodies:
+            raw = moon_raw - position(body, jd_b)[0]
+            elong_b[body] = elong_a[body] + (raw - elong_a[body] + 180.0) % 360.0 - 180.0
+            for level in _levels_between(elong_a[body], elong_b[body], _ELONGATIONS, 360.0):
+                guess = jd_a + (level - elong_a[body]) / (elong_b[body] - elong_a[body]) * (jd_b - jd_a)
+                jd = _refine(separation(body, level % 360.0), lo, hi, guess, tolerance)
+                degrees = level % 360.0
+                events.append(LunarEvent(
+                    ASPECT, jd, jd - jd_start,
+                    sign=_SIGNS[int(position(swe.MOON, jd)[0] // 30.0) % 12],
+                    planet=planet,
+                    aspect=_ASPECT_BY_DEGREES[int(min(degrees, 360.0 - degrees))],
+                    orb=abs(level - elong_start[body]),
+                ))
+
+        events.sort(key=lambda event: direction * event.jd)
+        yield from events
+        jd_a, moon_a, elong_a = jd_b, moon_b, elong_b
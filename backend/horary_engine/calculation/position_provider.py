@@ -0,0 +1,124 @@
+"""Pluggable sources of planetary positions.
+
+Positions are requested through the cached layer in ``ephemeris.py``,
+which delegates to a provider rather than calling ``swe.calc_ut`` directly,
+so the backing implementation can be swapped through ``ephemeris.provider``
+in the configuration:
+
+* ``swiss``     - Swiss Ephemeris, one C call per body per instant.
+* ``moshier``   - Swiss Ephemeris' analytical Moshier model; needs no data
+  files and is accurate to about an arcsecond for the traditional planets.
+* ``chebyshev`` - fitted Chebyshev polynomials evaluated in NumPy, much
+  cheaper for dense sweeps over many instants.
+
+Both return rows in ``swe.calc_ut`` layout:
+``(longitude, latitude, distance, lon_speed, lat_speed, dist_speed)``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import cfg
+
+from .chebyshev import DEFAULT_COEFFICIENTS_PATH, ChebyshevEphemeris
+
+logger = logging.getLogger(__name__)
+
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class SwissEphemerisProvider:
+    """Positions straight from Swiss Ephemeris."""
+
+    name = "swiss"
+
+    def __init__(self, flags: int = _FLAGS):
+        self.flags = flags
+
+    def calc(self, jd: float, body: int) -> Sequence[float]:
+        data, _ = swe.calc_ut(jd, body, self.flags)
+        return data
+
+    def calc_many(self, jds, body: int) -> np.ndarray:
+        return np.array([swe.calc_ut(jd, body, self.flags)[0] for jd in np.asarray(jds, dtype=float)])
+
+
+class MoshierProvider(SwissEphemerisProvider):
+    """Swiss Ephemeris restricted to the analytical Moshier model."""
+
+    name = "moshier"
+
+    def __init__(self):
+        super().__init__(swe.FLG_MOSEPH | swe.FLG_SPEED)
+
+
+class ChebyshevProvider:
+    """Positions from Chebyshev fits, with Swiss Ephemeris for other bodies."""
+
+    name = "chebyshev"
+
+    def __init__(self, ephemeris: Optional[ChebyshevEphemeris] = None):
+        self.ephemeris = ephemeris or ChebyshevEphemeris()
+        self._fallback = SwissEphemerisProvider()
+
+    def calc(self, jd: float, body: int) -> Sequence[float]:
+        if self.ephemeris.covers(body):
+            return self.ephemeris.calc(jd, body)
+        return self._fallback.calc(jd, body)
+
+    def calc_many(self, jds, body: int) -> np.ndarray:
+        if self.ephemeris.covers(body):
+            return self.ephemeris.calc_many(jds, body)
+        return self._fallback.calc_many(jds, body)
+
+
+def _load_chebyshev() -> ChebyshevProvider:
+    custom_path = getattr(getattr(cfg(), "ephemeris", None), "chebyshev_path", None)
+    path = Path(custom_path) if custom_path else DEFAULT_COEFFICIENTS_PATH
+    if path.exists():
+        try:
+            ephemeris = ChebyshevEphemeris.load(path)
+            logger.info(f"Loaded Chebyshev coefficients from {path}")
+            return ChebyshevProvider(ephemeris)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Chebyshev coefficients unavailable ({e}); fitting segments on demand")
+    return ChebyshevProvider()
+
+
+_FACTORIES = {
+    SwissEphemerisProvider.name: SwissEphemerisProvider,
+    MoshierProvider.name: MoshierProvider,
+    ChebyshevProvider.name: _load_chebyshev,
+}
+
+_providers: Dict[str, object] = {}
+_providers_lock = threading.Lock()
+
+
+def get_position_provider(name: Optional[str] = None):
+    """Return the shared provider called ``name`` (default: from configuration)."""
+    if name is None:
+        name = getattr(getattr(cfg(), "ephemeris", None), "provider", SwissEphemerisProvider.name)
+    provider = _providers.get(name)
+    if provider is None:
+        if name not in _FACTORIES:
+            raise ValueError(f"Unknown ephemeris provider: {name}")
+        with _providers_lock:
+            provider = _providers.get(name)
+            if provider is None:
+                provider = _FACTORIES[name]()
+                _providers[name] = provider
+    return provider
+
+
+def reset_position_providers() -> None:
+    """Drop shared providers so they are rebuilt from configuration (for testing)."""
+    with _providers_lock:
+        _providers.clear()
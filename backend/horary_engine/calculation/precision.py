@@ -0,0 +1,94 @@
+"""Named precision profiles for ephemeris work.
+
+Interactive judgments want full precision for the significators, while
+sweeps and batch jobs can trade a little accuracy for speed. A profile
+(``ephemeris.precision.profiles`` in ``horary_constants.yaml``) names the
+position provider and the event-solver tolerance to use. The active profile
+is per thread and scoped with :func:`use_precision`; the ephemeris layer,
+the event solver and everything built on them pick it up from there::
+
+    with use_precision("fast"):
+        calculator.calculate_chart(...)
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union
+
+from horary_config import cfg, section_items
+
+DEFAULT_PROFILE = "precise"
+
+
+@dataclass(frozen=True)
+class PrecisionProfile:
+    """Provider and solver settings used while a profile is active."""
+
+    name: str
+    provider: str
+    solver_tolerance_days: Optional[float] = None  # None = timing.event_solver
+
+
+def _settings():
+    return getattr(getattr(cfg(), "ephemeris", None), "precision", None)
+
+
+def precision_profile_names() -> List[str]:
+    profiles = getattr(_settings(), "profiles", None)
+    names = list(section_items(profiles)) if profiles is not None else []
+    return names or [DEFAULT_PROFILE]
+
+
+def get_precision_profile(name: Optional[str] = None) -> PrecisionProfile:
+    """Return the profile called ``name`` (default: ``ephemeris.precision.default``)."""
+    settings = _settings()
+    if name is None:
+        name = getattr(settings, "default", DEFAULT_PROFILE)
+    default_provider = getattr(getattr(cfg(), "ephemeris", None), "provider", "swiss")
+
+    entry = getattr(getattr(settings, "profiles", None), name, None)
+    if entry is None:
+        if name != DEFAULT_PROFILE:
+            raise ValueError(
+                f"Unknown precision profile: {name} (available: {', '.join(precision_profile_names())})"
+            )
+        return PrecisionProfile(name=name, provider=default_provider)
+
+    return PrecisionProfile(
+        name=name,
+        provider=getattr(entry, "provider", None) or default_provider,
+        solver_tolerance_days=getattr(entry, "solver_tolerance_days", None),
+    )
+
+
+_local = threading.local()
+
+
+def active_precision() -> PrecisionProfile:
+    """Profile of the innermost :func:`use_precision` block on this thread."""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        return stack[-1]
+    return get_precision_profile()
+
+
+@contextmanager
+def use_precision(profile: Union[str, PrecisionProfile, None]) -> Iterator[PrecisionProfile]:
+    """Make ``profile`` active on this thread; ``None`` keeps the current one."""
+    if profile is None:
+        yield active_precision()
+        return
+    if not isinstance(profile, PrecisionProfile):
+        profile = get_precision_profile(profile)
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(profile)
+    try:
+        yield profile
+    finally:
+        stack.pop()
@@ -0,0 +1,235 @@
+"""Precomputed retrograde/direct station calendar.
+
+Scanning the ephemeris for the next station costs thousands of
+``swe.calc_ut`` calls per planet. The calendar stores every station of
+Mercury through Saturn over a fixed epoch as sorted Julian Day arrays, so
+``calculate_next_station_time`` can answer with a bisect instead.
+
+The table is generated once from Swiss Ephemeris and shipped with the
+backend. To regenerate it for a different epoch::
+
+    python -m horary_engine.calculation.station_calendar --start 1900 --end 2100
+
+Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import logging
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import swisseph as swe
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+# Planets that turn retrograde/direct. The Sun and Moon never station
+# geocentrically, so lookups for them are answered without any table.
+STATION_BODIES = (swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN)
+NON_STATIONING_BODIES = (swe.SUN, swe.MOON)
+
+DEFAULT_CALENDAR_PATH = Path(__file__).parent / "data" / "station_calendar.bin"
+
+_MAGIC = b"HSTC"
+_VERSION = 1
+# magic, version, body count, first covered JD, last covered JD
+_HEADER = struct.Struct("<4sHHdd")
+# Swiss Ephemeris body id, number of stations that follow
+_BODY_HEADER = struct.Struct("<iI")
+
+_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+class StationCalendarMiss(LookupError):
+    """Raised when a query falls outside what the calendar can answer."""
+    pass
+
+
+class StationCalendar:
+    """Sorted station times per planet over a covered Julian Day range."""
+
+    def __init__(self, jd_start: float, jd_end: float, stations: Dict[int, array]):
+        self.jd_start = jd_start
+        self.jd_end = jd_end
+        self.stations = stations
+
+    def next_station(self, planet_id: int, jd_start: float, max_days: float) -> Optional[float]:
+        """Return the first station after ``jd_start`` within ``max_days``.
+
+        Returns ``None`` when the planet does not station in the window.
+
+        Raises:
+            StationCalendarMiss: If the planet or window is not covered.
+        """
+        if planet_id in NON_STATIONING_BODIES:
+            return None
+
+        table = self.stations.get(planet_id)
+        if table is None or not (self.jd_start <= jd_start < self.jd_end):
+            raise StationCalendarMiss(f"No station data for body {planet_id} at JD {jd_start}")
+
+        jd_limit = jd_start + max_days
+        idx = bisect.bisect_right(table, jd_start)
+        if idx < len(table):
+            station_jd = table[idx]
+            if station_jd < jd_limit:
+                return station_jd
+            return None
+
+        # No tabulated station after jd_start: only conclusive if the
+        # whole window lies inside the covered range.
+        if jd_limit <= self.jd_end:
+            return None
+        raise StationCalendarMiss(f"Window for body {planet_id} extends past JD {self.jd_end}")
+
+    @classmethod
+    def load(cls, path: Path) -> "StationCalendar":
+        """Read a calendar written by :meth:`save`."""
+        data = Path(path).read_bytes()
+        magic, version, body_count, jd_start, jd_end = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported station calendar file: {path}")
+
+        offset = _HEADER.size
+        stations: Dict[int, array] = {}
+        for _ in range(body_count):
+            body_id, count = _BODY_HEADER.unpack_from(data, offset)
+            offset += _BODY_HEADER.size
+            values = array("d")
+            values.frombytes(data[offset:offset + count * values.itemsize])
+            if sys.byteorder != "little":
+                values.byteswap()
+            offset += count * values.itemsize
+            stations[body_id] = values
+
+        return cls(jd_start, jd_end, stations)
+
+    def save(self, path: Path) -> None:
+        """Write the calendar as a compact little-endian binary file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(self.stations), self.jd_start, self.jd_end))
+            for body_id, values in sorted(self.stations.items()):
+                f.write(_BODY_HEADER.pack(body_id, len(values)))
+                out = array("d", values)
+                if sys.byteorder != "little":
+                    out.byteswap()
+                f.write(out.tobytes())
+
+
+def _speed(planet_id: int, jd: float) -> float:
+    data, _ = swe.calc_ut(jd, planet_id, _FLAGS)
+    return data[3]
+
+
+def _bisect_station(planet_id: int, jd_before: float, jd_after: float,
+                    speed_before: float, tolerance: float) -> float:
+    """Narrow a bracketed speed sign change down to ``tolerance`` days."""
+    while (jd_after - jd_before) > tolerance:
+        jd_mid = (jd_before + jd_after) / 2
+        speed_mid = _speed(planet_id, jd_mid)
+        if (speed_before > 0) == (speed_mid > 0):
+            jd_before, speed_before = jd_mid, speed_mid
+        else:
+            jd_after = jd_mid
+    return (jd_before + jd_after) / 2
+
+
+def find_stations(planet_id: int, jd_start: float, jd_end: float,
+                  step_days: float = 1.0, tolerance: float = 1e-6) -> array:
+    """Scan the ephemeris for every station of a planet between two dates.
+
+    A one-day step is safe for the classical planets: the shortest
+    retrograde period (Mercury) lasts about three weeks.
+    """
+    stations = array("d")
+    jd_prev = jd_start
+    speed_prev = _speed(planet_id, jd_prev)
+    jd = jd_start + step_days
+    while jd <= jd_end:
+        speed = _speed(planet_id, jd)
+        if (speed_prev > 0 and speed < 0) or (speed_prev < 0 and speed > 0):
+            stations.append(_bisect_station(planet_id, jd_prev, jd, speed_prev, tolerance))
+        jd_prev, speed_prev = jd, speed
+        jd += step_days
+    return stations
+
+
+def build_station_calendar(start_year: int, end_year: int,
+                           bodies: Iterable[int] = STATION_BODIES) -> StationCalendar:
+    """Compute a calendar covering 1 January ``start_year`` to 1 January ``end_year``."""
+    jd_start = swe.julday(start_year, 1, 1, 0.0)
+    jd_end = swe.julday(end_year, 1, 1, 0.0)
+    stations = {body: find_stations(body, jd_start, jd_end) for body in bodies}
+    return StationCalendar(jd_start, jd_end, stations)
+
+
+_calendar: Optional[StationCalendar] = None
+_calendar_loaded = False
+_calendar_lock = threading.Lock()
+
+
+def _configured_path() -> Optional[Path]:
+    settings = getattr(cfg().timing, "station_calendar", None)
+    if settings is not None and not getattr(settings, "enabled", True):
+        return None
+    custom_path = getattr(settings, "path", None) if settings is not None else None
+    return Path(custom_path) if custom_path else DEFAULT_CALENDAR_PATH
+
+
+def get_station_calendar() -> Optional[StationCalendar]:
+    """Return the process-wide calendar, loading it on first use.
+
+    Returns ``None`` when the calendar is disabled or cannot be read, in
+    which case callers fall back to scanning the ephemeris.
+    """
+    global _calendar, _calendar_loaded
+    if _calendar_loaded:
+        return _calendar
+    with _calendar_lock:
+        if not _calendar_loaded:
+            path = _configured_path()
+            if path is not None:
+                try:
+                    _calendar = StationCalendar.load(path)
+                    logger.info(f"Loaded station calendar from {path}")
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Station calendar unavailable ({e}); falling back to ephemeris scan")
+                    _calendar = None
+            _calendar_loaded = True
+    return _calendar
+
+
+def reset_station_calendar() -> None:
+    """Forget the loaded calendar so the next lookup reloads it (for testing)."""
+    global _calendar, _calendar_loaded
+    with _calendar_lock:
+        _calendar = None
+        _calendar_loaded = False
+
+
+def main(argv: Optional[list] = None) -> None:
+    settings = getattr(cfg().timing, "station_calendar", None)
+    parser = argparse.ArgumentParser(description="Generate the planetary station calendar")
+    parser.add_argument("--start", type=int, default=getattr(settings, "start_year", 1900))
+    parser.add_argument("--end", type=int, default=getattr(settings, "end_year", 2100))
+    parser.add_argument("--output", type=Path, default=DEFAULT_CALENDAR_PATH)
+    args = parser.parse_args(argv)
+
+    calendar = build_station_calendar(args.start, args.end)
+    calendar.save(args.output)
+    total = sum(len(v) for v in calendar.stations.values())
+    print(f"Wrote {total} stations ({args.start}-{args.end}) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Columnar calculation of many horary charts at once.
+
+``EnhancedTraditionalAstrologicalCalculator.calculate_chart`` builds one
+fully populated ``HoraryChart`` per call, with Python loops over planets,
+houses and aspect pairs. Research and electional sweeps need thousands of
+charts but usually only a few numeric columns of each, so
+``calculate_chart_batch`` computes the core quantities for all instants as
+NumPy arrays and only builds a ``HoraryChart`` when one is asked for.
+
+Planet axes follow :data:`BATCH_PLANETS`; aspect codes index
+:data:`BATCH_ASPECTS` with ``-1`` meaning no aspect.
+"""
+
+from __future__ import annotations
+
+import datetime
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import cfg
+from .aspects import ASPECT_ORDER, aspect_matrices, orb_limit_matrix, perfects_within_sign
+from .calculation.helpers import sun_altitude_at_civil_twilight
+from .dignities import HOUSE_JOYS, dignity_table, essential_dignity_score
+from .calculation.precision import active_precision, use_precision
+try:
+    from ..models import Aspect, HoraryChart, Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, HoraryChart, Planet, Sign
+
+BATCH_PLANETS: List[Planet] = [
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+]
+BATCH_ASPECTS: List[Aspect] = ASPECT_ORDER
+SIGNS: List[Sign] = list(Sign)
+
+_DIURNAL = (Planet.SUN, Planet.JUPITER, Planet.SATURN)
+_NOCTURNAL = (Planet.MOON, Planet.VENUS, Planet.MARS)
+
+
+class ChartBatch:
+    """NumPy columns for ``N`` charts, materialising ``HoraryChart`` lazily.
+
+    Arrays are shaped ``(N,)`` per chart, ``(N, 7)`` per planet, ``(N, 12)``
+    per house cusp and ``(N, 7, 7)`` per planet pair.
+    """
+
+    def __init__(self, calculator, julian_day: np.ndarray, latitude: np.ndarray,
+                 longitude: np.ndarray, location_names: Sequence[str],
+                 positions: np.ndarray, cusps: np.ndarray, ascendant: np.ndarray,
+                 midheaven: np.ndarray):
+        self._calculator = calculator
+        self._charts: Dict[int, HoraryChart] = {}
+        # Charts materialised later use the profile the batch was computed with
+        self.precision = active_precision().name
+        self.planets = BATCH_PLANETS
+        self.julian_day = julian_day
+        self.latitude = latitude
+        self.longitude = longitude
+        self.location_names = list(location_names)
+
+        self.planet_longitude = positions[:, :, 0]
+        self.planet_latitude = positions[:, :, 1]
+        self.speed = positions[:, :, 3]
+        self.retrograde = self.speed < 0
+        self.sign = np.floor(self.planet_longitude / 30.0).astype(np.int8) % 12
+
+        self.cusps = cusps
+        self.ascendant = ascendant
+        self.midheaven = midheaven
+        self.house = _house_positions(self.planet_longitude, cusps)
+
+        self.essential_dignity, self.accidental_dignity = _dignity_scores(self)
+        self.dignity_score = self.essential_dignity + self.accidental_dignity
+
+        aspects = aspect_matrices(self.planet_longitude, self.speed, orb_limit_matrix(BATCH_PLANETS))
+        self.aspect = aspects.code
+        self.aspect_orb = aspects.orb
+        self.applying = aspects.applying
+        # Linear extrapolation from the chart speeds (HoraryChart aspects are
+        # timed against the ephemeris instead)
+        self.time_to_perfection = aspects.time_to_perfection
+        self.perfection_within_sign = self.applying & perfects_within_sign(
+            self.planet_longitude, self.speed, self.time_to_perfection
+        )
+
+    def __len__(self) -> int:
+        return len(self.julian_day)
+
+    def __getitem__(self, index: int) -> HoraryChart:
+        return self.chart(index)
+
+    def __iter__(self) -> Iterator[HoraryChart]:
+        for index in range(len(self)):
+            yield self.chart(index)
+
+    def chart(self, index: int) -> HoraryChart:
+        """Build (once) the full ``HoraryChart`` for one row.
+
+        The chart goes through ``calculate_chart`` so it carries everything a
+        single calculation would, including aspect timing and lunar aspects.
+        Batch times are UTC, so the chart's local time is UTC as well.
+        """
+        if index < 0:
+            index += len(self)
+        chart = self._charts.get(index)
+        if chart is None:
+            dt_utc = _jd_to_datetime(float(self.julian_day[index]))
+            chart = self._calculator.calculate_chart(
+                dt_utc,
+                dt_utc,
+                "UTC",
+                float(self.latitude[index]),
+                float(self.longitude[index]),
+                self.location_names[index],
+                precision=self.precision,
+            )
+            self._charts[index] = chart
+        return chart
+
+
+def calculate_chart_batch(calculator, times: Sequence, lats, lons,
+                          location_names: Optional[Sequence[str]] = None,
+                          precision: Optional[str] = None) -> ChartBatch:
+    """Compute ``N`` charts as columns; see ``ChartBatch``.
+
+    ``times`` holds UTC datetimes (aware values are converted) or Julian
+    Days. ``lats``/``lons`` are scalars or length-``N`` sequences.
+    ``precision`` names the profile for the job (default: the active one).
+    """
+    with use_precision(precision):
+        return _calculate_chart_batch(calculator, times, lats, lons, location_names)
+
+
+def _calculate_chart_batch(calculator, times, lats, lons, location_names) -> ChartBatch:
+    jd = np.array([_to_julian_day(t) for t in times], dtype=float)
+    n = jd.size
+    lat = np.broadcast_to(np.asarray(lats, dtype=float), (n,)).copy()
+    lon = np.broadcast_to(np.asarray(lons, dtype=float), (n,)).copy()
+    if location_names is None:
+        location_names = [f"{a:.4f}, {b:.4f}" for a, b in zip(lat, lon)]
+
+    ephemeris = calculator.ephemeris
+    positions = np.empty((n, len(BATCH_PLANETS), 6))
+    for p, planet in enumerate(BATCH_PLANETS):
+        positions[:, p, :] = ephemeris.calc_many(jd, calculator.planets_swe[planet])
+
+    # swe.houses has no vector form; one C call per chart
+    cusps = np.empty((n, 12))
+    ascendant = np.empty(n)
+    midheaven = np.empty(n)
+    for i in range(n):
+        houses_data, ascmc = swe.houses(jd[i], lat[i], lon[i], b'R')  # Regiomontanus
+        cusps[i] = houses_data
+        ascendant[i] = ascmc[0]
+        midheaven[i] = ascmc[1]
+
+    return ChartBatch(calculator, jd, lat, lon, location_names, positions, cusps, ascendant, midheaven)
+
+
+def _to_julian_day(value) -> float:
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return swe.julday(value.year, value.month, value.day,
+                          value.hour + value.minute / 60.0 + value.second / 3600.0)
+    return float(value)
+
+
+def _jd_to_datetime(jd: float) -> datetime.datetime:
+    year, month, day, hours = swe.revjul(jd)
+    # Round to the second so calculate_chart reproduces the same Julian Day
+    seconds = int(round(hours * 3600.0))
+    return datetime.datetime(year, month, day) + datetime.timedelta(seconds=seconds)
+
+
+def _house_positions(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """House (1-12) of every planet, matching ``_calculate_house_position``."""
+    cusps = cusps % 360.0
+    width = (np.roll(cusps, -1, axis=1) - cusps) % 360.0
+    offset = (longitudes[:, :, None] % 360.0 - cusps[:, None, :]) % 360.0
+    inside = offset < width[:, None, :]
+    house = np.argmax(inside, axis=2) + 1
+    house[~inside.any(axis=2)] = 1
+    return house.astype(np.int8)
+
+
+def _dignity_scores(batch: ChartBatch):
+    """Essential and accidental scores matching the single-chart calculator."""
+    calculator = batch._calculator
+    config = cfg()
+    n = len(batch)
+    sign = batch.sign.astype(np.intp)
+    house = batch.house
+    degree = batch.planet_longitude % 30.0
+
+    sun = BATCH_PLANETS.index(Planet.SUN)
+    is_day = batch.house[:, sun] >= 7  # Sun below the horizon in houses 7-12
+
+    # Essential dignity for every planet at once from the compiled table
+    masks = dignity_table(config).batch_masks(sign, degree, is_day)
+    essential = essential_dignity_score(masks, config)
+    accidental = np.zeros((n, len(BATCH_PLANETS)), dtype=np.int64)
+
+    # Angular cusps within 5 degrees count as angular regardless of house
+    angular_cusps = batch.cusps[:, [0, 3, 6, 9]] % 360.0
+    diff = np.abs(batch.planet_longitude[:, :, None] % 360.0 - angular_cusps[:, None, :])
+    near_angle = (np.minimum(diff, 360.0 - diff) <= 5.0).any(axis=2)
+    house_class = np.where(np.isin(house, (1, 4, 7, 10)), config.dignity.angular,
+                           np.where(np.isin(house, (2, 5, 8, 11)), config.dignity.succedent,
+                                    config.dignity.cadent))
+    angularity = np.where(near_angle, config.dignity.angular, house_class)
+
+    sun_lon = batch.planet_longitude[:, sun]
+    solar = config.confidence.solar
+    sun_altitude: Optional[np.ndarray] = None
+
+    for p, planet in enumerate(BATCH_PLANETS):
+        s = sign[:, p]
+        acc = accidental[:, p]
+
+        acc += np.where(house[:, p] == HOUSE_JOYS[planet], config.dignity.joy, 0)
+        acc += angularity[:, p]
+        acc += _speed_scores(planet, batch.speed[:, p], config)
+        acc += np.where(batch.retrograde[:, p], config.retrograde.dignity_penalty, 0)
+        if planet in _DIURNAL:
+            acc += np.where(is_day, config.dignity.hayz_bonus, config.dignity.hayz_penalty)
+        elif planet in _NOCTURNAL:
+            acc += np.where(is_day, config.dignity.hayz_penalty, config.dignity.hayz_bonus)
+
+        if planet == Planet.SUN:
+            continue
+        elong = np.abs(batch.planet_longitude[:, p] - sun_lon)
+        elong = np.minimum(elong, 360.0 - elong)
+        cazimi = elong <= 17 / 60.0
+        combust = ~cazimi & (elong <= 8.5)
+        beams = ~cazimi & ~combust & (elong <= 17.0)
+
+        exception = np.zeros(n, dtype=bool)
+        if planet in calculator.combustion_resistant:
+            candidates = (combust | beams) & (elong >= 10.0)
+            if candidates.any():
+                if sun_altitude is None:
+                    sun_altitude = np.full(n, np.nan)
+                for i in np.nonzero(candidates & np.isnan(sun_altitude))[0]:
+                    sun_altitude[i] = sun_altitude_at_civil_twilight(
+                        batch.latitude[i], batch.longitude[i], batch.julian_day[i])
+                dark = sun_altitude <= -8.0
+                if planet == Planet.MERCURY:
+                    in_own = np.isin(s, (SIGNS.index(Sign.GEMINI), SIGNS.index(Sign.VIRGO)))
+                    exception = candidates & dark & (in_own | (elong >= 18.0))
+                else:
+                    exception = candidates & (dark | (elong >= 40.0))
+
+        acc += np.where(cazimi & (elong <= 3 / 60.0), solar.exact_cazimi_bonus,
+                        np.where(cazimi, solar.cazimi_bonus, 0))
+        acc -= np.where(combust & ~exception, solar.combustion_penalty, 0)
+        acc -= np.where(beams & ~exception, solar.under_beams_penalty, 0)
+
+    return essential, accidental
+
+
+def _speed_scores(planet: Planet, speed: np.ndarray, config) -> np.ndarray:
+    bonus, penalty = config.dignity.speed_bonus, config.dignity.speed_penalty
+    if planet == Planet.MOON:
+        return np.where(speed > 13.0, bonus, np.where(speed < 11.0, penalty, 0))
+    if planet in (Planet.MERCURY, Planet.VENUS):
+        return np.where(speed > 1.0, bonus, 0)
+    if planet in (Planet.MARS, Planet.JUPITER, Planet.SATURN):
+        return np.where(speed > 0.3, bonus, np.where(speed < 0.1, penalty, 0))
+    return np.zeros(speed.shape, dtype=np.int64)
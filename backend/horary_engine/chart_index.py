@@ -0,0 +1,126 @@
+"""Lookup structures built once per chart.
+
+Judgment code keeps asking the same structural questions of a chart: which
+aspect joins two planets, which houses a planet rules, which house a
+longitude falls in. :class:`ChartIndex` answers them from maps built on
+first use instead of scanning ``chart.aspects``, ``chart.house_rulers`` or
+the cusps every time.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from ..models import AspectInfo, HoraryChart, Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import AspectInfo, HoraryChart, Planet
+
+
+class HouseCusps:
+    """House lookup by bisecting the cusps measured from the Ascendant.
+
+    Cusps that are not in zodiacal order (degenerate house systems at high
+    latitudes) fall back to the cusp-by-cusp scan.
+    """
+
+    def __init__(self, houses: Sequence[float]):
+        self._cusps = [cusp % 360 for cusp in houses]
+        self._origin = self._cusps[0] if self._cusps else 0.0
+        offsets = [(cusp - self._origin) % 360 for cusp in self._cusps]
+        ordered = len(offsets) == 12 and all(a < b for a, b in zip(offsets, offsets[1:]))
+        self._offsets: Optional[List[float]] = offsets if ordered else None
+
+    def house_of(self, longitude: float) -> int:
+        """House (1-12) containing ``longitude``."""
+        longitude = longitude % 360
+        if self._offsets is None:
+            return _scan_house(longitude, self._cusps)
+        return bisect_right(self._offsets, (longitude - self._origin) % 360)
+
+
+def _scan_house(longitude: float, cusps: List[float]) -> int:
+    for i in range(len(cusps)):
+        current_cusp = cusps[i]
+        next_cusp = cusps[(i + 1) % len(cusps)]
+        if current_cusp > next_cusp:  # Crosses 0°
+            if longitude >= current_cusp or longitude < next_cusp:
+                return i + 1
+        elif current_cusp <= longitude < next_cusp:
+            return i + 1
+    return 1
+
+
+@lru_cache(maxsize=64)
+def _house_cusps(houses: Tuple[float, ...]) -> HouseCusps:
+    return HouseCusps(houses)
+
+
+def house_position(longitude: float, houses: Sequence[float]) -> int:
+    """House (1-12) of ``longitude`` for the given cusps."""
+    return _house_cusps(tuple(houses)).house_of(longitude)
+
+
+class ChartIndex:
+    """Aspects by planet pair and by planet, houses by ruler, and house lookup.
+
+    Lists keep the order of ``chart.aspects`` and ``chart.house_rulers`` so a
+    lookup returns what a scan of the chart would have found first.
+    """
+
+    def __init__(self, chart: HoraryChart):
+        pairs: Dict[Tuple[Planet, Planet], List[AspectInfo]] = {}
+        by_planet: Dict[Planet, List[AspectInfo]] = {}
+        for aspect in chart.aspects:
+            between = pairs.get((aspect.planet1, aspect.planet2))
+            if between is None:
+                between = pairs[(aspect.planet1, aspect.planet2)] = []
+                pairs[(aspect.planet2, aspect.planet1)] = between
+            between.append(aspect)
+            by_planet.setdefault(aspect.planet1, []).append(aspect)
+            if aspect.planet2 != aspect.planet1:
+                by_planet.setdefault(aspect.planet2, []).append(aspect)
+        self._pairs = pairs
+        self._by_planet = by_planet
+
+        houses_ruled: Dict[Planet, List[int]] = {}
+        for house, ruler in chart.house_rulers.items():
+            houses_ruled.setdefault(ruler, []).append(house)
+        self._houses_ruled = houses_ruled
+
+        self.cusps = HouseCusps(chart.houses)
+
+    def aspects_between(self, planet1: Planet, planet2: Planet) -> Sequence[AspectInfo]:
+        """Aspects joining the two planets, in either order."""
+        return self._pairs.get((planet1, planet2), ())
+
+    def aspect_between(
+        self, planet1: Planet, planet2: Planet, applying: Optional[bool] = None
+    ) -> Optional[AspectInfo]:
+        """First aspect joining the two planets, optionally only applying or separating ones."""
+        for aspect in self._pairs.get((planet1, planet2), ()):
+            if applying is None or aspect.applying == applying:
+                return aspect
+        return None
+
+    def aspects_of(self, planet: Planet) -> Sequence[AspectInfo]:
+        """Aspects the planet takes part in."""
+        return self._by_planet.get(planet, ())
+
+    def houses_ruled(self, planet: Planet) -> Sequence[int]:
+        """Houses whose cusp sign the planet rules."""
+        return self._houses_ruled.get(planet, ())
+
+    def house_of(self, longitude: float) -> int:
+        """House (1-12) of ``longitude`` in this chart."""
+        return self.cusps.house_of(longitude)
+
+
+def chart_index(chart: HoraryChart) -> ChartIndex:
+    """The chart's :class:`ChartIndex`, created on first use."""
+    index = getattr(chart, "index_cache", None)
+    if index is None:
+        index = chart.index_cache = ChartIndex(chart)
+    return index
@@ -0,0 +1,66 @@
+"""Per-chart memo of derived quantities.
+
+One judgment asks the same questions of a chart many times: the significators
+for the question, whether the Moon is void, whether the chart is radical, when
+a planet next stations. :class:`ChartContext` remembers each answer for the
+life of the chart so the helpers that compute them run once per argument set.
+
+The memo is dropped when the configuration is reloaded, since every cached
+result depends on it.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from horary_config import cfg
+try:
+    from ..models import HoraryChart
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import HoraryChart
+
+
+class ChartContext:
+    """Memoized helper results for one chart.
+
+    Values are keyed by helper name and argument key. ``hits`` and
+    ``misses`` count lookups per helper name.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Tuple[str, Hashable], Any] = {}
+        self._config = None
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    def memo(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value cached under ``(name, key)``, computing it once."""
+        config = cfg()
+        if config is not self._config:
+            self._values.clear()
+            self._config = config
+        slot = (name, key)
+        try:
+            value = self._values[slot]
+        except KeyError:
+            self.misses[name] += 1
+            value = self._values[slot] = compute()
+            return value
+        self.hits[name] += 1
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit and miss counts per helper name."""
+        return {
+            name: {"hits": self.hits[name], "misses": self.misses[name]}
+            for name in sorted(set(self.hits) | set(self.misses))
+        }
+
+
+def chart_context(chart: HoraryChart) -> ChartContext:
+    """The chart's :class:`ChartContext`, created on first use."""
+    context = getattr(chart, "context", None)
+    if context is None:
+        context = chart.context = ChartContext()
+    return context
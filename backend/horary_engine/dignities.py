@@ -0,0 +1,237 @@
+"""Compiled essential dignity tables.
+
+A planet's essential dignities depend only on its sign, its whole degree
+within the sign (terms and faces change on whole degrees) and whether the
+chart is diurnal. :func:`dignity_table` compiles the rulership, exaltation,
+triplicity, detriment and fall tables below together with the terms and
+faces from ``horary_constants.yaml`` into arrays indexed by
+``(sign, degree)``, so the calculator, the reception calculator and the
+batch calculator look a planet up instead of walking the YAML lists.
+
+Each cell holds a bitmask of the dignity flags for every planet of
+:data:`DIGNITY_PLANETS`, separately for night and day charts.
+
+Classical source: Lilly, Christian Astrology I - table of the essential
+dignities of the planets
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from horary_config import cfg
+try:
+    from ..models import Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet, Sign
+
+DIGNITY_PLANETS: List[Planet] = [
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+]
+SIGNS: List[Sign] = list(Sign)
+
+# Dignity flags stored in the table masks
+RULERSHIP = 1
+EXALTATION = 2
+TRIPLICITY = 4
+TERM = 8
+FACE = 16
+DETRIMENT = 32
+FALL = 64
+
+# Positive dignities in order of strength with their report labels
+ESSENTIAL_DIGNITIES: List[Tuple[int, str]] = [
+    (RULERSHIP, "rulership"),
+    (EXALTATION, "exaltation"),
+    (TRIPLICITY, "triplicity"),
+    (TERM, "term"),
+    (FACE, "face"),
+]
+
+EXALTATIONS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.ARIES,
+    Planet.MOON: Sign.TAURUS,
+    Planet.MERCURY: Sign.VIRGO,
+    Planet.VENUS: Sign.PISCES,
+    Planet.MARS: Sign.CAPRICORN,
+    Planet.JUPITER: Sign.CANCER,
+    Planet.SATURN: Sign.LIBRA,
+}
+
+# Opposite to exaltations
+FALLS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.LIBRA,
+    Planet.MOON: Sign.SCORPIO,
+    Planet.MERCURY: Sign.PISCES,
+    Planet.VENUS: Sign.VIRGO,
+    Planet.MARS: Sign.CANCER,
+    Planet.JUPITER: Sign.CAPRICORN,
+    Planet.SATURN: Sign.ARIES,
+}
+
+# Opposite to rulership
+DETRIMENTS: Dict[Planet, List[Sign]] = {
+    Planet.SUN: [Sign.AQUARIUS],
+    Planet.MOON: [Sign.CAPRICORN],
+    Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
+    Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
+    Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
+    Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
+    Planet.SATURN: [Sign.CANCER, Sign.LEO],
+}
+
+# Triplicity rulers by element as (day, night)
+_FIRE = (Planet.SUN, Planet.JUPITER)
+_EARTH = (Planet.VENUS, Planet.MOON)
+_AIR = (Planet.SATURN, Planet.MERCURY)
+_WATER = (Planet.VENUS, Planet.MARS)
+TRIPLICITY_RULERS: Dict[Sign, Tuple[Planet, Planet]] = {
+    Sign.ARIES: _FIRE, Sign.LEO: _FIRE, Sign.SAGITTARIUS: _FIRE,
+    Sign.TAURUS: _EARTH, Sign.VIRGO: _EARTH, Sign.CAPRICORN: _EARTH,
+    Sign.GEMINI: _AIR, Sign.LIBRA: _AIR, Sign.AQUARIUS: _AIR,
+    Sign.CANCER: _WATER, Sign.SCORPIO: _WATER, Sign.PISCES: _WATER,
+}
+
+HOUSE_JOYS: Dict[Planet, int] = {
+    Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
+    Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12,
+}
+
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(DIGNITY_PLANETS)}
+_SIGN_INDEX: Dict[Sign, int] = {sign: i for i, sign in enumerate(SIGNS)}
+
+
+class DignityTable:
+    """Essential dignity masks indexed by ``(sign, degree)``.
+
+    ``term_ruler`` and ``face_ruler`` are shaped ``(12, 30)`` and hold the
+    index in :data:`DIGNITY_PLANETS` of the ruler (``-1`` when the YAML has
+    none). ``masks`` is shaped ``(2, 12, 30, 7)`` with night charts at
+    index 0 and day charts at index 1.
+    """
+
+    def __init__(self, term_ruler: np.ndarray, face_ruler: np.ndarray, masks: np.ndarray):
+        self.term_ruler = term_ruler
+        self.face_ruler = face_ruler
+        self.masks = masks
+        # Nested lists index faster than NumPy for one planet at a time
+        self._cells = masks.tolist()
+
+    def mask(self, planet: Planet, sign: Sign, degree: float, is_day: bool) -> int:
+        """Dignity flags of ``planet`` at ``degree`` (0-30) of ``sign``."""
+        p = _PLANET_INDEX.get(planet)
+        if p is None:
+            return 0
+        return self._cells[int(is_day)][_SIGN_INDEX[sign]][_whole_degree(degree)][p]
+
+    def batch_masks(self, sign: np.ndarray, degree: np.ndarray, is_day: np.ndarray) -> np.ndarray:
+        """Masks for positions shaped ``(..., 7)`` following :data:`DIGNITY_PLANETS`.
+
+        ``is_day`` is shaped ``(...)``, one flag per chart.
+        """
+        sign = np.asarray(sign, dtype=np.intp)
+        whole = np.minimum(np.asarray(degree, dtype=float).astype(np.intp), 29)
+        day = np.broadcast_to(np.asarray(is_day, dtype=np.intp)[..., None], sign.shape)
+        planet = np.broadcast_to(np.arange(len(DIGNITY_PLANETS)), sign.shape)
+        return self.masks[day, sign, whole, planet]
+
+
+def _whole_degree(degree: float) -> int:
+    # ``% 30`` can round up to exactly 30.0 just below a sign boundary
+    return min(int(degree), 29)
+
+
+def essential_dignity_score(mask, config=None):
+    """Essential dignity score of a mask, or of an array of masks.
+
+    Rulership, exaltation, triplicity, detriment and fall are weighted by
+    the ``dignity`` settings; a term counts 2 and a face 1.
+    """
+    weights = _weights(config or cfg())
+    if isinstance(mask, np.ndarray):
+        score = np.zeros(mask.shape, dtype=np.int64)
+        for flag, weight in weights:
+            score += np.where(mask & flag, weight, 0)
+        return score
+    return sum(weight for flag, weight in weights if mask & flag)
+
+
+def _weights(config) -> List[Tuple[int, int]]:
+    dignity = config.dignity
+    return [
+        (RULERSHIP, dignity.rulership),
+        (EXALTATION, dignity.exaltation),
+        (TRIPLICITY, dignity.triplicity),
+        (TERM, 2),
+        (FACE, 1),
+        (DETRIMENT, dignity.detriment),
+        (FALL, dignity.fall),
+    ]
+
+
+def _bound_rulers(table) -> np.ndarray:
+    """Ruler index per ``(sign, degree)`` from a terms or faces section."""
+    rulers = np.full((len(SIGNS), 30), -1, dtype=np.int8)
+    if table is None:
+        return rulers
+    for s, sign in enumerate(SIGNS):
+        for bound in getattr(table, sign.sign_name, None) or []:
+            ruler = _PLANET_INDEX[Planet[bound.ruler.upper()]]
+            span = rulers[s, int(bound.start):int(bound.end)]
+            # The first matching bound wins, as in the YAML order
+            span[span == -1] = ruler
+    return rulers
+
+
+def build_dignity_table(config=None) -> DignityTable:
+    """Compile the dignity table from ``config`` (default: the active one)."""
+    config = config or cfg()
+    reception = getattr(config, "reception", None)
+    term_ruler = _bound_rulers(getattr(reception, "terms", None))
+    face_ruler = _bound_rulers(getattr(reception, "faces", None))
+
+    masks = np.zeros((2, len(SIGNS), 30, len(DIGNITY_PLANETS)), dtype=np.uint8)
+    for p, planet in enumerate(DIGNITY_PLANETS):
+        for s, sign in enumerate(SIGNS):
+            flags = 0
+            if sign.ruler == planet:
+                flags |= RULERSHIP
+            if EXALTATIONS.get(planet) == sign:
+                flags |= EXALTATION
+            if sign in DETRIMENTS.get(planet, ()):
+                flags |= DETRIMENT
+            if FALLS.get(planet) == sign:
+                flags |= FALL
+            masks[:, s, :, p] |= flags
+            day_ruler, night_ruler = TRIPLICITY_RULERS[sign]
+            if day_ruler == planet:
+                masks[1, s, :, p] |= TRIPLICITY
+            if night_ruler == planet:
+                masks[0, s, :, p] |= TRIPLICITY
+        masks[:, :, :, p] |= np.where(term_ruler == p, TERM, 0).astype(np.uint8)
+        masks[:, :, :, p] |= np.where(face_ruler == p, FACE, 0).astype(np.uint8)
+
+    return DignityTable(term_ruler, face_ruler, masks)
+
+
+_table_cache: Optional[Tuple[object, DignityTable]] = None
+
+
+def dignity_table(config=None) -> DignityTable:
+    """The compiled table, rebuilt only when the configuration object changes."""
+    global _table_cache
+    config = config or cfg()
+    cached = _table_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    table = build_dignity_table(config)
+    _table_cache = (config, table)
+    return table
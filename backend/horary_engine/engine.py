@@ -14,21 +14,26 @@ import datetime
 import logging
 import re
 import math
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from types import SimpleNamespace
 
 # Configuration system
-from horary_config import get_config, cfg, HoraryError
+from horary_config import get_config, cfg, HoraryError, with_config_snapshot
 
 # Timezone handling
 import swisseph as swe
 
 # Import our computational helpers
+from .calculation.ephemeris import get_ephemeris
+from .calculation.ephemeris_data import configure_ephemeris_data
+from .calculation.lunar_calendar import get_lunar_calendar
+from .calculation.lunar_timeline import TIMELINE_PLANETS, lunar_timeline, moon_elongation
+from .calculation.precision import active_precision, use_precision
+from .chart_batch import ChartBatch, calculate_chart_batch
 from .calculation.helpers import (
     calculate_next_station_time,
     calculate_future_longitude,
     calculate_sign_boundary_longitude,
-    days_to_sign_exit,
     calculate_elongation,
     is_planet_oriental,
     sun_altitude_at_civil_twilight,
@@ -38,8 +43,8 @@ from .calculation.helpers import (
     degrees_to_dms,
 )
 from .services.geolocation import (
-    TimezoneManager,
     LocationError,
+    get_timezone_manager,
     safe_geocode,
 )
 try:
@@ -358,8 +363,14 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
             """Return signed days until the aspect perfection.
 
             Positive values represent future contacts while negative values
-            indicate the aspect perfected that many days in the past.
+            indicate the aspect perfected that many days in the past. When a
+            Julian Day is supplied the future contact is solved against the
+            ephemeris instead.
             """
+            if jd_start:
+                return perfection_matrix(chart).time_to_perfection(
+                    p1.planet, p2.planet, aspect, max_days
+                )
             target_angles = {
                 Aspect.CONJUNCTION: 0,
                 Aspect.SEXTILE: 60,
@@ -386,8 +397,9 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
             Aspect.OPPOSITION,
         ]
         times: List[float] = []
+        max_days = cfg().timing.max_future_days
         for a in aspect_types:
-            t = _calc_aspect_time(pos1, pos2, a)
+            t = _calc_aspect_time(pos1, pos2, a, chart.julian_day, max_days)
             if t and t > 0:
                 times.append(t)
         if times:
@@ -451,9 +463,9 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
     relevant_houses = set()
     
     # Always include houses for significators
-    for house_num, ruler in chart.house_rulers.items():
-        if ruler == contract.get("querent") or ruler == contract.get("quesited"):
-            relevant_houses.add(house_num)
+    index = chart_index(chart)
+    relevant_houses.update(index.houses_ruled(contract.get("querent")))
+    relevant_houses.update(index.houses_ruled(contract.get("quesited")))
     
     # If no contract-based houses found, use category-specific houses
     if not relevant_houses:
@@ -584,6 +596,14 @@ except ImportError:  # pragma: no cover - fallback when package context is missi
     from taxonomy import Category, resolve_category, resolve as resolve_significators, get_defaults
     from category_rules import get_category_rules
 from .reception import TraditionalReceptionCalculator
+from .dignities import (
+    ESSENTIAL_DIGNITIES,
+    EXALTATIONS,
+    FALLS,
+    HOUSE_JOYS,
+    dignity_table,
+    essential_dignity_score,
+)
 from .aspects import (
     calculate_enhanced_aspects,
     calculate_moon_last_aspect,
@@ -595,19 +615,32 @@ from .serialization import (
     serialize_lunar_aspect,
     serialize_planet_with_solar,
 )
-from .perfection import check_future_prohibitions
+from .perfection import (
+    PerfectionMatrix,
+    check_future_prohibitions,
+    linear_future_aspect_time,
+    perfection_matrix,
+    solve_aspect_time,
+)
+from .context import ChartContext, chart_context
+from .response_fields import expand_fields, parse_fields, project, wants
+from .services.result_cache import get_result_cache, normalize_question
+from .chart_index import HouseCusps, chart_index, house_position
 
 
 class EnhancedTraditionalAstrologicalCalculator:
     """Enhanced Traditional astrological calculations with configuration system"""
+
+    # Regiomontanus - traditional for horary
+    HOUSE_SYSTEM = b'R'
     
     def __init__(self, timezone_manager=None):
-        # Set Swiss Ephemeris path
-        swe.set_ephe_path('')
-        
-        # Initialize timezone manager (use provided or create new)
-        self.timezone_manager = timezone_manager or TimezoneManager()
+        # Point Swiss Ephemeris at its data files and preload them
+        self.ephemeris_data = configure_ephemeris_data()
         
+        # Initialize timezone manager (use provided or the shared one)
+        self.timezone_manager = timezone_manager or get_timezone_manager()
+
         # Traditional planets only
         self.planets_swe = {
             Planet.SUN: swe.SUN,
@@ -619,27 +652,9 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.SATURN: swe.SATURN
         }
         
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA
-        }
-        
-        # Traditional falls (opposite to exaltations)
-        self.falls = {
-            Planet.SUN: Sign.LIBRA,
-            Planet.MOON: Sign.SCORPIO,
-            Planet.MERCURY: Sign.PISCES,
-            Planet.VENUS: Sign.VIRGO,
-            Planet.MARS: Sign.CANCER,
-            Planet.JUPITER: Sign.CAPRICORN,
-            Planet.SATURN: Sign.ARIES
-        }
+        # Traditional exaltations and falls (opposite to exaltations)
+        self.exaltations = EXALTATIONS
+        self.falls = FALLS
         
         # Planets that have traditional exceptions to combustion
         self.combustion_resistant = {
@@ -647,23 +662,41 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.VENUS: "Venus as morning/evening star"
         }
     
+    @property
+    def ephemeris(self):
+        """Shared, cached ephemeris for the active precision profile."""
+        return get_ephemeris()
+
     def get_real_moon_speed(self, jd_ut: float) -> float:
         """Get actual Moon speed from ephemeris in degrees per day"""
         try:
-            moon_data, ret_flag = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            moon_data = self.ephemeris.calc(jd_ut, swe.MOON)
             return abs(moon_data[3])  # degrees per day
         except Exception as e:
             logger.warning(f"Failed to get Moon speed from ephemeris: {e}")
             # Fall back to configured default
             return cfg().timing.default_moon_speed_fallback
+
+    @staticmethod
+    def julian_day(dt_utc: datetime.datetime) -> float:
+        """Julian Day (UT) of a UTC datetime, as used for the chart."""
+        return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                          dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
     
     def calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime, 
-                       timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
-        """Enhanced Calculate horary chart with configuration system"""
+                       timezone_info: str, lat: float, lon: float, location_name: str,
+                       precision: Optional[str] = None) -> HoraryChart:
+        """Enhanced Calculate horary chart with configuration system
+
+        ``precision`` names an ``ephemeris.precision`` profile; by default the
+        profile active on this thread is used.
+        """
+        if precision is not None:
+            with use_precision(precision):
+                return self.calculate_chart(dt_local, dt_utc, timezone_info, lat, lon, location_name)
         
         # Convert UTC datetime to Julian Day for Swiss Ephemeris
-        jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
-                          dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+        jd_ut = self.julian_day(dt_utc)
         
         logger.info(f"Calculating chart for:")
         logger.info(f"  Local time: {dt_local} ({timezone_info})")
@@ -680,7 +713,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         planets = {}
         for planet_enum, planet_id in self.planets_swe.items():
             try:
-                planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+                planet_data = self.ephemeris.calc(jd_ut, planet_id)
                 
                 longitude = planet_data[0]
                 latitude = planet_data[1]
@@ -715,7 +748,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         # Calculate houses (Regiomontanus - traditional for horary)
         try:
-            houses_data, ascmc = swe.houses(jd_ut, lat, lon, b'R')  # Regiomontanus
+            houses_data, ascmc = swe.houses(jd_ut, lat, lon, self.HOUSE_SYSTEM)
             houses = list(houses_data)
             ascendant = ascmc[0]
             midheaven = ascmc[1]
@@ -732,9 +765,9 @@ class EnhancedTraditionalAstrologicalCalculator:
             house_rulers[i] = sign.ruler
         
         # Update planet house positions
+        cusps = HouseCusps(houses)
         for planet_pos in planets.values():
-            house = self._calculate_house_position(planet_pos.longitude, houses)
-            planet_pos.house = house
+            planet_pos.house = cusps.house_of(planet_pos.longitude)
         
         # Enhanced solar condition analysis
         sun_pos = planets[Planet.SUN]
@@ -753,8 +786,10 @@ class EnhancedTraditionalAstrologicalCalculator:
             planet_pos.accidental_dignity = dignity_info["accidental_score"]
             planet_pos.dignities = dignity_info["dignities"]
         
-        # Calculate enhanced traditional aspects
-        aspects = calculate_enhanced_aspects(planets, jd_ut)
+        # Calculate enhanced traditional aspects; their solved perfection
+        # times seed the chart's shared perfection matrix
+        perfections = PerfectionMatrix(jd_ut, planets)
+        aspects = calculate_enhanced_aspects(planets, jd_ut, perfections)
 
         # NEW: Calculate last and next lunar aspects
         moon_last_aspect = calculate_moon_last_aspect(
@@ -779,12 +814,26 @@ class EnhancedTraditionalAstrologicalCalculator:
             solar_analyses=solar_analyses,
             julian_day=jd_ut,
             moon_last_aspect=moon_last_aspect,
-            moon_next_aspect=moon_next_aspect
+            moon_next_aspect=moon_next_aspect,
+            perfection_cache=perfections,
+            context=ChartContext(),
         )
         
         return chart
     
     
+    def calculate_chart_batch(self, times, lats, lons,
+                              location_names: Optional[List[str]] = None,
+                              precision: Optional[str] = None) -> ChartBatch:
+        """Calculate many charts at once as NumPy columns.
+
+        ``times`` are UTC datetimes or Julian Days. Positions, houses,
+        dignity scores and aspects match ``calculate_chart``; full
+        ``HoraryChart`` objects are built lazily via ``ChartBatch.chart``.
+        ``precision`` selects the profile for the whole job.
+        """
+        return calculate_chart_batch(self, times, lats, lons, location_names, precision)
+
     # [Continue with the rest of the methods...]
     # Due to space constraints, I'll continue with key methods
     
@@ -979,9 +1028,7 @@ class EnhancedTraditionalAstrologicalCalculator:
         so messaging and confidence adjustments can reference specific dignities like triplicity,
         term and face.
         """
-        essential_score = 0
         accidental_score = 0
-        dignities: List[str] = []
         config = cfg()
         sign = self._get_sign(planet_pos.longitude)
         house = planet_pos.house
@@ -989,70 +1036,18 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         # === ESSENTIAL DIGNITIES ===
         
-        # Rulership (+5)
-        if sign.ruler == planet:
-            essential_score += config.dignity.rulership
-            dignities.append("rulership")
-        
-        # Exaltation (+4)
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            essential_score += config.dignity.exaltation
-            dignities.append("exaltation")
-        
-        # Triplicity (+3) - traditional day/night rulers
-        triplicity_score = self._calculate_triplicity_dignity(planet, sign, sun_pos)
-        if triplicity_score:
-            essential_score += triplicity_score
-            dignities.append("triplicity")
-
-        # Terms (+2) and Faces (+1)
-        try:
-            terms_table = getattr(cfg().reception.terms, sign.sign_name)
-            for term in terms_table:
-                if term.start <= sign_degree < term.end and Planet[term.ruler.upper()] == planet:
-                    essential_score += 2
-                    dignities.append("term")
-                    break
-        except AttributeError:
-            pass
-
-        try:
-            faces_table = getattr(cfg().reception.faces, sign.sign_name)
-            for face in faces_table:
-                if face.start <= sign_degree < face.end and Planet[face.ruler.upper()] == planet:
-                    essential_score += 1
-                    dignities.append("face")
-                    break
-        except AttributeError:
-            pass
-        
-        # Detriment (-5)
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN], 
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            essential_score += config.dignity.detriment
-        
-        # Fall (-4)
-        if planet in self.falls and self.falls[planet] == sign:
-            essential_score += config.dignity.fall
+        # Rulership (+5), exaltation (+4), triplicity (+3), term (+2), face (+1),
+        # detriment (-5) and fall (-4) from the compiled dignity table.
+        # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6
+        is_day = sun_pos.house in [7, 8, 9, 10, 11, 12]
+        mask = dignity_table(config).mask(planet, sign, sign_degree, is_day)
+        essential_score = essential_dignity_score(mask, config)
+        dignities: List[str] = [name for flag, name in ESSENTIAL_DIGNITIES if mask & flag]
         
         # === ACCIDENTAL DIGNITIES ===
         
         # House joys (+2)
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if HOUSE_JOYS.get(planet) == house:
             accidental_score += config.dignity.joy
         
         # Angularity with 5° rule
@@ -1108,45 +1103,6 @@ class EnhancedTraditionalAstrologicalCalculator:
             "dignities": dignities
         }
     
-    def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition) -> int:
-        """Calculate traditional triplicity dignity (ENHANCED)"""
-        # Traditional triplicity rulers by element and day/night (CORRECTED)
-        triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius) 
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-            
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-            
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.SCORPIO: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.PISCES: {"day": Planet.VENUS, "night": Planet.MARS}
-        }
-        
-        if sign not in triplicity_rulers:
-            return 0
-            
-        # Determine if it's day or night (Sun above or below horizon)
-        # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
-        sun_house = sun_pos.house
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        sect = "day" if is_day else "night"
-        
-        if triplicity_rulers[sign][sect] == planet:
-            return cfg().dignity.triplicity  # Configurable triplicity score
-            
-        return 0
-    
     def _calculate_speed_dignity(self, planet: Planet, speed: float) -> int:
         """Calculate dignity bonus/penalty based on planetary speed (ENHANCED)"""
         config = cfg()
@@ -1274,20 +1230,7 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
         """Calculate house position"""
-        longitude = longitude % 360
-        
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-            
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
-        
-        return 1
+        return house_position(longitude, houses)
     
     def _get_traditional_angularity(self, longitude: float, houses: List[float], house: int) -> str:
         """Determine traditional angularity using 5° rule (ENHANCED)"""
@@ -1323,11 +1266,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def __init__(self):
         self.question_analyzer = TraditionalHoraryQuestionAnalyzer()
-        self.timezone_manager = TimezoneManager()
+        self.timezone_manager = get_timezone_manager()
         self.calculator = EnhancedTraditionalAstrologicalCalculator(timezone_manager=self.timezone_manager)
         self.reception_calculator = TraditionalReceptionCalculator()
     
-    def judge_question(self, question: str, location: str, 
+    @with_config_snapshot
+    def judge_question(self, *args, **kwargs) -> Dict[str, Any]:
+        """Enhanced Traditional horary judgment with configuration system
+
+        Takes the arguments of :meth:`judge_question_with_chart` and returns
+        only the result.
+        """
+        result, _chart = self.judge_question_with_chart(*args, **kwargs)
+        return result
+
+    @with_config_snapshot
+    def judge_question_with_chart(self, question: str, location: str, 
                       date_str: Optional[str] = None, time_str: Optional[str] = None,
                       timezone_str: Optional[str] = None, use_current_time: bool = True,
                       manual_houses: Optional[List[int]] = None,
@@ -1337,8 +1291,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
-        """Enhanced Traditional horary judgment with configuration system"""
+                      exaltation_confidence_boost: float = None,
+                      fields: Optional[Iterable[str]] = None) -> Tuple[Dict[str, Any], Optional[HoraryChart]]:
+        """Judge the question and return the result with the chart it was cast on.
+
+        The chart is the live :class:`HoraryChart` (``None`` when casting
+        failed), so callers can evaluate or audit it without rebuilding it
+        from the serialized ``chart_data``. ``fields`` limits the result to
+        those sections (see :mod:`horary_engine.response_fields`); sections
+        not requested are not computed.
+        """
+        fields = parse_fields(fields)
+        question = normalize_question(question)
         
         logger.info("=== JUDGE_QUESTION METHOD CALLED ===")
         logger.info(f"Location parameter: {location}")
@@ -1364,7 +1328,36 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
                     date_str, time_str, timezone_str, lat, lon)
             
-            chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
+            # Identical manual-time requests reuse the cached judgment or chart
+            cache = get_result_cache()
+            chart = chart_key = judgment_key = None
+            if use_current_time:
+                cache.bypass()
+            else:
+                chart_key = cache.chart_key(
+                    self.calculator.julian_day(dt_utc), lat, lon, self.calculator.HOUSE_SYSTEM,
+                    timezone_used, full_location, active_precision().name)
+                judgment_key = cache.judgment_key(
+                    chart_key, question,
+                    manual_houses=manual_houses,
+                    ignore_radicality=ignore_radicality,
+                    ignore_void_moon=ignore_void_moon,
+                    ignore_combustion=ignore_combustion,
+                    ignore_saturn_7th=ignore_saturn_7th,
+                    exaltation_confidence_boost=exaltation_confidence_boost,
+                    fields=fields)
+                cached = cache.get_judgment(judgment_key)
+                if cached is not None:
+                    return cached
+                chart = cache.get_chart(chart_key)
+            chart_cached = chart is not None
+            if chart is None:
+                try:
+                    chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
+                finally:
+                    if chart_key is not None:
+                        # Release concurrent requests waiting for this chart
+                        cache.share_chart(chart_key, chart)
             
             # Analyze question traditionally
             question_analysis = self.question_analyzer.analyze_question(question)
@@ -1556,15 +1549,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     judgment["confidence_source"] = "evaluation"
 
             judgment["scoring_trace"] = evaluation["trace"]
-            reasoning_bundle = serialize_reasoning_v1(structured_reasoning) if USE_REASONING_V1 else None
+            reasoning_bundle = None
+            if USE_REASONING_V1 and wants(fields, "reasoning_v1"):
+                reasoning_bundle = serialize_reasoning_v1(structured_reasoning)
 
             # Serialize chart data for frontend
-            chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
+            chart_data_serialized = None
+            if wants(fields, "chart_data"):
+                chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
 
-            general_info = self._calculate_general_info(chart)
-            considerations = self._calculate_considerations(chart, question_analysis)
+            general_info = self._calculate_general_info(chart) if wants(fields, "general_info") else None
+            considerations = None
+            if wants(fields, "considerations"):
+                considerations = self._calculate_considerations(chart, question_analysis)
+            moon_story = self._build_moon_story(chart) if wants(fields, "moon_aspects") else None
 
-            return {
+            result = project({
                 "question": question,
                 "judgment": judgment["result"],
                 "confidence": judgment["confidence"],
@@ -1576,7 +1576,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 
                 "question_analysis": question_analysis,
                 "timing": judgment.get("timing"),
-                "moon_aspects": self._build_moon_story(chart),  # Enhanced Moon story
+                "moon_aspects": moon_story,  # Enhanced Moon story
                 "traditional_factors": judgment.get("traditional_factors", {}),
                 "solar_factors": judgment.get("solar_factors", {}),
                 "general_info": general_info,
@@ -1596,7 +1596,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "longitude": lon
                     }
                 }
-            }
+            }, fields)
+            if judgment_key is not None:
+                if not chart_cached:
+                    cache.put_chart(chart_key, chart)
+                cache.put_judgment(judgment_key, result, chart)
+            return result, chart
             
         except LocationError as e:
             return {
@@ -1605,7 +1610,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "confidence": 0,
                 "reasoning": _structure_reasoning([f"Location error: {e}"]),
                 "error_type": "LocationError"
-            }
+            }, None
         except Exception as e:
             import traceback
             logger.error(f"Error in judge_question: {e}")
@@ -1615,7 +1620,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "judgment": "ERROR",
                 "confidence": 0,
                 "reasoning": _structure_reasoning([f"Calculation error: {e}"])
-            }
+            }, None
     
     def _moon_aspects_significator_directly(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> bool:
         """
@@ -2645,10 +2650,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 reasoning.append(f"Reception supports perfection: {reception}")
             
             # FIXED: Check Moon's dual roles (house ruler vs co-significator)
-            moon_house_roles = []
-            for house_num, ruler in chart.house_rulers.items():
-                if ruler == Planet.MOON:
-                    moon_house_roles.append(house_num)
+            moon_house_roles = list(chart_index(chart).houses_ruled(Planet.MOON))
             
             if moon_house_roles:
                 relevant_moon_roles = []
@@ -3276,18 +3278,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             querent_aspect = None
             quesited_aspect = None
             
-            # First, check existing aspects in chart
-            for aspect in chart.aspects:
-                # Check orb limits using moiety-based calculation
-                if not self._is_aspect_within_orb_limits(chart, aspect):
-                    continue  # Skip aspects that exceed proper orb limits
-                
-                if ((aspect.planet1 == planet and aspect.planet2 == querent) or
-                    (aspect.planet1 == querent and aspect.planet2 == planet)):
+            # First, check existing aspects in chart (the last one within
+            # moiety-based orb limits, as a scan of chart.aspects would keep)
+            index = chart_index(chart)
+            for aspect in reversed(index.aspects_between(planet, querent)):
+                if self._is_aspect_within_orb_limits(chart, aspect):
                     querent_aspect = aspect
-                elif ((aspect.planet1 == planet and aspect.planet2 == quesited) or
-                      (aspect.planet1 == quesited and aspect.planet2 == planet)):
-                    quesited_aspect = aspect
+                    break
+            if quesited != querent:
+                for aspect in reversed(index.aspects_between(planet, quesited)):
+                    if self._is_aspect_within_orb_limits(chart, aspect):
+                        quesited_aspect = aspect
+                        break
             
             # CRITICAL FIX: For Moon translation, always check for enhanced sequences
             # even if some aspects exist (e.g., Moon square Sun shouldn't block Moon translating to Saturn)
@@ -3441,146 +3443,74 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"found": False}
     
-    def _calculate_future_lunar_aspects(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[Planet, object]:
+    def _calculate_future_lunar_aspects(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[Planet, AspectInfo]:
         """Calculate future lunar aspects after sign changes for translation of light detection.
         
         This detects the classic cross-sign lunar sequences that traditional aspect 
-        calculations miss due to sign-boundary restrictions.
+        calculations miss due to sign-boundary restrictions. Perfections are read
+        from the lunar timeline, which stops once both significators are found.
         """
-        from .aspects import Aspect, _signed_longitude_delta
-        import math
-        
-        # Create a simple aspect-like class that mimics AspectInfo interface
-        class FutureAspect:
-            def __init__(self, planet1, planet2, aspect_type, applying, degrees_to_exact, time_to_perfection):
-                self.planet1 = planet1
-                self.planet2 = planet2
-                self.aspect = aspect_type
-                self.applying = applying
-                self.degrees_to_exact = degrees_to_exact
-                self.time_to_perfection = time_to_perfection
-                self.perfection_within_sign = False  # Cross-sign by definition
-                self.orb = degrees_to_exact
-        
-        moon_pos = chart.planets[Planet.MOON]
-        future_aspects = {}
-        
-        # Only check for Moon (fastest-moving planet for translation)
-        if moon_pos.speed <= 0:
-            return future_aspects
-            
-        # Check future aspects with each significator
-        for target_planet in [querent, quesited]:
-            target_pos = chart.planets[target_planet]
-            
-            # Look ahead up to 15 days for lunar translation sequences
-            best_aspect = None
-            best_time = float('inf')
-            
-            for days_ahead in [d * 0.5 for d in range(1, 31)]:  # Check every 0.5 days up to 15 days
-                # Calculate future positions
-                future_moon_lon = (moon_pos.longitude + moon_pos.speed * days_ahead) % 360
-                future_target_lon = (target_pos.longitude + target_pos.speed * days_ahead) % 360
-                
-                # Calculate angular separation
-                separation = abs(_signed_longitude_delta(future_moon_lon, future_target_lon))
-                
-                # Check each traditional aspect
-                for aspect_type in Aspect:
-                    orb_diff = abs(separation - aspect_type.degrees)
-                    
-                    # Use wider orb for future cross-sign aspects
-                    max_orb = aspect_type.orb * 1.5
-                    
-                    if orb_diff <= max_orb:
-                        # Check if Moon will have crossed at least one sign boundary
-                        current_sign = int(moon_pos.longitude // 30)
-                        future_sign = int(future_moon_lon // 30) 
-                        
-                        if future_sign != current_sign:  # Cross-sign aspect
-                            # Create future aspect with proper interface
-                            future_aspect = FutureAspect(
-                                planet1=Planet.MOON,
-                                planet2=target_planet,
-                                aspect_type=aspect_type,
-                                applying=True,  # Future aspects are applying by definition
-                                degrees_to_exact=orb_diff,
-                                time_to_perfection=days_ahead
-                            )
-                            
-                            # Keep the earliest (best) aspect found
-                            if days_ahead < best_time:
-                                best_aspect = future_aspect
-                                best_time = days_ahead
-                                
-            if best_aspect:
-                future_aspects[target_planet] = best_aspect
-                            
+        targets = {querent, quesited} & set(TIMELINE_PLANETS)
+        future_aspects: Dict[Planet, AspectInfo] = {}
+        ingress = None
+
+        # Look ahead up to 15 days for lunar translation sequences
+        for event in lunar_timeline(chart.julian_day, 15.0, planets=targets):
+            if event.is_ingress:
+                if ingress is None:
+                    ingress = event
+                continue
+            # Only cross-sign aspects; keep the earliest for each significator
+            if ingress is not None and event.planet not in future_aspects:
+                # The translation limits take the elongation still to cover once
+                # the aspect is cross-sign and within 1.5x its orb: at the ingress,
+                # or on entering that orb if later. The Moon gains on every planet,
+                # so what it covers before the ingress is the forward difference.
+                covered = (moon_elongation(event.planet, ingress.jd)
+                           - moon_elongation(event.planet, chart.julian_day)) % 360.0
+                in_orb = min(event.orb - covered, event.aspect.orb * 1.5)
+                future_aspects[event.planet] = AspectInfo(
+                    planet1=Planet.MOON,
+                    planet2=event.planet,
+                    aspect=event.aspect,
+                    orb=in_orb,
+                    applying=True,  # Future aspects are applying by definition
+                    time_to_perfection=event.days,
+                    perfection_within_sign=False,  # Cross-sign by definition
+                    degrees_to_exact=in_orb,
+                )
+                if len(future_aspects) == len(targets):
+                    break
+
         return future_aspects
     
-    def _calculate_recent_lunar_separations(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[Planet, object]:
+    def _calculate_recent_lunar_separations(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[Planet, AspectInfo]:
         """Calculate recent lunar separating aspects using pure time-based analysis.
         
         CRITICAL FIX: Does not rely on current orbs - only time to perfection.
         This catches aspects that were exact recently but are now way outside normal orbs.
         """
-        from .aspects import Aspect, time_to_perfection
-        import math
-        
-        # Create aspect-like class for separating aspects
-        class RecentSeparatingAspect:
-            def __init__(self, planet1, planet2, aspect_type, applying, degrees_to_exact, time_to_perfection):
-                self.planet1 = planet1
-                self.planet2 = planet2
-                self.aspect = aspect_type
-                self.applying = applying  # Will be False for separating
-                self.degrees_to_exact = degrees_to_exact
-                self.time_to_perfection = time_to_perfection
-                self.perfection_within_sign = True  # Recent aspects usually within same sign
-                self.orb = degrees_to_exact
-        
-        moon_pos = chart.planets[Planet.MOON]
-        separating_aspects = {}
-        
-        # Only check for Moon (fastest-moving planet for translation)
-        if moon_pos.speed <= 0:
-            return separating_aspects
-            
-        # Check recent separating aspects with each significator
-        for target_planet in [querent, quesited]:
-            target_pos = chart.planets[target_planet]
-            best_separating = None
-            most_recent_time = float('inf')
-            
-            # Check each traditional aspect for recent exact separations
-            for aspect_type in Aspect:
-                # Calculate time to perfection (negative means past perfection = separating)
-                t = time_to_perfection(moon_pos, target_pos, aspect_type)
-                
-                # PURE TIME-BASED CHECK: If aspect was exact within last 7 days, include it
-                # regardless of current orb (Moon may have moved 100+ degrees since exactness)
-                if t < 0 and abs(t) <= 7:  # Separated within last 7 days
-                    time_since_exact = abs(t)
-                    
-                    # Keep the most recent separating aspect for this planet
-                    if time_since_exact < most_recent_time:
-                        most_recent_time = time_since_exact
-                        
-                        # Distance Moon has traveled since exactness
-                        degrees_traveled = time_since_exact * moon_pos.speed
-                        
-                        best_separating = RecentSeparatingAspect(
-                            planet1=Planet.MOON,
-                            planet2=target_planet,
-                            aspect_type=aspect_type,
-                            applying=False,  # Separating by definition
-                            degrees_to_exact=degrees_traveled,  # How far we've moved since exactness
-                            time_to_perfection=t  # Negative value (days since perfection)
-                        )
-            
-            if best_separating:
-                separating_aspects[target_planet] = best_separating
-                            
+        targets = {querent, quesited} & set(TIMELINE_PLANETS)
+        separating_aspects: Dict[Planet, AspectInfo] = {}
+
+        # PURE TIME-BASED CHECK: the most recent exact aspect within the last 7 days,
+        # regardless of current orb (Moon may have moved 100+ degrees since exactness)
+        for event in lunar_timeline(chart.julian_day, 7.0, backward=True, planets=targets):
+            if event.is_ingress or event.planet in separating_aspects:
+                continue
+            separating_aspects[event.planet] = AspectInfo(
+                planet1=Planet.MOON,
+                planet2=event.planet,
+                aspect=event.aspect,
+                orb=event.orb,
+                applying=False,  # Separating by definition
+                time_to_perfection=event.days,  # Negative value (days since perfection)
+                perfection_within_sign=True,  # Recent aspects usually within same sign
+                degrees_to_exact=event.orb,  # How far we've moved since exactness
+            )
+            if len(separating_aspects) == len(targets):
+                break
+
         return separating_aspects
     
     def _check_transaction_translation(self, chart: HoraryChart, seller: Planet, buyer: Planet, item: Planet) -> Dict[str, Any]:
@@ -3595,15 +3525,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             # Find aspects involving the translator
             translator_aspects = []
-            for aspect in chart.aspects:
-                if aspect.planet1 == translator_planet or aspect.planet2 == translator_planet:
-                    other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
-                    translator_aspects.append({
-                        "other": other_planet,
-                        "aspect": aspect,
-                        "applying": aspect.applying,
-                        "degrees_to_exact": aspect.degrees_to_exact
-                    })
+            for aspect in chart_index(chart).aspects_of(translator_planet):
+                other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
+                translator_aspects.append({
+                    "other": other_planet,
+                    "aspect": aspect,
+                    "applying": aspect.applying,
+                    "degrees_to_exact": aspect.degrees_to_exact
+                })
             
             # Check for transaction translation patterns:
             # Pattern 1: Translator separates from item, applies to seller/buyer
@@ -3680,74 +3609,68 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         moon_significator_aspects = []
         
         # Find quesited house number for planets-in-house testimony
-        quesited_house_number = None
-        for house_num, ruler in chart.house_rulers.items():
-            if ruler == quesited:
-                quesited_house_number = house_num
-                break
+        index = chart_index(chart)
+        quesited_house_number = next(iter(index.houses_ruled(quesited)), None)
         
         # Check all current Moon aspects
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+        for aspect in index.aspects_of(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
                 
-                # Check if this is a significator aspect
-                if other_planet in [querent, quesited]:
-                    # Determine which house this planet rules
-                    house_role = ""
-                    if other_planet == querent:
-                        house_role = "querent (L1)"
-                    elif other_planet == quesited:
-                        # Find which house this quesited planet rules
-                        for house, ruler in chart.house_rulers.items():
-                            if ruler == other_planet:
-                                house_role = f"L{house}"
-                                break
-                        if not house_role:
-                            house_role = "quesited"
+            # Check if this is a significator aspect
+            if other_planet in [querent, quesited]:
+                # Determine which house this planet rules
+                house_role = ""
+                if other_planet == querent:
+                    house_role = "querent (L1)"
+                elif other_planet == quesited:
+                    # Find which house this quesited planet rules
+                    for house in index.houses_ruled(other_planet)[:1]:
+                        house_role = f"L{house}"
+                    if not house_role:
+                        house_role = "quesited"
                     
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
                     
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": house_role,
-                        "description": f"{aspect_desc} ({house_role})",
-                        "testimony_type": "significator"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": house_role,
+                    "description": f"{aspect_desc} ({house_role})",
+                    "testimony_type": "significator"
+                })
                 
-                # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
-                elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
+            # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
+            elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
                     
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"benefic in {chart.planets[other_planet].house}th house",
-                        "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
-                        "testimony_type": "moon_to_benefic"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"benefic in {chart.planets[other_planet].house}th house",
+                    "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
+                    "testimony_type": "moon_to_benefic"
+                })
                 
-                # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
-                elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
+            # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
+            elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.display_name, other_planet.value, aspect.applying)
                     
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"planet in {quesited_house_number}th house",
-                        "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
-                        "testimony_type": "planet_in_house"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"planet in {quesited_house_number}th house",
+                    "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
+                    "testimony_type": "planet_in_house"
+                })
         
         # If Moon has significant aspects to significators, prioritize this
         if moon_significator_aspects:
@@ -3759,7 +3682,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 applying_with_degrees = []
                 for aspect_data in applying_aspects:
                     # Find corresponding aspect in chart.aspects to get degrees_to_exact
-                    for chart_aspect in chart.aspects:
+                    for chart_aspect in index.aspects_between(Planet.MOON, aspect_data["planet"]):
                         if (Planet.MOON in [chart_aspect.planet1, chart_aspect.planet2] and
                             aspect_data["planet"] in [chart_aspect.planet1, chart_aspect.planet2] and
                             chart_aspect.aspect == aspect_data["aspect"] and
@@ -3912,11 +3835,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         significators = [querent_planet, quesited_planet]
 
         # Determine which house the quesited planet rules
-        quesited_house_number = None
-        for house_num, ruler in chart.house_rulers.items():
-            if ruler == quesited_planet:
-                quesited_house_number = house_num
-                break
+        index = chart_index(chart)
+        quesited_house_number = next(iter(index.houses_ruled(quesited_planet)), None)
 
         benefic_aspects = []
         total_score = 0
@@ -3933,42 +3853,39 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     continue
 
                 # Find aspects between benefic and significator
-                for aspect in chart.aspects:
-                    if ((aspect.planet1 == benefic and aspect.planet2 == significator) or
-                        (aspect.planet1 == significator and aspect.planet2 == benefic)):
-
-                        if not aspect.applying:
-                            # Record separating aspects as historical notes only
-                            separating_notes.append(
-                                self._format_aspect_for_display(
-                                    benefic.value,
-                                    aspect.aspect.display_name,
-                                    significator.value,
-                                    aspect.applying,
-                                )
+                for aspect in index.aspects_between(benefic, significator):
+                    if not aspect.applying:
+                        # Record separating aspects as historical notes only
+                        separating_notes.append(
+                            self._format_aspect_for_display(
+                                benefic.value,
+                                aspect.aspect.display_name,
+                                significator.value,
+                                aspect.applying,
                             )
-                            continue
-
-                        # Calculate benefic strength
-                        aspect_strength = self._calculate_benefic_aspect_strength(
-                            benefic, significator, aspect, chart)
-
-                        if aspect_strength > 0:
-                            description = self._format_aspect_for_display(
-                                benefic.value, aspect.aspect.display_name,
-                                significator.value, aspect.applying)
-                            benefic_aspects.append({
-                                "benefic": benefic.value,
-                                "significator": significator.value,
-                                "aspect": aspect.aspect.display_name,
-                                "applying": aspect.applying,
-                                "degrees": aspect.degrees_to_exact,
-                                "strength": aspect_strength,
-                                "house_position": benefic_pos.house,
-                                "description": description,
-                                "type": "aspect",
-                            })
-                            total_score += aspect_strength
+                        )
+                        continue
+
+                    # Calculate benefic strength
+                    aspect_strength = self._calculate_benefic_aspect_strength(
+                        benefic, significator, aspect, chart)
+
+                    if aspect_strength > 0:
+                        description = self._format_aspect_for_display(
+                            benefic.value, aspect.aspect.display_name,
+                            significator.value, aspect.applying)
+                        benefic_aspects.append({
+                            "benefic": benefic.value,
+                            "significator": significator.value,
+                            "aspect": aspect.aspect.display_name,
+                            "applying": aspect.applying,
+                            "degrees": aspect.degrees_to_exact,
+                            "strength": aspect_strength,
+                            "house_position": benefic_pos.house,
+                            "description": description,
+                            "type": "aspect",
+                        })
+                        total_score += aspect_strength
 
         # Check for benefic planets located in the quesited's house
         if quesited_house_number:
@@ -4138,7 +4055,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         permitted orb, considering true motion (including retrograde).
         """
         
-        return self._void_traditional_ground_truth(chart)
+        return chart_context(chart).memo(
+            "moon_void", None, lambda: self._void_traditional_ground_truth(chart)
+        )
     
     def _void_traditional_ground_truth(self, chart: HoraryChart) -> Dict[str, Any]:
         """GROUND TRUTH: Traditional void of course implementation
@@ -4163,14 +4082,16 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "first_applying_aspect": None,
             }
 
-        # Determine next lunar aspect using analytic helper
-        moon_next_aspect = calculate_moon_next_aspect(
-            chart.planets,
-            chart.julian_day,
-            ignore_orb_for_voc=True,
-        )
-
+        # The chart's next aspect comes from the exact lunar timeline, so the
+        # void result, its reason and the API's moon_next_aspect agree; the
+        # lunar calendar only supplies the void period's bounds
+        moon_next_aspect = chart.moon_next_aspect
         if moon_next_aspect is None:
+            void_period = None
+            calendar = get_lunar_calendar()
+            if calendar is not None and calendar.covers(chart.julian_day):
+                void_period = calendar.void_period_at(chart.julian_day)
+
             # CRITICAL FIX: Lilly's sign-based VOC nuance
             # VOC is less severe in Taurus, Cancer, Sagittarius, Pisces
             mitigating_signs = {"Taurus", "Cancer", "Sagittarius", "Pisces"}
@@ -4184,15 +4105,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "degrees_left_in_sign": degrees_left_in_sign,
                 "first_applying_aspect": None,
                 "sign_mitigation": sign_mitigation,
+                "void_period": void_period.to_dict() if void_period else None,
             }
 
+        reason = (
+            f"Moon will {moon_next_aspect.aspect.display_name.lower()} "
+            f"{moon_next_aspect.planet.value} in {moon_next_aspect.perfection_eta_days:.1f} days"
+        )
+
         return {
             "void": False,
             "exception": False,
-            "reason": (
-                f"Moon will {moon_next_aspect.aspect.display_name.lower()} "
-                f"{moon_next_aspect.planet.value} in {moon_next_aspect.perfection_eta_days:.1f} days"
-            ),
+            "reason": reason,
             "degrees_left_in_sign": degrees_left_in_sign,
             "first_applying_aspect": moon_next_aspect,
         }
@@ -4228,59 +4152,47 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _build_moon_story(self, chart: HoraryChart) -> List[Dict]:
         """Enhanced Moon story with real timing calculations"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
-        
-        # Calculate how much time Moon has left in current sign
-        moon_degree_in_sign = moon_pos.longitude % 30
-        degrees_left_in_sign = 30 - moon_degree_in_sign
-        days_to_sign_exit = degrees_left_in_sign / abs(moon_speed) if abs(moon_speed) > 0 else None
+        # Exact perfections before the Moon changes signs (CONSISTENCY FIX)
+        perfections = perfection_matrix(chart)
+        max_days = cfg().timing.max_future_days
+        moon_exit = perfections.sign_exit(Planet.MOON, max_days)
         
         # Get current aspects
         current_moon_aspects = []
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+        for aspect in chart_index(chart).aspects_of(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
                 
-                # Enhanced timing using analytic solver
-                if aspect.applying:
-                    other_pos = chart.planets[other_planet]
-                    timing_days = self._calculate_future_aspect_time(
-                        moon_pos,
-                        other_pos,
-                        aspect.aspect,
-                        chart.julian_day,
-                        cfg().timing.max_future_days,
-                    ) or 0
-                    
-                    # Check if aspect will perfect before Moon changes signs (CONSISTENCY FIX)
-                    will_perfect_in_sign = True
-                    if days_to_sign_exit is not None and timing_days > days_to_sign_exit:
-                        will_perfect_in_sign = False
+            # Enhanced timing from the chart's perfection matrix
+            if aspect.applying:
+                timing_days = perfections.time_to_perfection(
+                    Planet.MOON, other_planet, aspect.aspect, max_days
+                )
+                if timing_days is not None and moon_exit is not None and timing_days >= moon_exit:
+                    timing_days = None
                     
-                    # Only include applying aspects that will perfect within the current sign
-                    if will_perfect_in_sign:
-                        timing_estimate = self._format_timing_description_enhanced(timing_days)
-                        current_moon_aspects.append({
-                            "planet": other_planet.value,
-                            "aspect": aspect.aspect.display_name,
-                            "orb": float(aspect.orb),
-                            "applying": bool(aspect.applying),
-                            "status": "applying" if aspect.applying else "separating",
-                            "timing": str(timing_estimate),
-                            "days_to_perfect": float(timing_days)
-                        })
-                else:
-                    # Always include separating aspects (they've already happened)
+                # Only include applying aspects that will perfect within the current sign
+                if timing_days is not None:
+                    timing_estimate = self._format_timing_description_enhanced(timing_days)
                     current_moon_aspects.append({
                         "planet": other_planet.value,
                         "aspect": aspect.aspect.display_name,
                         "orb": float(aspect.orb),
                         "applying": bool(aspect.applying),
                         "status": "applying" if aspect.applying else "separating",
-                        "timing": "Past",
-                        "days_to_perfect": 0.0
+                        "timing": str(timing_estimate),
+                        "days_to_perfect": float(timing_days)
                     })
+            else:
+                # Always include separating aspects (they've already happened)
+                current_moon_aspects.append({
+                    "planet": other_planet.value,
+                    "aspect": aspect.aspect.display_name,
+                    "orb": float(aspect.orb),
+                    "applying": bool(aspect.applying),
+                    "status": "applying" if aspect.applying else "separating",
+                    "timing": "Past",
+                    "days_to_perfect": 0.0
+                })
         
         # Sort by timing for applying aspects, orb for separating
         current_moon_aspects.sort(key=lambda x: x.get("days_to_perfect", 999) if x["applying"] else x["orb"])
@@ -4315,7 +4227,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 # Handle Aspect object - get degrees_to_exact from perfection root level
                 degrees = perfection.get("degrees_to_exact") or perfection.get("t_perfect_days", 0) * 13.0  # Fallback calculation
                 
-            moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+            moon_speed = chart_context(chart).memo(
+                "moon_speed", None, lambda: self.calculator.get_real_moon_speed(chart.julian_day)
+            )
             if degrees > 0 and moon_speed > 0:
                 timing_days = degrees / moon_speed
                 return self._format_timing_description_enhanced(timing_days)
@@ -4333,38 +4247,45 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         category = question_analysis.get("question_type")
         manual_houses = question_analysis.get("relevant_houses")
         significator_info = question_analysis.get("significators", {})
-        return resolve_significators(
-            chart,
+        key = (
             category,
-            manual_houses=manual_houses,
-            significator_info=significator_info,
+            tuple(manual_houses) if manual_houses else None,
+            repr(significator_info),
+        )
+        return chart_context(chart).memo(
+            "significators",
+            key,
+            lambda: resolve_significators(
+                chart,
+                category,
+                manual_houses=manual_houses,
+                significator_info=significator_info,
+            ),
         )
 
     def _find_applying_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find applying aspect between two planets (preserved)"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)) and aspect.applying:
-                return {
-                    "aspect": aspect.aspect,
-                    "orb": aspect.orb,
-                    "degrees_to_exact": aspect.degrees_to_exact,
-                    "applying": True
-                }
+        aspect = chart_index(chart).aspect_between(planet1, planet2, applying=True)
+        if aspect is not None:
+            return {
+                "aspect": aspect.aspect,
+                "orb": aspect.orb,
+                "degrees_to_exact": aspect.degrees_to_exact,
+                "applying": True
+            }
         return None
     
     def _find_any_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find any aspect (applying or separating) between two planets"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)):
-                return {
-                    "aspect": aspect.aspect,
-                    "orb": aspect.orb,
-                    "degrees_to_exact": aspect.degrees_to_exact,
-                    "applying": aspect.applying,
-                    "full_aspect": aspect  # Include full aspect for detailed analysis
-                }
+        aspect = chart_index(chart).aspect_between(planet1, planet2)
+        if aspect is not None:
+            return {
+                "aspect": aspect.aspect,
+                "orb": aspect.orb,
+                "degrees_to_exact": aspect.degrees_to_exact,
+                "applying": aspect.applying,
+                "full_aspect": aspect  # Include full aspect for detailed analysis
+            }
         return None
     
     def _check_enhanced_perfection(self, chart: HoraryChart, querent: Planet, quesited: Planet,
@@ -4713,12 +4634,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         alignment_info = None
         
         # First check if there's an existing aspect between significators
-        existing_aspect = None
-        for aspect_info in chart.aspects:
-            if ((aspect_info.planet1 == querent and aspect_info.planet2 == quesited) or
-                (aspect_info.planet1 == quesited and aspect_info.planet2 == querent)):
-                existing_aspect = aspect_info
-                break
+        existing_aspect = chart_index(chart).aspect_between(querent, quesited)
         
         # Calculate future aspect perfection times
         aspect_types = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION]
@@ -4742,17 +4658,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if separation > orb_limit or not applying:
                 continue
 
-            days_to_perfection = self._calculate_future_aspect_time(
-                querent_pos, quesited_pos, aspect_type, chart.julian_day, max_window
+            days_to_perfection = perfection_matrix(chart).time_to_perfection(
+                querent, quesited, aspect_type, max_window
             )
 
             if days_to_perfection is not None and 0 < days_to_perfection <= max_window:
                 # Sign boundary check
                 if getattr(config.perfection, "require_in_sign", False):
-                    exit_q = days_to_sign_exit(querent_pos.longitude, querent_pos.speed)
-                    exit_qs = days_to_sign_exit(quesited_pos.longitude, quesited_pos.speed)
-                    exits = [e for e in (exit_q, exit_qs) if e is not None]
-                    if exits and days_to_perfection > min(exits):
+                    perfection = perfection_matrix(chart).entry(querent, quesited, aspect_type, max_window)
+                    if not perfection.in_sign:
                         return {
                             "perfects": False,
                             "type": "out_of_sign",
@@ -4932,8 +4846,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         aspect_types = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION]
         
         for aspect_type in aspect_types:
-            days_to_perfection = self._calculate_future_aspect_time(
-                planet_pos, ruler_pos, aspect_type, chart.julian_day, max_window
+            days_to_perfection = perfection_matrix(chart).time_to_perfection(
+                planet, ruler, aspect_type, max_window
             )
             
             if days_to_perfection is not None and 0 < days_to_perfection <= max_window:
@@ -5014,12 +4928,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         This delegates to :func:`check_future_prohibitions` which implements
         classical Lilly/Sahl rules for prohibition, translation and collection
-        of light. The helper is passed a reference to this engine's
-        ``_calculate_future_aspect_time`` so it can solve timing analytically.
+        of light. Charts with a Julian Day read every leg from the chart's
+        perfection matrix; synthetic charts use this engine's
+        ``_calculate_future_aspect_time`` to solve timing analytically.
         """
 
+        calc_aspect_time = None if chart.julian_day else self._calculate_future_aspect_time
         return check_future_prohibitions(
-            chart, querent, quesited, days_ahead, self._calculate_future_aspect_time
+            chart, querent, quesited, days_ahead, calc_aspect_time
         )
     
     def _check_moon_sun_education_perfection(self, chart: HoraryChart, question_analysis: Dict) -> Dict[str, Any]:
@@ -5067,16 +4983,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _find_separating_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find separating aspect between two planets"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)):
-                if not aspect.applying:  # Separating
-                    return {
-                        "aspect": aspect.aspect,
-                        "orb": aspect.orb,
-                        "applying": False,
-                        "degrees_to_exact": aspect.degrees_to_exact
-                    }
+        aspect = chart_index(chart).aspect_between(planet1, planet2, applying=False)
+        if aspect is not None:
+            return {
+                "aspect": aspect.aspect,
+                "orb": aspect.orb,
+                "applying": False,
+                "degrees_to_exact": aspect.degrees_to_exact
+            }
         return None
     
     def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
@@ -5114,21 +5028,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # TRADITIONAL REQUIREMENT 4: Timing validation - collection must complete in current signs
-            querent_days_to_sign = self._days_to_sign_exit(querent_pos)
-            quesited_days_to_sign = self._days_to_sign_exit(quesited_pos)
-            
-            # Calculate when collection aspects will perfect
-            querent_collection_days = self._days_to_aspect_perfection(querent_pos, pos, aspects_from_querent)
-            quesited_collection_days = self._days_to_aspect_perfection(quesited_pos, pos, aspects_from_quesited)
-            
-            # Check timing validity
-            timing_valid = True
-            if querent_days_to_sign and querent_collection_days > querent_days_to_sign:
-                timing_valid = False
-            if quesited_days_to_sign and quesited_collection_days > quesited_days_to_sign:
-                timing_valid = False
-
-            if not timing_valid:
+            max_days = config.timing.max_future_days
+            querent_collection = perfection_matrix(chart).entry(
+                querent, planet, aspects_from_querent["aspect"], max_days
+            )
+            quesited_collection = perfection_matrix(chart).entry(
+                quesited, planet, aspects_from_quesited["aspect"], max_days
+            )
+            if not (querent_collection.in_sign and quesited_collection.in_sign):
                 continue
             
             # Assess collector's condition and dignity
@@ -5161,7 +5068,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
             favorable = collector_strength >= 0 and not hard_aspect
 
-            days_to_perfection = max(querent_collection_days, quesited_collection_days)
+            days_to_perfection = max(querent_collection.days, quesited_collection.days)
 
             candidates.append(
                 {
@@ -5413,7 +5320,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         # Calculate timing for the main perfection
         querent_pos = chart.planets[querent]
         quesited_pos = chart.planets[quesited]
-        main_perfection_days = self._days_to_aspect_perfection(querent_pos, quesited_pos, direct_aspect)
+        main_perfection_days = self._days_to_aspect_perfection(chart, querent, quesited, direct_aspect)
 
         # TRADITIONAL REQUIREMENT 2: Check if any third planet completes aspect first
         for aspect in chart.aspects:
@@ -5437,38 +5344,30 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             frustrating_pos = chart.planets[frustrating_planet]
             target_pos = chart.planets[target_significator]
 
-            # Compute analytic future time to this specific aspect
-            frustrating_days = self._calculate_future_aspect_time(
-                target_pos,
-                frustrating_pos,
+            # Future time to this specific aspect, with the in-sign guard
+            frustration = perfection_matrix(chart).entry(
+                target_significator,
+                frustrating_planet,
                 aspect.aspect,
-                chart.julian_day,
-                cfg().timing.max_future_days,
+                config.timing.max_future_days,
             )
-            if frustrating_days is None:
-                continue
-
-            # In-sign guard for the frustrating contact
-            exit_target = days_to_sign_exit(target_pos.longitude, target_pos.speed)
-            exit_frustrator = days_to_sign_exit(frustrating_pos.longitude, frustrating_pos.speed)
-            if (exit_target is not None and frustrating_days >= exit_target) or (
-                exit_frustrator is not None and frustrating_days >= exit_frustrator
-            ):
+            if frustration.days is None or not frustration.in_sign:
                 continue
+            frustrating_days = frustration.days
 
             # Refranation guard: if either stations before the contact, ignore
             planet_id_target = self.calculator.planets_swe.get(target_pos.planet)
             planet_id_frustrator = self.calculator.planets_swe.get(frustrating_pos.planet)
             try:
                 if planet_id_target is not None:
-                    st_target = calculate_next_station_time(planet_id_target, chart.julian_day)
+                    st_target = self._next_station_time(chart, planet_id_target)
                 else:
                     st_target = None
             except Exception:
                 st_target = None
             try:
                 if planet_id_frustrator is not None:
-                    st_frustrator = calculate_next_station_time(planet_id_frustrator, chart.julian_day)
+                    st_frustrator = self._next_station_time(chart, planet_id_frustrator)
                 else:
                     st_frustrator = None
             except Exception:
@@ -5509,17 +5408,6 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"found": False}
     
-    def _days_to_sign_exit(self, pos: PlanetPosition) -> float:
-        """Calculate days until planet exits current sign"""
-        try:
-            from .calculation.helpers import days_to_sign_exit
-            return days_to_sign_exit(pos.longitude, pos.speed)
-        except ImportError:
-            # Fallback calculation
-            degrees_in_sign = pos.longitude % 30
-            degrees_remaining = 30 - degrees_in_sign if pos.speed > 0 else degrees_in_sign
-            return degrees_remaining / abs(pos.speed) if pos.speed != 0 else None
-    
     def _check_moon_translation_pattern(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
         """Check for Moon translation using chart moon_last_aspect and moon_next_aspect data"""
         
@@ -5873,11 +5761,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 pass
         
         # Check direct aspects between significators
-        for aspect in chart.aspects:
+        for aspect in chart_index(chart).aspects_between(querent, quesited):
             if aspect.applying and aspect.time_to_perfection is not None:
-                if ((aspect.planet1 == querent and aspect.planet2 == quesited) or
-                    (aspect.planet1 == quesited and aspect.planet2 == querent)):
-                    earliest_days = min(earliest_days, aspect.time_to_perfection)
+                earliest_days = min(earliest_days, self._applying_aspect_days(chart, aspect))
         
         # Return finite value or None if no perfection found
         return earliest_days if earliest_days != float('inf') else None
@@ -5951,8 +5837,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         collector_pos = chart.planets[best_collector]
         
         # Calculate timing (when the last significator reaches the collector)
-        querent_timing = collector_data['querent_aspect'].time_to_perfection
-        quesited_timing = collector_data['quesited_aspect'].time_to_perfection
+        querent_timing = self._applying_aspect_days(chart, collector_data['querent_aspect'])
+        quesited_timing = self._applying_aspect_days(chart, collector_data['quesited_aspect'])
         collection_timing = max(querent_timing, quesited_timing) if (querent_timing and quesited_timing) else None
         
         # Determine favorability based on collector
@@ -5978,7 +5864,25 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "perfection_type": "collection"
         }
     
-    def _days_to_aspect_perfection(self, pos1: PlanetPosition, pos2: PlanetPosition, aspect_info: Dict) -> float:
+    def _applying_aspect_days(self, chart: HoraryChart, aspect: AspectInfo) -> float:
+        """Days until an applying chart aspect perfects, from the perfection matrix.
+
+        Contacts beyond the solver window keep the estimate stored on the aspect."""
+        days = perfection_matrix(chart).time_to_perfection(
+            aspect.planet1, aspect.planet2, aspect.aspect, cfg().timing.max_future_days
+        )
+        return days if days is not None else aspect.time_to_perfection
+
+    def _next_station_time(self, chart: HoraryChart, planet_id: int) -> Optional[float]:
+        """Julian Day of the planet's next station after the chart, memoized per chart."""
+        return chart_context(chart).memo(
+            "next_station",
+            planet_id,
+            lambda: calculate_next_station_time(planet_id, chart.julian_day),
+        )
+
+    def _days_to_aspect_perfection(self, chart: HoraryChart, planet1: Planet, planet2: Planet,
+                                   aspect_info: Dict) -> float:
         """Calculate days until an applying aspect perfects.
 
         Falls back to ``inf`` when no aspect is present or perfection is
@@ -5988,12 +5892,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if not aspect:
             return float("inf")
 
-        t = self._calculate_future_aspect_time(
-            pos1,
-            pos2,
-            aspect,
-            jd_start=0.0,
-            max_days=cfg().timing.max_future_days,
+        t = perfection_matrix(chart).time_to_perfection(
+            planet1, planet2, aspect, cfg().timing.max_future_days
         )
         return t if t is not None else float("inf")
     
@@ -6003,20 +5903,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         Returns tuple (perfects, impediment) where impediment details reason if False."""
         
-        # Use enhanced sign exit calculations
-        days_to_exit_1 = days_to_sign_exit(pos1.longitude, pos1.speed)
-        days_to_exit_2 = days_to_sign_exit(pos2.longitude, pos2.speed)
-
-        # Estimate days until aspect perfects using analytic solver
-        days_to_perfect = self._calculate_future_aspect_time(
-            pos1,
-            pos2,
-            aspect_info["aspect"],
-            chart.julian_day,
-            cfg().timing.max_future_days,
+        # Days until the aspect perfects, and sign exits up to that moment
+        perfection = perfection_matrix(chart).entry(
+            pos1.planet, pos2.planet, aspect_info["aspect"], cfg().timing.max_future_days
         )
+        days_to_perfect = perfection.days
         if days_to_perfect is None:
             return False, {"type": "stalled"}
+        days_to_exit_1, days_to_exit_2 = perfection.exit1, perfection.exit2
 
         # NEW: Check for future stations before perfection
         jd_start = chart.julian_day
@@ -6024,12 +5918,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         planet_id_2 = self.calculator.planets_swe.get(pos2.planet)
 
         if planet_id_1 is not None:
-            station_jd_1 = calculate_next_station_time(planet_id_1, jd_start)
+            station_jd_1 = self._next_station_time(chart, planet_id_1)
             if station_jd_1 and (station_jd_1 - jd_start) < days_to_perfect:
                 return False, {"type": "refranation", "planet": pos1.planet}
 
         if planet_id_2 is not None:
-            station_jd_2 = calculate_next_station_time(planet_id_2, jd_start)
+            station_jd_2 = self._next_station_time(chart, planet_id_2)
             if station_jd_2 and (station_jd_2 - jd_start) < days_to_perfect:
                 return False, {"type": "refranation", "planet": pos2.planet}
 
@@ -6049,45 +5943,23 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         jd_start: float,
         max_days: int = 30,
     ) -> Optional[float]:
-        """Analytically solve when two planets perfect an aspect.
-
-        Uses signed velocities so retrograde motion is honoured. Returns the
-        smallest positive time ``t`` (in days) such that ``(lon1 - lon2)``
-        achieves the aspect's angular distance. ``None`` is returned when the
-        perfection lies outside ``max_days``.
-        """
+        """Solve when two planets perfect an aspect.
 
-        target_angles = {
-            Aspect.CONJUNCTION: 0,
-            Aspect.SEXTILE: 60,
-            Aspect.SQUARE: 90,
-            Aspect.TRINE: 120,
-            Aspect.OPPOSITION: 180,
-        }
+        Returns the smallest positive time ``t`` (in days) such that
+        ``(lon1 - lon2)`` achieves the aspect's angular distance. ``None`` is
+        returned when the perfection lies outside ``max_days``.
 
-        A = target_angles.get(aspect)
-        if A is None:
-            return None
-
-        lon1 = pos1.longitude
-        lon2 = pos2.longitude
-        speed1 = pos1.speed
-        speed2 = pos2.speed
-
-        theta0 = (lon1 - lon2) % 360.0
-        v_rel = speed1 - speed2
-        if abs(v_rel) < 1e-6:
-            return None
+        With a chart Julian Day the time is found against the ephemeris by
+        the event solver, so speed changes and stations inside the window are
+        honoured. Without one (synthetic positions) the signed velocities are
+        extrapolated linearly.
+        """
 
-        # Compute delta for both aspect polarities (e.g. 90° and -90° for a square)
-        delta1 = (A - theta0 + 180.0) % 360.0 - 180.0
-        delta2 = (-A - theta0 + 180.0) % 360.0 - 180.0
-        delta = delta1 if abs(delta1) < abs(delta2) else delta2
+        if jd_start:
+            return solve_aspect_time(pos1, pos2, aspect, jd_start, max_days)
 
-        t = delta / v_rel
-        if t < 0:
-            t += 360.0 / abs(v_rel)
-        if t <= 0 or t > max_days:
+        t = linear_future_aspect_time(pos1, pos2, aspect)
+        if t is None or t > max_days:
             return None
         return t
     
@@ -6911,7 +6783,16 @@ class HoraryEngine:
     def __init__(self):
         self.engine = EnhancedTraditionalHoraryJudgmentEngine()
     
+    @with_config_snapshot
     def judge(self, question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Main entry point for horary judgment; see :meth:`judge_with_chart`."""
+        result, _chart = self.judge_with_chart(question, settings)
+        return result
+
+    @with_config_snapshot
+    def judge_with_chart(
+        self, question: str, settings: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[HoraryChart]]:
         """
         Main entry point for horary judgment as specified in requirements
         
@@ -6920,7 +6801,9 @@ class HoraryEngine:
             settings: Dictionary containing all judgment settings
         
         Returns:
-            Dictionary with judgment result and analysis
+            Dictionary with judgment result and analysis, and the live chart
+            (``None`` if the chart could not be cast). ``chart_data`` in the
+            result is the chart's only serialization.
         """
         logger.info(f"=== JUDGE METHOD CALLED ===")
         logger.info(f"Question: {question}")
@@ -6945,24 +6828,32 @@ class HoraryEngine:
         if exaltation_confidence_boost is None:
             # Use configured default
             exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
+
+        # Named ephemeris precision profile (None = configured default)
+        precision = settings.get("precision")
+
+        # Requested response sections (None = all); the audit reads reasoning
+        fields = parse_fields(settings.get("fields"))
         
         # Call the enhanced engine
         logger.info("About to call self.engine.judge_question()...")
         try:
-            result = self.engine.judge_question(
-                question=question,
-                location=location,
-                date_str=date_str,
-                time_str=time_str,
-                timezone_str=timezone_str,
-                use_current_time=use_current_time,
-                manual_houses=manual_houses,
-                ignore_radicality=ignore_radicality,
-                ignore_void_moon=ignore_void_moon,
-                ignore_combustion=ignore_combustion,
-                ignore_saturn_7th=ignore_saturn_7th,
-                exaltation_confidence_boost=exaltation_confidence_boost
-            )
+            with use_precision(precision):
+                result, chart = self.engine.judge_question_with_chart(
+                    question=question,
+                    location=location,
+                    date_str=date_str,
+                    time_str=time_str,
+                    timezone_str=timezone_str,
+                    use_current_time=use_current_time,
+                    manual_houses=manual_houses,
+                    ignore_radicality=ignore_radicality,
+                    ignore_void_moon=ignore_void_moon,
+                    ignore_combustion=ignore_combustion,
+                    ignore_saturn_7th=ignore_saturn_7th,
+                    exaltation_confidence_boost=exaltation_confidence_boost,
+                    fields=expand_fields(fields)
+                )
             logger.info("self.engine.judge_question() completed successfully")
         except Exception as engine_error:
             logger.error(f"ERROR in self.engine.judge_question(): {str(engine_error)}")
@@ -6971,28 +6862,11 @@ class HoraryEngine:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             raise
         
-        # ENHANCED: Apply explanation consistency audit
-        if hasattr(result, 'get') and result.get('chart_data'):
-            chart = result.get('chart_data')  # Chart data for audit
-            if chart:
-                # Create a simplified chart object for audit
-                class AuditChart:
-                    def __init__(self, chart_data):
-                        self.house_rulers = chart_data.get('house_rulers', {})
-                        self.planets = {}
-                        # Convert planet data for audit
-                        for planet_name, planet_data in chart_data.get('planets', {}).items():
-                            class PlanetPos:
-                                def __init__(self, data):
-                                    self.dignity_score = data.get('dignity_score', 0)
-                                    self.house = data.get('house', 1)
-                            self.planets[planet_name] = PlanetPos(planet_data)
-                        self.houses = chart_data.get('houses', [])
-                
-                audit_chart = AuditChart(chart)
-                result = self.engine._audit_explanation_consistency(result, audit_chart)
+        # ENHANCED: Apply explanation consistency audit on the live chart
+        if chart is not None and wants(fields, "explanation_audit"):
+            result = self.engine._audit_explanation_consistency(result, chart)
         
-        return result
+        return project(result, fields), chart
 
 
 # Preserve backward compatibility
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from horary_config import cfg
-from .calculation.helpers import days_to_sign_exit, calculate_next_station_time
+from .calculation.helpers import days_to_sign_exit
+from .calculation.event_solver import get_event_solver
 from .reception import TraditionalReceptionCalculator
 try:
-    from ..models import Planet, Aspect, HoraryChart
+    from ..models import Planet, Aspect, HoraryChart, PlanetPosition
 except ImportError:  # pragma: no cover - fallback when executed as script
-    from models import Planet, Aspect, HoraryChart
+    from models import Planet, Aspect, HoraryChart, PlanetPosition
 import swisseph as swe
 
 CLASSICAL_PLANETS: List[Planet] = [
@@ -29,6 +31,211 @@ ASPECT_TYPES: List[Aspect] = [
     Aspect.OPPOSITION,
 ]
 
+# Swiss Ephemeris IDs for classical planets
+SWE_ID: Dict[Planet, int] = {
+    Planet.SUN: swe.SUN,
+    Planet.MOON: swe.MOON,
+    Planet.MERCURY: swe.MERCURY,
+    Planet.VENUS: swe.VENUS,
+    Planet.MARS: swe.MARS,
+    Planet.JUPITER: swe.JUPITER,
+    Planet.SATURN: swe.SATURN,
+}
+
+
+def solve_aspect_time(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    jd_start: float,
+    max_days: float,
+) -> Optional[float]:
+    """Return days until two planets perfect ``aspect``, from the ephemeris.
+
+    Unlike a linear extrapolation of the chart speeds this follows the real
+    motion, so stations and changing speed inside the window are honoured.
+    Returns ``None`` when the aspect does not perfect within ``max_days``.
+    """
+    body1 = SWE_ID.get(pos1.planet)
+    body2 = SWE_ID.get(pos2.planet)
+    if body1 is None or body2 is None:
+        return None
+    try:
+        event = get_event_solver().aspect_perfection(body1, body2, aspect.degrees, jd_start, max_days)
+    except swe.Error:
+        return None
+    return event.days if event is not None else None
+
+
+def solve_sign_exit(pos: PlanetPosition, jd_start: float, max_days: float) -> Optional[float]:
+    """Return days until a planet leaves its sign, from the ephemeris.
+
+    Falls back to :func:`days_to_sign_exit` when the chart has no Julian Day.
+    ``None`` means the planet stays in its sign for at least ``max_days``.
+    """
+    body = SWE_ID.get(pos.planet)
+    if not jd_start or body is None:
+        return days_to_sign_exit(pos.longitude, pos.speed)
+    try:
+        event = get_event_solver().sign_ingress(body, jd_start, max_days)
+    except swe.Error:
+        return days_to_sign_exit(pos.longitude, pos.speed)
+    return event.days if event is not None else None
+
+
+def _linear_aspect_time(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    jd_start: float,
+    max_days: float,
+) -> Optional[float]:
+    """Signed days to ``aspect`` assuming constant speeds (charts without a JD)."""
+    v = pos1.speed - pos2.speed
+    if v == 0:
+        return None
+    delta = ((pos1.longitude - pos2.longitude - aspect.degrees + 180) % 360) - 180
+    return -delta / v
+
+
+def linear_future_aspect_time(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+) -> Optional[float]:
+    """Smallest positive days to ``aspect`` assuming constant speeds.
+
+    Both polarities are considered (e.g. +90 and -90 for a square).
+    Returns ``None`` when the planets keep the same distance.
+    """
+    theta0 = (pos1.longitude - pos2.longitude) % 360.0
+    v_rel = pos1.speed - pos2.speed
+    if abs(v_rel) < 1e-6:
+        return None
+
+    delta1 = (aspect.degrees - theta0 + 180.0) % 360.0 - 180.0
+    delta2 = (-aspect.degrees - theta0 + 180.0) % 360.0 - 180.0
+    delta = delta1 if abs(delta1) < abs(delta2) else delta2
+
+    t = delta / v_rel
+    if t < 0:
+        t += 360.0 / abs(v_rel)
+    return t if t > 0 else None
+
+
+@dataclass
+class PerfectionEntry:
+    """Timing of one pair and aspect read from a :class:`PerfectionMatrix`."""
+
+    days: Optional[float]  # None when it does not perfect within the window
+    exit1: Optional[float]  # sign exits, None when beyond the perfection
+    exit2: Optional[float]
+
+    @property
+    def in_sign(self) -> bool:
+        """Perfection happens before either planet leaves its sign."""
+        if self.days is None:
+            return False
+        return all(exit is None or self.days < exit for exit in (self.exit1, self.exit2))
+
+
+class PerfectionMatrix:
+    """Perfection times for every classical pair and aspect of one chart.
+
+    Entries of the 7x7x5 table (planet, planet, aspect) and the per-planet
+    sign exits are solved on first use and remembered together with the
+    window that was searched. The solver returns the *first* event, so a
+    later question with a shorter window is answered from the table and
+    only a longer window after a miss solves again. Every perfection check
+    of a judgment reads the same table through :func:`perfection_matrix`,
+    so each contact is solved at most once per chart.
+
+    Charts without a Julian Day use constant-speed extrapolation instead
+    of the ephemeris.
+
+    Only solved cells are stored, as ``(days, window searched)`` keyed by
+    the cell number, so a cached chart carries a few entries rather than
+    the whole table.
+    """
+
+    __slots__ = ("julian_day", "planets", "_aspects", "_exits", "solves")
+
+    def __init__(self, julian_day: float, planets: Dict[Planet, PlanetPosition]):
+        self.julian_day = julian_day
+        self.planets = planets
+        self._aspects: Dict[int, Tuple[Optional[float], float]] = {}
+        self._exits: Dict[int, Tuple[Optional[float], float]] = {}
+        self.solves = 0  # solver runs, for tuning and tests
+
+    def time_to_perfection(self, planet1: Planet, planet2: Planet, aspect: Aspect,
+                           max_days: float) -> Optional[float]:
+        """Days until ``planet1`` and ``planet2`` perfect ``aspect``.
+
+        ``None`` when the aspect does not perfect within ``max_days``.
+        """
+        i, j, k = _PLANET_INDEX.get(planet1), _PLANET_INDEX.get(planet2), _ASPECT_INDEX.get(aspect)
+        if i is None or j is None or k is None:
+            return self._solve_aspect(planet1, planet2, aspect, max_days)
+
+        # Perfection times do not depend on argument order
+        cell = (min(i, j) * len(CLASSICAL_PLANETS) + max(i, j)) * len(ASPECT_TYPES) + k
+        days, searched = self._aspects.get(cell, _UNSOLVED)
+        if days is None and max_days > searched:
+            days = self._solve_aspect(planet1, planet2, aspect, max_days)
+            self._aspects[cell] = (days, max_days)
+        return days if days is not None and days <= max_days else None
+
+    def sign_exit(self, planet: Planet, max_days: float) -> Optional[float]:
+        """Days until ``planet`` leaves its sign, ``None`` beyond ``max_days``."""
+        i = _PLANET_INDEX.get(planet)
+        if i is None:
+            days = self._solve_exit(planet, max_days)
+        else:
+            days, searched = self._exits.get(i, _UNSOLVED)
+            if days is None and max_days > searched:
+                days = self._solve_exit(planet, max_days)
+                self._exits[i] = (days, max_days)
+        return days if days is not None and days <= max_days else None
+
+    def entry(self, planet1: Planet, planet2: Planet, aspect: Aspect,
+              max_days: float) -> PerfectionEntry:
+        """Perfection time with both sign exits up to that perfection."""
+        days = self.time_to_perfection(planet1, planet2, aspect, max_days)
+        if days is None:
+            return PerfectionEntry(None, None, None)
+        return PerfectionEntry(days, self.sign_exit(planet1, days), self.sign_exit(planet2, days))
+
+    def _solve_aspect(self, planet1: Planet, planet2: Planet, aspect: Aspect,
+                      max_days: float) -> Optional[float]:
+        pos1, pos2 = self.planets.get(planet1), self.planets.get(planet2)
+        if pos1 is None or pos2 is None:
+            return None
+        self.solves += 1
+        if self.julian_day:
+            return solve_aspect_time(pos1, pos2, aspect, self.julian_day, max_days)
+        # Constant speeds: the solution does not depend on the window
+        return linear_future_aspect_time(pos1, pos2, aspect)
+
+    def _solve_exit(self, planet: Planet, max_days: float) -> Optional[float]:
+        pos = self.planets.get(planet)
+        if pos is None:
+            return None
+        self.solves += 1
+        return solve_sign_exit(pos, self.julian_day, max_days)
+
+
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(CLASSICAL_PLANETS)}
+_ASPECT_INDEX: Dict[Aspect, int] = {aspect: k for k, aspect in enumerate(ASPECT_TYPES)}
+_UNSOLVED: Tuple[Optional[float], float] = (None, 0.0)
+
+
+def perfection_matrix(chart: HoraryChart) -> PerfectionMatrix:
+    """The chart's shared :class:`PerfectionMatrix`, created on first use."""
+    matrix = getattr(chart, "perfection_cache", None)
+    if matrix is None:
+        matrix = chart.perfection_cache = PerfectionMatrix(chart.julian_day, chart.planets)
+    return matrix
+
 
 def verb(aspect: Aspect) -> str:
     """Return the verb form for a given aspect."""
@@ -47,7 +254,7 @@ def check_future_prohibitions(
     sig1: Planet,
     sig2: Planet,
     days_ahead: float,
-    calc_aspect_time: Callable[[Any, Any, Aspect, float, float], float],
+    calc_aspect_time: Optional[Callable[[Any, Any, Aspect, float, float], float]] = None,
 ) -> Dict[str, Any]:
     """Scan for intervening aspects before a main perfection.
 
@@ -59,9 +266,11 @@ def check_future_prohibitions(
         Significators forming the main perfection.
     days_ahead : float
         Time until the main perfection in days.
-    calc_aspect_time : callable
+    calc_aspect_time : callable, optional
         Function for computing signed time to an aspect. Positive values are
         future contacts while negative values indicate a recent separation.
+        Defaults to the chart's :func:`perfection_matrix` for charts with a
+        Julian Day.
     """
 
     config = cfg()
@@ -72,24 +281,24 @@ def check_future_prohibitions(
     pos2 = chart.planets[sig2]
     reception_calc = TraditionalReceptionCalculator()
 
-    # Local Swiss Ephemeris ID mapping for classical planets
-    SWE_ID: Dict[Planet, int] = {
-        Planet.SUN: swe.SUN,
-        Planet.MOON: swe.MOON,
-        Planet.MERCURY: swe.MERCURY,
-        Planet.VENUS: swe.VENUS,
-        Planet.MARS: swe.MARS,
-        Planet.JUPITER: swe.JUPITER,
-        Planet.SATURN: swe.SATURN,
-    }
+    matrix = perfection_matrix(chart)
+    if calc_aspect_time is None:
+        if chart.julian_day:
+            def calc_aspect_time(p_a, p_b, aspect, jd_start, max_days):
+                return matrix.time_to_perfection(p_a.planet, p_b.planet, aspect, max_days)
+        else:
+            calc_aspect_time = _linear_aspect_time
+
+    def _exit(p) -> Optional[float]:
+        return matrix.sign_exit(p.planet, days_ahead)
 
     def _leg_valid(p_a, p_b, t_leg: Optional[float]) -> bool:
         """Validate a leg timing with in-sign and station (refranation) checks."""
         if t_leg is None or t_leg <= 0 or t_leg >= days_ahead:
             return False
         if require_in_sign and not allow_out_of_sign:
-            exit_a = days_to_sign_exit(p_a.longitude, p_a.speed)
-            exit_b = days_to_sign_exit(p_b.longitude, p_b.speed)
+            exit_a = _exit(p_a)
+            exit_b = _exit(p_b)
             if exit_a is not None and t_leg >= exit_a:
                 return False
             if exit_b is not None and t_leg >= exit_b:
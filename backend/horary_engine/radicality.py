@@ -1,36 +1,14 @@
 """Radicality checks for horary charts."""
 
-import datetime
 from typing import Any, Dict
 
-import swisseph as swe
-
 from horary_config import cfg
 try:
     from ..models import HoraryChart, Planet, Sign
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import HoraryChart, Planet, Sign
-
-
-PLANET_SEQUENCE = [
-    Planet.SATURN,
-    Planet.JUPITER,
-    Planet.MARS,
-    Planet.SUN,
-    Planet.VENUS,
-    Planet.MERCURY,
-    Planet.MOON,
-]
-
-PLANETARY_DAY_RULERS = {
-    0: Planet.MOON,  # Monday
-    1: Planet.MARS,  # Tuesday
-    2: Planet.MERCURY,  # Wednesday
-    3: Planet.JUPITER,  # Thursday
-    4: Planet.VENUS,  # Friday
-    5: Planet.SATURN,  # Saturday
-    6: Planet.SUN,  # Sunday
-}
+from .context import chart_context
+from .services.planetary_hours import PlanetaryHoursError, get_planetary_hours_service
 
 
 def _sign_triplicity(sign: Sign) -> str:
@@ -47,74 +25,16 @@ def _sign_triplicity(sign: Sign) -> str:
 def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]:
     """Check if planetary hour ruler agrees with Ascendant ruler.
 
-    Computes local sunrise and sunset using Swiss Ephemeris and divides the
-    day/night into twelve unequal planetary hours. The active planetary hour at
-    the query time determines the hour ruler.
+    The hour ruler comes from the cached planetary-hour table for the chart's
+    local date and location (see ``services.planetary_hours``).
     """
 
-    # Ensure timezone-aware datetimes
-    dt_local = chart.date_time
-    if dt_local.tzinfo is None:
-        dt_local = dt_local.replace(tzinfo=datetime.timezone.utc)
-    dt_utc = chart.date_time_utc
-    if dt_utc.tzinfo is None:
-        dt_utc = dt_utc.replace(tzinfo=datetime.timezone.utc)
-
     lat, lon = chart.location
-
-    # Julian day numbers for computations
-    jd = swe.julday(
-        dt_utc.year,
-        dt_utc.month,
-        dt_utc.day,
-        dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600,
-        swe.GREG_CAL,
-    )
-    jd0 = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 0.0, swe.GREG_CAL)
-
-    # Sunrise and sunset for today
-    _, rise_today = swe.rise_trans(jd0, swe.SUN, swe.CALC_RISE, (lon, lat, 0))
-    sunrise_today = rise_today[0]
-    _, set_today = swe.rise_trans(jd0, swe.SUN, swe.CALC_SET, (lon, lat, 0))
-    sunset_today = set_today[0]
-
-    if jd >= sunrise_today:
-        # After today's sunrise
-        sunrise_prev = sunrise_today
-        sunset_prev = sunset_today
-        _, rise_next = swe.rise_trans(jd0 + 1, swe.SUN, swe.CALC_RISE, (lon, lat, 0))
-        sunrise_next = rise_next[0]
-    else:
-        # Before today's sunrise -> use previous day's data
-        _, rise_prev = swe.rise_trans(jd0 - 1, swe.SUN, swe.CALC_RISE, (lon, lat, 0))
-        sunrise_prev = rise_prev[0]
-        _, set_prev = swe.rise_trans(jd0 - 1, swe.SUN, swe.CALC_SET, (lon, lat, 0))
-        sunset_prev = set_prev[0]
-        sunrise_next = sunrise_today
-
-    # Determine the planetary day ruler (day starts at local sunrise)
-    y, m, d, h = swe.revjul(sunrise_today, swe.GREG_CAL)
-    sunrise_today_dt = (
-        datetime.datetime(y, m, d, tzinfo=datetime.timezone.utc)
-        + datetime.timedelta(hours=h)
-    ).astimezone(dt_local.tzinfo)
-    weekday = dt_local.weekday()
-    if dt_local < sunrise_today_dt:
-        weekday = (weekday - 1) % 7
-    day_ruler = PLANETARY_DAY_RULERS.get(weekday, Planet.SUN)
-
-    # Determine planetary hour index
-    if sunrise_prev <= jd < sunset_prev:
-        day_length = sunset_prev - sunrise_prev
-        hour_len = day_length / 12.0
-        hour_index = int((jd - sunrise_prev) / hour_len)
-    else:
-        night_length = sunrise_next - sunset_prev
-        hour_len = night_length / 12.0
-        hour_index = 12 + int((jd - sunset_prev) / hour_len)
-
-    start_idx = PLANET_SEQUENCE.index(day_ruler)
-    hour_ruler = PLANET_SEQUENCE[(start_idx + hour_index) % 7]
+    try:
+        hour = get_planetary_hours_service().hour_at(chart.date_time, lat, lon, chart.timezone_info)
+    except PlanetaryHoursError as e:
+        return {"valid": True, "reason": f"Planetary hours undefined: {e}"}
+    hour_ruler = hour.ruler
 
     asc_sign = list(Sign)[int((chart.ascendant % 360) // 30)]
     asc_ruler = asc_sign.ruler
@@ -171,8 +91,18 @@ def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]
 
 
 def check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool = False) -> Dict[str, Any]:
-    """Enhanced radicality checks with configuration"""
+    """Enhanced radicality checks with configuration
+
+    The result is memoized on the chart's :class:`~horary_engine.context.ChartContext`.
+    """
+    return chart_context(chart).memo(
+        "radicality",
+        bool(ignore_saturn_7th),
+        lambda: _check_enhanced_radicality(chart, ignore_saturn_7th),
+    )
+
 
+def _check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool) -> Dict[str, Any]:
     config = cfg()
     asc_degree = chart.ascendant % 30
 
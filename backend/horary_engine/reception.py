@@ -2,70 +2,42 @@
 
 from typing import Dict, List, Tuple, Any
 
-from horary_config import cfg
+from .chart_index import chart_index, house_position
+from .dignities import DIGNITY_PLANETS, ESSENTIAL_DIGNITIES, RULERSHIP, dignity_table
 
 try:
-    from ..models import Planet, Sign, HoraryChart
+    from ..models import Planet, HoraryChart
 except ImportError:  # pragma: no cover - fallback when executed as script
-    from models import Planet, Sign, HoraryChart
+    from models import Planet, HoraryChart
 
 
 class TraditionalReceptionCalculator:
     """Centralized reception calculator - single source of truth for all reception logic"""
 
-    def __init__(self) -> None:
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA,
-        }
-
-        # Traditional triplicity rulers (day/night)
-        self.triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius)
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.SCORPIO: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.PISCES: {"day": Planet.MARS, "night": Planet.VENUS},
-        }
-
     def calculate_comprehensive_reception(
         self, chart: HoraryChart, planet1: Planet, planet2: Planet
     ) -> Dict[str, Any]:
         """SINGLE SOURCE OF TRUTH for all reception calculations
-        Returns comprehensive reception data used by both reasoning and structured output."""
-
-        # Get planet positions
-        pos1 = chart.planets[planet1]
-        pos2 = chart.planets[planet2]
-
-        # Determine day/night for triplicity calculations
-        sun_pos = chart.planets[Planet.SUN]
-        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
-
-        # Check all dignity types for both directions
-        reception_1_to_2 = self._check_all_dignities(planet1, pos2, is_day)
-        reception_2_to_1 = self._check_all_dignities(planet2, pos1, is_day)
+        Returns comprehensive reception data used by both reasoning and structured output.
+
+        Pairs are read from the chart's :class:`ReceptionMatrix`, so each
+        pair is classified once per chart. The returned dict is a copy the
+        caller may modify."""
+        return dict(self.reception_matrix(chart).pair(planet1, planet2))
+
+    def reception_matrix(self, chart: HoraryChart) -> "ReceptionMatrix":
+        """The chart's shared :class:`ReceptionMatrix`, built on first use."""
+        matrix = getattr(chart, "reception_cache", None)
+        if matrix is None:
+            matrix = ReceptionMatrix(self, chart)
+            chart.reception_cache = matrix
+        return matrix
+
+    def _pair_reception(
+        self, planet1: Planet, planet2: Planet, reception_1_to_2: List[str],
+        reception_2_to_1: List[str], is_day: bool
+    ) -> Dict[str, Any]:
+        """Classify one pair from the dignities by which each receives the other."""
 
         # Determine overall reception type
         reception_type, reception_details = self._classify_reception(
@@ -108,65 +80,17 @@ class TraditionalReceptionCalculator:
         self, receiving_planet: Planet, received_position, is_day: bool
     ) -> List[str]:
         """Check all traditional dignity types for reception"""
-        dignities: List[str] = []
-
-        # 1. Domicile/Rulership (strongest)
-        if received_position.sign.ruler == receiving_planet:
-            dignities.append("domicile")
-
-        # 2. Exaltation (second strongest)
-        if (
-            receiving_planet in self.exaltations
-            and self.exaltations[receiving_planet] == received_position.sign
-        ):
-            dignities.append("exaltation")
-
-        # 3. Triplicity (third strongest)
-        if self._has_triplicity_dignity(
-            receiving_planet, received_position.sign, is_day
-        ):
-            dignities.append("triplicity")
-
+        sign = received_position.sign
         # Get position within sign for terms/faces
-        sign_degree = (
-            received_position.longitude - received_position.sign.start_degree
-        ) % 30
-
-        # 4. Terms (Egyptian terms)
-        try:
-            terms_table = getattr(
-                cfg().reception.terms, received_position.sign.sign_name
-            )
-            for term in terms_table:
-                if term.start <= sign_degree < term.end:
-                    if Planet[term.ruler.upper()] == receiving_planet:
-                        dignities.append("term")
-                    break
-        except AttributeError:
-            pass
-
-        # 5. Faces/Decans
-        try:
-            faces_table = getattr(
-                cfg().reception.faces, received_position.sign.sign_name
-            )
-            for face in faces_table:
-                if face.start <= sign_degree < face.end:
-                    if Planet[face.ruler.upper()] == receiving_planet:
-                        dignities.append("face")
-                    break
-        except AttributeError:
-            pass
-
-        return dignities
+        sign_degree = (received_position.longitude - sign.start_degree) % 30
+        mask = dignity_table().mask(receiving_planet, sign, sign_degree, is_day)
 
-    def _has_triplicity_dignity(self, planet: Planet, sign: Sign, is_day: bool) -> bool:
-        """Check if planet has triplicity dignity in sign"""
-        if sign not in self.triplicity_rulers:
-            return False
-
-        sect = "day" if is_day else "night"
-        return self.triplicity_rulers[sign][sect] == planet
+        # Domicile (strongest), exaltation, triplicity, terms (Egyptian) and faces
+        return [
+            "domicile" if flag == RULERSHIP else name
+            for flag, name in ESSENTIAL_DIGNITIES
+            if mask & flag
+        ]
 
     def _classify_reception(
         self,
@@ -305,18 +229,15 @@ class TraditionalReceptionCalculator:
         Returns specific directional reception information to eliminate confusion
         about parameter order in comprehensive reception calculations.
         """
-        reception_data = self.calculate_comprehensive_reception(chart, receiving_planet, received_planet)
-        
-        # Since we called calculate_comprehensive_reception(chart, receiving_planet, received_planet),
-        # receiving_planet is always planet1, so we want planet1_receives_planet2
-        dignities = reception_data["planet1_receives_planet2"]
+        matrix = self.reception_matrix(chart)
+        dignities = matrix.receives(receiving_planet, received_planet)
             
         has_reception = len(dignities) > 0
         
         return {
             "has_reception": has_reception,
             "dignities": dignities,
-            "reception_strength": self._calculate_single_direction_strength(dignities),
+            "reception_strength": matrix.strength(receiving_planet, received_planet),
             "display_text": self._format_single_direction_display(receiving_planet, received_planet, dignities) if has_reception else "no reception"
         }
         
@@ -374,17 +295,64 @@ class TraditionalReceptionCalculator:
 
     def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
         """Helper method for house calculation"""
-        longitude = longitude % 360
+        return house_position(longitude, houses)
+
 
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
+class ReceptionMatrix:
+    """Reception between every pair of classical planets in one chart.
 
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
+    Built once per chart: the day/night status and, for each ordered pair
+    of the 7x7 grid, the dignities by which one planet receives the other
+    and the single-direction strength. Pair summaries (type, mutual,
+    one-way labels, display text) are only classified and formatted when a
+    pair is first asked for, then kept for the rest of the judgment.
+    """
 
-        return 1
+    def __init__(self, calculator: TraditionalReceptionCalculator, chart: HoraryChart) -> None:
+        self._calculator = calculator
+        self._planets = chart.planets
+
+        # Determine day/night for triplicity calculations
+        sun_pos = chart.planets[Planet.SUN]
+        sun_house = chart_index(chart).house_of(sun_pos.longitude)
+        self.is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
+
+        present = [planet for planet in DIGNITY_PLANETS if planet in chart.planets]
+        self._receives: Dict[Tuple[Planet, Planet], List[str]] = {}
+        self._strength: Dict[Tuple[Planet, Planet], int] = {}
+        for receiving in present:
+            for received in present:
+                self._direction(receiving, received)
+        self._pairs: Dict[Tuple[Planet, Planet], Dict[str, Any]] = {}
+
+    def receives(self, receiving: Planet, received: Planet) -> List[str]:
+        """Dignities of ``receiving`` at the position of ``received``."""
+        return self._direction(receiving, received)
+
+    def strength(self, receiving: Planet, received: Planet) -> int:
+        """Single-direction strength: domicile=5 down to face=1, 0 for none."""
+        self._direction(receiving, received)
+        return self._strength[(receiving, received)]
+
+    def pair(self, planet1: Planet, planet2: Planet) -> Dict[str, Any]:
+        """Full reception summary for ``planet1`` and ``planet2`` (shared, do not modify)."""
+        key = (planet1, planet2)
+        summary = self._pairs.get(key)
+        if summary is None:
+            summary = self._calculator._pair_reception(
+                planet1, planet2, self.receives(planet1, planet2),
+                self.receives(planet2, planet1), self.is_day,
+            )
+            self._pairs[key] = summary
+        return summary
+
+    def _direction(self, receiving: Planet, received: Planet) -> List[str]:
+        key = (receiving, received)
+        dignities = self._receives.get(key)
+        if dignities is None:
+            dignities = self._calculator._check_all_dignities(
+                receiving, self._planets[received], self.is_day
+            )
+            self._receives[key] = dignities
+            self._strength[key] = self._calculator._calculate_single_direction_strength(dignities)
+        return dignities
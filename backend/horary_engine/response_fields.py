@@ -0,0 +1,116 @@
+"""Response sections of a judgment and projection onto requested fields.
+
+A full ``/api/calculate-chart`` response carries many sections, several of
+them expensive to build. Clients that only need a few pass ``fields`` (alias
+``include``), e.g. ``fields=judgment,confidence,timing``; every layer then
+builds only those sections and drops the rest. ``None`` means everything.
+
+Section dependencies (what building each section costs):
+
+``question``, ``judgment``, ``confidence``, ``error``, ``error_type``
+    Always included. The judgment itself is always computed.
+``reasoning``, ``timing``, ``traditional_factors``, ``solar_factors``, ``question_analysis``, ``scoring_trace``, ``timezone_info``
+    By-products of the judgment; free.
+``reasoning_v1``
+    Structured reasoning bundle (``USE_REASONING_V1``), or the
+    ``evaluate_chart`` rationale when the request asks for reasoning v1.
+``chart_data``
+    ``serialize_chart_for_frontend``: every planet, aspect and cusp.
+``moon_aspects``
+    ``_build_moon_story``: the Moon's aspects with timing descriptions.
+``general_info``
+    ``_calculate_general_info``: planetary day and hour, lunar phase and
+    mansion, Moon condition.
+``considerations``
+    ``_calculate_considerations``: radicality and void-of-course checks.
+``moon_last_aspect``, ``moon_next_aspect``
+    Serialized lunar aspects of the chart.
+``explanation_audit``
+    Consistency audit of ``reasoning`` (needs ``reasoning``).
+``ledger``, ``rationale``
+    ``evaluate_chart``: testimony extraction and aggregation. ``rationale``
+    falls back to ``reasoning`` when evaluation fails.
+``calculation_metadata``
+    Timing and ephemeris usage of the request.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Union
+
+ALWAYS_INCLUDED: FrozenSet[str] = frozenset({"question", "judgment", "confidence", "error", "error_type"})
+
+RESPONSE_SECTIONS: FrozenSet[str] = ALWAYS_INCLUDED | frozenset({
+    "reasoning",
+    "timing",
+    "traditional_factors",
+    "solar_factors",
+    "question_analysis",
+    "scoring_trace",
+    "timezone_info",
+    "reasoning_v1",
+    "chart_data",
+    "moon_aspects",
+    "general_info",
+    "considerations",
+    "moon_last_aspect",
+    "moon_next_aspect",
+    "explanation_audit",
+    "ledger",
+    "rationale",
+    "calculation_metadata",
+})
+
+# Sections another section is built from
+SECTION_DEPENDENCIES: Mapping[str, FrozenSet[str]] = {
+    "explanation_audit": frozenset({"reasoning"}),
+    "rationale": frozenset({"reasoning"}),
+    "reasoning_v1": frozenset({"reasoning"}),
+}
+
+Fields = Optional[FrozenSet[str]]
+
+
+def parse_fields(value: Union[None, str, Iterable[str]]) -> Fields:
+    """Requested sections from a comma-separated string or a list.
+
+    Returns ``None`` (everything) for a missing or empty value.
+
+    Raises:
+        ValueError: If a name is not a response section.
+    """
+    if value is None:
+        return None
+    names = value.split(",") if isinstance(value, str) else value
+    fields = frozenset(name.strip() for name in names if name and name.strip())
+    if not fields:
+        return None
+    unknown = fields - RESPONSE_SECTIONS
+    if unknown:
+        raise ValueError(
+            f"Unknown response field(s): {', '.join(sorted(unknown))} "
+            f"(available: {', '.join(sorted(RESPONSE_SECTIONS))})"
+        )
+    return fields
+
+
+def expand_fields(fields: Fields) -> Fields:
+    """``fields`` plus the sections they are built from."""
+    if fields is None:
+        return None
+    expanded = set(fields)
+    for name in fields:
+        expanded |= SECTION_DEPENDENCIES.get(name, frozenset())
+    return frozenset(expanded)
+
+
+def wants(fields: Fields, section: str) -> bool:
+    """Whether ``section`` should be built for ``fields``."""
+    return fields is None or section in fields or section in ALWAYS_INCLUDED
+
+
+def project(result: Dict[str, Any], fields: Fields) -> Dict[str, Any]:
+    """``result`` restricted to ``fields`` and the always-included keys."""
+    if fields is None:
+        return result
+    return {key: value for key, value in result.items() if wants(fields, key)}
@@ -1,5 +1,5 @@
 """Service utilities for the horary engine."""
 
-from .geolocation import TimezoneManager, LocationError, safe_geocode
+from .geolocation import TimezoneManager, LocationError, get_timezone_manager, safe_geocode
 
-__all__ = ["TimezoneManager", "LocationError", "safe_geocode"]
+__all__ = ["TimezoneManager", "LocationError", "get_timezone_manager", "safe_geocode"]
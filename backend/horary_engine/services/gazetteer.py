@@ -0,0 +1,490 @@
+"""Offline gazetteer of populated places for network-free geocoding.
+
+``safe_geocode`` resolves a location from this index before asking the
+geocoding service, and ``/api/locations/autocomplete`` searches it as the
+user types. The index is a single little-endian binary file that is
+memory-mapped, so workers share its pages and loading it costs no parsing:
+
+* place columns (latitude, longitude, population, country code and string
+  references), ordered by descending population and then GeoNames id, so
+  a smaller place index always means a higher rank;
+* every normalized name, ASCII name and alias of every place, sorted with
+  its kind (the place's own name or an alternate name) and the place it
+  belongs to, so exact and prefix lookups are a bisect.
+
+Names are normalized by stripping accents, case-folding and replacing
+punctuation with spaces. Text after the first comma qualifies the name by
+country code, country name, first-level region or its postal abbreviation
+("Paris, Texas", "Paris, TX", "London, UK"). Matches rank exact names
+before prefixes before fuzzy (misspelt) names. Within each group a
+place's own names rank before alternate names, which are often old or
+foreign names of another, larger place ("Victoria" for Hong Kong), and
+then by population.
+
+The bundled index is built from the GeoNames ``cities15000`` list (see
+``data/README.md``). It can be rebuilt from a GeoNames cities dump
+(``cities15000.txt`` or ``cities500.txt``, optionally with
+``admin1CodesASCII.txt`` for region names)::
+
+    python -m horary_engine.services.gazetteer --source cities15000.zip --admin1 admin1CodesASCII.txt
+
+Without the file the gazetteer is disabled and every lookup goes to the
+geocoding service.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import difflib
+import io
+import logging
+import mmap
+import struct
+import threading
+import unicodedata
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).parent / "data" / "gazetteer.bin"
+
+_MAGIC = b"HGAZ"
+_VERSION = 2
+# magic, version, place count, key count, string count
+_HEADER = struct.Struct("<4sH2xIII")
+_ALIGN = 8
+
+# Place columns in file order
+_COLUMNS = (
+    ("latitude", "<f8"),
+    ("longitude", "<f8"),
+    ("population", "<i8"),
+    ("geonameid", "<i4"),
+    ("name", "<u4"),
+    ("label", "<u4"),
+    ("admin1", "<u4"),
+    ("admin1_code", "<u4"),
+    ("timezone", "<u4"),
+    ("country", "S2"),
+)
+
+# Country names for labels where pytz's differ from common usage
+COUNTRY_NAMES = {
+    "GB": "United Kingdom",
+    "KP": "North Korea",
+    "KR": "South Korea",
+    "MM": "Myanmar",
+}
+
+# Other names of countries accepted as qualifiers
+COUNTRY_ALIASES = {
+    "uk": "GB",
+    "britain": "GB",
+    "great britain": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "wales": "GB",
+    "northern ireland": "GB",
+    "usa": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uae": "AE",
+    "russia": "RU",
+    "czech republic": "CZ",
+    "holland": "NL",
+}
+
+# Postal abbreviations of first-level regions accepted as qualifiers. US
+# GeoNames admin1 codes are already the postal abbreviations.
+ADMIN1_ABBREVIATIONS = {
+    "AU.01": "ACT", "AU.02": "NSW", "AU.03": "NT", "AU.04": "QLD",
+    "AU.05": "SA", "AU.06": "TAS", "AU.07": "VIC", "AU.08": "WA",
+    "CA.01": "AB", "CA.02": "BC", "CA.03": "MB", "CA.04": "NB",
+    "CA.05": "NL", "CA.07": "NS", "CA.08": "ON", "CA.09": "PE",
+    "CA.10": "QC", "CA.11": "SK", "CA.12": "YT", "CA.13": "NT",
+    "CA.14": "NU",
+}
+
+# Key kinds, in rank order: a place's own (or ASCII) name, an alternate name
+NAME, ALIAS = 0, 1
+
+# Fuzzy matching compares against keys sharing this many leading characters
+_FUZZY_PREFIX = 2
+_FUZZY_CUTOFF = 0.8
+_FUZZY_MAX_KEYS = 20000
+
+EXACT, PREFIX, FUZZY = "exact", "prefix", "fuzzy"
+
+
+def normalize_name(text: str) -> str:
+    """Accent-free, case-folded ``text`` with punctuation as single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return " ".join("".join(c if c.isalnum() else " " for c in stripped).split())
+
+
+def country_name(code: str) -> str:
+    return COUNTRY_NAMES.get(code) or pytz.country_names.get(code, code)
+
+
+def _split_query(query: str) -> Tuple[str, List[str]]:
+    """Place name and qualifiers ("Paris, Texas, US" -> "paris", ["texas", "us"])."""
+    parts = [normalize_name(part) for part in query.split(",")]
+    return parts[0], [part for part in parts[1:] if part]
+
+
+@dataclass(frozen=True)
+class Place:
+    """One populated place."""
+
+    geonameid: int
+    name: str
+    label: str  # "Name, Region, Country"
+    latitude: float
+    longitude: float
+    country_code: str
+    admin1: str
+    population: int
+    timezone: str
+    admin1_code: str = ""  # postal abbreviation of the region, if known
+
+    def to_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+
+class Gazetteer:
+    """Memory-mapped place index with exact, prefix and fuzzy name lookup."""
+
+    def __init__(self, buffer, path: Optional[Path] = None):
+        self.path = path
+        self._buffer = buffer
+        magic, version, places, keys, strings = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported gazetteer file: {path}")
+        offset = _HEADER.size
+        self._columns: Dict[str, np.ndarray] = {}
+        for name, dtype in _COLUMNS:
+            self._columns[name], offset = _view(buffer, dtype, places, offset)
+        self._string_offsets, offset = _view(buffer, "<u4", strings + 1, offset)
+        self._key_offsets, offset = _view(buffer, "<u4", keys + 1, offset)
+        self._key_places, offset = _view(buffer, "<u4", keys, offset)
+        self._key_kinds, offset = _view(buffer, "<u1", keys, offset)
+        self._strings_start = offset
+        self._keys_start = offset + int(self._string_offsets[-1])
+        self.place_count = places
+        self.key_count = keys
+
+    @classmethod
+    def load(cls, path: Path) -> "Gazetteer":
+        """Map a file written by :func:`write_gazetteer`."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, Path(path))
+
+    def place(self, index: int) -> Place:
+        columns = self._columns
+        return Place(
+            geonameid=int(columns["geonameid"][index]),
+            name=self._string(columns["name"][index]),
+            label=self._string(columns["label"][index]),
+            latitude=float(columns["latitude"][index]),
+            longitude=float(columns["longitude"][index]),
+            country_code=columns["country"][index].decode("ascii"),
+            admin1=self._string(columns["admin1"][index]),
+            population=int(columns["population"][index]),
+            timezone=self._string(columns["timezone"][index]),
+            admin1_code=self._string(columns["admin1_code"][index]),
+        )
+
+    def resolve(self, query: str) -> Optional[Place]:
+        """The highest-ranked place whose name is exactly ``query``, if any.
+
+        Qualifiers after a comma must each match the country or region. A
+        place known by ``query`` only as an alternate name is returned only
+        when no qualifying place has it as its own name.
+        """
+        name, qualifiers = _split_query(query)
+        if not name:
+            return None
+        lo, hi = self._key_range(name.encode(), exact=True)
+        for index in self._ranked(lo, hi):
+            if self._qualifies(index, qualifiers, partial=False):
+                return self.place(index)
+        return None
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Tuple[Place, str]]:
+        """Up to ``limit`` ``(place, match)`` pairs for a partially typed query.
+
+        ``match`` is ``"exact"``, ``"prefix"`` or ``"fuzzy"``; the last
+        qualifier may be incomplete.
+        """
+        name, qualifiers = _split_query(query)
+        if not name or limit <= 0:
+            return []
+        key = name.encode()
+        found: Dict[int, str] = {}
+
+        def collect(indexes: Iterable[int], match: str) -> bool:
+            for index in indexes:
+                if index not in found and self._qualifies(index, qualifiers, partial=True):
+                    found[index] = match
+                    if len(found) >= limit:
+                        return True
+            return False
+
+        exact_lo, exact_hi = self._key_range(key, exact=True)
+        done = collect(self._ranked(exact_lo, exact_hi), EXACT)
+        if not done:
+            lo, hi = self._key_range(key, exact=False)
+            done = collect(self._ranked(lo, hi), PREFIX)
+        if not done and fuzzy and len(name) > _FUZZY_PREFIX:
+            collect(self._fuzzy(name), FUZZY)
+        return [(self.place(index), match) for index, match in found.items()]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": str(self.path) if self.path is not None else None,
+            "places": self.place_count,
+            "names": self.key_count,
+            "bytes": len(self._buffer),
+        }
+
+    def _string(self, index) -> str:
+        start = self._strings_start + int(self._string_offsets[index])
+        end = self._strings_start + int(self._string_offsets[index + 1])
+        return self._buffer[start:end].decode("utf-8")
+
+    def _key(self, index: int) -> bytes:
+        start = self._keys_start + int(self._key_offsets[index])
+        end = self._keys_start + int(self._key_offsets[index + 1])
+        return self._buffer[start:end]
+
+    def _key_range(self, key: bytes, exact: bool) -> Tuple[int, int]:
+        """Index range of the keys equal to (or starting with) ``key``."""
+        keys = range(self.key_count)
+        lo = bisect.bisect_left(keys, key, key=self._key)
+        if exact:
+            hi = bisect.bisect_right(keys, key, lo=lo, key=self._key)
+        else:
+            hi = bisect.bisect_right(keys, key, lo=lo, key=lambda i: self._key(i)[:len(key)])
+        return lo, hi
+
+    def _ranked(self, lo: int, hi: int) -> Iterator[int]:
+        """Distinct places of keys ``lo:hi``, own names first, then by rank."""
+        places, kinds = self._key_places[lo:hi], self._key_kinds[lo:hi]
+        named = np.unique(places[kinds == NAME])
+        for index in named:
+            yield int(index)
+        for index in np.setdiff1d(places[kinds == ALIAS], named):
+            yield int(index)
+
+    def _fuzzy(self, name: str) -> Iterator[int]:
+        """Places of keys close to ``name``, closest and then best ranked first."""
+        lo, hi = self._key_range(name[:_FUZZY_PREFIX].encode(), exact=False)
+        hi = min(hi, lo + _FUZZY_MAX_KEYS)
+        candidates: Dict[str, List[int]] = {}
+        for index in range(lo, hi):
+            candidates.setdefault(self._key(index).decode("utf-8"), []).append(int(self._key_places[index]))
+        for close in difflib.get_close_matches(name, candidates, n=50, cutoff=_FUZZY_CUTOFF):
+            yield from sorted(candidates[close])
+
+    def _qualifies(self, index: int, qualifiers: Sequence[str], partial: bool) -> bool:
+        if not qualifiers:
+            return True
+        country = self._columns["country"][index].decode("ascii")
+        names = [
+            country.casefold(),
+            normalize_name(country_name(country)),
+            normalize_name(self._string(self._columns["admin1"][index])),
+            self._string(self._columns["admin1_code"][index]).casefold(),
+        ]
+        for position, qualifier in enumerate(qualifiers):
+            if COUNTRY_ALIASES.get(qualifier) == country:
+                continue
+            if partial and position == len(qualifiers) - 1:
+                if not any(candidate.startswith(qualifier) for candidate in names if candidate):
+                    return False
+            elif qualifier not in names:
+                return False
+        return True
+
+
+def _view(buffer, dtype: str, count: int, offset: int) -> Tuple[np.ndarray, int]:
+    array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return array, _aligned(offset + array.nbytes)
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def write_gazetteer(entries: Iterable[Tuple[Place, Iterable[str], Iterable[str]]], path: Path) -> int:
+    """Write a gazetteer file; returns the place count.
+
+    ``entries`` are ``(place, names, aliases)``: ``names`` are the place's
+    own names besides ``place.name`` (its ASCII name), ``aliases`` its
+    alternate names.
+    """
+    ranked = sorted(entries, key=lambda entry: (-entry[0].population, entry[0].geonameid))
+    strings: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        return strings.setdefault(text, len(strings))
+
+    columns = {name: [] for name, _dtype in _COLUMNS}
+    kinds: Dict[Tuple[bytes, int], int] = {}
+    for index, (place, names, aliases) in enumerate(ranked):
+        columns["latitude"].append(place.latitude)
+        columns["longitude"].append(place.longitude)
+        columns["population"].append(place.population)
+        columns["geonameid"].append(place.geonameid)
+        columns["name"].append(intern(place.name))
+        columns["label"].append(intern(place.label))
+        columns["admin1"].append(intern(place.admin1))
+        columns["admin1_code"].append(intern(place.admin1_code))
+        columns["timezone"].append(intern(place.timezone))
+        columns["country"].append(place.country_code.encode("ascii"))
+        named = [(name, NAME) for name in (place.name, *names)]
+        for text, kind in named + [(alias, ALIAS) for alias in aliases]:
+            key = normalize_name(text)
+            if key:
+                entry = (key.encode("utf-8"), index)
+                kinds[entry] = min(kind, kinds.get(entry, kind))
+    keys = sorted((key, kind, index) for (key, index), kind in kinds.items())
+
+    string_blob = [text.encode("utf-8") for text in strings]
+    key_blob = [key for key, _kind, _index in keys]
+    sections = [np.asarray(columns[name], dtype=dtype) for name, dtype in _COLUMNS]
+    sections.append(np.cumsum([0] + [len(s) for s in string_blob], dtype="<u4"))
+    sections.append(np.cumsum([0] + [len(k) for k in key_blob], dtype="<u4"))
+    sections.append(np.asarray([index for _key, _kind, index in keys], dtype="<u4"))
+    sections.append(np.asarray([kind for _key, kind, _index in keys], dtype="<u1"))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(ranked), len(keys), len(strings)))
+        for section in sections:
+            f.write(section.tobytes())
+            f.write(b"\0" * (_aligned(f.tell()) - f.tell()))
+        f.write(b"".join(string_blob))
+        f.write(b"".join(key_blob))
+    return len(ranked)
+
+
+def _open_text(path: Path) -> io.TextIOBase:
+    """Open a GeoNames text file, or the single text file inside a zip."""
+    if Path(path).suffix == ".zip":
+        archive = zipfile.ZipFile(path)
+        member = next(name for name in archive.namelist() if name.endswith(".txt"))
+        return io.TextIOWrapper(archive.open(member), encoding="utf-8")
+    return open(path, encoding="utf-8", newline="")
+
+
+def read_admin1(path: Path) -> Dict[str, str]:
+    """``"GB.ENG" -> "England"`` from GeoNames ``admin1CodesASCII.txt``."""
+    with _open_text(path) as f:
+        return {row[0]: row[1] for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE) if len(row) > 1}
+
+
+def read_geonames(source: Path, admin1: Optional[Dict[str, str]] = None,
+                  min_population: int = 0) -> Iterator[Tuple[Place, List[str], List[str]]]:
+    """``(place, names, aliases)`` for every populated place in a GeoNames cities dump."""
+    admin1 = admin1 or {}
+    with _open_text(source) as f:
+        for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+            if len(row) < 18 or row[6] != "P":
+                continue
+            population = int(row[14] or 0)
+            if population < min_population:
+                continue
+            country = row[8]
+            code = f"{country}.{row[10]}"
+            region = admin1.get(code, "")
+            parts = (row[1], region if region != row[1] else "", country_name(country))
+            label = ", ".join(part for part in parts if part)
+            place = Place(
+                geonameid=int(row[0]),
+                name=row[1],
+                label=label,
+                latitude=float(row[4]),
+                longitude=float(row[5]),
+                country_code=country,
+                admin1=region,
+                population=population,
+                timezone=row[17],
+                admin1_code=row[10] if country == "US" else ADMIN1_ABBREVIATIONS.get(code, ""),
+            )
+            aliases = [alias for alias in row[3].split(",") if alias]
+            yield place, [row[2]], aliases
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+_gazetteer_lock = threading.Lock()
+
+
+def _configured_path() -> Optional[Path]:
+    settings = getattr(cfg(), "gazetteer", None)
+    if settings is not None and not getattr(settings, "enabled", True):
+        return None
+    custom_path = getattr(settings, "path", None) if settings is not None else None
+    return Path(custom_path) if custom_path else DEFAULT_GAZETTEER_PATH
+
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """Return the process-wide gazetteer, mapping it on first use.
+
+    Returns ``None`` when the gazetteer is disabled or its file is missing,
+    in which case locations are resolved by the geocoding service.
+    """
+    global _gazetteer, _gazetteer_loaded
+    if _gazetteer_loaded:
+        return _gazetteer
+    with _gazetteer_lock:
+        if not _gazetteer_loaded:
+            path = _configured_path()
+            if path is not None and path.exists():
+                try:
+                    _gazetteer = Gazetteer.load(path)
+                    logger.info(f"Loaded gazetteer of {_gazetteer.place_count} places from {path}")
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Gazetteer unavailable ({e}); using the geocoding service only")
+                    _gazetteer = None
+            _gazetteer_loaded = True
+    return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Forget the loaded gazetteer so the next lookup reloads it (for testing)."""
+    global _gazetteer, _gazetteer_loaded
+    with _gazetteer_lock:
+        _gazetteer = None
+        _gazetteer_loaded = False
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Build the offline gazetteer from a GeoNames cities dump")
+    parser.add_argument("--source", type=Path, required=True, help="citiesNNNN.txt or .zip")
+    parser.add_argument("--admin1", type=Path, help="admin1CodesASCII.txt, for region names")
+    parser.add_argument("--min-population", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=_configured_path() or DEFAULT_GAZETTEER_PATH)
+    args = parser.parse_args(argv)
+
+    admin1 = read_admin1(args.admin1) if args.admin1 else None
+    count = write_gazetteer(read_geonames(args.source, admin1, args.min_population), args.output)
+    print(f"Wrote {count} places ({args.output.stat().st_size / 2**20:.1f} MiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
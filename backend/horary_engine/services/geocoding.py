@@ -0,0 +1,325 @@
+"""Persistent, coalescing cache in front of the geocoding service.
+
+Every judgment and the timezone endpoints geocode a free-text location,
+and a Nominatim round trip is the slowest step of a typical request.
+``GeocodeCache`` answers repeated lookups locally:
+
+* an in-memory LRU of recent queries;
+* an SQLite store of normalized query -> (latitude, longitude, address),
+  shared by all workers on the host and kept across restarts;
+* negative entries for queries the service could not resolve, kept for a
+  shorter time so new places become findable;
+* single-flight coalescing: concurrent lookups of the same query wait for
+  one upstream call instead of each making their own.
+
+Queries are normalized by case-folding and collapsing whitespace. Service
+errors (timeouts, unavailability) are never cached. The store is located
+by, in order:
+
+1. the ``HORARY_GEOCODE_CACHE`` environment variable,
+2. ``geocoding.cache_path`` in ``horary_constants.yaml``,
+3. ``$XDG_CACHE_HOME/horary/geocode.sqlite3`` (``~/.cache`` by default).
+
+If the store cannot be opened the cache keeps working from memory alone.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from geopy.geocoders import Nominatim
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH_ENV = "HORARY_GEOCODE_CACHE"
+
+Location = Tuple[float, float, str]
+# (query, timeout) -> location, or None when the service finds nothing
+Lookup = Callable[[str, float], Optional[Location]]
+
+# Memory-tier marker for a cached "not found"
+_NOT_FOUND = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    query TEXT PRIMARY KEY,
+    latitude REAL,
+    longitude REAL,
+    address TEXT,
+    expires REAL NOT NULL
+)
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Cache key of a location query: case-folded, whitespace collapsed."""
+    return " ".join(query.split()).casefold()
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "horary" / "geocode.sqlite3"
+
+
+_geolocator: Optional[Nominatim] = None
+
+
+def nominatim_lookup(query: str, timeout: float) -> Optional[Location]:
+    """Query Nominatim once; None when the location is not found."""
+    global _geolocator
+    if _geolocator is None:
+        user_agent = getattr(getattr(cfg(), "geocoding", None), "user_agent", "horary_astrology_precise")
+        _geolocator = Nominatim(user_agent=user_agent)
+    location = _geolocator.geocode(query, timeout=timeout)
+    if location is None:
+        return None
+    return (location.latitude, location.longitude, location.address)
+
+
+class _Flight:
+    """An upstream lookup that concurrent callers of the same query wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class GeocodeCache:
+    """Memory LRU and SQLite store in front of a geocoding ``lookup``."""
+
+    def __init__(self, lookup: Lookup, path: Optional[Path] = None,
+                 memory_entries: int = 4096, ttl_seconds: float = 90 * 86400.0,
+                 negative_ttl_seconds: float = 86400.0):
+        self.lookup = lookup
+        self.memory_entries = memory_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        # normalized query -> (location or _NOT_FOUND, expires)
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        # sqlite3 connections may only be used by the thread that opened them
+        self._local = threading.local()
+        self.path = self._open_store(path) if path is not None else None
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.negative_hits = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def geocode(self, query: str, timeout: float = 10) -> Optional[Location]:
+        """``(latitude, longitude, address)`` for ``query``, or None if not found.
+
+        Exceptions raised by ``lookup`` propagate to every caller waiting on
+        the same query and are not cached.
+        """
+        key = normalize_query(query)
+        with self._lock:
+            value = self._memory_get(key)
+            if value is not None:
+                self.memory_hits += 1
+                flight = None
+            else:
+                flight = self._inflight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._inflight[key] = _Flight()
+                else:
+                    self.coalesced += 1
+
+        if flight is None:
+            return self._hit(value)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._hit(flight.value)
+
+        try:
+            flight.value = self._resolve(key, query, timeout)
+            return self._hit(flight.value)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def clear(self) -> None:
+        """Empty the memory tier and the persistent store."""
+        with self._lock:
+            self._memory.clear()
+        connection = self._connection()
+        if connection is not None:
+            with connection:
+                connection.execute("DELETE FROM geocode")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.store_hits + self.upstream_calls + self.coalesced
+            local = self.memory_hits + self.store_hits + self.coalesced
+            return {
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.memory_entries,
+                "store": str(self.path) if self.path is not None else None,
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "negative_hits": self.negative_hits,
+                "upstream_calls": self.upstream_calls,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "hit_rate": local / lookups if lookups else 0.0,
+            }
+
+    def _resolve(self, key: str, query: str, timeout: float) -> Any:
+        """Store lookup, then the upstream service; runs once per flight."""
+        now = time.time()
+        stored = self._store_get(key, now)
+        if stored is not None:
+            with self._lock:
+                self.store_hits += 1
+                self._memory_put(key, *stored)
+            return stored[0]
+
+        with self._lock:
+            self.upstream_calls += 1
+        try:
+            location = self.lookup(query, timeout)
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        if location is None:
+            value, expires = _NOT_FOUND, now + self.negative_ttl_seconds
+        else:
+            value, expires = tuple(location), now + self.ttl_seconds
+        with self._lock:
+            self._memory_put(key, value, expires)
+        self._store_put(key, value, expires)
+        return value
+
+    def _hit(self, value: Any) -> Optional[Location]:
+        if value is _NOT_FOUND:
+            with self._lock:
+                self.negative_hits += 1
+            return None
+        return value
+
+    def _memory_get(self, key: str) -> Any:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry[0]
+
+    def _memory_put(self, key: str, value: Any, expires: float) -> None:
+        self._memory[key] = (value, expires)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _open_store(self, path: Path) -> Optional[Path]:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(path), timeout=5.0)
+            # WAL lets workers read while another one writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Geocode store {path} unavailable ({e}); caching in memory only")
+            return None
+        self._local.connection = connection
+        logger.info(f"Geocode store: {path}")
+        return path
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.path is None:
+            return None
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(str(self.path), timeout=5.0)
+        return connection
+
+    def _store_get(self, key: str, now: float) -> Optional[Tuple[Any, float]]:
+        connection = self._connection()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute(
+                "SELECT latitude, longitude, address, expires FROM geocode WHERE query = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Geocode store read failed: {e}")
+            return None
+        if row is None or row[3] <= now:
+            return None
+        return (_NOT_FOUND if row[2] is None else (row[0], row[1], row[2])), row[3]
+
+    def _store_put(self, key: str, value: Any, expires: float) -> None:
+        connection = self._connection()
+        if connection is None:
+            return
+        lat, lon, address = (None, None, None) if value is _NOT_FOUND else value
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?)",
+                    (key, lat, lon, address, expires),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Geocode store write failed: {e}")
+
+
+def configured_cache_path() -> Optional[Path]:
+    """Location of the persistent store, or None when persistence is off."""
+    settings = getattr(cfg(), "geocoding", None)
+    if not getattr(settings, "persistent", True):
+        return None
+    custom = os.environ.get(CACHE_PATH_ENV) or getattr(settings, "cache_path", None)
+    return Path(custom) if custom else default_cache_path()
+
+
+_cache: Optional[GeocodeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """Return the process-wide Nominatim cache configured from ``geocoding``."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                settings = getattr(cfg(), "geocoding", None)
+                _cache = GeocodeCache(
+                    nominatim_lookup,
+                    path=configured_cache_path(),
+                    memory_entries=getattr(settings, "memory_entries", 4096),
+                    ttl_seconds=getattr(settings, "ttl_days", 90) * 86400.0,
+                    negative_ttl_seconds=getattr(settings, "negative_ttl_hours", 24) * 3600.0,
+                )
+    return _cache
+
+
+def reset_geocode_cache() -> None:
+    """Discard the shared cache so the next call re-reads configuration."""
+    global _cache
+    with _cache_lock:
+        _cache = None
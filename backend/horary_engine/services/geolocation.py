@@ -1,5 +1,8 @@
 import logging
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import datetime
 import pytz
@@ -18,6 +21,11 @@ except ImportError:  # pragma: no cover
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 
+from horary_config import cfg
+from .gazetteer import get_gazetteer
+from .geocoding import get_geocode_cache
+from .timezone_raster import TimezoneRaster, get_timezone_raster
+
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +35,17 @@ class LocationError(Exception):
     pass
 
 
-def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float, str]:
+def safe_geocode(location_string: str, timeout: Optional[float] = None) -> Tuple[float, float, str]:
     """Geocode a location string with fail-fast behaviour.
 
+    Places in the offline gazetteer (:mod:`horary_engine.services.gazetteer`)
+    are resolved without the network. Other results, including "not found",
+    are cached in memory and on disk, and concurrent lookups of the same
+    location share one request (see :mod:`horary_engine.services.geocoding`).
+
     Args:
         location_string: Location to geocode.
-        timeout: Timeout in seconds.
+        timeout: Timeout in seconds (default ``geocoding.timeout_seconds``).
 
     Returns:
         Tuple of (latitude, longitude, full_address).
@@ -40,26 +53,62 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
     Raises:
         LocationError: If geocoding fails or the library is unavailable.
     """
+    gazetteer = get_gazetteer()
+    if gazetteer is not None:
+        place = gazetteer.resolve(location_string)
+        if place is not None:
+            return (place.latitude, place.longitude, place.label)
+
+    if timeout is None:
+        timeout = getattr(getattr(cfg(), "geocoding", None), "timeout_seconds", 10)
     try:
-        geolocator = Nominatim(user_agent="horary_astrology_precise")
-        location = geolocator.geocode(location_string, timeout=timeout)
-        if location is None:
-            raise LocationError(
-                f"Location not found: '{location_string}'. Please provide a more specific location."
-            )
-        return (location.latitude, location.longitude, location.address)
+        location = get_geocode_cache().geocode(location_string, timeout)
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
         raise LocationError(f"Geocoding service unavailable: {e}")
     except ImportError:
         raise LocationError("Geocoding library not available. Please install geopy.")
     except Exception as e:  # pragma: no cover - unexpected errors
         raise LocationError(f"Geocoding failed for '{location_string}': {e}")
+    if location is None:
+        raise LocationError(
+            f"Location not found: '{location_string}'. Please provide a more specific location."
+        )
+    return location
+
+
+@lru_cache(maxsize=None)
+def get_zone(timezone_str: str):
+    """Timezone object for an IANA name, created once per name.
+
+    Unknown names raise ``ZoneInfoNotFoundError`` (or
+    ``pytz.UnknownTimeZoneError`` without zoneinfo) and are not cached.
+    """
+    if ZoneInfo:
+        return ZoneInfo(timezone_str)
+    return pytz.timezone(timezone_str)
 
 
 class TimezoneManager:
-    """Handles timezone operations for horary calculations."""
+    """Handles timezone operations for horary calculations.
+
+    Construction loads the TimezoneFinder polygon data, so the engine and the
+    endpoints share one instance from :func:`get_timezone_manager`. Lookups
+    are answered, in order, from a cache keyed by latitude/longitude rounded
+    to ``location_precision`` degrees, from the precomputed
+    :class:`TimezoneRaster` away from borders, and from the polygons.
+    """
+
+    def __init__(self, location_precision: float = 0.001, cache_size: int = 65536,
+                 raster: Optional[TimezoneRaster] = None) -> None:
+        self.location_precision = location_precision
+        self.cache_size = cache_size
+        self.raster = raster
+        self._cache: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.raster_hits = 0
+        self.polygon_lookups = 0
 
-    def __init__(self) -> None:
         if TIMEZONEFINDER_AVAILABLE:
             try:
                 self.tf = TimezoneFinder()
@@ -81,7 +130,50 @@ class TimezoneManager:
             self.geolocator = None
 
     def get_timezone_for_location(self, lat: float, lon: float) -> Optional[str]:
-        """Get timezone string for given coordinates with enhanced debugging."""
+        """Get timezone string for given coordinates."""
+        key = (round(lat / self.location_precision), round(lon / self.location_precision))
+        with self._cache_lock:
+            timezone_str = self._cache.get(key)
+            if timezone_str is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return timezone_str
+
+        timezone_str = None
+        if self.raster is not None:
+            timezone_str = self.raster.timezone_at(lat, lon)
+        if timezone_str is not None:
+            timezone_str = self._validate_timezone_for_coordinates(timezone_str, lat, lon)
+            with self._cache_lock:
+                self.raster_hits += 1
+        else:
+            timezone_str = self._detect_timezone(lat, lon)
+            with self._cache_lock:
+                self.polygon_lookups += 1
+
+        # Failed lookups are retried next time
+        if timezone_str is not None:
+            with self._cache_lock:
+                self._cache[key] = timezone_str
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return timezone_str
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            lookups = self.cache_hits + self.raster_hits + self.polygon_lookups
+            return {
+                "cache_entries": len(self._cache),
+                "cache_size": self.cache_size,
+                "cache_hits": self.cache_hits,
+                "raster_hits": self.raster_hits,
+                "polygon_lookups": self.polygon_lookups,
+                "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+                "raster": self.raster.stats() if self.raster is not None else None,
+            }
+
+    def _detect_timezone(self, lat: float, lon: float) -> Optional[str]:
+        """Timezone from the TimezoneFinder polygons, with enhanced debugging."""
         logger.info(f"=== TIMEZONE DETECTION STARTED for {lat}, {lon} ===")
 
         try:
@@ -203,9 +295,7 @@ class TimezoneManager:
             logger.error(f"Fallback timezone detection failed: {e}")
 
         try:
-            from timezonefinder import TimezoneFinderL
-
-            tf = TimezoneFinder()
+            tf = self.tf if self.tf is not None else TimezoneFinder()
             return tf.timezone_at(lat=lat, lng=lon)
         except Exception:
             return None
@@ -251,10 +341,7 @@ class TimezoneManager:
 
         if timezone_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(timezone_str)
-                else:
-                    tz = pytz.timezone(timezone_str)
+                tz = get_zone(timezone_str)
                 timezone_used = timezone_str
             except Exception:
                 tz = pytz.UTC
@@ -263,10 +350,7 @@ class TimezoneManager:
             tz_str = self.get_timezone_for_location(lat, lon)
             if tz_str:
                 try:
-                    if ZoneInfo:
-                        tz = ZoneInfo(tz_str)
-                    else:
-                        tz = pytz.timezone(tz_str)
+                    tz = get_zone(tz_str)
                     timezone_used = tz_str
                 except Exception:
                     tz = pytz.UTC
@@ -309,10 +393,7 @@ class TimezoneManager:
 
         if tz_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(tz_str)
-                else:
-                    tz = pytz.timezone(tz_str)
+                tz = get_zone(tz_str)
                 timezone_used = tz_str
             except Exception:
                 tz = pytz.UTC
@@ -325,3 +406,29 @@ class TimezoneManager:
         local_now = utc_now.astimezone(tz)
 
         return local_now, utc_now, timezone_used
+
+
+_manager: Optional[TimezoneManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_timezone_manager() -> TimezoneManager:
+    """Return the process-wide timezone manager configured from ``timezones``."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                settings = getattr(cfg(), "timezones", None)
+                _manager = TimezoneManager(
+                    location_precision=getattr(settings, "location_precision_deg", 0.001),
+                    cache_size=getattr(settings, "cache_size", 65536),
+                    raster=get_timezone_raster(),
+                )
+    return _manager
+
+
+def reset_timezone_manager() -> None:
+    """Discard the shared manager so the next call re-reads configuration."""
+    global _manager
+    with _manager_lock:
+        _manager = None
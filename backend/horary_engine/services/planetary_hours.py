@@ -0,0 +1,305 @@
+"""Planetary-hour tables per local date and location.
+
+A planetary day runs from sunrise to the next sunrise and is split into
+twelve unequal day hours and twelve unequal night hours, ruled in Chaldean
+order starting with the ruler of the weekday. Finding sunrise and sunset
+with ``swe.rise_trans`` is among the most expensive ephemeris operations, so
+``PlanetaryHoursService`` builds each table once per (local date, rounded
+latitude/longitude, timezone) and keeps recent tables in an LRU cache.
+
+Classical source: Lilly, Christian Astrology I - table of the planetary hours
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytz
+import swisseph as swe
+
+from horary_config import cfg
+try:
+    from ...models import Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet
+
+logger = logging.getLogger(__name__)
+
+# Chaldean order, slowest to fastest
+PLANET_SEQUENCE = [
+    Planet.SATURN,
+    Planet.JUPITER,
+    Planet.MARS,
+    Planet.SUN,
+    Planet.VENUS,
+    Planet.MERCURY,
+    Planet.MOON,
+]
+
+PLANETARY_DAY_RULERS = {
+    0: Planet.MOON,  # Monday
+    1: Planet.MARS,  # Tuesday
+    2: Planet.MERCURY,  # Wednesday
+    3: Planet.JUPITER,  # Thursday
+    4: Planet.VENUS,  # Friday
+    5: Planet.SATURN,  # Saturday
+    6: Planet.SUN,  # Sunday
+}
+
+
+class PlanetaryHoursError(ValueError):
+    """Raised when the Sun does not rise or set on the requested date."""
+
+
+@dataclass
+class PlanetaryHour:
+    """One of the 24 unequal hours of a planetary day."""
+
+    number: int  # 1-12 by day, 13-24 by night
+    ruler: Planet
+    start_jd: float
+    end_jd: float
+
+    @property
+    def is_day(self) -> bool:
+        return self.number <= 12
+
+
+@dataclass
+class PlanetaryHourTable:
+    """The planetary day that begins at sunrise on ``date`` (local)."""
+
+    date: datetime.date
+    latitude: float
+    longitude: float
+    timezone: str
+    day_ruler: Planet
+    sunrise_jd: float
+    sunset_jd: float
+    next_sunrise_jd: float
+    hours: List[PlanetaryHour] = field(default_factory=list)
+
+    def covers(self, jd: float) -> bool:
+        return self.sunrise_jd <= jd < self.next_sunrise_jd
+
+    def hour_at(self, jd: float) -> PlanetaryHour:
+        """The planetary hour in effect at ``jd`` (must be within the table)."""
+        if not self.covers(jd):
+            raise ValueError(f"JD {jd} is outside the planetary day of {self.date}")
+        starts = [hour.start_jd for hour in self.hours]
+        return self.hours[bisect.bisect_right(starts, jd) - 1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        tz = pytz.timezone(self.timezone)
+
+        def local(jd: float) -> str:
+            return _jd_to_utc(jd).astimezone(tz).isoformat()
+
+        return {
+            "date": self.date.isoformat(),
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "timezone": self.timezone,
+            "day_ruler": self.day_ruler.value,
+            "sunrise": local(self.sunrise_jd),
+            "sunset": local(self.sunset_jd),
+            "next_sunrise": local(self.next_sunrise_jd),
+            "hours": [
+                {
+                    "number": hour.number,
+                    "ruler": hour.ruler.value,
+                    "is_day": hour.is_day,
+                    "start": local(hour.start_jd),
+                    "end": local(hour.end_jd),
+                }
+                for hour in self.hours
+            ],
+        }
+
+
+def _jd_to_utc(jd: float) -> datetime.datetime:
+    year, month, day, hours = swe.revjul(jd, swe.GREG_CAL)
+    return datetime.datetime(year, month, day, tzinfo=datetime.timezone.utc) + datetime.timedelta(hours=hours)
+
+
+def _utc_to_jd(dt: datetime.datetime) -> float:
+    dt = dt.astimezone(datetime.timezone.utc)
+    return swe.julday(dt.year, dt.month, dt.day,
+                      dt.hour + dt.minute / 60 + dt.second / 3600 + dt.microsecond / 3.6e9,
+                      swe.GREG_CAL)
+
+
+def _aware(moment: datetime.datetime) -> datetime.datetime:
+    return moment if moment.tzinfo else moment.replace(tzinfo=datetime.timezone.utc)
+
+
+def _zone_name(tzinfo) -> str:
+    """IANA name of a zoneinfo or pytz timezone, ``UTC`` when unknown."""
+    return getattr(tzinfo, "key", None) or getattr(tzinfo, "zone", None) or "UTC"
+
+
+def _next_event(jd: float, event: int, lat: float, lon: float, date: datetime.date) -> float:
+    res, tret = swe.rise_trans(jd, swe.SUN, event, (lon, lat, 0))
+    if res != 0:
+        kind = "rise" if event == swe.CALC_RISE else "set"
+        raise PlanetaryHoursError(f"The Sun does not {kind} at latitude {lat:.2f} on {date}")
+    return tret[0]
+
+
+def build_planetary_hour_table(date: datetime.date, lat: float, lon: float,
+                               timezone: str) -> PlanetaryHourTable:
+    """Compute the table for the planetary day starting at sunrise on ``date``."""
+    tz = pytz.timezone(timezone)
+    local_midnight = tz.localize(datetime.datetime.combine(date, datetime.time()))
+    jd_midnight = _utc_to_jd(local_midnight)
+
+    sunrise = _next_event(jd_midnight, swe.CALC_RISE, lat, lon, date)
+    sunset = _next_event(sunrise, swe.CALC_SET, lat, lon, date)
+    next_sunrise = _next_event(sunset, swe.CALC_RISE, lat, lon, date)
+
+    day_ruler = PLANETARY_DAY_RULERS[date.weekday()]
+    start_idx = PLANET_SEQUENCE.index(day_ruler)
+    day_hour = (sunset - sunrise) / 12.0
+    night_hour = (next_sunrise - sunset) / 12.0
+
+    hours = []
+    for i in range(24):
+        if i < 12:
+            start, length = sunrise + i * day_hour, day_hour
+        else:
+            start, length = sunset + (i - 12) * night_hour, night_hour
+        end = sunset if i == 11 else next_sunrise if i == 23 else start + length
+        hours.append(PlanetaryHour(i + 1, PLANET_SEQUENCE[(start_idx + i) % 7], start, end))
+
+    return PlanetaryHourTable(
+        date=date,
+        latitude=lat,
+        longitude=lon,
+        timezone=timezone,
+        day_ruler=day_ruler,
+        sunrise_jd=sunrise,
+        sunset_jd=sunset,
+        next_sunrise_jd=next_sunrise,
+        hours=hours,
+    )
+
+
+_TableKey = Tuple[datetime.date, float, float, str]
+
+
+class PlanetaryHoursService:
+    """LRU cache of planetary-hour tables keyed by local date and rounded location."""
+
+    def __init__(self, max_tables: int = 1024, location_precision: float = 0.01):
+        self.max_tables = max_tables
+        self.location_precision = location_precision
+        self._tables: "OrderedDict[_TableKey, PlanetaryHourTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, date: datetime.date, lat: float, lon: float, timezone: str) -> PlanetaryHourTable:
+        """Table for the planetary day starting on local ``date``."""
+        key = (date, self._quantize(lat), self._quantize(lon), timezone)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return table
+
+        table = build_planetary_hour_table(date, key[1], key[2], timezone)
+        with self._lock:
+            self.misses += 1
+            self._tables[key] = table
+            if len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+        return table
+
+    def table_at(self, moment: datetime.datetime, lat: float, lon: float,
+                 timezone: Optional[str] = None) -> PlanetaryHourTable:
+        """Table for the planetary day containing ``moment``.
+
+        Before sunrise the moment still belongs to the previous local date.
+        Naive datetimes are taken to be UTC; when ``timezone`` is missing or
+        unknown the moment's own zone is used.
+        """
+        moment = _aware(moment)
+        if timezone not in pytz.all_timezones_set:
+            timezone = _zone_name(moment.tzinfo)
+        local_date = moment.astimezone(pytz.timezone(timezone)).date()
+
+        table = self.table(local_date, lat, lon, timezone)
+        if _utc_to_jd(moment) < table.sunrise_jd:
+            table = self.table(local_date - datetime.timedelta(days=1), lat, lon, timezone)
+        return table
+
+    def hour_at(self, moment: datetime.datetime, lat: float, lon: float,
+                timezone: Optional[str] = None) -> PlanetaryHour:
+        """The planetary hour in effect at ``moment``."""
+        table = self.table_at(moment, lat, lon, timezone)
+        return table.hour_at(_utc_to_jd(_aware(moment)))
+
+    def precompute(self, lat: float, lon: float, timezone: str,
+                   start: datetime.date, days: int) -> int:
+        """Fill the cache for ``days`` consecutive dates; returns tables built."""
+        built = 0
+        for offset in range(days):
+            before = self.misses
+            try:
+                self.table(start + datetime.timedelta(days=offset), lat, lon, timezone)
+            except PlanetaryHoursError as e:
+                logger.debug(f"Skipping planetary hours precompute: {e}")
+            built += self.misses - before
+        return built
+
+    def precompute_configured(self, start: Optional[datetime.date] = None) -> int:
+        """Precompute ``planetary_hours.precompute`` locations from ``start`` (default today)."""
+        settings = getattr(cfg(), "planetary_hours", None)
+        locations = getattr(settings, "precompute", None) or []
+        days = getattr(settings, "precompute_days", 7)
+        start = start or datetime.date.today()
+        built = 0
+        for location in locations:
+            built += self.precompute(location.latitude, location.longitude, location.timezone, start, days)
+        if built:
+            logger.info(f"Precomputed {built} planetary hour tables for {len(locations)} locations")
+        return built
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"tables": len(self._tables), "hits": self.hits, "misses": self.misses}
+
+    def _quantize(self, value: float) -> float:
+        return round(round(value / self.location_precision) * self.location_precision, 6)
+
+
+_service: Optional[PlanetaryHoursService] = None
+_service_lock = threading.Lock()
+
+
+def get_planetary_hours_service() -> PlanetaryHoursService:
+    """Return the process-wide service configured from ``planetary_hours``."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                settings = getattr(cfg(), "planetary_hours", None)
+                _service = PlanetaryHoursService(
+                    max_tables=getattr(settings, "cache_size", 1024),
+                    location_precision=getattr(settings, "location_precision_deg", 0.01),
+                )
+    return _service
+
+
+def reset_planetary_hours_service() -> None:
+    """Discard the shared service so the next call re-reads configuration."""
+    global _service
+    with _service_lock:
+        _service = None
@@ -0,0 +1,363 @@
+"""Two-tier cache of charts and judgments for repeated requests.
+
+Retries, page reloads and shared links resubmit identical manual-time
+requests. ``ResultCache`` keeps two LRU tiers with a time-to-live and a
+memory bound:
+
+* charts, keyed by (quantized Julian Day, quantized latitude/longitude,
+  house system, timezone, location name, precision profile);
+* judgments, keyed by the chart key, the normalized question and every
+  option that changes the result (manual houses, override flags, reception
+  boost, requested fields).
+
+A judgment hit skips the chart and the judgment; a chart hit (same chart,
+different question or options) skips only the chart. Concurrent requests for
+a chart that is not cached yet wait for the first one to build it instead of
+building it again (batch items often share a chart). Both tiers are emptied
+when the configuration snapshot or the loaded rule pack changes, since
+every cached result depends on them. Requests using the current time are
+never cached.
+
+Per-request outcomes come from :meth:`ResultCache.track`::
+
+    with get_result_cache().track() as status:
+        engine.judge(question, settings)
+    status  # {'chart': 'hit', 'judgment': 'miss'}
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from horary_config import ConfigSection, cfg
+try:
+    from ... import rule_engine
+except ImportError:  # pragma: no cover - fallback when executed as script
+    import rule_engine
+
+HIT, MISS, BYPASS = "hit", "miss", "bypass"
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximate bytes held by ``obj`` and everything it references.
+
+    Enum members, classes, functions and configuration sections are shared
+    and not counted.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, (enum.Enum, type, ConfigSection)) or callable(item):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, np.ndarray):
+            # getsizeof counts the buffer only for arrays that own it
+            if item.base is not None:
+                stack.append(item.base)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, bool, datetime.datetime)):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for cls in type(item).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    value = getattr(item, name, None)
+                    if value is not None:
+                        stack.append(value)
+    return total
+
+
+class _Tier:
+    """LRU entries with an expiry time and an entry and byte budget."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, size, expires)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[2] <= now:
+            self._drop(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek(self, key: Hashable) -> Any:
+        """Value for ``key`` without updating recency or statistics."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: Hashable, value: Any, size: int, now: float) -> None:
+        if key in self._entries:
+            self._drop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size, now + self.ttl_seconds)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _drop(self, key: Hashable) -> None:
+        _value, size, _expires = self._entries.pop(key)
+        self.bytes -= size
+
+
+class ResultCache:
+    """Chart and judgment tiers shared by all requests of the process."""
+
+    def __init__(self, enabled: bool = True, ttl_seconds: float = 3600.0,
+                 max_charts: int = 512, max_chart_bytes: int = 32 * 2**20,
+                 max_judgments: int = 2048, max_judgment_bytes: int = 32 * 2**20,
+                 location_precision: float = 1.0e-4, quantum_days: float = 1.0e-8):
+        self.enabled = enabled
+        self.location_precision = location_precision
+        self.quantum_days = quantum_days
+        self._charts = _Tier(max_charts, max_chart_bytes, ttl_seconds)
+        self._judgments = _Tier(max_judgments, max_judgment_bytes, ttl_seconds)
+        self._lock = threading.Lock()
+        self._version: Optional[Tuple[Any, Any]] = None
+        self.invalidations = 0
+        # Chart keys being built -> event set once the chart is shared
+        self._building: Dict[Hashable, threading.Event] = {}
+        self.coalesced = 0
+        # Status dicts of the track() blocks active on each thread
+        self._local = threading.local()
+
+    def chart_key(self, jd: float, lat: float, lon: float, house_system: bytes,
+                  timezone: str, location_name: str, precision: str) -> Hashable:
+        """Key of the chart cast for these inputs."""
+        return (
+            round(jd / self.quantum_days),
+            self._quantize(lat),
+            self._quantize(lon),
+            house_system,
+            timezone,
+            location_name,
+            precision,
+        )
+
+    @staticmethod
+    def judgment_key(chart_key: Hashable, question: str, **options: Any) -> Hashable:
+        """Key of a judgment: chart, normalized question and result-changing options."""
+        frozen = []
+        for name, value in sorted(options.items()):
+            if isinstance(value, (set, frozenset)):
+                value = tuple(sorted(value))
+            elif isinstance(value, list):
+                value = tuple(value)
+            frozen.append((name, value))
+        return (chart_key, normalize_question(question), tuple(frozen))
+
+    def get_chart(self, key: Hashable) -> Any:
+        """Cached chart, or None if the caller should build it.
+
+        A caller that gets None for a key no one else is building must call
+        :meth:`share_chart` afterwards, even if building fails. Callers asking
+        for a key already being built wait for it.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._check_version()
+            chart = self._charts.get(key, time.monotonic())
+            building = None
+            if chart is None:
+                building = self._building.get(key)
+                if building is None:
+                    self._building[key] = threading.Event()
+        if building is not None:
+            building.wait()
+            with self._lock:
+                chart = self._charts.peek(key)
+                if chart is not None:
+                    self.coalesced += 1
+        for status in self._active():
+            status["chart"] = HIT if chart is not None else MISS
+        return chart
+
+    def share_chart(self, key: Hashable, chart: Any) -> None:
+        """Store the chart built after a :meth:`get_chart` miss and release waiters.
+
+        ``chart`` is None when building failed; the waiting requests then
+        build their own.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if chart is not None:
+                self._charts.put(key, chart, approximate_size(chart), time.monotonic())
+            building = self._building.pop(key, None)
+        if building is not None:
+            building.set()
+
+    def put_chart(self, key: Hashable, chart: Any) -> None:
+        """Store (or re-measure, once judging has filled its caches) a chart."""
+        self._put(self._charts, key, chart, approximate_size(chart))
+
+    def get_judgment(self, key: Hashable) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """Cached ``(result, chart)``; the result is a shallow copy."""
+        entry = self._get(self._judgments, "judgment", key)
+        if entry is None:
+            return None
+        for status in self._active():
+            status["chart"] = HIT
+        result, chart = entry
+        return dict(result), chart
+
+    def put_judgment(self, key: Hashable, result: Dict[str, Any], chart: Any) -> None:
+        # The chart is accounted for by the chart tier
+        self._put(self._judgments, key, (dict(result), chart), approximate_size(result))
+
+    def bypass(self) -> None:
+        """Record that the current request is not cacheable."""
+        for status in self._active():
+            status.update(chart=BYPASS, judgment=BYPASS)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._charts.clear()
+            self._judgments.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "invalidations": self.invalidations,
+                "coalesced_charts": self.coalesced,
+                "charts": self._charts.stats(),
+                "judgments": self._judgments.stats(),
+            }
+
+    @contextmanager
+    def track(self) -> Iterator[Dict[str, str]]:
+        """Record the current thread's chart and judgment cache outcomes."""
+        status = {"chart": BYPASS, "judgment": BYPASS}
+        active = self._active()
+        active.append(status)
+        try:
+            yield status
+        finally:
+            active.remove(status)
+
+    def _get(self, tier: _Tier, name: str, key: Hashable) -> Any:
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._check_version()
+            value = tier.get(key, time.monotonic())
+        for status in self._active():
+            status[name] = HIT if value is not None else MISS
+        return value
+
+    def _put(self, tier: _Tier, key: Hashable, value: Any, size: int) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._check_version()
+            tier.put(key, value, size, time.monotonic())
+
+    def _check_version(self) -> None:
+        """Empty both tiers when the configuration or the rule pack changed."""
+        config, rules = cfg(), rule_engine.RULES
+        if self._version is not None and self._version[0] is config and self._version[1] is rules:
+            return
+        if self._version is not None:
+            self._charts.clear()
+            self._judgments.clear()
+            self.invalidations += 1
+        self._version = (config, rules)
+
+    def _active(self) -> List[Dict[str, str]]:
+        active = getattr(self._local, "statuses", None)
+        if active is None:
+            active = self._local.statuses = []
+        return active
+
+    def _quantize(self, value: float) -> float:
+        return round(round(value / self.location_precision) * self.location_precision, 8)
+
+
+def normalize_question(question: str) -> str:
+    """Question text with surrounding and repeated whitespace removed."""
+    return " ".join(question.split())
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Return the process-wide cache configured from ``result_cache``."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                settings = getattr(cfg(), "result_cache", None)
+                charts = getattr(settings, "charts", None)
+                judgments = getattr(settings, "judgments", None)
+                _cache = ResultCache(
+                    enabled=getattr(settings, "enabled", True),
+                    ttl_seconds=getattr(settings, "ttl_seconds", 3600.0),
+                    max_charts=getattr(charts, "max_entries", 512),
+                    max_chart_bytes=int(getattr(charts, "max_mb", 32) * 2**20),
+                    max_judgments=getattr(judgments, "max_entries", 2048),
+                    max_judgment_bytes=int(getattr(judgments, "max_mb", 32) * 2**20),
+                    location_precision=getattr(settings, "location_precision_deg", 1.0e-4),
+                    quantum_days=getattr(settings, "quantum_days", 1.0e-8),
+                )
+    return _cache
+
+
+def reset_result_cache() -> None:
+    """Discard the shared cache so the next call re-reads configuration."""
+    global _cache
+    with _cache_lock:
+        _cache = None
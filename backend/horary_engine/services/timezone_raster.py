@@ -0,0 +1,211 @@
+"""Precomputed raster of timezone ids for constant-time lookups.
+
+``TimezoneFinder.timezone_at`` tests the point against timezone polygons on
+every call. Away from borders and coastlines the answer is the same for a
+whole neighbourhood, so the raster stores one timezone id per cell of a
+regular latitude/longitude grid. A cell is filled only when a 5x5 grid of
+samples across it (edges included) all agree; other cells are marked as
+borders, and lookups there fall back to the polygons. Features narrower
+than the sample spacing (an eighth of a degree by default) can still be
+missed inside a filled cell.
+
+The raster is a little-endian binary file that is memory-mapped on first
+use. It is generated from the installed ``timezonefinder`` data and shipped
+with the backend. To regenerate it, e.g. after upgrading ``timezonefinder``::
+
+    python -m horary_engine.services.timezone_raster --resolution 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import math
+import mmap
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from horary_config import cfg
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RASTER_PATH = Path(__file__).parent / "data" / "timezone_raster.bin"
+
+_MAGIC = b"HTZR"
+_VERSION = 1
+# magic, version, cell size in degrees, columns, rows, name count, source length
+_HEADER = struct.Struct("<4sHxxdIIII")
+# Cell value of border cells, answered by the polygons
+BORDER = 0xFFFF
+
+
+class TimezoneRaster:
+    """Timezone id per grid cell, ``BORDER`` where the cell is not uniform."""
+
+    def __init__(self, resolution: float, cells: np.ndarray, names: List[str],
+                 source: str = "", path: Optional[Path] = None):
+        self.resolution = resolution
+        self.cells = cells
+        self.names = names
+        self.source = source
+        self.path = path
+        self.rows, self.columns = cells.shape
+
+    def timezone_at(self, lat: float, lon: float) -> Optional[str]:
+        """Timezone of the cell containing the point, or None for border cells."""
+        row = min(int((90.0 - lat) / self.resolution), self.rows - 1)
+        column = int((lon + 180.0) / self.resolution) % self.columns
+        if row < 0:
+            return None
+        value = self.cells[row, column]
+        return None if value == BORDER else self.names[value]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": str(self.path) if self.path is not None else None,
+            "resolution_deg": self.resolution,
+            "timezones": len(self.names),
+            "border_fraction": float(np.count_nonzero(self.cells == BORDER)) / self.cells.size,
+            "source": self.source,
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> "TimezoneRaster":
+        """Map a raster written by :meth:`save`."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, resolution, columns, rows, name_count, source_length = _HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"Unsupported timezone raster file: {path}")
+        offset = _HEADER.size
+        cells = np.frombuffer(buffer, dtype="<u2", count=rows * columns, offset=offset).reshape(rows, columns)
+        offset += cells.nbytes
+        source = buffer[offset:offset + source_length].decode("utf-8")
+        names = buffer[offset + source_length:].decode("utf-8").split("\n")
+        if len(names) != name_count:
+            raise ValueError(f"Corrupt timezone raster file: {path}")
+        return cls(resolution, cells, names, source, Path(path))
+
+    def save(self, path: Path) -> None:
+        """Write the raster as a compact little-endian binary file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        source = self.source.encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.resolution, self.columns, self.rows,
+                                 len(self.names), len(source)))
+            f.write(self.cells.astype("<u2").tobytes())
+            f.write(source)
+            f.write("\n".join(self.names).encode("utf-8"))
+
+
+def build_timezone_raster(finder, resolution: float = 0.5, samples_per_edge: int = 5,
+                          progress: bool = False) -> TimezoneRaster:
+    """Sample ``finder.timezone_at`` on a grid of ``resolution`` degree cells."""
+    columns = round(360.0 / resolution)
+    rows = round(180.0 / resolution)
+    # Neighbouring cells share their edge samples
+    steps = samples_per_edge - 1
+    lats = 90.0 - np.arange(steps * rows + 1) * resolution / steps
+    lons = -180.0 + np.arange(steps * columns + 1) * resolution / steps
+    ids: Dict[Optional[str], int] = {}
+    samples = np.empty((len(lats), len(lons)), dtype=np.int32)
+    started = time.monotonic()
+    for i, lat in enumerate(lats):
+        lat = float(np.clip(lat, -89.9999, 89.9999))
+        for j, lon in enumerate(lons):
+            name = finder.timezone_at(lat=lat, lng=float(min(lon, 179.9999)))
+            samples[i, j] = ids.setdefault(name, len(ids))
+        if progress and i % 100 == 0:
+            print(f"  {i + 1}/{len(lats)} rows, {time.monotonic() - started:.0f} s", flush=True)
+
+    window = (samples_per_edge, samples_per_edge)
+    blocks = np.lib.stride_tricks.sliding_window_view(samples, window)[::steps, ::steps]
+    first = blocks[..., 0, 0]
+    uniform = (blocks == first[..., None, None]).all(axis=(-1, -2))
+    names = [None] * len(ids)
+    for name, index in ids.items():
+        names[index] = name
+    # Cells whose samples have no timezone are left to the polygons too
+    if None in ids:
+        uniform &= first != ids[None]
+    cells = np.where(uniform, first, BORDER).astype(np.uint16)
+    if len(names) >= BORDER:
+        raise ValueError("Too many timezones for a 16-bit raster")
+    return TimezoneRaster(resolution, cells, [name or "" for name in names])
+
+
+_raster: Optional[TimezoneRaster] = None
+_raster_loaded = False
+_raster_lock = threading.Lock()
+
+
+def _settings():
+    return getattr(getattr(cfg(), "timezones", None), "raster", None)
+
+
+def _configured_path() -> Optional[Path]:
+    settings = _settings()
+    if settings is not None and not getattr(settings, "enabled", True):
+        return None
+    custom_path = getattr(settings, "path", None) if settings is not None else None
+    return Path(custom_path) if custom_path else DEFAULT_RASTER_PATH
+
+
+def get_timezone_raster() -> Optional[TimezoneRaster]:
+    """Return the process-wide raster, mapping it on first use.
+
+    Returns ``None`` when the raster is disabled or cannot be read, in which
+    case every lookup uses the polygons.
+    """
+    global _raster, _raster_loaded
+    if _raster_loaded:
+        return _raster
+    with _raster_lock:
+        if not _raster_loaded:
+            path = _configured_path()
+            if path is not None:
+                try:
+                    _raster = TimezoneRaster.load(path)
+                    logger.info(f"Loaded timezone raster from {path}")
+                except (OSError, ValueError, struct.error) as e:
+                    logger.warning(f"Timezone raster unavailable ({e}); using timezone polygons")
+                    _raster = None
+            _raster_loaded = True
+    return _raster
+
+
+def reset_timezone_raster() -> None:
+    """Forget the loaded raster so the next lookup reloads it (for testing)."""
+    global _raster, _raster_loaded
+    with _raster_lock:
+        _raster = None
+        _raster_loaded = False
+
+
+def main(argv: Optional[list] = None) -> None:
+    from importlib.metadata import version
+    from timezonefinder import TimezoneFinder
+
+    parser = argparse.ArgumentParser(description="Generate the timezone raster")
+    parser.add_argument("--resolution", type=float, default=getattr(_settings(), "resolution_deg", 0.5))
+    parser.add_argument("--samples", type=int, default=5, help="samples along each cell edge")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RASTER_PATH)
+    args = parser.parse_args(argv)
+    if not math.isclose(180.0 / args.resolution, round(180.0 / args.resolution)):
+        parser.error("resolution must divide 180 degrees")
+
+    raster = build_timezone_raster(TimezoneFinder(), args.resolution, args.samples, progress=True)
+    raster.source = f"timezonefinder {version('timezonefinder')}"
+    raster.save(args.output)
+    border = raster.stats()["border_fraction"]
+    print(f"Wrote {raster.rows}x{raster.columns} raster ({border:.1%} border cells) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,9 +40,13 @@ class Aspect(Enum):
     @property
     def orb(self) -> float:
         """Get orb from configuration."""
+        config = cfg()
+        tables = getattr(config, "tables", None)
+        if tables is not None:
+            return tables.orb(self.config_key)
         try:
-            return cfg().orbs.__dict__[self.config_key]
-        except (AttributeError, KeyError):
+            return getattr(config.orbs, self.config_key)
+        except AttributeError:
             logger.warning(f"Orb not found for {self.config_key}, using default 8.0")
             return 8.0
 
@@ -80,7 +84,7 @@ class SolarCondition(Enum):
         self.description = description
 
 
-@dataclass
+@dataclass(slots=True)
 class SolarAnalysis:
     """Analysis of planet's relationship to the Sun."""
     planet: Planet
@@ -90,7 +94,7 @@ class SolarAnalysis:
     traditional_exception: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanetPosition:
     planet: Planet
     longitude: float
@@ -105,7 +109,7 @@ class PlanetPosition:
     dignities: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AspectInfo:
     planet1: Planet
     planet2: Planet
@@ -118,7 +122,7 @@ class AspectInfo:
     degrees_to_exact: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LunarAspect:
     """Enhanced lunar aspect information."""
     planet: Planet
@@ -130,7 +134,7 @@ class LunarAspect:
     applying: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Significator:
     """Represents a significator in horary astrology."""
     planet: Planet
@@ -139,7 +143,7 @@ class Significator:
     role: str  # "querent", "quesited", etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class HoraryChart:
     date_time: datetime.datetime
     date_time_utc: datetime.datetime  # UTC time for calculations
@@ -156,4 +160,15 @@ class HoraryChart:
     julian_day: float = 0.0
     moon_last_aspect: Optional[LunarAspect] = None
     moon_next_aspect: Optional[LunarAspect] = None
+    # Lazily solved perfection times shared by all checks; see
+    # horary_engine.perfection.perfection_matrix
+    perfection_cache: Optional[object] = field(default=None, repr=False, compare=False)
+    # Reception between every planet pair; see
+    # horary_engine.reception.TraditionalReceptionCalculator.reception_matrix
+    reception_cache: Optional[object] = field(default=None, repr=False, compare=False)
+    # Aspect, ruler and cusp lookups; see horary_engine.chart_index.ChartIndex
+    index_cache: Optional[object] = field(default=None, repr=False, compare=False)
+    # Memoized helper results for this chart; see
+    # horary_engine.context.ChartContext
+    context: Optional[object] = field(default=None, repr=False, compare=False)
 
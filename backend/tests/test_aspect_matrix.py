@@ -0,0 +1,98 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_config import cfg
+from horary_engine.aspects import (
+    ASPECT_ORDER,
+    _is_orb_shrinking,
+    _will_perfect_before_sign_exit,
+    aspect_matrices,
+    calculate_enhanced_aspects,
+    calculate_moiety_based_orb,
+    orb_limit_matrix,
+    perfects_within_sign,
+    time_to_perfection,
+)
+from models import Planet, PlanetPosition, Sign
+
+PLANETS = [Planet.SUN, Planet.MOON, Planet.MERCURY, Planet.VENUS, Planet.MARS, Planet.JUPITER, Planet.SATURN]
+SPEEDS = [(0.95, 1.02), (11.8, 15.1), (-1.2, 2.1), (-0.6, 1.25), (-0.4, 0.8), (-0.13, 0.25), (-0.08, 0.13)]
+
+
+def _positions(rng):
+    longitude = rng.uniform(0, 360, len(PLANETS))
+    speed = np.array([rng.uniform(lo, hi) for lo, hi in SPEEDS])
+    planets = {
+        planet: PlanetPosition(planet=planet, longitude=float(lon), latitude=0.0, house=1,
+                               sign=list(Sign)[int(lon // 30)], dignity_score=0, speed=float(spd))
+        for planet, lon, spd in zip(PLANETS, longitude, speed)
+    }
+    return longitude, speed, planets
+
+
+def _pairwise(planets, p1, p2):
+    """Closest in-orb aspect by the scalar rules, or None."""
+    pos1, pos2 = planets[p1], planets[p2]
+    separation = abs((pos1.longitude - pos2.longitude + 180) % 360 - 180)
+    candidates = []
+    for aspect in ASPECT_ORDER:
+        limit = calculate_moiety_based_orb(p1, p2, aspect, cfg())
+        if abs(separation - aspect.degrees) <= limit:
+            candidates.append((abs(separation - aspect.degrees), aspect))
+    return min(candidates, key=lambda c: c[0]) if candidates else None
+
+
+def test_matrices_match_scalar_rules():
+    rng = np.random.default_rng(7)
+    limits = orb_limit_matrix(PLANETS)
+    for _ in range(100):
+        longitude, speed, planets = _positions(rng)
+        matrices = aspect_matrices(longitude, speed, limits)
+        for i, p1 in enumerate(PLANETS):
+            assert matrices.code[i, i] == -1
+            for j, p2 in enumerate(PLANETS[i + 1:], start=i + 1):
+                expected = _pairwise(planets, p1, p2)
+                if expected is None:
+                    assert matrices.code[i, j] == -1 and np.isnan(matrices.orb[i, j])
+                    continue
+                orb, aspect = expected
+                assert ASPECT_ORDER[matrices.code[i, j]] == aspect
+                assert matrices.orb[i, j] == orb
+                assert matrices.applying[i, j] == _is_orb_shrinking(planets[p1], planets[p2], aspect)
+                assert matrices.time_to_perfection[i, j] == time_to_perfection(planets[p1], planets[p2], aspect)
+                assert matrices.code[j, i] == matrices.code[i, j]
+
+
+def test_within_sign_matches_scalar_rule():
+    rng = np.random.default_rng(11)
+    for _ in range(50):
+        longitude, speed, planets = _positions(rng)
+        t = rng.uniform(-2, 40, (len(PLANETS), len(PLANETS)))
+        within = perfects_within_sign(longitude, speed, t)
+        for i, p1 in enumerate(PLANETS):
+            for j, p2 in enumerate(PLANETS):
+                assert within[i, j] == _will_perfect_before_sign_exit(
+                    planets[p1], planets[p2], ASPECT_ORDER[0], t[i, j])
+
+
+def test_batch_shapes_and_single_chart_agree():
+    rng = np.random.default_rng(3)
+    rows = [_positions(rng) for _ in range(20)]
+    longitude = np.stack([r[0] for r in rows])
+    speed = np.stack([r[1] for r in rows])
+    batch = aspect_matrices(longitude, speed, orb_limit_matrix(PLANETS))
+    assert batch.code.shape == (20, 7, 7)
+
+    for n, (_, _, planets) in enumerate(rows):
+        aspects = calculate_enhanced_aspects(planets, None)
+        found = {(PLANETS.index(a.planet1), PLANETS.index(a.planet2)): a for a in aspects}
+        assert set(found) == set(zip(*np.nonzero(np.triu(batch.code[n] >= 0, 1))))
+        for (i, j), aspect in found.items():
+            assert ASPECT_ORDER[batch.code[n, i, j]] == aspect.aspect
+            assert batch.applying[n, i, j] == aspect.applying
+            assert aspect.degrees_to_exact == pytest.approx(max(aspect.orb, 0.1))
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+from horary_engine.services.result_cache import reset_result_cache
+
+ITEM = {
+    "location": "London",
+    "useCurrentTime": False,
+    "date": "2024-03-15",
+    "time": "18:30",
+    "timezone": "Europe/London",
+}
+
+
+@pytest.fixture()
+def client(monkeypatch):
+    from app import app, horary_engine
+
+    # Avoid the network geocoder and count the charts actually calculated
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location: (51.5074, -0.1278, "London, UK"))
+    calculated = []
+    calculate_chart = horary_engine.engine.calculator.calculate_chart
+
+    def counting(*args, **kwargs):
+        calculated.append(args)
+        return calculate_chart(*args, **kwargs)
+
+    monkeypatch.setattr(horary_engine.engine.calculator, "calculate_chart", counting)
+    reset_result_cache()
+    yield app.test_client(), calculated
+    reset_result_cache()
+
+
+def _lines(response):
+    assert response.mimetype == "application/x-ndjson"
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_array_batch_streams_every_item_and_shares_the_chart(client):
+    client, calculated = client
+    items = [
+        {**ITEM, "id": "job", "question": "Will I get the job?"},
+        {**ITEM, "id": "move", "question": "Should I move house?"},
+        {**ITEM, "id": "lost", "question": "Will I find my keys?"},
+        {**ITEM, "id": "empty"},
+    ]
+    lines = _lines(client.post("/api/calculate-chart/batch?fields=judgment", json=items))
+
+    summary = lines.pop()
+    assert summary["summary"] and (summary["items"], summary["succeeded"], summary["failed"]) == (4, 3, 1)
+    by_id = {line["id"]: line for line in lines}
+    assert sorted(line["index"] for line in lines) == [0, 1, 2, 3]
+    assert by_id["empty"]["status"] == 400 and by_id["empty"]["error"] == "Question is required"
+    for name in ("job", "move", "lost"):
+        assert by_id[name]["status"] == 200 and by_id[name]["result"]["judgment"] in ("YES", "NO", "UNCLEAR")
+        assert by_id[name]["elapsed_ms"] >= 0
+    # The three questions share one chart
+    assert len(calculated) == 1
+
+
+def test_ndjson_batch_reports_malformed_lines(client):
+    client, _ = client
+    body = "\n".join([
+        json.dumps({**ITEM, "question": "Will I get the job?"}),
+        "{not json",
+        "",
+        json.dumps(["not", "an", "object"]),
+    ])
+    lines = _lines(client.post("/api/calculate-chart/batch", data=body,
+                               content_type="application/x-ndjson"))
+
+    assert lines[-1]["items"] == 3
+    statuses = {line["index"]: line["status"] for line in lines[:-1]}
+    assert statuses == {0: 200, 1: 400, 2: 400}
+    assert next(line for line in lines if line.get("index") == 1)["error"].startswith("Invalid JSON")
+
+
+def test_batch_must_be_a_list(client):
+    client, _ = client
+    response = client.post("/api/calculate-chart/batch", json={"question": "Will I get the job?"})
+    assert response.status_code == 400
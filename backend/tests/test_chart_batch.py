@@ -0,0 +1,75 @@
+import datetime
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.chart_batch import BATCH_ASPECTS, BATCH_PLANETS
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return EnhancedTraditionalAstrologicalCalculator()
+
+
+@pytest.fixture(scope="module")
+def samples():
+    rng = np.random.default_rng(11)
+    start = datetime.datetime(2000, 1, 1)
+    times = [start + datetime.timedelta(minutes=int(m)) for m in rng.integers(0, 60 * 24 * 365 * 30, 40)]
+    return times, rng.uniform(-60, 60, 40), rng.uniform(-180, 180, 40)
+
+
+def test_batch_matches_sequential_charts(calculator, samples):
+    times, lats, lons = samples
+    batch = calculator.calculate_chart_batch(times, lats, lons)
+    assert len(batch) == len(times)
+
+    for i, dt in enumerate(times):
+        chart = calculator.calculate_chart(dt, dt, "UTC", lats[i], lons[i], "test")
+        assert batch.julian_day[i] == chart.julian_day
+        assert list(batch.cusps[i]) == chart.houses
+
+        for p, planet in enumerate(BATCH_PLANETS):
+            pos = chart.planets[planet]
+            assert batch.planet_longitude[i, p] == pos.longitude
+            assert batch.house[i, p] == pos.house
+            assert batch.sign[i, p] == list(type(pos.sign)).index(pos.sign)
+            assert batch.essential_dignity[i, p] == pos.essential_dignity
+            assert batch.accidental_dignity[i, p] == pos.accidental_dignity
+
+        found = {(a.planet1, a.planet2): a for a in chart.aspects}
+        for p in range(len(BATCH_PLANETS)):
+            for q in range(p + 1, len(BATCH_PLANETS)):
+                aspect = found.get((BATCH_PLANETS[p], BATCH_PLANETS[q]))
+                if aspect is None:
+                    assert batch.aspect[i, p, q] == -1
+                    continue
+                assert BATCH_ASPECTS[batch.aspect[i, p, q]] == aspect.aspect
+                assert batch.aspect_orb[i, p, q] == pytest.approx(aspect.orb, abs=1e-9)
+                assert batch.applying[i, p, q] == aspect.applying
+                assert batch.aspect[i, q, p] == batch.aspect[i, p, q]
+
+
+def test_charts_are_materialised_lazily(calculator, samples):
+    times, lats, lons = samples
+    batch = calculator.calculate_chart_batch(times[:3], lats[:3], lons[:3])
+    assert batch._charts == {}
+
+    chart = batch[1]
+    assert batch[1] is chart
+    assert list(batch._charts) == [1]
+    assert chart.julian_day == pytest.approx(batch.julian_day[1], abs=1e-9)
+    assert chart.moon_next_aspect is not None or chart.moon_last_aspect is not None
+
+
+def test_julian_days_and_scalar_location(calculator, samples):
+    times, _, _ = samples
+    by_datetime = calculator.calculate_chart_batch(times[:5], 51.5, -0.12)
+    by_jd = calculator.calculate_chart_batch(list(by_datetime.julian_day), 51.5, -0.12)
+    np.testing.assert_array_equal(by_datetime.planet_longitude, by_jd.planet_longitude)
+    np.testing.assert_array_equal(by_jd.latitude, np.full(5, 51.5))
@@ -0,0 +1,46 @@
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.context import ChartContext, chart_context
+from horary_engine.engine import (
+    EnhancedTraditionalAstrologicalCalculator,
+    EnhancedTraditionalHoraryJudgmentEngine,
+)
+from horary_engine.radicality import check_enhanced_radicality
+
+
+@pytest.fixture()
+def chart():
+    dt = datetime.datetime(2024, 3, 15, 18, 30)
+    return EnhancedTraditionalAstrologicalCalculator().calculate_chart(dt, dt, "UTC", 51.5, -0.13, "London")
+
+
+def test_memo_counts_hits_per_helper():
+    context = ChartContext()
+    calls = []
+    compute = lambda: calls.append(1) or len(calls)
+    assert context.memo("helper", 1, compute) == 1
+    assert context.memo("helper", 1, compute) == 1
+    assert context.memo("helper", 2, compute) == 2
+    assert context.stats() == {"helper": {"hits": 1, "misses": 2}}
+
+
+def test_helpers_run_once_per_chart(chart):
+    assert isinstance(chart.context, ChartContext)
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    analysis = {"question_type": "general", "relevant_houses": [1, 7], "significators": {}}
+
+    assert check_enhanced_radicality(chart) is check_enhanced_radicality(chart)
+    assert check_enhanced_radicality(chart, True) is not check_enhanced_radicality(chart)
+    assert engine._identify_significators(chart, analysis) is engine._identify_significators(chart, dict(analysis))
+    assert engine._is_moon_void_of_course_enhanced(chart) is engine._is_moon_void_of_course_enhanced(chart)
+
+    stats = chart_context(chart).stats()
+    assert stats["radicality"] == {"hits": 2, "misses": 2}
+    assert stats["significators"] == {"hits": 1, "misses": 1}
+    assert stats["moon_void"] == {"hits": 1, "misses": 1}
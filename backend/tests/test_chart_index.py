@@ -0,0 +1,49 @@
+import datetime
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.chart_index import HouseCusps, _scan_house, chart_index
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+from models import Planet
+
+
+@pytest.fixture(scope="module")
+def chart():
+    dt = datetime.datetime(2024, 3, 15, 18, 30)
+    return EnhancedTraditionalAstrologicalCalculator().calculate_chart(dt, dt, "UTC", 51.5, -0.13, "London")
+
+
+def test_bisect_matches_cusp_scan():
+    rng = random.Random(11)
+    for _ in range(200):
+        asc = rng.uniform(0, 360)
+        widths = [rng.uniform(10, 50) for _ in range(12)]
+        scale = 360 / sum(widths)
+        houses, cusp = [], asc
+        for width in widths:
+            houses.append(cusp % 360)
+            cusp += width * scale
+        cusps = HouseCusps(houses)
+        scan_cusps = [c % 360 for c in houses]
+        for lon in [rng.uniform(0, 360) for _ in range(30)] + houses:
+            assert cusps.house_of(lon) == _scan_house(lon % 360, scan_cusps)
+
+
+def test_lookups_match_chart_scans(chart):
+    index = chart_index(chart)
+    assert chart_index(chart) is index
+    for p1 in chart.planets:
+        for p2 in chart.planets:
+            found = [a for a in chart.aspects if {a.planet1, a.planet2} == {p1, p2}]
+            assert list(index.aspects_between(p1, p2)) == found
+            applying = next((a for a in found if a.applying), None)
+            assert index.aspect_between(p1, p2, applying=True) is applying
+        assert list(index.aspects_of(p1)) == [a for a in chart.aspects if p1 in (a.planet1, a.planet2)]
+        assert list(index.houses_ruled(p1)) == [h for h, r in chart.house_rulers.items() if r == p1]
+        assert index.house_of(chart.planets[p1].longitude) == chart.planets[p1].house
+    assert index.houses_ruled(Planet.ASC) == ()
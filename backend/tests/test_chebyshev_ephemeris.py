@@ -0,0 +1,70 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.chebyshev import ChebyshevEphemeris
+from horary_engine.calculation.position_provider import (
+    ChebyshevProvider,
+    SwissEphemerisProvider,
+    get_position_provider,
+)
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# (longitude deg, latitude deg, speed deg/day). The slow planets are limited
+# by the light-deflection kink Swiss Ephemeris applies near solar conjunction.
+BOUNDS = {
+    swe.SUN: (1e-6, 1e-6, 1e-4),
+    swe.MOON: (1e-6, 1e-6, 5e-4),
+    swe.MERCURY: (1e-4, 1e-4, 3e-3),
+    swe.VENUS: (2e-4, 1e-4, 3e-3),
+    swe.MARS: (1e-4, 1e-4, 3e-3),
+    swe.JUPITER: (1e-3, 1e-3, 5e-3),
+    swe.SATURN: (2e-3, 1e-3, 5e-3),
+}
+
+
+@pytest.fixture(scope="module")
+def sample_jds():
+    rng = np.random.default_rng(7)
+    return swe.julday(2000, 1, 1, 0.0) + rng.uniform(0, 365.25 * 30, 400)
+
+
+@pytest.mark.parametrize("body", sorted(BOUNDS))
+def test_chebyshev_matches_swiss_ephemeris(body, sample_jds):
+    ephemeris = ChebyshevEphemeris()
+    approx = ephemeris.calc_many(sample_jds, body)
+    exact = np.array([swe.calc_ut(jd, body, FLAGS)[0] for jd in sample_jds])
+
+    lon_bound, lat_bound, speed_bound = BOUNDS[body]
+    lon_err = np.abs((approx[:, 0] - exact[:, 0] + 180) % 360 - 180)
+    assert lon_err.max() < lon_bound
+    assert np.abs(approx[:, 1] - exact[:, 1]).max() < lat_bound
+    assert np.abs(approx[:, 3] - exact[:, 3]).max() < speed_bound
+
+    # Scalar path agrees with the vectorised one
+    assert np.allclose(ephemeris.calc(sample_jds[0], body), approx[0], atol=1e-9)
+
+
+def test_round_trip_preserves_segments(tmp_path, sample_jds):
+    ephemeris = ChebyshevEphemeris()
+    before = ephemeris.calc_many(sample_jds[:20], swe.MOON)
+    path = tmp_path / "coefficients.npz"
+    ephemeris.save(path)
+
+    loaded = ChebyshevEphemeris.load(path)
+    assert np.array_equal(loaded.calc_many(sample_jds[:20], swe.MOON), before)
+
+
+def test_provider_falls_back_for_other_bodies():
+    provider = ChebyshevProvider()
+    jd = swe.julday(2025, 9, 1, 0.0)
+    assert provider.calc(jd, swe.URANUS) == SwissEphemerisProvider().calc(jd, swe.URANUS)
+    assert get_position_provider("swiss").name == "swiss"
+    with pytest.raises(ValueError):
+        get_position_provider("nonexistent")
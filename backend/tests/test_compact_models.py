@@ -0,0 +1,35 @@
+import datetime
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+from horary_engine.perfection import perfection_matrix
+from models import Aspect, Planet
+
+
+@pytest.fixture(scope="module")
+def chart():
+    dt = datetime.datetime(2024, 3, 15, 18, 30)
+    return EnhancedTraditionalAstrologicalCalculator().calculate_chart(dt, dt, "UTC", 51.5, -0.13, "London")
+
+
+def test_models_have_no_instance_dict(chart):
+    objects = [chart, *chart.planets.values(), *chart.aspects, chart.moon_next_aspect]
+    objects += list(chart.solar_analyses.values())
+    for obj in objects:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+    with pytest.raises(AttributeError):
+        chart.planets[Planet.SUN].unknown = 1
+
+
+def test_chart_survives_pickle(chart):
+    copy = pickle.loads(pickle.dumps(chart))
+    assert copy == chart
+    matrix = perfection_matrix(copy)
+    days = matrix.time_to_perfection(Planet.MOON, Planet.SUN, Aspect.OPPOSITION, 30)
+    assert days == perfection_matrix(chart).time_to_perfection(Planet.SUN, Planet.MOON, Aspect.OPPOSITION, 30)
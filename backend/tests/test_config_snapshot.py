@@ -0,0 +1,106 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+import yaml
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_config import (
+    ConfigWatcher,
+    HoraryError,
+    cfg,
+    config_file_path,
+    config_snapshot,
+    reload_config,
+)
+from horary_engine.aspects import orb_limit_matrix
+from models import Aspect, Planet
+
+PLANETS = [Planet.SUN, Planet.MOON, Planet.MERCURY, Planet.VENUS, Planet.MARS, Planet.JUPITER, Planet.SATURN]
+
+
+@pytest.fixture()
+def config_file(tmp_path):
+    with open(config_file_path(), encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    path = tmp_path / "horary_constants.yaml"
+
+    def write(**orbs):
+        data["orbs"].update(orbs)
+        path.write_text(yaml.safe_dump(data), encoding='utf-8')
+        return path
+
+    yield write
+    reload_config()
+
+
+def test_snapshot_is_read_only():
+    config = cfg()
+    with pytest.raises(AttributeError):
+        config.orbs.conjunction = 1.0
+    with pytest.raises(AttributeError):
+        config.new_section = {}
+    assert not hasattr(config.orbs, "__dict__")
+    assert not config.tables.max_orb.flags.writeable
+
+
+def test_snapshot_pickles_by_value():
+    copy = pickle.loads(pickle.dumps(cfg()))
+    assert copy == cfg() and copy is not cfg()
+    assert (copy.tables.max_orb == cfg().tables.max_orb).all()
+
+
+def test_tables_match_orbs_section():
+    orbs = cfg().orbs
+    tables = cfg().tables
+    for aspect in Aspect:
+        assert aspect.orb == getattr(orbs, aspect.config_key)
+    sun, moon = tables.planet_index["Sun"], tables.planet_index["Moon"]
+    opposition = tables.aspect_index["opposition"]
+    expected = (orbs.moieties.Sun + orbs.moieties.Moon) / 2.0
+    assert tables.max_orb[sun, moon, opposition] == expected
+    assert np.array_equal(orb_limit_matrix(PLANETS), tables.max_orb)
+
+
+def test_reload_swaps_snapshot_atomically(config_file):
+    pinned_orbs = cfg().orbs
+    with config_snapshot() as pinned:
+        reload_config(config_file(conjunction=3.5))
+        assert cfg() is pinned
+        assert Aspect.CONJUNCTION.orb == pinned_orbs.conjunction
+    assert cfg() is not pinned
+    assert Aspect.CONJUNCTION.orb == 3.5
+    assert orb_limit_matrix(PLANETS) is not orb_limit_matrix(PLANETS, pinned)
+
+
+def test_failed_reload_keeps_current_snapshot(config_file, tmp_path):
+    current = cfg()
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("orbs: [", encoding='utf-8')
+    with pytest.raises(HoraryError):
+        reload_config(broken)
+    assert cfg() is current
+
+    path = config_file(conjunction=4.0)
+    watcher = ConfigWatcher(config_file=path)
+    assert not watcher.check()
+    os.utime(path, (0, 0))
+    assert watcher.check()
+    assert cfg().orbs.conjunction == 4.0
+
+
+def test_reload_endpoint_requires_a_configured_token(monkeypatch):
+    from app import app
+
+    client = app.test_client()
+    monkeypatch.delenv("HORARY_ADMIN_TOKEN", raising=False)
+    assert client.post("/api/admin/reload-config").status_code == 404
+
+    monkeypatch.setenv("HORARY_ADMIN_TOKEN", "s3cret")
+    assert client.post("/api/admin/reload-config").status_code == 403
+    assert client.post("/api/admin/reload-config", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    response = client.post("/api/admin/reload-config", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200 and response.get_json()["success"]
@@ -0,0 +1,73 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_config import cfg
+from horary_engine.dignities import (
+    DETRIMENT,
+    DIGNITY_PLANETS,
+    FACE,
+    FALL,
+    RULERSHIP,
+    TERM,
+    TRIPLICITY,
+    dignity_table,
+    essential_dignity_score,
+)
+from horary_engine.reception import TraditionalReceptionCalculator
+from models import Planet, Sign
+
+
+def test_terms_and_faces_follow_yaml():
+    table = dignity_table()
+    for s, sign in enumerate(Sign):
+        for bound in getattr(cfg().reception.terms, sign.sign_name):
+            ruler = DIGNITY_PLANETS.index(Planet[bound.ruler.upper()])
+            assert (table.term_ruler[s, bound.start:bound.end] == ruler).all()
+        for bound in getattr(cfg().reception.faces, sign.sign_name):
+            ruler = DIGNITY_PLANETS.index(Planet[bound.ruler.upper()])
+            assert (table.face_ruler[s, bound.start:bound.end] == ruler).all()
+
+
+def test_mask_and_score():
+    table = dignity_table()
+    # Mars at 5 Scorpio by night: ruler, night triplicity ruler of water, own term and face
+    mask = table.mask(Planet.MARS, Sign.SCORPIO, 5.5, is_day=False)
+    assert mask == RULERSHIP | TRIPLICITY | TERM | FACE
+    assert table.mask(Planet.MARS, Sign.SCORPIO, 5.5, is_day=True) == RULERSHIP | TERM | FACE
+
+    dignity = cfg().dignity
+    assert essential_dignity_score(mask) == dignity.rulership + dignity.triplicity + 3
+    # Detriment and fall carry their negative weights
+    assert table.mask(Planet.SUN, Sign.AQUARIUS, 29.99, is_day=True) & DETRIMENT
+    assert table.mask(Planet.SATURN, Sign.ARIES, 0.0, is_day=True) & FALL
+    assert essential_dignity_score(DETRIMENT | FALL) == dignity.detriment + dignity.fall
+
+
+def test_batch_masks_match_single_lookups():
+    table = dignity_table()
+    rng = np.random.default_rng(3)
+    longitude = rng.uniform(0, 360, size=(50, len(DIGNITY_PLANETS)))
+    is_day = rng.random(50) < 0.5
+    masks = table.batch_masks((longitude // 30).astype(int), longitude % 30, is_day)
+
+    signs = list(Sign)
+    for n in range(50):
+        for p, planet in enumerate(DIGNITY_PLANETS):
+            lon = longitude[n, p]
+            assert masks[n, p] == table.mask(planet, signs[int(lon // 30)], lon % 30, bool(is_day[n]))
+    assert (essential_dignity_score(masks)[0] == [essential_dignity_score(int(m)) for m in masks[0]]).all()
+
+
+def test_reception_water_triplicity_is_venus_by_day_and_mars_by_night():
+    calculator = TraditionalReceptionCalculator()
+    # 21 Cancer: term of Jupiter, face of the Moon
+    position = SimpleNamespace(sign=Sign.CANCER, longitude=111.0)
+    assert calculator._check_all_dignities(Planet.VENUS, position, is_day=True) == ["triplicity"]
+    assert calculator._check_all_dignities(Planet.MARS, position, is_day=True) == []
+    assert calculator._check_all_dignities(Planet.MARS, position, is_day=False) == ["triplicity"]
+    assert calculator._check_all_dignities(Planet.VENUS, position, is_day=False) == []
@@ -0,0 +1,76 @@
+import datetime
+import os
+import sys
+import threading
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.ephemeris import DEFAULT_FLAGS, Ephemeris, get_ephemeris
+from horary_engine.calculation.position_provider import SwissEphemerisProvider
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+JD = swe.julday(2025, 9, 1, 12.0)
+
+
+def test_cached_lookup_matches_swiss_ephemeris():
+    ephemeris = Ephemeris(SwissEphemerisProvider())
+    expected = tuple(swe.calc_ut(JD, swe.MARS, DEFAULT_FLAGS)[0])
+
+    assert ephemeris.calc(JD, swe.MARS) == expected
+    assert ephemeris.calc(JD, swe.MARS) == expected
+    stats = ephemeris.stats()
+    assert (stats["calls"], stats["hits"], stats["misses"]) == (2, 1, 1)
+
+
+def test_key_includes_body_flags_and_quantized_time():
+    ephemeris = Ephemeris(SwissEphemerisProvider(), quantum_days=1e-6)
+    ephemeris.calc(JD, swe.MOON)
+    ephemeris.calc(JD + 1e-8, swe.MOON)  # same quantum
+    ephemeris.calc(JD + 1e-3, swe.MOON)
+    ephemeris.calc(JD, swe.SUN)
+    equatorial = ephemeris.calc(JD, swe.MOON, DEFAULT_FLAGS | swe.FLG_EQUATORIAL)
+
+    assert equatorial == tuple(swe.calc_ut(JD, swe.MOON, DEFAULT_FLAGS | swe.FLG_EQUATORIAL)[0])
+    assert ephemeris.stats()["hits"] == 1
+    assert ephemeris.stats()["misses"] == 4
+
+
+def test_cache_is_bounded_and_evicts_least_recent():
+    ephemeris = Ephemeris(SwissEphemerisProvider(), max_entries=2)
+    ephemeris.calc(JD, swe.SUN)
+    ephemeris.calc(JD, swe.MOON)
+    ephemeris.calc(JD, swe.SUN)  # refresh Sun
+    ephemeris.calc(JD, swe.MARS)  # evicts Moon
+
+    assert ephemeris.stats()["size"] == 2
+    ephemeris.calc(JD, swe.SUN)
+    ephemeris.calc(JD, swe.MOON)
+    assert ephemeris.stats()["hits"] == 2
+
+
+def test_measure_counts_only_current_thread():
+    ephemeris = Ephemeris(SwissEphemerisProvider())
+    other = threading.Thread(target=lambda: [ephemeris.calc(JD + i, swe.VENUS) for i in range(50)])
+
+    with ephemeris.measure() as usage:
+        other.start()
+        ephemeris.calc(JD, swe.SATURN)
+        ephemeris.calc(JD, swe.SATURN)
+        other.join()
+
+    assert usage == {"calls": 2, "hits": 1, "misses": 1}
+    assert ephemeris.stats()["calls"] == 52
+
+
+def test_chart_calculation_reuses_shared_entries():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    assert calculator.ephemeris is get_ephemeris()
+    dt = datetime.datetime(2025, 9, 1, 12, 0)
+    with calculator.ephemeris.measure() as usage:
+        chart = calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.12, "London")
+        calculator.get_real_moon_speed(chart.julian_day)
+    assert usage["hits"] >= 1
+    assert usage["calls"] == usage["hits"] + usage["misses"]
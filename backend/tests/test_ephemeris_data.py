@@ -0,0 +1,73 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation import ephemeris_data
+from horary_engine.calculation.ephemeris_data import (
+    EPHE_PATH_ENV,
+    configure_ephemeris_data,
+    required_files,
+    reset_ephemeris_data,
+    resolve_ephe_path,
+)
+
+
+@pytest.fixture()
+def fresh_state(monkeypatch):
+    reset_ephemeris_data()
+    yield monkeypatch
+    monkeypatch.undo()
+    reset_ephemeris_data()
+    configure_ephemeris_data()
+
+
+def test_required_files_cover_date_range():
+    assert required_files(1800, 2399) == ["sepl_18.se1", "semo_18.se1"]
+    assert required_files(1900, 2100) == ["sepl_18.se1", "semo_18.se1"]
+    assert required_files(1500, 2500) == [
+        "sepl_12.se1", "semo_12.se1",
+        "sepl_18.se1", "semo_18.se1",
+        "sepl_24.se1", "semo_24.se1",
+    ]
+
+
+def test_environment_overrides_configured_path(fresh_state, tmp_path):
+    fresh_state.setenv(EPHE_PATH_ENV, str(tmp_path))
+    assert resolve_ephe_path() == tmp_path
+
+
+def test_missing_files_fall_back_to_moshier(fresh_state, tmp_path):
+    fresh_state.setenv(EPHE_PATH_ENV, str(tmp_path))
+    status = configure_ephemeris_data()
+
+    assert status.backend == "MOSHIER"
+    assert status.path == str(tmp_path)
+    assert status.files == []
+    assert status.missing == ["sepl_18.se1", "semo_18.se1"]
+    assert configure_ephemeris_data() is status
+
+
+def test_preload_maps_every_file(tmp_path):
+    files = []
+    for name, size in (("a.se1", 10000), ("b.se1", 3)):
+        path = tmp_path / name
+        path.write_bytes(b"\0" * size)
+        files.append(path)
+    try:
+        assert ephemeris_data._preload(files) == 10003
+    finally:
+        reset_ephemeris_data()
+        configure_ephemeris_data()
+
+
+def test_health_reports_backend():
+    from app import app
+
+    data = app.test_client().get('/api/health?skip_network=true').get_json()
+    swiss = data['services']['swiss_ephemeris']
+    # The files for the default range are bundled
+    assert swiss['backend'] == "SWIEPH"
+    assert swiss['date_range'] == [1800, 2399] and swiss['missing'] == []
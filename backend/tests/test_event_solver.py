@@ -0,0 +1,99 @@
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.event_solver import EventSolver
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Planet, Aspect, PlanetPosition, Sign
+
+JD = swe.julday(2025, 9, 1, 2.25)
+
+
+def longitude(body, jd):
+    data, _ = swe.calc_ut(jd, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return data[0]
+
+
+def make_pos(planet, body, sign):
+    data, _ = swe.calc_ut(JD, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return PlanetPosition(
+        planet=planet,
+        longitude=data[0],
+        latitude=0.0,
+        house=1,
+        sign=sign,
+        dignity_score=0,
+        speed=data[3],
+    )
+
+
+@pytest.mark.parametrize(
+    "body1, body2, angle",
+    [
+        (swe.MOON, swe.SUN, 90),
+        (swe.MOON, swe.SATURN, 0),
+        (swe.MARS, swe.JUPITER, 90),
+        (swe.SUN, swe.SATURN, 180),
+    ],
+)
+def test_aspect_perfection_is_exact(body1, body2, angle):
+    solver = EventSolver()
+    event = solver.aspect_perfection(body1, body2, angle, JD, 30)
+    assert event is not None
+    assert event.days == pytest.approx(event.jd - JD)
+
+    separation = abs((longitude(body1, event.jd) - longitude(body2, event.jd) + 180) % 360 - 180)
+    assert separation == pytest.approx(angle, abs=1e-3)
+
+    # Far fewer ephemeris calls than a 0.1-day scan of the window
+    assert event.ephemeris_calls < 100
+    assert event.iterations > 0
+
+
+def test_aspect_outside_window_is_none():
+    solver = EventSolver()
+    event = solver.aspect_perfection(swe.MOON, swe.SUN, 90, JD, 30)
+    assert solver.aspect_perfection(swe.MOON, swe.SUN, 90, JD, event.days - 0.5) is None
+
+
+def test_sign_ingress_handles_retrograde_exit():
+    solver = EventSolver()
+    # Saturn sits at 0 Aries moving retrograde: it leaves backwards into Pisces
+    event = solver.sign_ingress(swe.SATURN, JD, 60)
+    assert event is not None
+    assert event.days < 1
+    offset = (longitude(swe.SATURN, event.jd) + 180) % 360 - 180
+    assert offset == pytest.approx(0, abs=1e-4)
+
+    event = solver.sign_ingress(swe.MOON, JD, 60)
+    assert event is not None
+    assert event.days < 3
+
+
+def test_station_brackets_speed_sign_change():
+    solver = EventSolver()
+    event = solver.station(swe.JUPITER, JD, 365)
+    assert event is not None
+    speed_before = swe.calc_ut(event.jd - 1, swe.JUPITER, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+    speed_after = swe.calc_ut(event.jd + 1, swe.JUPITER, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+    assert speed_before > 0 > speed_after
+    assert solver.station(swe.SUN, JD, 365) is None
+    assert solver.stats()["events"] == 1
+
+
+def test_engine_uses_solver_with_julian_day():
+    mars = make_pos(Planet.MARS, swe.MARS, Sign.LIBRA)
+    jupiter = make_pos(Planet.JUPITER, swe.JUPITER, Sign.CANCER)
+
+    engine_cls = EnhancedTraditionalHoraryJudgmentEngine
+    solved = engine_cls._calculate_future_aspect_time(engine_cls, mars, jupiter, Aspect.SQUARE, JD, 30)
+    linear = engine_cls._calculate_future_aspect_time(engine_cls, mars, jupiter, Aspect.SQUARE, 0.0, 30)
+
+    assert solved is not None and linear is not None
+    # Mars is accelerating, so the true contact comes slightly before the linear estimate
+    assert solved == pytest.approx(linear, abs=0.2)
+    assert solved < linear
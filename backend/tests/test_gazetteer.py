@@ -0,0 +1,151 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.services.gazetteer as gazetteer_module
+import horary_engine.services.geolocation as geolocation
+from horary_engine.services.gazetteer import Gazetteer, read_admin1, read_geonames, write_gazetteer
+
+# geonameid, name, asciiname, alternatenames, lat, lon, class, code, country, cc2,
+# admin1, admin2, admin3, admin4, population, elevation, dem, timezone, modified
+CITIES = [
+    ("2643743", "London", "London", "Londra,Londres,Lundun", "51.50853", "-0.12574", "P", "PPLC", "GB", "", "ENG", "GLA", "", "", "8961989", "", "25", "Europe/London", "2024-01-01"),
+    ("6058560", "London", "London", "", "42.98339", "-81.23304", "P", "PPL", "CA", "", "08", "", "", "", "422324", "", "252", "America/Toronto", "2024-01-01"),
+    ("2643736", "Londonderry", "Londonderry", "Derry", "54.9981", "-7.30934", "P", "PPL", "GB", "", "NIR", "", "", "", "83652", "", "8", "Europe/London", "2024-01-01"),
+    ("2988507", "Paris", "Paris", "Paname", "48.85341", "2.3488", "P", "PPLC", "FR", "", "11", "75", "", "", "2138551", "", "42", "Europe/Paris", "2024-01-01"),
+    ("4717560", "Paris", "Paris", "", "33.66094", "-95.55551", "P", "PPLA2", "US", "", "TX", "277", "", "", "24782", "", "183", "America/Chicago", "2024-01-01"),
+    ("2950159", "Berlin", "Berlin", "", "52.52437", "13.41053", "P", "PPLC", "DE", "", "16", "", "", "", "3426354", "", "74", "Europe/Berlin", "2024-01-01"),
+    ("2867714", "München", "Muenchen", "Munich,Monaco di Baviera", "48.13743", "11.57549", "P", "PPLA", "DE", "", "02", "", "", "", "1260391", "", "524", "Europe/Berlin", "2024-01-01"),
+    ("1819729", "Hong Kong", "Hong Kong", "Victoria,Xianggang", "22.27832", "114.17469", "P", "PPLC", "HK", "", "NA", "", "", "", "7491609", "", "10", "Asia/Hong_Kong", "2024-01-01"),
+    ("6174041", "Victoria", "Victoria", "", "48.4359", "-123.35155", "P", "PPLA", "CA", "", "02", "", "", "", "289625", "", "23", "America/Vancouver", "2024-01-01"),
+    ("2643741", "City of London", "City of London", "", "51.51279", "-0.09184", "A", "ADM2", "GB", "", "ENG", "", "", "", "8071", "", "", "Europe/London", "2024-01-01"),
+]
+ADMIN1 = [
+    ("GB.ENG", "England", "England", "6269131"),
+    ("GB.NIR", "Northern Ireland", "Northern Ireland", "2641364"),
+    ("CA.02", "British Columbia", "British Columbia", "5909050"),
+    ("CA.08", "Ontario", "Ontario", "6093943"),
+    ("US.TX", "Texas", "Texas", "4736286"),
+]
+
+
+@pytest.fixture()
+def gazetteer(tmp_path):
+    cities = tmp_path / "cities.txt"
+    cities.write_text("".join("\t".join(row) + "\n" for row in CITIES), encoding="utf-8")
+    admin1 = tmp_path / "admin1.txt"
+    admin1.write_text("".join("\t".join(row) + "\n" for row in ADMIN1), encoding="utf-8")
+    path = tmp_path / "gazetteer.bin"
+    assert write_gazetteer(read_geonames(cities, read_admin1(admin1)), path) == 9
+    return Gazetteer.load(path)
+
+
+def test_resolve_ranks_by_population_and_honours_qualifiers(gazetteer):
+    london = gazetteer.resolve("london")
+    assert london.label == "London, England, United Kingdom"
+    assert (london.latitude, london.longitude, london.timezone) == (51.50853, -0.12574, "Europe/London")
+    assert gazetteer.resolve("London, Ontario").country_code == "CA"
+    assert gazetteer.resolve("Paris, Texas, US").timezone == "America/Chicago"
+    assert gazetteer.resolve("  PARIS ,  uk ") is None
+    assert gazetteer.resolve("Londres").geonameid == 2643743
+    assert gazetteer.resolve("Munchen").name == "München"
+    assert gazetteer.resolve("City of London") is None  # not a populated place
+    assert gazetteer.resolve("Lond") is None
+
+
+def test_own_names_outrank_alternate_names(gazetteer):
+    # Hong Kong is far larger, but "Victoria" is only one of its alternate names
+    assert gazetteer.resolve("Victoria").geonameid == 6174041
+    assert [place.geonameid for place, _match in gazetteer.search("victoria")] == [6174041, 1819729]
+    assert [place.geonameid for place, _match in gazetteer.search("vic")] == [6174041, 1819729]
+    # An alternate name still resolves when no place has it as its own name
+    assert gazetteer.resolve("Xianggang").geonameid == 1819729
+    assert gazetteer.resolve("Victoria, Hong Kong").geonameid == 1819729
+
+
+def test_region_abbreviations_qualify(gazetteer):
+    assert gazetteer.resolve("Paris, TX").timezone == "America/Chicago"
+    assert gazetteer.resolve("London, ON").country_code == "CA"
+    assert gazetteer.resolve("Victoria, BC").admin1_code == "BC"
+    assert gazetteer.resolve("Paris, ON") is None
+    assert [place.geonameid for place, _match in gazetteer.search("paris, t")] == [4717560]
+
+
+def test_search_orders_exact_prefix_and_fuzzy_matches(gazetteer):
+    results = gazetteer.search("lond")
+    assert [(place.geonameid, match) for place, match in results] == [
+        (2643743, "prefix"), (6058560, "prefix"), (2643736, "prefix"),
+    ]
+    results = gazetteer.search("London")
+    assert [match for _place, match in results] == ["exact", "exact", "prefix"]
+    assert [place.country_code for place, _match in gazetteer.search("london, c")] == ["CA"]
+    assert gazetteer.search("london", limit=1)[0][0].geonameid == 2643743
+    assert gazetteer.search("Berlni") == [(gazetteer.resolve("Berlin"), "fuzzy")]
+    assert gazetteer.search("") == []
+
+
+def test_safe_geocode_prefers_gazetteer(gazetteer, monkeypatch):
+    monkeypatch.setattr(geolocation, "get_gazetteer", lambda: gazetteer)
+
+    def offline(*args):
+        raise AssertionError("geocoding service called")
+
+    monkeypatch.setattr(geolocation, "get_geocode_cache", offline)
+    assert geolocation.safe_geocode("Paris, France") == (48.85341, 2.3488, "Paris, France")
+
+
+def test_missing_file_disables_gazetteer(tmp_path, monkeypatch):
+    monkeypatch.setattr(gazetteer_module, "DEFAULT_GAZETTEER_PATH", tmp_path / "missing.bin")
+    gazetteer_module.reset_gazetteer()
+    try:
+        assert gazetteer_module.get_gazetteer() is None
+    finally:
+        gazetteer_module.reset_gazetteer()
+
+
+def test_bundled_gazetteer_resolves_without_the_network(monkeypatch):
+    gazetteer_module.reset_gazetteer()
+    try:
+        bundled = gazetteer_module.get_gazetteer()
+        assert bundled is not None and bundled.place_count > 30000
+        london = bundled.resolve("London, UK")
+        assert (round(london.latitude, 1), round(london.longitude, 1)) == (51.5, -0.1)
+        assert bundled.resolve("London, Ontario").country_code == "CA"
+        assert bundled.resolve("Paris, Texas").timezone == "America/Chicago"
+        assert bundled.search("Syd")[0][0].name == "Sydney"
+
+        def offline(*args):
+            raise AssertionError("geocoding service called")
+
+        monkeypatch.setattr(geolocation, "get_geocode_cache", offline)
+        latitude, longitude, _ = geolocation.safe_geocode("Delhi, India")
+        assert (round(latitude), round(longitude)) == (29, 77)
+    finally:
+        gazetteer_module.reset_gazetteer()
+
+
+def test_bundled_gazetteer_prefers_the_place_called_that():
+    gazetteer_module.reset_gazetteer()
+    try:
+        bundled = gazetteer_module.get_gazetteer()
+        # Each of these is an alternate name of a larger city elsewhere
+        for name, country in [("Islamabad", "PK"), ("Cancún", "MX"), ("Zaragoza", "ES"),
+                              ("Stavropol", "RU"), ("Jayapura", "ID"), ("Victoria, BC", "CA")]:
+            place = bundled.resolve(name)
+            assert (place.name.split(",")[0], place.country_code) == (name.split(",")[0], country)
+        for query, label in [("Paris, TX", "Paris, Texas, United States"),
+                             ("New York, NY", "New York City, New York, United States"),
+                             ("Cambridge, MA", "Cambridge, Massachusetts, United States"),
+                             ("Washington, DC", "Washington, Washington, D.C., United States"),
+                             ("Newcastle, NSW", "Newcastle, New South Wales, Australia")]:
+            assert bundled.resolve(query).label == label
+
+        # No place's own name resolves to a place called something else
+        names = {gazetteer_module.normalize_name(bundled.place(index).name) for index in range(bundled.place_count)}
+        wrong = [name for name in names if gazetteer_module.normalize_name(bundled.resolve(name).name) != name]
+        assert wrong == []
+    finally:
+        gazetteer_module.reset_gazetteer()
@@ -0,0 +1,89 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from geopy.exc import GeocoderUnavailable
+
+import horary_engine.services.geolocation as geolocation
+from horary_engine.services.geocoding import GeocodeCache
+from horary_engine.services.geolocation import LocationError
+
+LONDON = (51.5074, -0.1278, "London, Greater London, England, United Kingdom")
+
+
+class FakeService:
+    def __init__(self, results=None, release=None):
+        self.results = results or {"london": LONDON}
+        self.release = release
+        self.calls = []
+
+    def __call__(self, query, timeout):
+        self.calls.append(query)
+        if self.release is not None:
+            self.release.wait(5)
+        result = self.results.get(query.casefold())
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_results_persist_across_instances(tmp_path):
+    path = tmp_path / "geocode.sqlite3"
+    service = FakeService()
+    cache = GeocodeCache(service, path=path)
+    assert cache.geocode("London") == LONDON
+    assert cache.geocode("  LONDON ") == LONDON
+    assert cache.geocode("Atlantis") is None
+    assert cache.geocode("atlantis") is None
+    assert service.calls == ["London", "Atlantis"]
+
+    restarted = GeocodeCache(FakeService(results={}), path=path)
+    assert restarted.geocode("london") == LONDON
+    assert restarted.geocode("Atlantis") is None
+    assert restarted.stats()["store_hits"] == 2
+    assert restarted.stats()["upstream_calls"] == 0
+
+
+def test_negative_entries_expire_and_errors_are_not_cached(tmp_path):
+    service = FakeService(results={"atlantis": None})
+    cache = GeocodeCache(service, path=tmp_path / "geocode.sqlite3", negative_ttl_seconds=-1)
+    cache.geocode("Atlantis")
+    cache.geocode("Atlantis")
+    assert len(service.calls) == 2
+
+    service.results["atlantis"] = GeocoderUnavailable("down")
+    with pytest.raises(GeocoderUnavailable):
+        cache.geocode("Atlantis")
+    service.results["atlantis"] = LONDON
+    assert cache.geocode("Atlantis") == LONDON
+    assert cache.stats()["errors"] == 1
+
+
+def test_concurrent_lookups_share_one_request():
+    release = threading.Event()
+    service = FakeService(release=release)
+    cache = GeocodeCache(service)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.geocode("London"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while cache.stats()["coalesced"] < 7:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [LONDON] * 8
+    assert service.calls == ["London"]
+
+
+def test_safe_geocode_reports_not_found(monkeypatch):
+    # London is in the bundled gazetteer; exercise the geocoding service path
+    monkeypatch.setattr(geolocation, "get_gazetteer", lambda: None)
+    monkeypatch.setattr(geolocation, "get_geocode_cache", lambda: GeocodeCache(FakeService()))
+    assert geolocation.safe_geocode("London") == LONDON
+    with pytest.raises(LocationError, match="Location not found"):
+        geolocation.safe_geocode("Atlantis")
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+from evaluate_chart import evaluate_chart
+from horary_engine.engine import HoraryEngine
+from horary_engine.serialization import deserialize_chart_for_evaluation, serialize_chart_for_frontend
+from models import HoraryChart
+
+SETTINGS = {
+    "location": "London",
+    "date": "2024-03-15",
+    "time": "18:30",
+    "timezone": "Europe/London",
+    "use_current_time": False,
+}
+
+
+@pytest.fixture()
+def engine(monkeypatch):
+    # Avoid the network geocoder
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location: (51.5074, -0.1278, "London, UK"))
+    return HoraryEngine()
+
+
+def test_judge_returns_live_chart(engine):
+    result, chart = engine.judge_with_chart("Will I get the job?", SETTINGS)
+    assert isinstance(chart, HoraryChart)
+    assert result["chart_data"] == serialize_chart_for_frontend(chart, chart.solar_analyses)
+    assert engine.judge("Will I get the job?", SETTINGS)["judgment"] == result["judgment"]
+
+
+def test_live_chart_evaluates_like_round_trip(engine):
+    result, chart = engine.judge_with_chart("Will I sell my house?", SETTINGS)
+    live = evaluate_chart(chart, use_dsl=False)
+    round_trip = evaluate_chart(deserialize_chart_for_evaluation(result["chart_data"]), use_dsl=False)
+    assert live["verdict"] == round_trip["verdict"]
+    assert live["rationale"] == round_trip["rationale"]
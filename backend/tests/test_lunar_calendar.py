@@ -0,0 +1,108 @@
+import datetime
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.event_solver import EventSolver
+from horary_engine.calculation.lunar_calendar import (
+    VOID_TARGETS,
+    LunarCalendarMiss,
+    build_lunar_calendar,
+    get_lunar_calendar,
+)
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, Planet, Sign
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    return build_lunar_calendar(2024, 2025)
+
+
+def test_ingresses_match_event_solver(calendar):
+    jd = swe.julday(2024, 3, 10, 5.0)
+    ingress_jd, sign = calendar.next_ingress(jd)
+    assert ingress_jd == pytest.approx(EventSolver().sign_ingress(swe.MOON, jd, 5).jd, abs=1e-5)
+    assert sign == Sign.ARIES
+
+
+def test_void_period_has_no_later_aspect(calendar):
+    solver = EventSolver()
+    jd = swe.julday(2024, 3, 10, 5.0)
+    periods = calendar.next_void_periods(jd, 3)
+    assert len(periods) == 3
+
+    # 2024-03-10 new moon at 29 Pisces, the last aspect before Aries
+    first = periods[0]
+    assert (first.sign, first.next_sign) == (Sign.PISCES, Sign.ARIES)
+    assert (first.last_planet, first.last_aspect) == (Planet.SUN, Aspect.CONJUNCTION)
+
+    for period in periods:
+        for body in VOID_TARGETS:
+            for aspect in Aspect:
+                event = solver.aspect_perfection(swe.MOON, body, aspect.degrees,
+                                                 period.start_jd + 1e-4, period.duration_days)
+                assert event is None or event.jd >= period.end_jd - 1e-4
+
+
+def test_void_queries_agree(calendar):
+    period = calendar.next_void_periods(swe.julday(2024, 7, 1, 0.0))[0]
+    inside = period.start_jd + period.duration_days / 2
+    assert calendar.is_void(inside)
+    assert calendar.void_period_at(inside) == period
+    assert not calendar.is_void(period.start_jd - 1e-3)
+    assert calendar.void_period_at(period.start_jd - 1e-3) is None
+    # A period in progress is returned first
+    assert calendar.next_void_periods(inside, 2)[0] == period
+
+
+def test_round_trip_and_misses(calendar, tmp_path):
+    path = tmp_path / "lunar.bin"
+    calendar.save(path)
+    loaded = type(calendar).load(path)
+    assert list(loaded.void_start) == list(calendar.void_start)
+    assert list(loaded.last_body) == list(calendar.last_body)
+    # About 13.4 sidereal months a year, twelve ingresses each
+    assert 160 <= len(loaded) <= 166
+
+    with pytest.raises(LunarCalendarMiss):
+        loaded.is_void(loaded.jd_end + 1)
+
+
+def test_bundled_calendar_drives_engine_void_check():
+    calendar = get_lunar_calendar()
+    assert calendar is not None
+    period = calendar.next_void_periods(swe.julday(2024, 3, 10, 5.0))[0]
+
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    jd = period.start_jd + period.duration_days / 2
+    year, month, day, hours = swe.revjul(jd)
+    dt = datetime.datetime(year, month, day) + datetime.timedelta(hours=hours)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.12, "London")
+    result = engine._is_moon_void_of_course_enhanced(chart)
+    assert result["void"] is True
+    assert result["void_period"]["sign"] == "Pisces"
+
+
+def test_engine_and_chart_name_the_aspect_that_ends_each_void_free_stretch():
+    calendar = get_lunar_calendar()
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    for period in calendar.next_void_periods(swe.julday(2024, 3, 10, 5.0), 24):
+        if period.last_planet is None:
+            continue
+        # One minute before the Moon's last aspect in the sign
+        year, month, day, hours = swe.revjul(period.start_jd - 1 / 1440)
+        dt = datetime.datetime(year, month, day) + datetime.timedelta(hours=hours)
+        chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.12, "London")
+        result = engine._is_moon_void_of_course_enhanced(chart)
+
+        assert result["void"] is False
+        assert result["first_applying_aspect"] is chart.moon_next_aspect
+        next_aspect = chart.moon_next_aspect
+        assert (next_aspect.planet, next_aspect.aspect) == (period.last_planet, period.last_aspect)
+        assert next_aspect.perfection_eta_days == pytest.approx(1 / 1440, abs=1e-4)
+        assert next_aspect.planet.value in result["reason"]
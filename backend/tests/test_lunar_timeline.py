@@ -0,0 +1,107 @@
+import datetime
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.ephemeris import Ephemeris
+from horary_engine.calculation.event_solver import EventSolver
+from horary_engine.calculation.lunar_calendar import get_lunar_calendar
+from horary_engine.calculation.lunar_timeline import lunar_timeline
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, Planet, Sign
+
+JD = swe.julday(2024, 3, 10, 5.0)
+
+
+def test_forward_events_are_exact_and_ordered():
+    events = list(lunar_timeline(JD, 4.0))
+    assert [e.jd for e in events] == sorted(e.jd for e in events)
+    assert all(0 < e.days <= 4.0 for e in events)
+
+    # 2024-03-10 new moon, then the Moon enters Aries
+    first, second = events[0], events[1]
+    assert (first.planet, first.aspect, first.sign) == (Planet.SUN, Aspect.CONJUNCTION, Sign.PISCES)
+    assert first.jd == pytest.approx(EventSolver().aspect_perfection(swe.MOON, swe.SUN, 0, JD, 5).jd, abs=1e-5)
+    assert second.is_ingress and second.sign == Sign.ARIES
+    assert second.jd == pytest.approx(get_lunar_calendar().next_ingress(JD)[0], abs=1e-5)
+
+
+def test_every_solver_perfection_appears():
+    solver = EventSolver()
+    events = list(lunar_timeline(JD, 10.0))
+    for planet, body in ((Planet.MARS, swe.MARS), (Planet.SATURN, swe.SATURN)):
+        for aspect in Aspect:
+            expected = solver.aspect_perfection(swe.MOON, body, aspect.degrees, JD, 10.0)
+            if expected is not None:
+                assert any(e.planet == planet and e.aspect == aspect and abs(e.jd - expected.jd) < 1e-5
+                           for e in events)
+
+
+def test_backward_is_most_recent_first():
+    events = list(lunar_timeline(JD, 3.0, backward=True, planets=[Planet.SATURN, Planet.JUPITER]))
+    assert [e.jd for e in events] == sorted((e.jd for e in events), reverse=True)
+    assert all(-3.0 <= e.days < 0 for e in events)
+    assert {e.planet for e in events if not e.is_ingress} <= {Planet.SATURN, Planet.JUPITER}
+
+
+def test_stopping_early_limits_ephemeris_reads():
+    full = Ephemeris()
+    list(lunar_timeline(JD, 15.0, ephemeris=full))
+
+    lazy = Ephemeris()
+    next(e for e in lunar_timeline(JD, 15.0, ephemeris=lazy) if e.is_ingress)
+    assert lazy.stats()["misses"] * 5 < full.stats()["misses"]
+
+
+def test_translation_helpers_read_the_timeline():
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2024, 3, 10, 5, 0)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.12, "London")
+
+    future = engine._calculate_future_lunar_aspects(chart, Planet.MERCURY, Planet.MARS)
+    # Both perfect after the Moon enters Aries
+    assert future[Planet.MERCURY].aspect == Aspect.CONJUNCTION
+    assert future[Planet.MARS].aspect == Aspect.SEXTILE
+    assert all(a.applying and not a.perfection_within_sign for a in future.values())
+
+    recent = engine._calculate_recent_lunar_separations(chart, Planet.SATURN, Planet.VENUS)
+    assert recent[Planet.SATURN].aspect == Aspect.CONJUNCTION
+    assert -1.0 < recent[Planet.SATURN].time_to_perfection < 0
+    assert recent[Planet.VENUS].time_to_perfection < recent[Planet.SATURN].time_to_perfection
+
+
+def test_cross_sign_moon_translation_is_detected():
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    # The Moon separates from a trine of Saturn, enters Virgo and conjoins
+    # Mercury 2.3 days later, about 27 degrees of elongation away
+    dt = datetime.datetime(2016, 9, 27, 2, 36)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", -33.8688, 151.2093, "Sydney")
+
+    conjunction = engine._calculate_future_lunar_aspects(chart, Planet.SATURN, Planet.MERCURY)[Planet.MERCURY]
+    assert conjunction.aspect == Aspect.CONJUNCTION
+    assert conjunction.time_to_perfection == pytest.approx(2.31, abs=0.01)
+    # Elongation on coming within 1.5x orb in the new sign, not from the chart moment
+    assert conjunction.degrees_to_exact == pytest.approx(1.5 * Aspect.CONJUNCTION.orb)
+
+    translation = engine._check_enhanced_translation_of_light(chart, Planet.SATURN, Planet.MERCURY)
+    assert translation["found"] and translation["translator"] == Planet.MOON
+
+
+def test_cross_sign_aspect_in_orb_at_ingress_takes_the_elongation_at_ingress():
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    # The Moon enters Libra already within orb of conjoining Jupiter
+    dt = datetime.datetime(1957, 1, 19, 3, 12)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 35.6762, 139.6503, "Tokyo")
+
+    conjunction = engine._calculate_future_lunar_aspects(chart, Planet.VENUS, Planet.JUPITER)[Planet.JUPITER]
+    assert conjunction.aspect == Aspect.CONJUNCTION
+
+    ingress = EventSolver().sign_ingress(swe.MOON, chart.julian_day, 3).jd
+    moon = swe.calc_ut(ingress, swe.MOON)[0][0]
+    jupiter = swe.calc_ut(ingress, swe.JUPITER)[0][0]
+    assert conjunction.degrees_to_exact == pytest.approx((jupiter - moon) % 360.0, abs=1e-3)
+    assert conjunction.degrees_to_exact == pytest.approx(1.77, abs=0.01)
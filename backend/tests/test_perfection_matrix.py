@@ -0,0 +1,87 @@
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.perfection import (
+    PerfectionMatrix,
+    perfection_matrix,
+    solve_aspect_time,
+    solve_sign_exit,
+)
+from models import Planet, Aspect, PlanetPosition, Sign
+
+JD = swe.julday(2025, 9, 1, 2.25)
+
+BODIES = {
+    Planet.SUN: swe.SUN,
+    Planet.MOON: swe.MOON,
+    Planet.MARS: swe.MARS,
+    Planet.JUPITER: swe.JUPITER,
+}
+
+
+def make_planets():
+    planets = {}
+    for planet, body in BODIES.items():
+        data, _ = swe.calc_ut(JD, body, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        planets[planet] = PlanetPosition(
+            planet=planet,
+            longitude=data[0],
+            latitude=0.0,
+            house=1,
+            sign=list(Sign)[int(data[0] // 30)],
+            dignity_score=0,
+            speed=data[3],
+        )
+    return planets
+
+
+def test_matches_solver_and_solves_each_contact_once():
+    planets = make_planets()
+    matrix = PerfectionMatrix(JD, planets)
+
+    days = matrix.time_to_perfection(Planet.MOON, Planet.SUN, Aspect.SQUARE, 30)
+    expected = solve_aspect_time(planets[Planet.MOON], planets[Planet.SUN], Aspect.SQUARE, JD, 30)
+    assert days == pytest.approx(expected)
+
+    # Repeats, swapped order and shorter windows are answered from the table
+    solves = matrix.solves
+    assert matrix.time_to_perfection(Planet.SUN, Planet.MOON, Aspect.SQUARE, 30) == days
+    assert matrix.time_to_perfection(Planet.MOON, Planet.SUN, Aspect.SQUARE, days + 1) == days
+    assert matrix.time_to_perfection(Planet.MOON, Planet.SUN, Aspect.SQUARE, days - 0.5) is None
+    assert matrix.solves == solves
+
+
+def test_miss_is_solved_again_for_a_longer_window():
+    planets = make_planets()
+    matrix = PerfectionMatrix(JD, planets)
+
+    expected = solve_aspect_time(planets[Planet.MARS], planets[Planet.JUPITER], Aspect.SQUARE, JD, 30)
+    assert matrix.time_to_perfection(Planet.MARS, Planet.JUPITER, Aspect.SQUARE, expected - 1) is None
+    assert matrix.time_to_perfection(Planet.MARS, Planet.JUPITER, Aspect.SQUARE, 30) == pytest.approx(expected)
+    assert matrix.solves == 2
+
+
+def test_entry_reports_sign_exits_up_to_perfection():
+    planets = make_planets()
+    matrix = PerfectionMatrix(JD, planets)
+
+    entry = matrix.entry(Planet.MOON, Planet.JUPITER, Aspect.CONJUNCTION, 30)
+    assert entry.days is not None
+    moon_exit = solve_sign_exit(planets[Planet.MOON], JD, 30)
+    assert entry.exit1 == (pytest.approx(moon_exit) if moon_exit < entry.days else None)
+    assert entry.in_sign == (entry.exit1 is None and entry.exit2 is None)
+
+
+def test_chart_accessor_is_memoized():
+    class Chart:
+        julian_day = JD
+        planets = make_planets()
+        perfection_cache = None
+
+    chart = Chart()
+    assert perfection_matrix(chart) is perfection_matrix(chart)
@@ -0,0 +1,86 @@
+import datetime
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.radicality import check_planetary_hour_agreement
+from horary_engine.services.planetary_hours import (
+    PlanetaryHoursError,
+    PlanetaryHoursService,
+)
+from models import Planet
+
+LONDON = (51.5074, -0.1278)
+
+
+def test_table_follows_chaldean_order_from_day_ruler():
+    service = PlanetaryHoursService()
+    table = service.table(datetime.date(2024, 4, 8), *LONDON, "Europe/London")  # Monday
+
+    assert table.day_ruler == Planet.MOON
+    assert [h.ruler for h in table.hours[:8]] == [
+        Planet.MOON, Planet.SATURN, Planet.JUPITER, Planet.MARS,
+        Planet.SUN, Planet.VENUS, Planet.MERCURY, Planet.MOON,
+    ]
+    assert table.hours[0].start_jd == table.sunrise_jd
+    assert table.hours[11].end_jd == table.sunset_jd == table.hours[12].start_jd
+    assert table.hours[23].end_jd == table.next_sunrise_jd
+    # The next planetary day begins with Tuesday's ruler
+    assert service.table(datetime.date(2024, 4, 9), *LONDON, "Europe/London").hours[0].ruler == Planet.MARS
+
+
+def test_before_sunrise_belongs_to_previous_planetary_day():
+    service = PlanetaryHoursService()
+    tz = datetime.timezone(datetime.timedelta(hours=1))
+    hour = service.hour_at(datetime.datetime(2024, 4, 9, 0, 13, tzinfo=tz), *LONDON, "Europe/London")
+    assert hour.number == 18
+    assert hour.ruler == Planet.MARS
+
+
+def test_tables_are_cached_by_rounded_location():
+    service = PlanetaryHoursService(max_tables=2, location_precision=0.01)
+    day = datetime.date(2024, 6, 1)
+    first = service.table(day, 51.5074, -0.1278, "Europe/London")
+    assert service.table(day, 51.5071, -0.1281, "Europe/London") is first
+    assert service.stats() == {"tables": 1, "hits": 1, "misses": 1}
+
+    assert service.precompute(*LONDON, "Europe/London", day, 3) == 2
+    assert service.stats()["tables"] == 2
+
+
+def test_polar_day_raises():
+    with pytest.raises(PlanetaryHoursError):
+        PlanetaryHoursService().table(datetime.date(2024, 6, 21), 78.2, 15.6, "Arctic/Longyearbyen")
+
+
+def test_radicality_uses_local_planetary_day():
+    # Saturday 06:39 EDT, inside the first (Saturn) hour after sunrise
+    dt_local = datetime.datetime(2024, 6, 8, 6, 39, tzinfo=datetime.timezone(datetime.timedelta(hours=-4)))
+    chart = SimpleNamespace(
+        date_time=dt_local,
+        date_time_utc=dt_local.astimezone(datetime.timezone.utc),
+        timezone_info="America/New_York",
+        location=(40.7128, -74.0060),
+        ascendant=280.0,  # Capricorn rising, ruled by Saturn
+        planets={},
+    )
+    config = SimpleNamespace(radicality=SimpleNamespace(hour_agreement_mode="ruler"))
+    assert check_planetary_hour_agreement(chart, config)["valid"] is True
+
+
+def test_planetary_hours_endpoint():
+    from app import app
+
+    client = app.test_client()
+    resp = client.get('/api/planetary-hours?lat=51.5074&lon=-0.1278&date=2024-04-08&timezone=Europe/London')
+    data = resp.get_json()
+    assert resp.status_code == 200
+    assert data['day_ruler'] == 'Moon'
+    assert len(data['hours']) == 24
+    assert data['sunrise'].startswith('2024-04-08T06:1')
+
+    assert client.get('/api/planetary-hours?lat=abc&lon=0').status_code == 400
@@ -0,0 +1,74 @@
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.ephemeris import get_ephemeris
+from horary_engine.calculation.event_solver import get_event_solver
+from horary_engine.calculation.precision import (
+    active_precision,
+    get_precision_profile,
+    use_precision,
+)
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+from models import Planet
+
+DT = datetime.datetime(2025, 9, 1, 12, 0)
+
+
+def test_profiles_come_from_configuration():
+    assert active_precision().name == "precise"
+    fast = get_precision_profile("fast")
+    assert fast.provider == "chebyshev"
+    assert fast.solver_tolerance_days == pytest.approx(1e-3)
+    with pytest.raises(ValueError):
+        get_precision_profile("sloppy")
+
+
+def test_use_precision_nests_and_selects_ephemeris():
+    precise = get_ephemeris()
+    with use_precision("fast"):
+        assert active_precision().name == "fast"
+        assert get_ephemeris().provider.name == "chebyshev"
+        assert get_event_solver().tolerance_days == pytest.approx(1e-3)
+        with use_precision("moshier"):
+            assert get_ephemeris().provider.name == "moshier"
+        with use_precision(None):
+            assert active_precision().name == "fast"
+    assert get_ephemeris() is precise
+
+
+def test_fast_chart_is_close_to_precise():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    precise = calculator.calculate_chart(DT, DT, "UTC", 51.5, -0.12, "London")
+    fast = calculator.calculate_chart(DT, DT, "UTC", 51.5, -0.12, "London", precision="fast")
+
+    for planet in Planet:
+        if planet in precise.planets:
+            assert fast.planets[planet].longitude == pytest.approx(precise.planets[planet].longitude, abs=1e-3)
+            assert fast.planets[planet].house == precise.planets[planet].house
+    assert active_precision().name == "precise"
+
+
+def test_batch_keeps_profile_for_lazy_charts():
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    batch = calculator.calculate_chart_batch([DT], 51.5, -0.12, precision="fast")
+    assert batch.precision == "fast"
+    with get_ephemeris("fast").measure() as usage:
+        batch.chart(0)
+    assert usage["calls"] > 0
+
+
+def test_unknown_profile_is_rejected_by_api():
+    from app import app
+
+    resp = app.test_client().post('/api/calculate-chart', json={
+        'question': 'Will I pass?',
+        'location': 'London, UK',
+        'precision': 'sloppy',
+    })
+    assert resp.status_code == 400
+    assert 'sloppy' in resp.get_json()['error']
@@ -0,0 +1,44 @@
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+from horary_engine.reception import TraditionalReceptionCalculator
+from models import Planet
+
+
+@pytest.fixture(scope="module")
+def chart():
+    dt = datetime.datetime(2024, 3, 15, 18, 30)
+    return EnhancedTraditionalAstrologicalCalculator().calculate_chart(dt, dt, "UTC", 51.5, -0.13, "London")
+
+
+def test_pairs_are_classified_once_per_chart(chart):
+    calc = TraditionalReceptionCalculator()
+    matrix = calc.reception_matrix(chart)
+    assert TraditionalReceptionCalculator().reception_matrix(chart) is matrix
+
+    first = calc.calculate_comprehensive_reception(chart, Planet.MARS, Planet.SATURN)
+    first["type"] = "changed"
+    second = calc.calculate_comprehensive_reception(chart, Planet.MARS, Planet.SATURN)
+    assert second["type"] != "changed"
+    assert matrix.pair(Planet.MARS, Planet.SATURN) is matrix.pair(Planet.MARS, Planet.SATURN)
+
+
+def test_directions_agree_with_pair_summary(chart):
+    calc = TraditionalReceptionCalculator()
+    matrix = calc.reception_matrix(chart)
+    for p1 in chart.planets:
+        for p2 in chart.planets:
+            if p1 == p2:
+                continue
+            summary = calc.calculate_comprehensive_reception(chart, p1, p2)
+            assert summary["planet1_receives_planet2"] == matrix.receives(p1, p2)
+            assert summary["planet2_receives_planet1"] == matrix.receives(p2, p1)
+            one_way = calc.does_planet_receive(chart, p1, p2)
+            assert one_way["has_reception"] == bool(matrix.receives(p1, p2))
+            assert one_way["reception_strength"] == matrix.strength(p1, p2)
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+from horary_engine.engine import HoraryEngine
+from horary_engine.response_fields import expand_fields, parse_fields
+
+SETTINGS = {
+    "location": "London",
+    "date": "2024-03-15",
+    "time": "18:30",
+    "timezone": "Europe/London",
+    "use_current_time": False,
+}
+
+
+@pytest.fixture()
+def engine(monkeypatch):
+    # Avoid the network geocoder
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location: (51.5074, -0.1278, "London, UK"))
+    return HoraryEngine()
+
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields("") is None
+    assert parse_fields(" judgment, timing ") == {"judgment", "timing"}
+    assert parse_fields(["chart_data"]) == {"chart_data"}
+    with pytest.raises(ValueError, match="planets"):
+        parse_fields("judgment,planets")
+    assert expand_fields(frozenset({"explanation_audit"})) == {"explanation_audit", "reasoning"}
+
+
+def test_unrequested_sections_are_not_built(engine, monkeypatch):
+    full = engine.judge("Will I get the job?", SETTINGS)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("section built although not requested")
+
+    monkeypatch.setattr(engine_module, "serialize_chart_for_frontend", fail)
+    for name in ("_build_moon_story", "_calculate_general_info", "_calculate_considerations",
+                 "_audit_explanation_consistency"):
+        monkeypatch.setattr(engine.engine, name, fail)
+
+    result = engine.judge("Will I get the job?", {**SETTINGS, "fields": "judgment,confidence,timing"})
+    assert set(result) == {"question", "judgment", "confidence", "timing"}
+    assert {key: full[key] for key in result} == result
@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import horary_engine.engine as engine_module
+from horary_config import reload_config
+from horary_engine.engine import HoraryEngine
+from horary_engine.services.result_cache import _Tier, get_result_cache, reset_result_cache
+
+SETTINGS = {
+    "location": "London",
+    "date": "2024-03-15",
+    "time": "18:30",
+    "timezone": "Europe/London",
+    "use_current_time": False,
+}
+
+
+@pytest.fixture()
+def engine(monkeypatch):
+    # Avoid the network geocoder
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location: (51.5074, -0.1278, "London, UK"))
+    reset_result_cache()
+    yield HoraryEngine()
+    reset_result_cache()
+
+
+def test_tier_evicts_by_age_count_and_size():
+    tier = _Tier(max_entries=2, max_bytes=100, ttl_seconds=10)
+    tier.put("a", 1, 40, now=0)
+    tier.put("b", 2, 40, now=0)
+    assert tier.get("a", now=1) == 1
+    tier.put("c", 3, 40, now=1)  # over budget: drops "b", the least recently used
+    assert tier.get("b", now=1) is None
+    assert tier.get("a", now=11) is None  # expired
+    tier.put("d", 4, 101, now=1)  # larger than the whole budget
+    assert tier.get("d", now=1) is None
+    assert tier.stats()["evictions"] == 1 and tier.stats()["expirations"] == 1
+
+
+def test_repeated_request_hits_judgment_then_chart_tier(engine):
+    cache = get_result_cache()
+    with cache.track() as first:
+        result, chart = engine.judge_with_chart("Will I get the job?", SETTINGS)
+    assert first == {"chart": "miss", "judgment": "miss"}
+
+    with cache.track() as again:
+        cached, cached_chart = engine.judge_with_chart("  Will I get   the job? ", SETTINGS)
+    assert again == {"chart": "hit", "judgment": "hit"}
+    assert cached_chart is chart and cached == result
+
+    with cache.track() as other:
+        _, other_chart = engine.judge_with_chart("Will he return?", {**SETTINGS, "ignore_void_moon": True})
+    assert other == {"chart": "hit", "judgment": "miss"}
+    assert other_chart is chart
+
+    with cache.track() as now:
+        engine.judge_with_chart("Will I get the job?", {**SETTINGS, "use_current_time": True})
+    assert now == {"chart": "bypass", "judgment": "bypass"}
+
+
+def test_config_reload_empties_cache(engine):
+    engine.judge("Will I get the job?", SETTINGS)
+    assert get_result_cache().stats()["judgments"]["entries"] == 1
+    reload_config()
+    with get_result_cache().track() as status:
+        engine.judge("Will I get the job?", SETTINGS)
+    assert status["judgment"] == "miss"
+    assert get_result_cache().stats()["invalidations"] == 1
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import pytest
+import swisseph as swe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.calculation.event_solver import EventSolver
+from horary_engine.calculation.helpers import calculate_next_station_time
+from horary_engine.calculation.station_calendar import (
+    StationCalendarMiss,
+    build_station_calendar,
+    get_station_calendar,
+)
+
+
+@pytest.mark.parametrize("planet_id", [swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN])
+def test_calendar_matches_ephemeris_scan(planet_id):
+    jd_start = swe.julday(2025, 9, 1, 2.25)
+    expected = EventSolver().station(planet_id, jd_start, 365)
+    actual = calculate_next_station_time(planet_id, jd_start)
+
+    if expected is None:
+        assert actual is None
+    else:
+        # Speed is nearly flat at a station, so the roots agree only loosely
+        assert actual == pytest.approx(expected.jd, abs=0.002)
+
+
+def test_luminaries_never_station():
+    jd_start = swe.julday(2025, 9, 1, 0.0)
+    assert calculate_next_station_time(swe.SUN, jd_start) is None
+    assert calculate_next_station_time(swe.MOON, jd_start) is None
+
+
+def test_station_outside_max_days_is_none():
+    calendar = get_station_calendar()
+    jd_start = swe.julday(2025, 9, 1, 0.0)
+    station = calendar.next_station(swe.SATURN, jd_start, 365)
+    assert station is not None
+    assert calendar.next_station(swe.SATURN, jd_start, station - jd_start - 1) is None
+
+
+def test_calendar_round_trip(tmp_path):
+    calendar = build_station_calendar(2024, 2025, bodies=[swe.MERCURY])
+    path = tmp_path / "stations.bin"
+    calendar.save(path)
+
+    loaded = type(calendar).load(path)
+    assert list(loaded.stations[swe.MERCURY]) == list(calendar.stations[swe.MERCURY])
+    # Mercury turns retrograde three or four times a year
+    assert 6 <= len(loaded.stations[swe.MERCURY]) <= 8
+
+    with pytest.raises(StationCalendarMiss):
+        loaded.next_station(swe.MERCURY, loaded.jd_end + 10, 30)
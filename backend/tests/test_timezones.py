@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from horary_engine.engine import HoraryEngine
+from horary_engine.services.geolocation import TimezoneManager, get_timezone_manager, get_zone
+from horary_engine.services.timezone_raster import BORDER, TimezoneRaster, build_timezone_raster
+
+
+class HalfWorld:
+    """West of the meridian is New York time, east of it London time."""
+
+    def timezone_at(self, lat, lng):
+        return "America/New_York" if lng < 0 else "Europe/London"
+
+
+def test_raster_marks_cells_that_straddle_a_border(tmp_path):
+    raster = build_timezone_raster(HalfWorld(), resolution=30)
+    assert raster.cells.shape == (6, 12)
+    # The cells whose edge lies on the meridian are borders
+    assert (raster.cells[:, 5] == BORDER).all() and (raster.cells[:, 6] != BORDER).all()
+    assert raster.timezone_at(51.5, -80) == "America/New_York"
+    assert raster.timezone_at(51.5, 45) == "Europe/London"
+    assert raster.timezone_at(51.5, -10) is None
+
+    path = tmp_path / "raster.bin"
+    raster.source = "test"
+    raster.save(path)
+    loaded = TimezoneRaster.load(path)
+    assert (loaded.cells == raster.cells).all() and loaded.names == raster.names
+    assert loaded.source == "test" and loaded.timezone_at(-60, 100) == "Europe/London"
+
+
+def test_manager_caches_by_rounded_coordinates():
+    manager = TimezoneManager(raster=build_timezone_raster(HalfWorld(), resolution=30))
+    assert manager.get_timezone_for_location(40.7128, -74.0060) == "America/New_York"
+    assert manager.get_timezone_for_location(40.71281, -74.00604) == "America/New_York"
+    # Border cell: answered by the polygons
+    assert manager.get_timezone_for_location(51.5074, -0.1278) == "Europe/London"
+    stats = manager.stats()
+    assert (stats["raster_hits"], stats["cache_hits"], stats["polygon_lookups"]) == (1, 1, 1)
+
+
+def test_engine_and_endpoints_share_one_manager():
+    assert HoraryEngine().engine.timezone_manager is get_timezone_manager()
+    assert get_zone("Europe/London") is get_zone("Europe/London")